@@ -46,4 +46,531 @@
 `+i[a].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=a&&0<=e);break}}}finally{xn=!1,Error.prepareStackTrace=u}return(u=l?l.displayName||l.name:"")?Eu(u):""}function pd(l,t){switch(l.tag){case 26:case 27:case 5:return Eu(l.type);case 16:return Eu("Lazy");case 13:return l.child!==t&&t!==null?Eu("Suspense Fallback"):Eu("Suspense");case 19:return Eu("SuspenseList");case 0:case 15:return Zn(l.type,!1);case 11:return Zn(l.type.render,!1);case 1:return Zn(l.type,!0);case 31:return Eu("Activity");default:return""}}function oi(l){try{var t="",u=null;do t+=pd(l,u),u=l,l=l.return;while(l);return t}catch(a){return`
 Error generating stack: `+a.message+`
 `+a.stack}}var Vn=Object.prototype.hasOwnProperty,Ln=A.unstable_scheduleCallback,Kn=A.unstable_cancelCallback,Ud=A.unstable_shouldYield,Hd=A.unstable_requestPaint,kl=A.unstable_now,Nd=A.unstable_getCurrentPriorityLevel,hi=A.unstable_ImmediatePriority,gi=A.unstable_UserBlockingPriority,Ee=A.unstable_NormalPriority,Rd=A.unstable_LowPriority,Si=A.unstable_IdlePriority,qd=A.log,Cd=A.unstable_setDisableYieldValue,Da=null,Il=null;function Ft(l){if(typeof qd=="function"&&Cd(l),Il&&typeof Il.setStrictMode=="function")try{Il.setStrictMode(Da,l)}catch{}}var Pl=Math.clz32?Math.clz32:jd,Bd=Math.log,Yd=Math.LN2;function jd(l){return l>>>=0,l===0?32:31-(Bd(l)/Yd|0)|0}var Ae=256,_e=262144,Oe=4194304;function Au(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Me(l,t,u){var a=l.pendingLanes;if(a===0)return 0;var e=0,n=l.suspendedLanes,f=l.pingedLanes;l=l.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?e=Au(a):(f&=c,f!==0?e=Au(f):u||(u=c&~l,u!==0&&(e=Au(u))))):(c=a&~n,c!==0?e=Au(c):f!==0?e=Au(f):u||(u=a&~l,u!==0&&(e=Au(u)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,u=t&-t,n>=u||n===32&&(u&4194048)!==0)?t:e}function pa(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Gd(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function ri(){var l=Oe;return Oe<<=1,(Oe&62914560)===0&&(Oe=4194304),l}function Jn(l){for(var t=[],u=0;31>u;u++)t.push(l);return t}function Ua(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Xd(l,t,u,a,e,n){var f=l.pendingLanes;l.pendingLanes=u,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=u,l.entangledLanes&=u,l.errorRecoveryDisabledLanes&=u,l.shellSuspendCounter=0;var c=l.entanglements,i=l.expirationTimes,m=l.hiddenUpdates;for(u=f&~u;0<u;){var S=31-Pl(u),z=1<<S;c[S]=0,i[S]=-1;var h=m[S];if(h!==null)for(m[S]=null,S=0;S<h.length;S++){var g=h[S];g!==null&&(g.lane&=-536870913)}u&=~z}a!==0&&bi(l,a,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(f&~t))}function bi(l,t,u){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-Pl(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|u&261930}function zi(l,t){var u=l.entangledLanes|=t;for(l=l.entanglements;u;){var a=31-Pl(u),e=1<<a;e&t|l[a]&t&&(l[a]|=t),u&=~e}}function Ti(l,t){var u=t&-t;return u=(u&42)!==0?1:wn(u),(u&(l.suspendedLanes|t))!==0?0:u}function wn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function Wn(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Ei(){var l=O.p;return l!==0?l:(l=window.event,l===void 0?32:cd(l.type))}function Ai(l,t){var u=O.p;try{return O.p=l,t()}finally{O.p=u}}var kt=Math.random().toString(36).slice(2),Dl="__reactFiber$"+kt,Zl="__reactProps$"+kt,Zu="__reactContainer$"+kt,$n="__reactEvents$"+kt,Qd="__reactListeners$"+kt,xd="__reactHandles$"+kt,_i="__reactResources$"+kt,Ha="__reactMarker$"+kt;function Fn(l){delete l[Dl],delete l[Zl],delete l[$n],delete l[Qd],delete l[xd]}function Vu(l){var t=l[Dl];if(t)return t;for(var u=l.parentNode;u;){if(t=u[Zu]||u[Dl]){if(u=t.alternate,t.child!==null||u!==null&&u.child!==null)for(l=Ky(l);l!==null;){if(u=l[Dl])return u;l=Ky(l)}return t}l=u,u=l.parentNode}return null}function Lu(l){if(l=l[Dl]||l[Zu]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Na(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(o(33))}function Ku(l){var t=l[_i];return t||(t=l[_i]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Ol(l){l[Ha]=!0}var Oi=new Set,Mi={};function _u(l,t){Ju(l,t),Ju(l+"Capture",t)}function Ju(l,t){for(Mi[l]=t,l=0;l<t.length;l++)Oi.add(t[l])}var Zd=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Di={},pi={};function Vd(l){return Vn.call(pi,l)?!0:Vn.call(Di,l)?!1:Zd.test(l)?pi[l]=!0:(Di[l]=!0,!1)}function De(l,t,u){if(Vd(t))if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+u)}}function pe(l,t,u){if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+u)}}function Nt(l,t,u,a){if(a===null)l.removeAttribute(u);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(u);return}l.setAttributeNS(t,u,""+a)}}function it(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Ui(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Ld(l,t,u){var a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var e=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(f){u=""+f,n.call(this,f)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return u},setValue:function(f){u=""+f},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function kn(l){if(!l._valueTracker){var t=Ui(l)?"checked":"value";l._valueTracker=Ld(l,t,""+l[t])}}function Hi(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var u=t.getValue(),a="";return l&&(a=Ui(l)?l.checked?"true":"false":l.value),l=a,l!==u?(t.setValue(l),!0):!1}function Ue(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var Kd=/[\n"\\]/g;function st(l){return l.replace(Kd,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function In(l,t,u,a,e,n,f,c){l.name="",f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.type=f:l.removeAttribute("type"),t!=null?f==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+it(t)):l.value!==""+it(t)&&(l.value=""+it(t)):f!=="submit"&&f!=="reset"||l.removeAttribute("value"),t!=null?Pn(l,f,it(t)):u!=null?Pn(l,f,it(u)):a!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+it(c):l.removeAttribute("name")}function Ni(l,t,u,a,e,n,f,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||u!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){kn(l);return}u=u!=null?""+it(u):"",t=t!=null?""+it(t):u,c||t===l.value||(l.value=t),l.defaultValue=t}a=a??e,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=c?l.checked:!!a,l.defaultChecked=!!a,f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"&&(l.name=f),kn(l)}function Pn(l,t,u){t==="number"&&Ue(l.ownerDocument)===l||l.defaultValue===""+u||(l.defaultValue=""+u)}function wu(l,t,u,a){if(l=l.options,t){t={};for(var e=0;e<u.length;e++)t["$"+u[e]]=!0;for(u=0;u<l.length;u++)e=t.hasOwnProperty("$"+l[u].value),l[u].selected!==e&&(l[u].selected=e),e&&a&&(l[u].defaultSelected=!0)}else{for(u=""+it(u),t=null,e=0;e<l.length;e++){if(l[e].value===u){l[e].selected=!0,a&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Ri(l,t,u){if(t!=null&&(t=""+it(t),t!==l.value&&(l.value=t),u==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=u!=null?""+it(u):""}function qi(l,t,u,a){if(t==null){if(a!=null){if(u!=null)throw Error(o(92));if(rt(a)){if(1<a.length)throw Error(o(93));a=a[0]}u=a}u==null&&(u=""),t=u}u=it(t),l.defaultValue=u,a=l.textContent,a===u&&a!==""&&a!==null&&(l.value=a),kn(l)}function Wu(l,t){if(t){var u=l.firstChild;if(u&&u===l.lastChild&&u.nodeType===3){u.nodeValue=t;return}}l.textContent=t}var Jd=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Ci(l,t,u){var a=t.indexOf("--")===0;u==null||typeof u=="boolean"||u===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,u):typeof u!="number"||u===0||Jd.has(t)?t==="float"?l.cssFloat=u:l[t]=(""+u).trim():l[t]=u+"px"}function Bi(l,t,u){if(t!=null&&typeof t!="object")throw Error(o(62));if(l=l.style,u!=null){for(var a in u)!u.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var e in t)a=t[e],t.hasOwnProperty(e)&&u[e]!==a&&Ci(l,e,a)}else for(var n in t)t.hasOwnProperty(n)&&Ci(l,n,t[n])}function lf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wd=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Wd=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function He(l){return Wd.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Rt(){}var tf=null;function uf(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var $u=null,Fu=null;function Yi(l){var t=Lu(l);if(t&&(l=t.stateNode)){var u=l[Zl]||null;l:switch(l=t.stateNode,t.type){case"input":if(In(l,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name),t=u.name,u.type==="radio"&&t!=null){for(u=l;u.parentNode;)u=u.parentNode;for(u=u.querySelectorAll('input[name="'+st(""+t)+'"][type="radio"]'),t=0;t<u.length;t++){var a=u[t];if(a!==l&&a.form===l.form){var e=a[Zl]||null;if(!e)throw Error(o(90));In(a,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<u.length;t++)a=u[t],a.form===l.form&&Hi(a)}break l;case"textarea":Ri(l,u.value,u.defaultValue);break l;case"select":t=u.value,t!=null&&wu(l,!!u.multiple,t,!1)}}}var af=!1;function ji(l,t,u){if(af)return l(t,u);af=!0;try{var a=l(t);return a}finally{if(af=!1,($u!==null||Fu!==null)&&(rn(),$u&&(t=$u,l=Fu,Fu=$u=null,Yi(t),l)))for(t=0;t<l.length;t++)Yi(l[t])}}function Ra(l,t){var u=l.stateNode;if(u===null)return null;var a=u[Zl]||null;if(a===null)return null;u=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(u&&typeof u!="function")throw Error(o(231,t,typeof u));return u}var qt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ef=!1;if(qt)try{var qa={};Object.defineProperty(qa,"passive",{get:function(){ef=!0}}),window.addEventListener("test",qa,qa),window.removeEventListener("test",qa,qa)}catch{ef=!1}var It=null,nf=null,Ne=null;function Gi(){if(Ne)return Ne;var l,t=nf,u=t.length,a,e="value"in It?It.value:It.textContent,n=e.length;for(l=0;l<u&&t[l]===e[l];l++);var f=u-l;for(a=1;a<=f&&t[u-a]===e[n-a];a++);return Ne=e.slice(l,1<a?1-a:void 0)}function Re(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function qe(){return!0}function Xi(){return!1}function Vl(l){function t(u,a,e,n,f){this._reactName=u,this._targetInst=e,this.type=a,this.nativeEvent=n,this.target=f,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(u=l[c],this[c]=u?u(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?qe:Xi,this.isPropagationStopped=Xi,this}return q(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var u=this.nativeEvent;u&&(u.preventDefault?u.preventDefault():typeof u.returnValue!="unknown"&&(u.returnValue=!1),this.isDefaultPrevented=qe)},stopPropagation:function(){var u=this.nativeEvent;u&&(u.stopPropagation?u.stopPropagation():typeof u.cancelBubble!="unknown"&&(u.cancelBubble=!0),this.isPropagationStopped=qe)},persist:function(){},isPersistent:qe}),t}var Ou={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Ce=Vl(Ou),Ca=q({},Ou,{view:0,detail:0}),$d=Vl(Ca),ff,cf,Ba,Be=q({},Ca,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:yf,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Ba&&(Ba&&l.type==="mousemove"?(ff=l.screenX-Ba.screenX,cf=l.screenY-Ba.screenY):cf=ff=0,Ba=l),ff)},movementY:function(l){return"movementY"in l?l.movementY:cf}}),Qi=Vl(Be),Fd=q({},Be,{dataTransfer:0}),kd=Vl(Fd),Id=q({},Ca,{relatedTarget:0}),sf=Vl(Id),Pd=q({},Ou,{animationName:0,elapsedTime:0,pseudoElement:0}),lv=Vl(Pd),tv=q({},Ou,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),uv=Vl(tv),av=q({},Ou,{data:0}),xi=Vl(av),ev={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nv={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fv={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function cv(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=fv[l])?!!t[l]:!1}function yf(){return cv}var iv=q({},Ca,{key:function(l){if(l.key){var t=ev[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=Re(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?nv[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:yf,charCode:function(l){return l.type==="keypress"?Re(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?Re(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),sv=Vl(iv),yv=q({},Be,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Zi=Vl(yv),dv=q({},Ca,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:yf}),vv=Vl(dv),mv=q({},Ou,{propertyName:0,elapsedTime:0,pseudoElement:0}),ov=Vl(mv),hv=q({},Be,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),gv=Vl(hv),Sv=q({},Ou,{newState:0,oldState:0}),rv=Vl(Sv),bv=[9,13,27,32],df=qt&&"CompositionEvent"in window,Ya=null;qt&&"documentMode"in document&&(Ya=document.documentMode);var zv=qt&&"TextEvent"in window&&!Ya,Vi=qt&&(!df||Ya&&8<Ya&&11>=Ya),Li=" ",Ki=!1;function Ji(l,t){switch(l){case"keyup":return bv.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function wi(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var ku=!1;function Tv(l,t){switch(l){case"compositionend":return wi(t);case"keypress":return t.which!==32?null:(Ki=!0,Li);case"textInput":return l=t.data,l===Li&&Ki?null:l;default:return null}}function Ev(l,t){if(ku)return l==="compositionend"||!df&&Ji(l,t)?(l=Gi(),Ne=nf=It=null,ku=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Vi&&t.locale!=="ko"?null:t.data;default:return null}}var Av={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Av[l.type]:t==="textarea"}function $i(l,t,u,a){$u?Fu?Fu.push(a):Fu=[a]:$u=a,t=On(t,"onChange"),0<t.length&&(u=new Ce("onChange","change",null,u,a),l.push({event:u,listeners:t}))}var ja=null,Ga=null;function _v(l){Ny(l,0)}function Ye(l){var t=Na(l);if(Hi(t))return l}function Fi(l,t){if(l==="change")return t}var ki=!1;if(qt){var vf;if(qt){var mf="oninput"in document;if(!mf){var Ii=document.createElement("div");Ii.setAttribute("oninput","return;"),mf=typeof Ii.oninput=="function"}vf=mf}else vf=!1;ki=vf&&(!document.documentMode||9<document.documentMode)}function Pi(){ja&&(ja.detachEvent("onpropertychange",ls),Ga=ja=null)}function ls(l){if(l.propertyName==="value"&&Ye(Ga)){var t=[];$i(t,Ga,l,uf(l)),ji(_v,t)}}function Ov(l,t,u){l==="focusin"?(Pi(),ja=t,Ga=u,ja.attachEvent("onpropertychange",ls)):l==="focusout"&&Pi()}function Mv(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Ye(Ga)}function Dv(l,t){if(l==="click")return Ye(t)}function pv(l,t){if(l==="input"||l==="change")return Ye(t)}function Uv(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var lt=typeof Object.is=="function"?Object.is:Uv;function Xa(l,t){if(lt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var u=Object.keys(l),a=Object.keys(t);if(u.length!==a.length)return!1;for(a=0;a<u.length;a++){var e=u[a];if(!Vn.call(t,e)||!lt(l[e],t[e]))return!1}return!0}function ts(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function us(l,t){var u=ts(l);l=0;for(var a;u;){if(u.nodeType===3){if(a=l+u.textContent.length,l<=t&&a>=t)return{node:u,offset:t-l};l=a}l:{for(;u;){if(u.nextSibling){u=u.nextSibling;break l}u=u.parentNode}u=void 0}u=ts(u)}}function as(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?as(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function es(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ue(l.document);t instanceof l.HTMLIFrameElement;){try{var u=typeof t.contentWindow.location.href=="string"}catch{u=!1}if(u)l=t.contentWindow;else break;t=Ue(l.document)}return t}function of(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Hv=qt&&"documentMode"in document&&11>=document.documentMode,Iu=null,hf=null,Qa=null,gf=!1;function ns(l,t,u){var a=u.window===u?u.document:u.nodeType===9?u:u.ownerDocument;gf||Iu==null||Iu!==Ue(a)||(a=Iu,"selectionStart"in a&&of(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Qa&&Xa(Qa,a)||(Qa=a,a=On(hf,"onSelect"),0<a.length&&(t=new Ce("onSelect","select",null,t,u),l.push({event:t,listeners:a}),t.target=Iu)))}function Mu(l,t){var u={};return u[l.toLowerCase()]=t.toLowerCase(),u["Webkit"+l]="webkit"+t,u["Moz"+l]="moz"+t,u}var Pu={animationend:Mu("Animation","AnimationEnd"),animationiteration:Mu("Animation","AnimationIteration"),animationstart:Mu("Animation","AnimationStart"),transitionrun:Mu("Transition","TransitionRun"),transitionstart:Mu("Transition","TransitionStart"),transitioncancel:Mu("Transition","TransitionCancel"),transitionend:Mu("Transition","TransitionEnd")},Sf={},fs={};qt&&(fs=document.createElement("div").style,"AnimationEvent"in window||(delete Pu.animationend.animation,delete Pu.animationiteration.animation,delete Pu.animationstart.animation),"TransitionEvent"in window||delete Pu.transitionend.transition);function Du(l){if(Sf[l])return Sf[l];if(!Pu[l])return l;var t=Pu[l],u;for(u in t)if(t.hasOwnProperty(u)&&u in fs)return Sf[l]=t[u];return l}var cs=Du("animationend"),is=Du("animationiteration"),ss=Du("animationstart"),Nv=Du("transitionrun"),Rv=Du("transitionstart"),qv=Du("transitioncancel"),ys=Du("transitionend"),ds=new Map,rf="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");rf.push("scrollEnd");function bt(l,t){ds.set(l,t),_u(t,[l])}var je=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},yt=[],la=0,bf=0;function Ge(){for(var l=la,t=bf=la=0;t<l;){var u=yt[t];yt[t++]=null;var a=yt[t];yt[t++]=null;var e=yt[t];yt[t++]=null;var n=yt[t];if(yt[t++]=null,a!==null&&e!==null){var f=a.pending;f===null?e.next=e:(e.next=f.next,f.next=e),a.pending=e}n!==0&&vs(u,e,n)}}function Xe(l,t,u,a){yt[la++]=l,yt[la++]=t,yt[la++]=u,yt[la++]=a,bf|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function zf(l,t,u,a){return Xe(l,t,u,a),Qe(l)}function pu(l,t){return Xe(l,null,null,t),Qe(l)}function vs(l,t,u){l.lanes|=u;var a=l.alternate;a!==null&&(a.lanes|=u);for(var e=!1,n=l.return;n!==null;)n.childLanes|=u,a=n.alternate,a!==null&&(a.childLanes|=u),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-Pl(u),l=n.hiddenUpdates,a=l[e],a===null?l[e]=[t]:a.push(t),t.lane=u|536870912),n):null}function Qe(l){if(50<ie)throw ie=0,Uc=null,Error(o(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ta={};function Cv(l,t,u,a){this.tag=l,this.key=u,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function tt(l,t,u,a){return new Cv(l,t,u,a)}function Tf(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Ct(l,t){var u=l.alternate;return u===null?(u=tt(l.tag,t,l.key,l.mode),u.elementType=l.elementType,u.type=l.type,u.stateNode=l.stateNode,u.alternate=l,l.alternate=u):(u.pendingProps=t,u.type=l.type,u.flags=0,u.subtreeFlags=0,u.deletions=null),u.flags=l.flags&65011712,u.childLanes=l.childLanes,u.lanes=l.lanes,u.child=l.child,u.memoizedProps=l.memoizedProps,u.memoizedState=l.memoizedState,u.updateQueue=l.updateQueue,t=l.dependencies,u.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},u.sibling=l.sibling,u.index=l.index,u.ref=l.ref,u.refCleanup=l.refCleanup,u}function ms(l,t){l.flags&=65011714;var u=l.alternate;return u===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,t=u.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function xe(l,t,u,a,e,n){var f=0;if(a=l,typeof l=="function")Tf(l)&&(f=1);else if(typeof l=="string")f=Xm(l,u,p.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case At:return l=tt(31,u,t,e),l.elementType=At,l.lanes=n,l;case Bl:return Uu(u.children,e,n,t);case Ut:f=8,e|=24;break;case Fl:return l=tt(12,u,t,e|2),l.elementType=Fl,l.lanes=n,l;case Et:return l=tt(13,u,t,e),l.elementType=Et,l.lanes=n,l;case Xl:return l=tt(19,u,t,e),l.elementType=Xl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case ql:f=10;break l;case $t:f=9;break l;case ct:f=11;break l;case W:f=14;break l;case Ql:f=16,a=null;break l}f=29,u=Error(o(130,l===null?"null":typeof l,"")),a=null}return t=tt(f,u,t,e),t.elementType=l,t.type=a,t.lanes=n,t}function Uu(l,t,u,a){return l=tt(7,l,a,t),l.lanes=u,l}function Ef(l,t,u){return l=tt(6,l,null,t),l.lanes=u,l}function os(l){var t=tt(18,null,null,0);return t.stateNode=l,t}function Af(l,t,u){return t=tt(4,l.children!==null?l.children:[],l.key,t),t.lanes=u,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var hs=new WeakMap;function dt(l,t){if(typeof l=="object"&&l!==null){var u=hs.get(l);return u!==void 0?u:(t={value:l,source:t,stack:oi(t)},hs.set(l,t),t)}return{value:l,source:t,stack:oi(t)}}var ua=[],aa=0,Ze=null,xa=0,vt=[],mt=0,Pt=null,Ot=1,Mt="";function Bt(l,t){ua[aa++]=xa,ua[aa++]=Ze,Ze=l,xa=t}function gs(l,t,u){vt[mt++]=Ot,vt[mt++]=Mt,vt[mt++]=Pt,Pt=l;var a=Ot;l=Mt;var e=32-Pl(a)-1;a&=~(1<<e),u+=1;var n=32-Pl(t)+e;if(30<n){var f=e-e%5;n=(a&(1<<f)-1).toString(32),a>>=f,e-=f,Ot=1<<32-Pl(t)+e|u<<e|a,Mt=n+l}else Ot=1<<n|u<<e|a,Mt=l}function _f(l){l.return!==null&&(Bt(l,1),gs(l,1,0))}function Of(l){for(;l===Ze;)Ze=ua[--aa],ua[aa]=null,xa=ua[--aa],ua[aa]=null;for(;l===Pt;)Pt=vt[--mt],vt[mt]=null,Mt=vt[--mt],vt[mt]=null,Ot=vt[--mt],vt[mt]=null}function Ss(l,t){vt[mt++]=Ot,vt[mt++]=Mt,vt[mt++]=Pt,Ot=t.id,Mt=t.overflow,Pt=l}var pl=null,yl=null,$=!1,lu=null,ot=!1,Mf=Error(o(519));function tu(l){var t=Error(o(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw Za(dt(t,l)),Mf}function rs(l){var t=l.stateNode,u=l.type,a=l.memoizedProps;switch(t[Dl]=l,t[Zl]=a,u){case"dialog":L("cancel",t),L("close",t);break;case"iframe":case"object":case"embed":L("load",t);break;case"video":case"audio":for(u=0;u<ye.length;u++)L(ye[u],t);break;case"source":L("error",t);break;case"img":case"image":case"link":L("error",t),L("load",t);break;case"details":L("toggle",t);break;case"input":L("invalid",t),Ni(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":L("invalid",t);break;case"textarea":L("invalid",t),qi(t,a.value,a.defaultValue,a.children)}u=a.children,typeof u!="string"&&typeof u!="number"&&typeof u!="bigint"||t.textContent===""+u||a.suppressHydrationWarning===!0||By(t.textContent,u)?(a.popover!=null&&(L("beforetoggle",t),L("toggle",t)),a.onScroll!=null&&L("scroll",t),a.onScrollEnd!=null&&L("scrollend",t),a.onClick!=null&&(t.onclick=Rt),t=!0):t=!1,t||tu(l,!0)}function bs(l){for(pl=l.return;pl;)switch(pl.tag){case 5:case 31:case 13:ot=!1;return;case 27:case 3:ot=!0;return;default:pl=pl.return}}function ea(l){if(l!==pl)return!1;if(!$)return bs(l),$=!0,!1;var t=l.tag,u;if((u=t!==3&&t!==27)&&((u=t===5)&&(u=l.type,u=!(u!=="form"&&u!=="button")||Lc(l.type,l.memoizedProps)),u=!u),u&&yl&&tu(l),bs(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(o(317));yl=Ly(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(o(317));yl=Ly(l)}else t===27?(t=yl,hu(l.type)?(l=$c,$c=null,yl=l):yl=t):yl=pl?gt(l.stateNode.nextSibling):null;return!0}function Hu(){yl=pl=null,$=!1}function Df(){var l=lu;return l!==null&&(wl===null?wl=l:wl.push.apply(wl,l),lu=null),l}function Za(l){lu===null?lu=[l]:lu.push(l)}var pf=y(null),Nu=null,Yt=null;function uu(l,t,u){M(pf,t._currentValue),t._currentValue=u}function jt(l){l._currentValue=pf.current,T(pf)}function Uf(l,t,u){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===u)break;l=l.return}}function Hf(l,t,u,a){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var f=e.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=e;for(var i=0;i<t.length;i++)if(c.context===t[i]){n.lanes|=u,c=n.alternate,c!==null&&(c.lanes|=u),Uf(n.return,u,l),a||(f=null);break l}n=c.next}}else if(e.tag===18){if(f=e.return,f===null)throw Error(o(341));f.lanes|=u,n=f.alternate,n!==null&&(n.lanes|=u),Uf(f,u,l),f=null}else f=e.child;if(f!==null)f.return=e;else for(f=e;f!==null;){if(f===l){f=null;break}if(e=f.sibling,e!==null){e.return=f.return,f=e;break}f=f.return}e=f}}function na(l,t,u,a){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var f=e.alternate;if(f===null)throw Error(o(387));if(f=f.memoizedProps,f!==null){var c=e.type;lt(e.pendingProps.value,f.value)||(l!==null?l.push(c):l=[c])}}else if(e===ll.current){if(f=e.alternate,f===null)throw Error(o(387));f.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(he):l=[he])}e=e.return}l!==null&&Hf(t,l,u,a),t.flags|=262144}function Ve(l){for(l=l.firstContext;l!==null;){if(!lt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Ru(l){Nu=l,Yt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Ul(l){return zs(Nu,l)}function Le(l,t){return Nu===null&&Ru(l),zs(l,t)}function zs(l,t){var u=t._currentValue;if(t={context:t,memoizedValue:u,next:null},Yt===null){if(l===null)throw Error(o(308));Yt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Yt=Yt.next=t;return u}var Bv=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(u,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(u){return u()})}},Yv=A.unstable_scheduleCallback,jv=A.unstable_NormalPriority,bl={$$typeof:ql,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Nf(){return{controller:new Bv,data:new Map,refCount:0}}function Va(l){l.refCount--,l.refCount===0&&Yv(jv,function(){l.controller.abort()})}var La=null,Rf=0,fa=0,ca=null;function Gv(l,t){if(La===null){var u=La=[];Rf=0,fa=Bc(),ca={status:"pending",value:void 0,then:function(a){u.push(a)}}}return Rf++,t.then(Ts,Ts),t}function Ts(){if(--Rf===0&&La!==null){ca!==null&&(ca.status="fulfilled");var l=La;La=null,fa=0,ca=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Xv(l,t){var u=[],a={status:"pending",value:null,reason:null,then:function(e){u.push(e)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var e=0;e<u.length;e++)(0,u[e])(t)},function(e){for(a.status="rejected",a.reason=e,e=0;e<u.length;e++)(0,u[e])(void 0)}),a}var Es=r.S;r.S=function(l,t){ny=kl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Gv(l,t),Es!==null&&Es(l,t)};var qu=y(null);function qf(){var l=qu.current;return l!==null?l:sl.pooledCache}function Ke(l,t){t===null?M(qu,qu.current):M(qu,t.pool)}function As(){var l=qf();return l===null?null:{parent:bl._currentValue,pool:l}}var ia=Error(o(460)),Cf=Error(o(474)),Je=Error(o(542)),we={then:function(){}};function _s(l){return l=l.status,l==="fulfilled"||l==="rejected"}function Os(l,t,u){switch(u=l[u],u===void 0?l.push(t):u!==t&&(t.then(Rt,Rt),t=u),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Ds(l),l;default:if(typeof t.status=="string")t.then(Rt,Rt);else{if(l=sl,l!==null&&100<l.shellSuspendCounter)throw Error(o(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=a}},function(a){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Ds(l),l}throw Bu=t,ia}}function Cu(l){try{var t=l._init;return t(l._payload)}catch(u){throw u!==null&&typeof u=="object"&&typeof u.then=="function"?(Bu=u,ia):u}}var Bu=null;function Ms(){if(Bu===null)throw Error(o(459));var l=Bu;return Bu=null,l}function Ds(l){if(l===ia||l===Je)throw Error(o(483))}var sa=null,Ka=0;function We(l){var t=Ka;return Ka+=1,sa===null&&(sa=[]),Os(sa,l,t)}function Ja(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function $e(l,t){throw t.$$typeof===vl?Error(o(525)):(l=Object.prototype.toString.call(t),Error(o(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function ps(l){function t(d,s){if(l){var v=d.deletions;v===null?(d.deletions=[s],d.flags|=16):v.push(s)}}function u(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function a(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function e(d,s){return d=Ct(d,s),d.index=0,d.sibling=null,d}function n(d,s,v){return d.index=v,l?(v=d.alternate,v!==null?(v=v.index,v<s?(d.flags|=67108866,s):v):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function f(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function c(d,s,v,b){return s===null||s.tag!==6?(s=Ef(v,d.mode,b),s.return=d,s):(s=e(s,v),s.return=d,s)}function i(d,s,v,b){var H=v.type;return H===Bl?S(d,s,v.props.children,b,v.key):s!==null&&(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===Ql&&Cu(H)===s.type)?(s=e(s,v.props),Ja(s,v),s.return=d,s):(s=xe(v.type,v.key,v.props,null,d.mode,b),Ja(s,v),s.return=d,s)}function m(d,s,v,b){return s===null||s.tag!==4||s.stateNode.containerInfo!==v.containerInfo||s.stateNode.implementation!==v.implementation?(s=Af(v,d.mode,b),s.return=d,s):(s=e(s,v.children||[]),s.return=d,s)}function S(d,s,v,b,H){return s===null||s.tag!==7?(s=Uu(v,d.mode,b,H),s.return=d,s):(s=e(s,v),s.return=d,s)}function z(d,s,v){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Ef(""+s,d.mode,v),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case $l:return v=xe(s.type,s.key,s.props,null,d.mode,v),Ja(v,s),v.return=d,v;case Gl:return s=Af(s,d.mode,v),s.return=d,s;case Ql:return s=Cu(s),z(d,s,v)}if(rt(s)||xl(s))return s=Uu(s,d.mode,v,null),s.return=d,s;if(typeof s.then=="function")return z(d,We(s),v);if(s.$$typeof===ql)return z(d,Le(d,s),v);$e(d,s)}return null}function h(d,s,v,b){var H=s!==null?s.key:null;if(typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint")return H!==null?null:c(d,s,""+v,b);if(typeof v=="object"&&v!==null){switch(v.$$typeof){case $l:return v.key===H?i(d,s,v,b):null;case Gl:return v.key===H?m(d,s,v,b):null;case Ql:return v=Cu(v),h(d,s,v,b)}if(rt(v)||xl(v))return H!==null?null:S(d,s,v,b,null);if(typeof v.then=="function")return h(d,s,We(v),b);if(v.$$typeof===ql)return h(d,s,Le(d,v),b);$e(d,v)}return null}function g(d,s,v,b,H){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return d=d.get(v)||null,c(s,d,""+b,H);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case $l:return d=d.get(b.key===null?v:b.key)||null,i(s,d,b,H);case Gl:return d=d.get(b.key===null?v:b.key)||null,m(s,d,b,H);case Ql:return b=Cu(b),g(d,s,v,b,H)}if(rt(b)||xl(b))return d=d.get(v)||null,S(s,d,b,H,null);if(typeof b.then=="function")return g(d,s,v,We(b),H);if(b.$$typeof===ql)return g(d,s,v,Le(s,b),H);$e(s,b)}return null}function D(d,s,v,b){for(var H=null,F=null,U=s,Q=s=0,w=null;U!==null&&Q<v.length;Q++){U.index>Q?(w=U,U=null):w=U.sibling;var k=h(d,U,v[Q],b);if(k===null){U===null&&(U=w);break}l&&U&&k.alternate===null&&t(d,U),s=n(k,s,Q),F===null?H=k:F.sibling=k,F=k,U=w}if(Q===v.length)return u(d,U),$&&Bt(d,Q),H;if(U===null){for(;Q<v.length;Q++)U=z(d,v[Q],b),U!==null&&(s=n(U,s,Q),F===null?H=U:F.sibling=U,F=U);return $&&Bt(d,Q),H}for(U=a(U);Q<v.length;Q++)w=g(U,d,Q,v[Q],b),w!==null&&(l&&w.alternate!==null&&U.delete(w.key===null?Q:w.key),s=n(w,s,Q),F===null?H=w:F.sibling=w,F=w);return l&&U.forEach(function(zu){return t(d,zu)}),$&&Bt(d,Q),H}function R(d,s,v,b){if(v==null)throw Error(o(151));for(var H=null,F=null,U=s,Q=s=0,w=null,k=v.next();U!==null&&!k.done;Q++,k=v.next()){U.index>Q?(w=U,U=null):w=U.sibling;var zu=h(d,U,k.value,b);if(zu===null){U===null&&(U=w);break}l&&U&&zu.alternate===null&&t(d,U),s=n(zu,s,Q),F===null?H=zu:F.sibling=zu,F=zu,U=w}if(k.done)return u(d,U),$&&Bt(d,Q),H;if(U===null){for(;!k.done;Q++,k=v.next())k=z(d,k.value,b),k!==null&&(s=n(k,s,Q),F===null?H=k:F.sibling=k,F=k);return $&&Bt(d,Q),H}for(U=a(U);!k.done;Q++,k=v.next())k=g(U,d,Q,k.value,b),k!==null&&(l&&k.alternate!==null&&U.delete(k.key===null?Q:k.key),s=n(k,s,Q),F===null?H=k:F.sibling=k,F=k);return l&&U.forEach(function(Fm){return t(d,Fm)}),$&&Bt(d,Q),H}function fl(d,s,v,b){if(typeof v=="object"&&v!==null&&v.type===Bl&&v.key===null&&(v=v.props.children),typeof v=="object"&&v!==null){switch(v.$$typeof){case $l:l:{for(var H=v.key;s!==null;){if(s.key===H){if(H=v.type,H===Bl){if(s.tag===7){u(d,s.sibling),b=e(s,v.props.children),b.return=d,d=b;break l}}else if(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===Ql&&Cu(H)===s.type){u(d,s.sibling),b=e(s,v.props),Ja(b,v),b.return=d,d=b;break l}u(d,s);break}else t(d,s);s=s.sibling}v.type===Bl?(b=Uu(v.props.children,d.mode,b,v.key),b.return=d,d=b):(b=xe(v.type,v.key,v.props,null,d.mode,b),Ja(b,v),b.return=d,d=b)}return f(d);case Gl:l:{for(H=v.key;s!==null;){if(s.key===H)if(s.tag===4&&s.stateNode.containerInfo===v.containerInfo&&s.stateNode.implementation===v.implementation){u(d,s.sibling),b=e(s,v.children||[]),b.return=d,d=b;break l}else{u(d,s);break}else t(d,s);s=s.sibling}b=Af(v,d.mode,b),b.return=d,d=b}return f(d);case Ql:return v=Cu(v),fl(d,s,v,b)}if(rt(v))return D(d,s,v,b);if(xl(v)){if(H=xl(v),typeof H!="function")throw Error(o(150));return v=H.call(v),R(d,s,v,b)}if(typeof v.then=="function")return fl(d,s,We(v),b);if(v.$$typeof===ql)return fl(d,s,Le(d,v),b);$e(d,v)}return typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint"?(v=""+v,s!==null&&s.tag===6?(u(d,s.sibling),b=e(s,v),b.return=d,d=b):(u(d,s),b=Ef(v,d.mode,b),b.return=d,d=b),f(d)):u(d,s)}return function(d,s,v,b){try{Ka=0;var H=fl(d,s,v,b);return sa=null,H}catch(U){if(U===ia||U===Je)throw U;var F=tt(29,U,null,d.mode);return F.lanes=b,F.return=d,F}finally{}}}var Yu=ps(!0),Us=ps(!1),au=!1;function Bf(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Yf(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function eu(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function nu(l,t,u){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,(I&2)!==0){var e=a.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),a.pending=t,t=Qe(l),vs(l,null,u),t}return Xe(l,a,t,u),Qe(l)}function wa(l,t,u){if(t=t.updateQueue,t!==null&&(t=t.shared,(u&4194048)!==0)){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,zi(l,u)}}function jf(l,t){var u=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,u===a)){var e=null,n=null;if(u=u.firstBaseUpdate,u!==null){do{var f={lane:u.lane,tag:u.tag,payload:u.payload,callback:null,next:null};n===null?e=n=f:n=n.next=f,u=u.next}while(u!==null);n===null?e=n=t:n=n.next=t}else e=n=t;u={baseState:a.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=u;return}l=u.lastBaseUpdate,l===null?u.firstBaseUpdate=t:l.next=t,u.lastBaseUpdate=t}var Gf=!1;function Wa(){if(Gf){var l=ca;if(l!==null)throw l}}function $a(l,t,u,a){Gf=!1;var e=l.updateQueue;au=!1;var n=e.firstBaseUpdate,f=e.lastBaseUpdate,c=e.shared.pending;if(c!==null){e.shared.pending=null;var i=c,m=i.next;i.next=null,f===null?n=m:f.next=m,f=i;var S=l.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==f&&(c===null?S.firstBaseUpdate=m:c.next=m,S.lastBaseUpdate=i))}if(n!==null){var z=e.baseState;f=0,S=m=i=null,c=n;do{var h=c.lane&-536870913,g=h!==c.lane;if(g?(J&h)===h:(a&h)===h){h!==0&&h===fa&&(Gf=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var D=l,R=c;h=t;var fl=u;switch(R.tag){case 1:if(D=R.payload,typeof D=="function"){z=D.call(fl,z,h);break l}z=D;break l;case 3:D.flags=D.flags&-65537|128;case 0:if(D=R.payload,h=typeof D=="function"?D.call(fl,z,h):D,h==null)break l;z=q({},z,h);break l;case 2:au=!0}}h=c.callback,h!==null&&(l.flags|=64,g&&(l.flags|=8192),g=e.callbacks,g===null?e.callbacks=[h]:g.push(h))}else g={lane:h,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(m=S=g,i=z):S=S.next=g,f|=h;if(c=c.next,c===null){if(c=e.shared.pending,c===null)break;g=c,c=g.next,g.next=null,e.lastBaseUpdate=g,e.shared.pending=null}}while(!0);S===null&&(i=z),e.baseState=i,e.firstBaseUpdate=m,e.lastBaseUpdate=S,n===null&&(e.shared.lanes=0),yu|=f,l.lanes=f,l.memoizedState=z}}function Hs(l,t){if(typeof l!="function")throw Error(o(191,l));l.call(t)}function Ns(l,t){var u=l.callbacks;if(u!==null)for(l.callbacks=null,l=0;l<u.length;l++)Hs(u[l],t)}var ya=y(null),Fe=y(0);function Rs(l,t){l=Jt,M(Fe,l),M(ya,t),Jt=l|t.baseLanes}function Xf(){M(Fe,Jt),M(ya,ya.current)}function Qf(){Jt=Fe.current,T(ya),T(Fe)}var ut=y(null),ht=null;function fu(l){var t=l.alternate;M(Sl,Sl.current&1),M(ut,l),ht===null&&(t===null||ya.current!==null||t.memoizedState!==null)&&(ht=l)}function xf(l){M(Sl,Sl.current),M(ut,l),ht===null&&(ht=l)}function qs(l){l.tag===22?(M(Sl,Sl.current),M(ut,l),ht===null&&(ht=l)):cu()}function cu(){M(Sl,Sl.current),M(ut,ut.current)}function at(l){T(ut),ht===l&&(ht=null),T(Sl)}var Sl=y(0);function ke(l){for(var t=l;t!==null;){if(t.tag===13){var u=t.memoizedState;if(u!==null&&(u=u.dehydrated,u===null||wc(u)||Wc(u)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Gt=0,X=null,el=null,zl=null,Ie=!1,da=!1,ju=!1,Pe=0,Fa=0,va=null,Qv=0;function ol(){throw Error(o(321))}function Zf(l,t){if(t===null)return!1;for(var u=0;u<t.length&&u<l.length;u++)if(!lt(l[u],t[u]))return!1;return!0}function Vf(l,t,u,a,e,n){return Gt=n,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,r.H=l===null||l.memoizedState===null?g0:ec,ju=!1,n=u(a,e),ju=!1,da&&(n=Bs(t,u,a,e)),Cs(l),n}function Cs(l){r.H=Pa;var t=el!==null&&el.next!==null;if(Gt=0,zl=el=X=null,Ie=!1,Fa=0,va=null,t)throw Error(o(300));l===null||Tl||(l=l.dependencies,l!==null&&Ve(l)&&(Tl=!0))}function Bs(l,t,u,a){X=l;var e=0;do{if(da&&(va=null),Fa=0,da=!1,25<=e)throw Error(o(301));if(e+=1,zl=el=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}r.H=S0,n=t(u,a)}while(da);return n}function xv(){var l=r.H,t=l.useState()[0];return t=typeof t.then=="function"?ka(t):t,l=l.useState()[0],(el!==null?el.memoizedState:null)!==l&&(X.flags|=1024),t}function Lf(){var l=Pe!==0;return Pe=0,l}function Kf(l,t,u){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~u}function Jf(l){if(Ie){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}Ie=!1}Gt=0,zl=el=X=null,da=!1,Fa=Pe=0,va=null}function jl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return zl===null?X.memoizedState=zl=l:zl=zl.next=l,zl}function rl(){if(el===null){var l=X.alternate;l=l!==null?l.memoizedState:null}else l=el.next;var t=zl===null?X.memoizedState:zl.next;if(t!==null)zl=t,el=l;else{if(l===null)throw X.alternate===null?Error(o(467)):Error(o(310));el=l,l={memoizedState:el.memoizedState,baseState:el.baseState,baseQueue:el.baseQueue,queue:el.queue,next:null},zl===null?X.memoizedState=zl=l:zl=zl.next=l}return zl}function ln(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function ka(l){var t=Fa;return Fa+=1,va===null&&(va=[]),l=Os(va,l,t),t=X,(zl===null?t.memoizedState:zl.next)===null&&(t=t.alternate,r.H=t===null||t.memoizedState===null?g0:ec),l}function tn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return ka(l);if(l.$$typeof===ql)return Ul(l)}throw Error(o(438,String(l)))}function wf(l){var t=null,u=X.updateQueue;if(u!==null&&(t=u.memoCache),t==null){var a=X.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),u===null&&(u=ln(),X.updateQueue=u),u.memoCache=t,u=t.data[t.index],u===void 0)for(u=t.data[t.index]=Array(l),a=0;a<l;a++)u[a]=xu;return t.index++,u}function Xt(l,t){return typeof t=="function"?t(l):t}function un(l){var t=rl();return Wf(t,el,l)}function Wf(l,t,u){var a=l.queue;if(a===null)throw Error(o(311));a.lastRenderedReducer=u;var e=l.baseQueue,n=a.pending;if(n!==null){if(e!==null){var f=e.next;e.next=n.next,n.next=f}t.baseQueue=e=n,a.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var c=f=null,i=null,m=t,S=!1;do{var z=m.lane&-536870913;if(z!==m.lane?(J&z)===z:(Gt&z)===z){var h=m.revertLane;if(h===0)i!==null&&(i=i.next={lane:0,revertLane:0,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null}),z===fa&&(S=!0);else if((Gt&h)===h){m=m.next,h===fa&&(S=!0);continue}else z={lane:0,revertLane:m.revertLane,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=z,f=n):i=i.next=z,X.lanes|=h,yu|=h;z=m.action,ju&&u(n,z),n=m.hasEagerState?m.eagerState:u(n,z)}else h={lane:z,revertLane:m.revertLane,gesture:m.gesture,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=h,f=n):i=i.next=h,X.lanes|=z,yu|=z;m=m.next}while(m!==null&&m!==t);if(i===null?f=n:i.next=c,!lt(n,l.memoizedState)&&(Tl=!0,S&&(u=ca,u!==null)))throw u;l.memoizedState=n,l.baseState=f,l.baseQueue=i,a.lastRenderedState=n}return e===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function $f(l){var t=rl(),u=t.queue;if(u===null)throw Error(o(311));u.lastRenderedReducer=l;var a=u.dispatch,e=u.pending,n=t.memoizedState;if(e!==null){u.pending=null;var f=e=e.next;do n=l(n,f.action),f=f.next;while(f!==e);lt(n,t.memoizedState)||(Tl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),u.lastRenderedState=n}return[n,a]}function Ys(l,t,u){var a=X,e=rl(),n=$;if(n){if(u===void 0)throw Error(o(407));u=u()}else u=t();var f=!lt((el||e).memoizedState,u);if(f&&(e.memoizedState=u,Tl=!0),e=e.queue,If(Xs.bind(null,a,e,l),[l]),e.getSnapshot!==t||f||zl!==null&&zl.memoizedState.tag&1){if(a.flags|=2048,ma(9,{destroy:void 0},Gs.bind(null,a,e,u,t),null),sl===null)throw Error(o(349));n||(Gt&127)!==0||js(a,t,u)}return u}function js(l,t,u){l.flags|=16384,l={getSnapshot:t,value:u},t=X.updateQueue,t===null?(t=ln(),X.updateQueue=t,t.stores=[l]):(u=t.stores,u===null?t.stores=[l]:u.push(l))}function Gs(l,t,u,a){t.value=u,t.getSnapshot=a,Qs(t)&&xs(l)}function Xs(l,t,u){return u(function(){Qs(t)&&xs(l)})}function Qs(l){var t=l.getSnapshot;l=l.value;try{var u=t();return!lt(l,u)}catch{return!0}}function xs(l){var t=pu(l,2);t!==null&&Wl(t,l,2)}function Ff(l){var t=jl();if(typeof l=="function"){var u=l;if(l=u(),ju){Ft(!0);try{u()}finally{Ft(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Xt,lastRenderedState:l},t}function Zs(l,t,u,a){return l.baseState=u,Wf(l,el,typeof a=="function"?a:Xt)}function Zv(l,t,u,a,e){if(nn(l))throw Error(o(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(f){n.listeners.push(f)}};r.T!==null?u(!0):n.isTransition=!1,a(n),u=t.pending,u===null?(n.next=t.pending=n,Vs(t,n)):(n.next=u.next,t.pending=u.next=n)}}function Vs(l,t){var u=t.action,a=t.payload,e=l.state;if(t.isTransition){var n=r.T,f={};r.T=f;try{var c=u(e,a),i=r.S;i!==null&&i(f,c),Ls(l,t,c)}catch(m){kf(l,t,m)}finally{n!==null&&f.types!==null&&(n.types=f.types),r.T=n}}else try{n=u(e,a),Ls(l,t,n)}catch(m){kf(l,t,m)}}function Ls(l,t,u){u!==null&&typeof u=="object"&&typeof u.then=="function"?u.then(function(a){Ks(l,t,a)},function(a){return kf(l,t,a)}):Ks(l,t,u)}function Ks(l,t,u){t.status="fulfilled",t.value=u,Js(t),l.state=u,t=l.pending,t!==null&&(u=t.next,u===t?l.pending=null:(u=u.next,t.next=u,Vs(l,u)))}function kf(l,t,u){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=u,Js(t),t=t.next;while(t!==a)}l.action=null}function Js(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function ws(l,t){return t}function Ws(l,t){if($){var u=sl.formState;if(u!==null){l:{var a=X;if($){if(yl){t:{for(var e=yl,n=ot;e.nodeType!==8;){if(!n){e=null;break t}if(e=gt(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){yl=gt(e.nextSibling),a=e.data==="F!";break l}}tu(a)}a=!1}a&&(t=u[0])}}return u=jl(),u.memoizedState=u.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ws,lastRenderedState:t},u.queue=a,u=m0.bind(null,X,a),a.dispatch=u,a=Ff(!1),n=ac.bind(null,X,!1,a.queue),a=jl(),e={state:t,dispatch:null,action:l,pending:null},a.queue=e,u=Zv.bind(null,X,e,n,u),e.dispatch=u,a.memoizedState=l,[t,u,!1]}function $s(l){var t=rl();return Fs(t,el,l)}function Fs(l,t,u){if(t=Wf(l,t,ws)[0],l=un(Xt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=ka(t)}catch(f){throw f===ia?Je:f}else a=t;t=rl();var e=t.queue,n=e.dispatch;return u!==t.memoizedState&&(X.flags|=2048,ma(9,{destroy:void 0},Vv.bind(null,e,u),null)),[a,n,l]}function Vv(l,t){l.action=t}function ks(l){var t=rl(),u=el;if(u!==null)return Fs(t,u,l);rl(),t=t.memoizedState,u=rl();var a=u.queue.dispatch;return u.memoizedState=l,[t,a,!1]}function ma(l,t,u,a){return l={tag:l,create:u,deps:a,inst:t,next:null},t=X.updateQueue,t===null&&(t=ln(),X.updateQueue=t),u=t.lastEffect,u===null?t.lastEffect=l.next=l:(a=u.next,u.next=l,l.next=a,t.lastEffect=l),l}function Is(){return rl().memoizedState}function an(l,t,u,a){var e=jl();X.flags|=l,e.memoizedState=ma(1|t,{destroy:void 0},u,a===void 0?null:a)}function en(l,t,u,a){var e=rl();a=a===void 0?null:a;var n=e.memoizedState.inst;el!==null&&a!==null&&Zf(a,el.memoizedState.deps)?e.memoizedState=ma(t,n,u,a):(X.flags|=l,e.memoizedState=ma(1|t,n,u,a))}function Ps(l,t){an(8390656,8,l,t)}function If(l,t){en(2048,8,l,t)}function Lv(l){X.flags|=4;var t=X.updateQueue;if(t===null)t=ln(),X.updateQueue=t,t.events=[l];else{var u=t.events;u===null?t.events=[l]:u.push(l)}}function l0(l){var t=rl().memoizedState;return Lv({ref:t,nextImpl:l}),function(){if((I&2)!==0)throw Error(o(440));return t.impl.apply(void 0,arguments)}}function t0(l,t){return en(4,2,l,t)}function u0(l,t){return en(4,4,l,t)}function a0(l,t){if(typeof t=="function"){l=l();var u=t(l);return function(){typeof u=="function"?u():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function e0(l,t,u){u=u!=null?u.concat([l]):null,en(4,4,a0.bind(null,t,l),u)}function Pf(){}function n0(l,t){var u=rl();t=t===void 0?null:t;var a=u.memoizedState;return t!==null&&Zf(t,a[1])?a[0]:(u.memoizedState=[l,t],l)}function f0(l,t){var u=rl();t=t===void 0?null:t;var a=u.memoizedState;if(t!==null&&Zf(t,a[1]))return a[0];if(a=l(),ju){Ft(!0);try{l()}finally{Ft(!1)}}return u.memoizedState=[a,t],a}function lc(l,t,u){return u===void 0||(Gt&1073741824)!==0&&(J&261930)===0?l.memoizedState=t:(l.memoizedState=u,l=cy(),X.lanes|=l,yu|=l,u)}function c0(l,t,u,a){return lt(u,t)?u:ya.current!==null?(l=lc(l,u,a),lt(l,t)||(Tl=!0),l):(Gt&42)===0||(Gt&1073741824)!==0&&(J&261930)===0?(Tl=!0,l.memoizedState=u):(l=cy(),X.lanes|=l,yu|=l,t)}function i0(l,t,u,a,e){var n=O.p;O.p=n!==0&&8>n?n:8;var f=r.T,c={};r.T=c,ac(l,!1,t,u);try{var i=e(),m=r.S;if(m!==null&&m(c,i),i!==null&&typeof i=="object"&&typeof i.then=="function"){var S=Xv(i,a);Ia(l,t,S,ft(l))}else Ia(l,t,a,ft(l))}catch(z){Ia(l,t,{then:function(){},status:"rejected",reason:z},ft())}finally{O.p=n,f!==null&&c.types!==null&&(f.types=c.types),r.T=f}}function Kv(){}function tc(l,t,u,a){if(l.tag!==5)throw Error(o(476));var e=s0(l).queue;i0(l,e,t,C,u===null?Kv:function(){return y0(l),u(a)})}function s0(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:C,baseState:C,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Xt,lastRenderedState:C},next:null};var u={};return t.next={memoizedState:u,baseState:u,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Xt,lastRenderedState:u},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function y0(l){var t=s0(l);t.next===null&&(t=l.alternate.memoizedState),Ia(l,t.next.queue,{},ft())}function uc(){return Ul(he)}function d0(){return rl().memoizedState}function v0(){return rl().memoizedState}function Jv(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var u=ft();l=eu(u);var a=nu(t,l,u);a!==null&&(Wl(a,t,u),wa(a,t,u)),t={cache:Nf()},l.payload=t;return}t=t.return}}function wv(l,t,u){var a=ft();u={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},nn(l)?o0(t,u):(u=zf(l,t,u,a),u!==null&&(Wl(u,l,a),h0(u,t,a)))}function m0(l,t,u){var a=ft();Ia(l,t,u,a)}function Ia(l,t,u,a){var e={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null};if(nn(l))o0(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var f=t.lastRenderedState,c=n(f,u);if(e.hasEagerState=!0,e.eagerState=c,lt(c,f))return Xe(l,t,e,0),sl===null&&Ge(),!1}catch{}finally{}if(u=zf(l,t,e,a),u!==null)return Wl(u,l,a),h0(u,t,a),!0}return!1}function ac(l,t,u,a){if(a={lane:2,revertLane:Bc(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},nn(l)){if(t)throw Error(o(479))}else t=zf(l,u,a,2),t!==null&&Wl(t,l,2)}function nn(l){var t=l.alternate;return l===X||t!==null&&t===X}function o0(l,t){da=Ie=!0;var u=l.pending;u===null?t.next=t:(t.next=u.next,u.next=t),l.pending=t}function h0(l,t,u){if((u&4194048)!==0){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,zi(l,u)}}var Pa={readContext:Ul,use:tn,useCallback:ol,useContext:ol,useEffect:ol,useImperativeHandle:ol,useLayoutEffect:ol,useInsertionEffect:ol,useMemo:ol,useReducer:ol,useRef:ol,useState:ol,useDebugValue:ol,useDeferredValue:ol,useTransition:ol,useSyncExternalStore:ol,useId:ol,useHostTransitionStatus:ol,useFormState:ol,useActionState:ol,useOptimistic:ol,useMemoCache:ol,useCacheRefresh:ol};Pa.useEffectEvent=ol;var g0={readContext:Ul,use:tn,useCallback:function(l,t){return jl().memoizedState=[l,t===void 0?null:t],l},useContext:Ul,useEffect:Ps,useImperativeHandle:function(l,t,u){u=u!=null?u.concat([l]):null,an(4194308,4,a0.bind(null,t,l),u)},useLayoutEffect:function(l,t){return an(4194308,4,l,t)},useInsertionEffect:function(l,t){an(4,2,l,t)},useMemo:function(l,t){var u=jl();t=t===void 0?null:t;var a=l();if(ju){Ft(!0);try{l()}finally{Ft(!1)}}return u.memoizedState=[a,t],a},useReducer:function(l,t,u){var a=jl();if(u!==void 0){var e=u(t);if(ju){Ft(!0);try{u(t)}finally{Ft(!1)}}}else e=t;return a.memoizedState=a.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},a.queue=l,l=l.dispatch=wv.bind(null,X,l),[a.memoizedState,l]},useRef:function(l){var t=jl();return l={current:l},t.memoizedState=l},useState:function(l){l=Ff(l);var t=l.queue,u=m0.bind(null,X,t);return t.dispatch=u,[l.memoizedState,u]},useDebugValue:Pf,useDeferredValue:function(l,t){var u=jl();return lc(u,l,t)},useTransition:function(){var l=Ff(!1);return l=i0.bind(null,X,l.queue,!0,!1),jl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,u){var a=X,e=jl();if($){if(u===void 0)throw Error(o(407));u=u()}else{if(u=t(),sl===null)throw Error(o(349));(J&127)!==0||js(a,t,u)}e.memoizedState=u;var n={value:u,getSnapshot:t};return e.queue=n,Ps(Xs.bind(null,a,n,l),[l]),a.flags|=2048,ma(9,{destroy:void 0},Gs.bind(null,a,n,u,t),null),u},useId:function(){var l=jl(),t=sl.identifierPrefix;if($){var u=Mt,a=Ot;u=(a&~(1<<32-Pl(a)-1)).toString(32)+u,t="_"+t+"R_"+u,u=Pe++,0<u&&(t+="H"+u.toString(32)),t+="_"}else u=Qv++,t="_"+t+"r_"+u.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:uc,useFormState:Ws,useActionState:Ws,useOptimistic:function(l){var t=jl();t.memoizedState=t.baseState=l;var u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=u,t=ac.bind(null,X,!0,u),u.dispatch=t,[l,t]},useMemoCache:wf,useCacheRefresh:function(){return jl().memoizedState=Jv.bind(null,X)},useEffectEvent:function(l){var t=jl(),u={impl:l};return t.memoizedState=u,function(){if((I&2)!==0)throw Error(o(440));return u.impl.apply(void 0,arguments)}}},ec={readContext:Ul,use:tn,useCallback:n0,useContext:Ul,useEffect:If,useImperativeHandle:e0,useInsertionEffect:t0,useLayoutEffect:u0,useMemo:f0,useReducer:un,useRef:Is,useState:function(){return un(Xt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=rl();return c0(u,el.memoizedState,l,t)},useTransition:function(){var l=un(Xt)[0],t=rl().memoizedState;return[typeof l=="boolean"?l:ka(l),t]},useSyncExternalStore:Ys,useId:d0,useHostTransitionStatus:uc,useFormState:$s,useActionState:$s,useOptimistic:function(l,t){var u=rl();return Zs(u,el,l,t)},useMemoCache:wf,useCacheRefresh:v0};ec.useEffectEvent=l0;var S0={readContext:Ul,use:tn,useCallback:n0,useContext:Ul,useEffect:If,useImperativeHandle:e0,useInsertionEffect:t0,useLayoutEffect:u0,useMemo:f0,useReducer:$f,useRef:Is,useState:function(){return $f(Xt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=rl();return el===null?lc(u,l,t):c0(u,el.memoizedState,l,t)},useTransition:function(){var l=$f(Xt)[0],t=rl().memoizedState;return[typeof l=="boolean"?l:ka(l),t]},useSyncExternalStore:Ys,useId:d0,useHostTransitionStatus:uc,useFormState:ks,useActionState:ks,useOptimistic:function(l,t){var u=rl();return el!==null?Zs(u,el,l,t):(u.baseState=l,[l,u.queue.dispatch])},useMemoCache:wf,useCacheRefresh:v0};S0.useEffectEvent=l0;function nc(l,t,u,a){t=l.memoizedState,u=u(a,t),u=u==null?t:q({},t,u),l.memoizedState=u,l.lanes===0&&(l.updateQueue.baseState=u)}var fc={enqueueSetState:function(l,t,u){l=l._reactInternals;var a=ft(),e=eu(a);e.payload=t,u!=null&&(e.callback=u),t=nu(l,e,a),t!==null&&(Wl(t,l,a),wa(t,l,a))},enqueueReplaceState:function(l,t,u){l=l._reactInternals;var a=ft(),e=eu(a);e.tag=1,e.payload=t,u!=null&&(e.callback=u),t=nu(l,e,a),t!==null&&(Wl(t,l,a),wa(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var u=ft(),a=eu(u);a.tag=2,t!=null&&(a.callback=t),t=nu(l,a,u),t!==null&&(Wl(t,l,u),wa(t,l,u))}};function r0(l,t,u,a,e,n,f){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,f):t.prototype&&t.prototype.isPureReactComponent?!Xa(u,a)||!Xa(e,n):!0}function b0(l,t,u,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(u,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(u,a),t.state!==l&&fc.enqueueReplaceState(t,t.state,null)}function Gu(l,t){var u=t;if("ref"in t){u={};for(var a in t)a!=="ref"&&(u[a]=t[a])}if(l=l.defaultProps){u===t&&(u=q({},u));for(var e in l)u[e]===void 0&&(u[e]=l[e])}return u}function z0(l){je(l)}function T0(l){console.error(l)}function E0(l){je(l)}function fn(l,t){try{var u=l.onUncaughtError;u(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function A0(l,t,u){try{var a=l.onCaughtError;a(u.value,{componentStack:u.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function cc(l,t,u){return u=eu(u),u.tag=3,u.payload={element:null},u.callback=function(){fn(l,t)},u}function _0(l){return l=eu(l),l.tag=3,l}function O0(l,t,u,a){var e=u.type.getDerivedStateFromError;if(typeof e=="function"){var n=a.value;l.payload=function(){return e(n)},l.callback=function(){A0(t,u,a)}}var f=u.stateNode;f!==null&&typeof f.componentDidCatch=="function"&&(l.callback=function(){A0(t,u,a),typeof e!="function"&&(du===null?du=new Set([this]):du.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function Wv(l,t,u,a,e){if(u.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=u.alternate,t!==null&&na(t,u,e,!0),u=ut.current,u!==null){switch(u.tag){case 31:case 13:return ht===null?bn():u.alternate===null&&hl===0&&(hl=3),u.flags&=-257,u.flags|=65536,u.lanes=e,a===we?u.flags|=16384:(t=u.updateQueue,t===null?u.updateQueue=new Set([a]):t.add(a),Rc(l,a,e)),!1;case 22:return u.flags|=65536,a===we?u.flags|=16384:(t=u.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},u.updateQueue=t):(u=t.retryQueue,u===null?t.retryQueue=new Set([a]):u.add(a)),Rc(l,a,e)),!1}throw Error(o(435,u.tag))}return Rc(l,a,e),bn(),!1}if($)return t=ut.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,a!==Mf&&(l=Error(o(422),{cause:a}),Za(dt(l,u)))):(a!==Mf&&(t=Error(o(423),{cause:a}),Za(dt(t,u))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,a=dt(a,u),e=cc(l.stateNode,a,e),jf(l,e),hl!==4&&(hl=2)),!1;var n=Error(o(520),{cause:a});if(n=dt(n,u),ce===null?ce=[n]:ce.push(n),hl!==4&&(hl=2),t===null)return!0;a=dt(a,u),u=t;do{switch(u.tag){case 3:return u.flags|=65536,l=e&-e,u.lanes|=l,l=cc(u.stateNode,a,l),jf(u,l),!1;case 1:if(t=u.type,n=u.stateNode,(u.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(du===null||!du.has(n))))return u.flags|=65536,e&=-e,u.lanes|=e,e=_0(e),O0(e,l,u,a),jf(u,e),!1}u=u.return}while(u!==null);return!1}var ic=Error(o(461)),Tl=!1;function Hl(l,t,u,a){t.child=l===null?Us(t,null,u,a):Yu(t,l.child,u,a)}function M0(l,t,u,a,e){u=u.render;var n=t.ref;if("ref"in a){var f={};for(var c in a)c!=="ref"&&(f[c]=a[c])}else f=a;return Ru(t),a=Vf(l,t,u,f,n,e),c=Lf(),l!==null&&!Tl?(Kf(l,t,e),Qt(l,t,e)):($&&c&&_f(t),t.flags|=1,Hl(l,t,a,e),t.child)}function D0(l,t,u,a,e){if(l===null){var n=u.type;return typeof n=="function"&&!Tf(n)&&n.defaultProps===void 0&&u.compare===null?(t.tag=15,t.type=n,p0(l,t,n,a,e)):(l=xe(u.type,null,a,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!gc(l,e)){var f=n.memoizedProps;if(u=u.compare,u=u!==null?u:Xa,u(f,a)&&l.ref===t.ref)return Qt(l,t,e)}return t.flags|=1,l=Ct(n,a),l.ref=t.ref,l.return=t,t.child=l}function p0(l,t,u,a,e){if(l!==null){var n=l.memoizedProps;if(Xa(n,a)&&l.ref===t.ref)if(Tl=!1,t.pendingProps=a=n,gc(l,e))(l.flags&131072)!==0&&(Tl=!0);else return t.lanes=l.lanes,Qt(l,t,e)}return sc(l,t,u,a,e)}function U0(l,t,u,a){var e=a.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|u:u,l!==null){for(a=t.child=l.child,e=0;a!==null;)e=e|a.lanes|a.childLanes,a=a.sibling;a=e&~n}else a=0,t.child=null;return H0(l,t,n,u,a)}if((u&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Ke(t,n!==null?n.cachePool:null),n!==null?Rs(t,n):Xf(),qs(t);else return a=t.lanes=536870912,H0(l,t,n!==null?n.baseLanes|u:u,u,a)}else n!==null?(Ke(t,n.cachePool),Rs(t,n),cu(),t.memoizedState=null):(l!==null&&Ke(t,null),Xf(),cu());return Hl(l,t,e,u),t.child}function le(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function H0(l,t,u,a,e){var n=qf();return n=n===null?null:{parent:bl._currentValue,pool:n},t.memoizedState={baseLanes:u,cachePool:n},l!==null&&Ke(t,null),Xf(),qs(t),l!==null&&na(l,t,a,!0),t.childLanes=e,null}function cn(l,t){return t=yn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function N0(l,t,u){return Yu(t,l.child,null,u),l=cn(t,t.pendingProps),l.flags|=2,at(t),t.memoizedState=null,l}function $v(l,t,u){var a=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if($){if(a.mode==="hidden")return l=cn(t,a),t.lanes=536870912,le(null,l);if(xf(t),(l=yl)?(l=Vy(l,ot),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:Pt!==null?{id:Ot,overflow:Mt}:null,retryLane:536870912,hydrationErrors:null},u=os(l),u.return=t,t.child=u,pl=t,yl=null)):l=null,l===null)throw tu(t);return t.lanes=536870912,null}return cn(t,a)}var n=l.memoizedState;if(n!==null){var f=n.dehydrated;if(xf(t),e)if(t.flags&256)t.flags&=-257,t=N0(l,t,u);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(o(558));else if(Tl||na(l,t,u,!1),e=(u&l.childLanes)!==0,Tl||e){if(a=sl,a!==null&&(f=Ti(a,u),f!==0&&f!==n.retryLane))throw n.retryLane=f,pu(l,f),Wl(a,l,f),ic;bn(),t=N0(l,t,u)}else l=n.treeContext,yl=gt(f.nextSibling),pl=t,$=!0,lu=null,ot=!1,l!==null&&Ss(t,l),t=cn(t,a),t.flags|=4096;return t}return l=Ct(l.child,{mode:a.mode,children:a.children}),l.ref=t.ref,t.child=l,l.return=t,l}function sn(l,t){var u=t.ref;if(u===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof u!="function"&&typeof u!="object")throw Error(o(284));(l===null||l.ref!==u)&&(t.flags|=4194816)}}function sc(l,t,u,a,e){return Ru(t),u=Vf(l,t,u,a,void 0,e),a=Lf(),l!==null&&!Tl?(Kf(l,t,e),Qt(l,t,e)):($&&a&&_f(t),t.flags|=1,Hl(l,t,u,e),t.child)}function R0(l,t,u,a,e,n){return Ru(t),t.updateQueue=null,u=Bs(t,a,u,e),Cs(l),a=Lf(),l!==null&&!Tl?(Kf(l,t,n),Qt(l,t,n)):($&&a&&_f(t),t.flags|=1,Hl(l,t,u,n),t.child)}function q0(l,t,u,a,e){if(Ru(t),t.stateNode===null){var n=ta,f=u.contextType;typeof f=="object"&&f!==null&&(n=Ul(f)),n=new u(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=fc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},Bf(t),f=u.contextType,n.context=typeof f=="object"&&f!==null?Ul(f):ta,n.state=t.memoizedState,f=u.getDerivedStateFromProps,typeof f=="function"&&(nc(t,u,f,a),n.state=t.memoizedState),typeof u.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(f=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),f!==n.state&&fc.enqueueReplaceState(n,n.state,null),$a(t,a,n,e),Wa(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,i=Gu(u,c);n.props=i;var m=n.context,S=u.contextType;f=ta,typeof S=="object"&&S!==null&&(f=Ul(S));var z=u.getDerivedStateFromProps;S=typeof z=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||m!==f)&&b0(t,n,a,f),au=!1;var h=t.memoizedState;n.state=h,$a(t,a,n,e),Wa(),m=t.memoizedState,c||h!==m||au?(typeof z=="function"&&(nc(t,u,z,a),m=t.memoizedState),(i=au||r0(t,u,i,a,h,m,f))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=m),n.props=a,n.state=m,n.context=f,a=i):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,Yf(l,t),f=t.memoizedProps,S=Gu(u,f),n.props=S,z=t.pendingProps,h=n.context,m=u.contextType,i=ta,typeof m=="object"&&m!==null&&(i=Ul(m)),c=u.getDerivedStateFromProps,(m=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f!==z||h!==i)&&b0(t,n,a,i),au=!1,h=t.memoizedState,n.state=h,$a(t,a,n,e),Wa();var g=t.memoizedState;f!==z||h!==g||au||l!==null&&l.dependencies!==null&&Ve(l.dependencies)?(typeof c=="function"&&(nc(t,u,c,a),g=t.memoizedState),(S=au||r0(t,u,S,a,h,g,i)||l!==null&&l.dependencies!==null&&Ve(l.dependencies))?(m||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,g,i),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,g,i)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=g),n.props=a,n.state=g,n.context=i,a=S):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,sn(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,u=a&&typeof u.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=Yu(t,l.child,null,e),t.child=Yu(t,null,u,e)):Hl(l,t,u,e),t.memoizedState=n.state,l=t.child):l=Qt(l,t,e),l}function C0(l,t,u,a){return Hu(),t.flags|=256,Hl(l,t,u,a),t.child}var yc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function dc(l){return{baseLanes:l,cachePool:As()}}function vc(l,t,u){return l=l!==null?l.childLanes&~u:0,t&&(l|=nt),l}function B0(l,t,u){var a=t.pendingProps,e=!1,n=(t.flags&128)!==0,f;if((f=n)||(f=l!==null&&l.memoizedState===null?!1:(Sl.current&2)!==0),f&&(e=!0,t.flags&=-129),f=(t.flags&32)!==0,t.flags&=-33,l===null){if($){if(e?fu(t):cu(),(l=yl)?(l=Vy(l,ot),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:Pt!==null?{id:Ot,overflow:Mt}:null,retryLane:536870912,hydrationErrors:null},u=os(l),u.return=t,t.child=u,pl=t,yl=null)):l=null,l===null)throw tu(t);return Wc(l)?t.lanes=32:t.lanes=536870912,null}var c=a.children;return a=a.fallback,e?(cu(),e=t.mode,c=yn({mode:"hidden",children:c},e),a=Uu(a,e,u,null),c.return=t,a.return=t,c.sibling=a,t.child=c,a=t.child,a.memoizedState=dc(u),a.childLanes=vc(l,f,u),t.memoizedState=yc,le(null,a)):(fu(t),mc(t,c))}var i=l.memoizedState;if(i!==null&&(c=i.dehydrated,c!==null)){if(n)t.flags&256?(fu(t),t.flags&=-257,t=oc(l,t,u)):t.memoizedState!==null?(cu(),t.child=l.child,t.flags|=128,t=null):(cu(),c=a.fallback,e=t.mode,a=yn({mode:"visible",children:a.children},e),c=Uu(c,e,u,null),c.flags|=2,a.return=t,c.return=t,a.sibling=c,t.child=a,Yu(t,l.child,null,u),a=t.child,a.memoizedState=dc(u),a.childLanes=vc(l,f,u),t.memoizedState=yc,t=le(null,a));else if(fu(t),Wc(c)){if(f=c.nextSibling&&c.nextSibling.dataset,f)var m=f.dgst;f=m,a=Error(o(419)),a.stack="",a.digest=f,Za({value:a,source:null,stack:null}),t=oc(l,t,u)}else if(Tl||na(l,t,u,!1),f=(u&l.childLanes)!==0,Tl||f){if(f=sl,f!==null&&(a=Ti(f,u),a!==0&&a!==i.retryLane))throw i.retryLane=a,pu(l,a),Wl(f,l,a),ic;wc(c)||bn(),t=oc(l,t,u)}else wc(c)?(t.flags|=192,t.child=l.child,t=null):(l=i.treeContext,yl=gt(c.nextSibling),pl=t,$=!0,lu=null,ot=!1,l!==null&&Ss(t,l),t=mc(t,a.children),t.flags|=4096);return t}return e?(cu(),c=a.fallback,e=t.mode,i=l.child,m=i.sibling,a=Ct(i,{mode:"hidden",children:a.children}),a.subtreeFlags=i.subtreeFlags&65011712,m!==null?c=Ct(m,c):(c=Uu(c,e,u,null),c.flags|=2),c.return=t,a.return=t,a.sibling=c,t.child=a,le(null,a),a=t.child,c=l.child.memoizedState,c===null?c=dc(u):(e=c.cachePool,e!==null?(i=bl._currentValue,e=e.parent!==i?{parent:i,pool:i}:e):e=As(),c={baseLanes:c.baseLanes|u,cachePool:e}),a.memoizedState=c,a.childLanes=vc(l,f,u),t.memoizedState=yc,le(l.child,a)):(fu(t),u=l.child,l=u.sibling,u=Ct(u,{mode:"visible",children:a.children}),u.return=t,u.sibling=null,l!==null&&(f=t.deletions,f===null?(t.deletions=[l],t.flags|=16):f.push(l)),t.child=u,t.memoizedState=null,u)}function mc(l,t){return t=yn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function yn(l,t){return l=tt(22,l,null,t),l.lanes=0,l}function oc(l,t,u){return Yu(t,l.child,null,u),l=mc(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Y0(l,t,u){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),Uf(l.return,t,u)}function hc(l,t,u,a,e,n){var f=l.memoizedState;f===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:u,tailMode:e,treeForkCount:n}:(f.isBackwards=t,f.rendering=null,f.renderingStartTime=0,f.last=a,f.tail=u,f.tailMode=e,f.treeForkCount=n)}function j0(l,t,u){var a=t.pendingProps,e=a.revealOrder,n=a.tail;a=a.children;var f=Sl.current,c=(f&2)!==0;if(c?(f=f&1|2,t.flags|=128):f&=1,M(Sl,f),Hl(l,t,a,u),a=$?xa:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Y0(l,u,t);else if(l.tag===19)Y0(l,u,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(u=t.child,e=null;u!==null;)l=u.alternate,l!==null&&ke(l)===null&&(e=u),u=u.sibling;u=e,u===null?(e=t.child,t.child=null):(e=u.sibling,u.sibling=null),hc(t,!1,e,u,n,a);break;case"backwards":case"unstable_legacy-backwards":for(u=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&ke(l)===null){t.child=e;break}l=e.sibling,e.sibling=u,u=e,e=l}hc(t,!0,u,null,n,a);break;case"together":hc(t,!1,null,null,void 0,a);break;default:t.memoizedState=null}return t.child}function Qt(l,t,u){if(l!==null&&(t.dependencies=l.dependencies),yu|=t.lanes,(u&t.childLanes)===0)if(l!==null){if(na(l,t,u,!1),(u&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(o(153));if(t.child!==null){for(l=t.child,u=Ct(l,l.pendingProps),t.child=u,u.return=t;l.sibling!==null;)l=l.sibling,u=u.sibling=Ct(l,l.pendingProps),u.return=t;u.sibling=null}return t.child}function gc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&Ve(l)))}function Fv(l,t,u){switch(t.tag){case 3:Yl(t,t.stateNode.containerInfo),uu(t,bl,l.memoizedState.cache),Hu();break;case 27:case 5:Ma(t);break;case 4:Yl(t,t.stateNode.containerInfo);break;case 10:uu(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,xf(t),null;break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(fu(t),t.flags|=128,null):(u&t.child.childLanes)!==0?B0(l,t,u):(fu(t),l=Qt(l,t,u),l!==null?l.sibling:null);fu(t);break;case 19:var e=(l.flags&128)!==0;if(a=(u&t.childLanes)!==0,a||(na(l,t,u,!1),a=(u&t.childLanes)!==0),e){if(a)return j0(l,t,u);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),M(Sl,Sl.current),a)break;return null;case 22:return t.lanes=0,U0(l,t,u,t.pendingProps);case 24:uu(t,bl,l.memoizedState.cache)}return Qt(l,t,u)}function G0(l,t,u){if(l!==null)if(l.memoizedProps!==t.pendingProps)Tl=!0;else{if(!gc(l,u)&&(t.flags&128)===0)return Tl=!1,Fv(l,t,u);Tl=(l.flags&131072)!==0}else Tl=!1,$&&(t.flags&1048576)!==0&&gs(t,xa,t.index);switch(t.lanes=0,t.tag){case 16:l:{var a=t.pendingProps;if(l=Cu(t.elementType),t.type=l,typeof l=="function")Tf(l)?(a=Gu(l,a),t.tag=1,t=q0(null,t,l,a,u)):(t.tag=0,t=sc(null,t,l,a,u));else{if(l!=null){var e=l.$$typeof;if(e===ct){t.tag=11,t=M0(null,t,l,a,u);break l}else if(e===W){t.tag=14,t=D0(null,t,l,a,u);break l}}throw t=Ht(l)||l,Error(o(306,t,""))}}return t;case 0:return sc(l,t,t.type,t.pendingProps,u);case 1:return a=t.type,e=Gu(a,t.pendingProps),q0(l,t,a,e,u);case 3:l:{if(Yl(t,t.stateNode.containerInfo),l===null)throw Error(o(387));a=t.pendingProps;var n=t.memoizedState;e=n.element,Yf(l,t),$a(t,a,null,u);var f=t.memoizedState;if(a=f.cache,uu(t,bl,a),a!==n.cache&&Hf(t,[bl],u,!0),Wa(),a=f.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:f.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=C0(l,t,a,u);break l}else if(a!==e){e=dt(Error(o(424)),t),Za(e),t=C0(l,t,a,u);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(yl=gt(l.firstChild),pl=t,$=!0,lu=null,ot=!0,u=Us(t,null,a,u),t.child=u;u;)u.flags=u.flags&-3|4096,u=u.sibling}else{if(Hu(),a===e){t=Qt(l,t,u);break l}Hl(l,t,a,u)}t=t.child}return t;case 26:return sn(l,t),l===null?(u=$y(t.type,null,t.pendingProps,null))?t.memoizedState=u:$||(u=t.type,l=t.pendingProps,a=Mn(Z.current).createElement(u),a[Dl]=t,a[Zl]=l,Nl(a,u,l),Ol(a),t.stateNode=a):t.memoizedState=$y(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return Ma(t),l===null&&$&&(a=t.stateNode=Jy(t.type,t.pendingProps,Z.current),pl=t,ot=!0,e=yl,hu(t.type)?($c=e,yl=gt(a.firstChild)):yl=e),Hl(l,t,t.pendingProps.children,u),sn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&$&&((e=a=yl)&&(a=Mm(a,t.type,t.pendingProps,ot),a!==null?(t.stateNode=a,pl=t,yl=gt(a.firstChild),ot=!1,e=!0):e=!1),e||tu(t)),Ma(t),e=t.type,n=t.pendingProps,f=l!==null?l.memoizedProps:null,a=n.children,Lc(e,n)?a=null:f!==null&&Lc(e,f)&&(t.flags|=32),t.memoizedState!==null&&(e=Vf(l,t,xv,null,null,u),he._currentValue=e),sn(l,t),Hl(l,t,a,u),t.child;case 6:return l===null&&$&&((l=u=yl)&&(u=Dm(u,t.pendingProps,ot),u!==null?(t.stateNode=u,pl=t,yl=null,l=!0):l=!1),l||tu(t)),null;case 13:return B0(l,t,u);case 4:return Yl(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=Yu(t,null,a,u):Hl(l,t,a,u),t.child;case 11:return M0(l,t,t.type,t.pendingProps,u);case 7:return Hl(l,t,t.pendingProps,u),t.child;case 8:return Hl(l,t,t.pendingProps.children,u),t.child;case 12:return Hl(l,t,t.pendingProps.children,u),t.child;case 10:return a=t.pendingProps,uu(t,t.type,a.value),Hl(l,t,a.children,u),t.child;case 9:return e=t.type._context,a=t.pendingProps.children,Ru(t),e=Ul(e),a=a(e),t.flags|=1,Hl(l,t,a,u),t.child;case 14:return D0(l,t,t.type,t.pendingProps,u);case 15:return p0(l,t,t.type,t.pendingProps,u);case 19:return j0(l,t,u);case 31:return $v(l,t,u);case 22:return U0(l,t,u,t.pendingProps);case 24:return Ru(t),a=Ul(bl),l===null?(e=qf(),e===null&&(e=sl,n=Nf(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=u),e=n),t.memoizedState={parent:a,cache:e},Bf(t),uu(t,bl,e)):((l.lanes&u)!==0&&(Yf(l,t),$a(t,null,null,u),Wa()),e=l.memoizedState,n=t.memoizedState,e.parent!==a?(e={parent:a,cache:a},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),uu(t,bl,a)):(a=n.cache,uu(t,bl,a),a!==e.cache&&Hf(t,[bl],u,!0))),Hl(l,t,t.pendingProps.children,u),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}function xt(l){l.flags|=4}function Sc(l,t,u,a,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(dy())l.flags|=8192;else throw Bu=we,Cf}else l.flags&=-16777217}function X0(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!ld(t))if(dy())l.flags|=8192;else throw Bu=we,Cf}function dn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?ri():536870912,l.lanes|=t,Sa|=t)}function te(l,t){if(!$)switch(l.tailMode){case"hidden":t=l.tail;for(var u=null;t!==null;)t.alternate!==null&&(u=t),t=t.sibling;u===null?l.tail=null:u.sibling=null;break;case"collapsed":u=l.tail;for(var a=null;u!==null;)u.alternate!==null&&(a=u),u=u.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function dl(l){var t=l.alternate!==null&&l.alternate.child===l.child,u=0,a=0;if(t)for(var e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags&65011712,a|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags,a|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=a,l.childLanes=u,t}function kv(l,t,u){var a=t.pendingProps;switch(Of(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return dl(t),null;case 1:return dl(t),null;case 3:return u=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),jt(bl),gl(),u.pendingContext&&(u.context=u.pendingContext,u.pendingContext=null),(l===null||l.child===null)&&(ea(t)?xt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Df())),dl(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(xt(t),n!==null?(dl(t),X0(t,n)):(dl(t),Sc(t,e,null,a,u))):n?n!==l.memoizedState?(xt(t),dl(t),X0(t,n)):(dl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==a&&xt(t),dl(t),Sc(t,e,l,a,u)),null;case 27:if(Te(t),u=Z.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&xt(t);else{if(!a){if(t.stateNode===null)throw Error(o(166));return dl(t),null}l=p.current,ea(t)?rs(t):(l=Jy(e,a,u),t.stateNode=l,xt(t))}return dl(t),null;case 5:if(Te(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&xt(t);else{if(!a){if(t.stateNode===null)throw Error(o(166));return dl(t),null}if(n=p.current,ea(t))rs(t);else{var f=Mn(Z.current);switch(n){case 1:n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=f.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?f.createElement("select",{is:a.is}):f.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?f.createElement(e,{is:a.is}):f.createElement(e)}}n[Dl]=t,n[Zl]=a;l:for(f=t.child;f!==null;){if(f.tag===5||f.tag===6)n.appendChild(f.stateNode);else if(f.tag!==4&&f.tag!==27&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===t)break l;for(;f.sibling===null;){if(f.return===null||f.return===t)break l;f=f.return}f.sibling.return=f.return,f=f.sibling}t.stateNode=n;l:switch(Nl(n,e,a),e){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break l;case"img":a=!0;break l;default:a=!1}a&&xt(t)}}return dl(t),Sc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,u),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&xt(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(o(166));if(l=Z.current,ea(t)){if(l=t.stateNode,u=t.memoizedProps,a=null,e=pl,e!==null)switch(e.tag){case 27:case 5:a=e.memoizedProps}l[Dl]=t,l=!!(l.nodeValue===u||a!==null&&a.suppressHydrationWarning===!0||By(l.nodeValue,u)),l||tu(t,!0)}else l=Mn(l).createTextNode(a),l[Dl]=t,t.stateNode=l}return dl(t),null;case 31:if(u=t.memoizedState,l===null||l.memoizedState!==null){if(a=ea(t),u!==null){if(l===null){if(!a)throw Error(o(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(o(557));l[Dl]=t}else Hu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;dl(t),l=!1}else u=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),l=!0;if(!l)return t.flags&256?(at(t),t):(at(t),null);if((t.flags&128)!==0)throw Error(o(558))}return dl(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=ea(t),a!==null&&a.dehydrated!==null){if(l===null){if(!e)throw Error(o(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(o(317));e[Dl]=t}else Hu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;dl(t),e=!1}else e=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(at(t),t):(at(t),null)}return at(t),(t.flags&128)!==0?(t.lanes=u,t):(u=a!==null,l=l!==null&&l.memoizedState!==null,u&&(a=t.child,e=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(e=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==e&&(a.flags|=2048)),u!==l&&u&&(t.child.flags|=8192),dn(t,t.updateQueue),dl(t),null);case 4:return gl(),l===null&&Xc(t.stateNode.containerInfo),dl(t),null;case 10:return jt(t.type),dl(t),null;case 19:if(T(Sl),a=t.memoizedState,a===null)return dl(t),null;if(e=(t.flags&128)!==0,n=a.rendering,n===null)if(e)te(a,!1);else{if(hl!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=ke(l),n!==null){for(t.flags|=128,te(a,!1),l=n.updateQueue,t.updateQueue=l,dn(t,l),t.subtreeFlags=0,l=u,u=t.child;u!==null;)ms(u,l),u=u.sibling;return M(Sl,Sl.current&1|2),$&&Bt(t,a.treeForkCount),t.child}l=l.sibling}a.tail!==null&&kl()>gn&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304)}else{if(!e)if(l=ke(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,dn(t,l),te(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!$)return dl(t),null}else 2*kl()-a.renderingStartTime>gn&&u!==536870912&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304);a.isBackwards?(n.sibling=t.child,t.child=n):(l=a.last,l!==null?l.sibling=n:t.child=n,a.last=n)}return a.tail!==null?(l=a.tail,a.rendering=l,a.tail=l.sibling,a.renderingStartTime=kl(),l.sibling=null,u=Sl.current,M(Sl,e?u&1|2:u&1),$&&Bt(t,a.treeForkCount),l):(dl(t),null);case 22:case 23:return at(t),Qf(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(u&536870912)!==0&&(t.flags&128)===0&&(dl(t),t.subtreeFlags&6&&(t.flags|=8192)):dl(t),u=t.updateQueue,u!==null&&dn(t,u.retryQueue),u=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==u&&(t.flags|=2048),l!==null&&T(qu),null;case 24:return u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),jt(bl),dl(t),null;case 25:return null;case 30:return null}throw Error(o(156,t.tag))}function Iv(l,t){switch(Of(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return jt(bl),gl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return Te(t),null;case 31:if(t.memoizedState!==null){if(at(t),t.alternate===null)throw Error(o(340));Hu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(at(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(o(340));Hu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return T(Sl),null;case 4:return gl(),null;case 10:return jt(t.type),null;case 22:case 23:return at(t),Qf(),l!==null&&T(qu),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return jt(bl),null;case 25:return null;default:return null}}function Q0(l,t){switch(Of(t),t.tag){case 3:jt(bl),gl();break;case 26:case 27:case 5:Te(t);break;case 4:gl();break;case 31:t.memoizedState!==null&&at(t);break;case 13:at(t);break;case 19:T(Sl);break;case 10:jt(t.type);break;case 22:case 23:at(t),Qf(),l!==null&&T(qu);break;case 24:jt(bl)}}function ue(l,t){try{var u=t.updateQueue,a=u!==null?u.lastEffect:null;if(a!==null){var e=a.next;u=e;do{if((u.tag&l)===l){a=void 0;var n=u.create,f=u.inst;a=n(),f.destroy=a}u=u.next}while(u!==e)}}catch(c){ul(t,t.return,c)}}function iu(l,t,u){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var n=e.next;a=n;do{if((a.tag&l)===l){var f=a.inst,c=f.destroy;if(c!==void 0){f.destroy=void 0,e=t;var i=u,m=c;try{m()}catch(S){ul(e,i,S)}}}a=a.next}while(a!==n)}}catch(S){ul(t,t.return,S)}}function x0(l){var t=l.updateQueue;if(t!==null){var u=l.stateNode;try{Ns(t,u)}catch(a){ul(l,l.return,a)}}}function Z0(l,t,u){u.props=Gu(l.type,l.memoizedProps),u.state=l.memoizedState;try{u.componentWillUnmount()}catch(a){ul(l,t,a)}}function ae(l,t){try{var u=l.ref;if(u!==null){switch(l.tag){case 26:case 27:case 5:var a=l.stateNode;break;case 30:a=l.stateNode;break;default:a=l.stateNode}typeof u=="function"?l.refCleanup=u(a):u.current=a}}catch(e){ul(l,t,e)}}function Dt(l,t){var u=l.ref,a=l.refCleanup;if(u!==null)if(typeof a=="function")try{a()}catch(e){ul(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof u=="function")try{u(null)}catch(e){ul(l,t,e)}else u.current=null}function V0(l){var t=l.type,u=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":u.autoFocus&&a.focus();break l;case"img":u.src?a.src=u.src:u.srcSet&&(a.srcset=u.srcSet)}}catch(e){ul(l,l.return,e)}}function rc(l,t,u){try{var a=l.stateNode;zm(a,l.type,u,t),a[Zl]=t}catch(e){ul(l,l.return,e)}}function L0(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&hu(l.type)||l.tag===4}function bc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||L0(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&hu(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function zc(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?(u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u).insertBefore(l,t):(t=u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u,t.appendChild(l),u=u._reactRootContainer,u!=null||t.onclick!==null||(t.onclick=Rt));else if(a!==4&&(a===27&&hu(l.type)&&(u=l.stateNode,t=null),l=l.child,l!==null))for(zc(l,t,u),l=l.sibling;l!==null;)zc(l,t,u),l=l.sibling}function vn(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?u.insertBefore(l,t):u.appendChild(l);else if(a!==4&&(a===27&&hu(l.type)&&(u=l.stateNode),l=l.child,l!==null))for(vn(l,t,u),l=l.sibling;l!==null;)vn(l,t,u),l=l.sibling}function K0(l){var t=l.stateNode,u=l.memoizedProps;try{for(var a=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);Nl(t,a,u),t[Dl]=l,t[Zl]=u}catch(n){ul(l,l.return,n)}}var Zt=!1,El=!1,Tc=!1,J0=typeof WeakSet=="function"?WeakSet:Set,Ml=null;function Pv(l,t){if(l=l.containerInfo,Zc=qn,l=es(l),of(l)){if("selectionStart"in l)var u={start:l.selectionStart,end:l.selectionEnd};else l:{u=(u=l.ownerDocument)&&u.defaultView||window;var a=u.getSelection&&u.getSelection();if(a&&a.rangeCount!==0){u=a.anchorNode;var e=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{u.nodeType,n.nodeType}catch{u=null;break l}var f=0,c=-1,i=-1,m=0,S=0,z=l,h=null;t:for(;;){for(var g;z!==u||e!==0&&z.nodeType!==3||(c=f+e),z!==n||a!==0&&z.nodeType!==3||(i=f+a),z.nodeType===3&&(f+=z.nodeValue.length),(g=z.firstChild)!==null;)h=z,z=g;for(;;){if(z===l)break t;if(h===u&&++m===e&&(c=f),h===n&&++S===a&&(i=f),(g=z.nextSibling)!==null)break;z=h,h=z.parentNode}z=g}u=c===-1||i===-1?null:{start:c,end:i}}else u=null}u=u||{start:0,end:0}}else u=null;for(Vc={focusedElem:l,selectionRange:u},qn=!1,Ml=t;Ml!==null;)if(t=Ml,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Ml=l;else for(;Ml!==null;){switch(t=Ml,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(u=0;u<l.length;u++)e=l[u],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,u=t,e=n.memoizedProps,n=n.memoizedState,a=u.stateNode;try{var D=Gu(u.type,e);l=a.getSnapshotBeforeUpdate(D,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(R){ul(u,u.return,R)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,u=l.nodeType,u===9)Jc(l);else if(u===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":Jc(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(o(163))}if(l=t.sibling,l!==null){l.return=t.return,Ml=l;break}Ml=t.return}}function w0(l,t,u){var a=u.flags;switch(u.tag){case 0:case 11:case 15:Lt(l,u),a&4&&ue(5,u);break;case 1:if(Lt(l,u),a&4)if(l=u.stateNode,t===null)try{l.componentDidMount()}catch(f){ul(u,u.return,f)}else{var e=Gu(u.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(f){ul(u,u.return,f)}}a&64&&x0(u),a&512&&ae(u,u.return);break;case 3:if(Lt(l,u),a&64&&(l=u.updateQueue,l!==null)){if(t=null,u.child!==null)switch(u.child.tag){case 27:case 5:t=u.child.stateNode;break;case 1:t=u.child.stateNode}try{Ns(l,t)}catch(f){ul(u,u.return,f)}}break;case 27:t===null&&a&4&&K0(u);case 26:case 5:Lt(l,u),t===null&&a&4&&V0(u),a&512&&ae(u,u.return);break;case 12:Lt(l,u);break;case 31:Lt(l,u),a&4&&F0(l,u);break;case 13:Lt(l,u),a&4&&k0(l,u),a&64&&(l=u.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(u=im.bind(null,u),pm(l,u))));break;case 22:if(a=u.memoizedState!==null||Zt,!a){t=t!==null&&t.memoizedState!==null||El,e=Zt;var n=El;Zt=a,(El=t)&&!n?Kt(l,u,(u.subtreeFlags&8772)!==0):Lt(l,u),Zt=e,El=n}break;case 30:break;default:Lt(l,u)}}function W0(l){var t=l.alternate;t!==null&&(l.alternate=null,W0(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&Fn(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var ml=null,Ll=!1;function Vt(l,t,u){for(u=u.child;u!==null;)$0(l,t,u),u=u.sibling}function $0(l,t,u){if(Il&&typeof Il.onCommitFiberUnmount=="function")try{Il.onCommitFiberUnmount(Da,u)}catch{}switch(u.tag){case 26:El||Dt(u,t),Vt(l,t,u),u.memoizedState?u.memoizedState.count--:u.stateNode&&(u=u.stateNode,u.parentNode.removeChild(u));break;case 27:El||Dt(u,t);var a=ml,e=Ll;hu(u.type)&&(ml=u.stateNode,Ll=!1),Vt(l,t,u),ve(u.stateNode),ml=a,Ll=e;break;case 5:El||Dt(u,t);case 6:if(a=ml,e=Ll,ml=null,Vt(l,t,u),ml=a,Ll=e,ml!==null)if(Ll)try{(ml.nodeType===9?ml.body:ml.nodeName==="HTML"?ml.ownerDocument.body:ml).removeChild(u.stateNode)}catch(n){ul(u,t,n)}else try{ml.removeChild(u.stateNode)}catch(n){ul(u,t,n)}break;case 18:ml!==null&&(Ll?(l=ml,xy(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,u.stateNode),Oa(l)):xy(ml,u.stateNode));break;case 4:a=ml,e=Ll,ml=u.stateNode.containerInfo,Ll=!0,Vt(l,t,u),ml=a,Ll=e;break;case 0:case 11:case 14:case 15:iu(2,u,t),El||iu(4,u,t),Vt(l,t,u);break;case 1:El||(Dt(u,t),a=u.stateNode,typeof a.componentWillUnmount=="function"&&Z0(u,t,a)),Vt(l,t,u);break;case 21:Vt(l,t,u);break;case 22:El=(a=El)||u.memoizedState!==null,Vt(l,t,u),El=a;break;default:Vt(l,t,u)}}function F0(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{Oa(l)}catch(u){ul(t,t.return,u)}}}function k0(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{Oa(l)}catch(u){ul(t,t.return,u)}}function lm(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new J0),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new J0),t;default:throw Error(o(435,l.tag))}}function mn(l,t){var u=lm(l);t.forEach(function(a){if(!u.has(a)){u.add(a);var e=sm.bind(null,l,a);a.then(e,e)}})}function Kl(l,t){var u=t.deletions;if(u!==null)for(var a=0;a<u.length;a++){var e=u[a],n=l,f=t,c=f;l:for(;c!==null;){switch(c.tag){case 27:if(hu(c.type)){ml=c.stateNode,Ll=!1;break l}break;case 5:ml=c.stateNode,Ll=!1;break l;case 3:case 4:ml=c.stateNode.containerInfo,Ll=!0;break l}c=c.return}if(ml===null)throw Error(o(160));$0(n,f,e),ml=null,Ll=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)I0(t,l),t=t.sibling}var zt=null;function I0(l,t){var u=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:Kl(t,l),Jl(l),a&4&&(iu(3,l,l.return),ue(3,l),iu(5,l,l.return));break;case 1:Kl(t,l),Jl(l),a&512&&(El||u===null||Dt(u,u.return)),a&64&&Zt&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(u=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=u===null?a:u.concat(a))));break;case 26:var e=zt;if(Kl(t,l),Jl(l),a&512&&(El||u===null||Dt(u,u.return)),a&4){var n=u!==null?u.memoizedState:null;if(a=l.memoizedState,u===null)if(a===null)if(l.stateNode===null){l:{a=l.type,u=l.memoizedProps,e=e.ownerDocument||e;t:switch(a){case"title":n=e.getElementsByTagName("title")[0],(!n||n[Ha]||n[Dl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(a),e.head.insertBefore(n,e.querySelector("head > title"))),Nl(n,a,u),n[Dl]=l,Ol(n),a=n;break l;case"link":var f=Iy("link","href",e).get(a+(u.href||""));if(f){for(var c=0;c<f.length;c++)if(n=f[c],n.getAttribute("href")===(u.href==null||u.href===""?null:u.href)&&n.getAttribute("rel")===(u.rel==null?null:u.rel)&&n.getAttribute("title")===(u.title==null?null:u.title)&&n.getAttribute("crossorigin")===(u.crossOrigin==null?null:u.crossOrigin)){f.splice(c,1);break t}}n=e.createElement(a),Nl(n,a,u),e.head.appendChild(n);break;case"meta":if(f=Iy("meta","content",e).get(a+(u.content||""))){for(c=0;c<f.length;c++)if(n=f[c],n.getAttribute("content")===(u.content==null?null:""+u.content)&&n.getAttribute("name")===(u.name==null?null:u.name)&&n.getAttribute("property")===(u.property==null?null:u.property)&&n.getAttribute("http-equiv")===(u.httpEquiv==null?null:u.httpEquiv)&&n.getAttribute("charset")===(u.charSet==null?null:u.charSet)){f.splice(c,1);break t}}n=e.createElement(a),Nl(n,a,u),e.head.appendChild(n);break;default:throw Error(o(468,a))}n[Dl]=l,Ol(n),a=n}l.stateNode=a}else Py(e,l.type,l.stateNode);else l.stateNode=ky(e,a,l.memoizedProps);else n!==a?(n===null?u.stateNode!==null&&(u=u.stateNode,u.parentNode.removeChild(u)):n.count--,a===null?Py(e,l.type,l.stateNode):ky(e,a,l.memoizedProps)):a===null&&l.stateNode!==null&&rc(l,l.memoizedProps,u.memoizedProps)}break;case 27:Kl(t,l),Jl(l),a&512&&(El||u===null||Dt(u,u.return)),u!==null&&a&4&&rc(l,l.memoizedProps,u.memoizedProps);break;case 5:if(Kl(t,l),Jl(l),a&512&&(El||u===null||Dt(u,u.return)),l.flags&32){e=l.stateNode;try{Wu(e,"")}catch(D){ul(l,l.return,D)}}a&4&&l.stateNode!=null&&(e=l.memoizedProps,rc(l,e,u!==null?u.memoizedProps:e)),a&1024&&(Tc=!0);break;case 6:if(Kl(t,l),Jl(l),a&4){if(l.stateNode===null)throw Error(o(162));a=l.memoizedProps,u=l.stateNode;try{u.nodeValue=a}catch(D){ul(l,l.return,D)}}break;case 3:if(Un=null,e=zt,zt=Dn(t.containerInfo),Kl(t,l),zt=e,Jl(l),a&4&&u!==null&&u.memoizedState.isDehydrated)try{Oa(t.containerInfo)}catch(D){ul(l,l.return,D)}Tc&&(Tc=!1,P0(l));break;case 4:a=zt,zt=Dn(l.stateNode.containerInfo),Kl(t,l),Jl(l),zt=a;break;case 12:Kl(t,l),Jl(l);break;case 31:Kl(t,l),Jl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,mn(l,a)));break;case 13:Kl(t,l),Jl(l),l.child.flags&8192&&l.memoizedState!==null!=(u!==null&&u.memoizedState!==null)&&(hn=kl()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,mn(l,a)));break;case 22:e=l.memoizedState!==null;var i=u!==null&&u.memoizedState!==null,m=Zt,S=El;if(Zt=m||e,El=S||i,Kl(t,l),El=S,Zt=m,Jl(l),a&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(u===null||i||Zt||El||Xu(l)),u=null,t=l;;){if(t.tag===5||t.tag===26){if(u===null){i=u=t;try{if(n=i.stateNode,e)f=n.style,typeof f.setProperty=="function"?f.setProperty("display","none","important"):f.display="none";else{c=i.stateNode;var z=i.memoizedProps.style,h=z!=null&&z.hasOwnProperty("display")?z.display:null;c.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(D){ul(i,i.return,D)}}}else if(t.tag===6){if(u===null){i=t;try{i.stateNode.nodeValue=e?"":i.memoizedProps}catch(D){ul(i,i.return,D)}}}else if(t.tag===18){if(u===null){i=t;try{var g=i.stateNode;e?Zy(g,!0):Zy(i.stateNode,!1)}catch(D){ul(i,i.return,D)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;u===t&&(u=null),t=t.return}u===t&&(u=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(u=a.retryQueue,u!==null&&(a.retryQueue=null,mn(l,u))));break;case 19:Kl(t,l),Jl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,mn(l,a)));break;case 30:break;case 21:break;default:Kl(t,l),Jl(l)}}function Jl(l){var t=l.flags;if(t&2){try{for(var u,a=l.return;a!==null;){if(L0(a)){u=a;break}a=a.return}if(u==null)throw Error(o(160));switch(u.tag){case 27:var e=u.stateNode,n=bc(l);vn(l,n,e);break;case 5:var f=u.stateNode;u.flags&32&&(Wu(f,""),u.flags&=-33);var c=bc(l);vn(l,c,f);break;case 3:case 4:var i=u.stateNode.containerInfo,m=bc(l);zc(l,m,i);break;default:throw Error(o(161))}}catch(S){ul(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function P0(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;P0(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function Lt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)w0(l,t.alternate,t),t=t.sibling}function Xu(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:iu(4,t,t.return),Xu(t);break;case 1:Dt(t,t.return);var u=t.stateNode;typeof u.componentWillUnmount=="function"&&Z0(t,t.return,u),Xu(t);break;case 27:ve(t.stateNode);case 26:case 5:Dt(t,t.return),Xu(t);break;case 22:t.memoizedState===null&&Xu(t);break;case 30:Xu(t);break;default:Xu(t)}l=l.sibling}}function Kt(l,t,u){for(u=u&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,e=l,n=t,f=n.flags;switch(n.tag){case 0:case 11:case 15:Kt(e,n,u),ue(4,n);break;case 1:if(Kt(e,n,u),a=n,e=a.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(m){ul(a,a.return,m)}if(a=n,e=a.updateQueue,e!==null){var c=a.stateNode;try{var i=e.shared.hiddenCallbacks;if(i!==null)for(e.shared.hiddenCallbacks=null,e=0;e<i.length;e++)Hs(i[e],c)}catch(m){ul(a,a.return,m)}}u&&f&64&&x0(n),ae(n,n.return);break;case 27:K0(n);case 26:case 5:Kt(e,n,u),u&&a===null&&f&4&&V0(n),ae(n,n.return);break;case 12:Kt(e,n,u);break;case 31:Kt(e,n,u),u&&f&4&&F0(e,n);break;case 13:Kt(e,n,u),u&&f&4&&k0(e,n);break;case 22:n.memoizedState===null&&Kt(e,n,u),ae(n,n.return);break;case 30:break;default:Kt(e,n,u)}t=t.sibling}}function Ec(l,t){var u=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==u&&(l!=null&&l.refCount++,u!=null&&Va(u))}function Ac(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l))}function Tt(l,t,u,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)ly(l,t,u,a),t=t.sibling}function ly(l,t,u,a){var e=t.flags;switch(t.tag){case 0:case 11:case 15:Tt(l,t,u,a),e&2048&&ue(9,t);break;case 1:Tt(l,t,u,a);break;case 3:Tt(l,t,u,a),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l)));break;case 12:if(e&2048){Tt(l,t,u,a),l=t.stateNode;try{var n=t.memoizedProps,f=n.id,c=n.onPostCommit;typeof c=="function"&&c(f,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(i){ul(t,t.return,i)}}else Tt(l,t,u,a);break;case 31:Tt(l,t,u,a);break;case 13:Tt(l,t,u,a);break;case 23:break;case 22:n=t.stateNode,f=t.alternate,t.memoizedState!==null?n._visibility&2?Tt(l,t,u,a):ee(l,t):n._visibility&2?Tt(l,t,u,a):(n._visibility|=2,oa(l,t,u,a,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Ec(f,t);break;case 24:Tt(l,t,u,a),e&2048&&Ac(t.alternate,t);break;default:Tt(l,t,u,a)}}function oa(l,t,u,a,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,f=t,c=u,i=a,m=f.flags;switch(f.tag){case 0:case 11:case 15:oa(n,f,c,i,e),ue(8,f);break;case 23:break;case 22:var S=f.stateNode;f.memoizedState!==null?S._visibility&2?oa(n,f,c,i,e):ee(n,f):(S._visibility|=2,oa(n,f,c,i,e)),e&&m&2048&&Ec(f.alternate,f);break;case 24:oa(n,f,c,i,e),e&&m&2048&&Ac(f.alternate,f);break;default:oa(n,f,c,i,e)}t=t.sibling}}function ee(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var u=l,a=t,e=a.flags;switch(a.tag){case 22:ee(u,a),e&2048&&Ec(a.alternate,a);break;case 24:ee(u,a),e&2048&&Ac(a.alternate,a);break;default:ee(u,a)}t=t.sibling}}var ne=8192;function ha(l,t,u){if(l.subtreeFlags&ne)for(l=l.child;l!==null;)ty(l,t,u),l=l.sibling}function ty(l,t,u){switch(l.tag){case 26:ha(l,t,u),l.flags&ne&&l.memoizedState!==null&&Qm(u,zt,l.memoizedState,l.memoizedProps);break;case 5:ha(l,t,u);break;case 3:case 4:var a=zt;zt=Dn(l.stateNode.containerInfo),ha(l,t,u),zt=a;break;case 22:l.memoizedState===null&&(a=l.alternate,a!==null&&a.memoizedState!==null?(a=ne,ne=16777216,ha(l,t,u),ne=a):ha(l,t,u));break;default:ha(l,t,u)}}function uy(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function fe(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ml=a,ey(a,l)}uy(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)ay(l),l=l.sibling}function ay(l){switch(l.tag){case 0:case 11:case 15:fe(l),l.flags&2048&&iu(9,l,l.return);break;case 3:fe(l);break;case 12:fe(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,on(l)):fe(l);break;default:fe(l)}}function on(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ml=a,ey(a,l)}uy(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:iu(8,t,t.return),on(t);break;case 22:u=t.stateNode,u._visibility&2&&(u._visibility&=-3,on(t));break;default:on(t)}l=l.sibling}}function ey(l,t){for(;Ml!==null;){var u=Ml;switch(u.tag){case 0:case 11:case 15:iu(8,u,t);break;case 23:case 22:if(u.memoizedState!==null&&u.memoizedState.cachePool!==null){var a=u.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:Va(u.memoizedState.cache)}if(a=u.child,a!==null)a.return=u,Ml=a;else l:for(u=l;Ml!==null;){a=Ml;var e=a.sibling,n=a.return;if(W0(a),a===u){Ml=null;break l}if(e!==null){e.return=n,Ml=e;break l}Ml=n}}}var tm={getCacheForType:function(l){var t=Ul(bl),u=t.data.get(l);return u===void 0&&(u=l(),t.data.set(l,u)),u},cacheSignal:function(){return Ul(bl).controller.signal}},um=typeof WeakMap=="function"?WeakMap:Map,I=0,sl=null,V=null,J=0,tl=0,et=null,su=!1,ga=!1,_c=!1,Jt=0,hl=0,yu=0,Qu=0,Oc=0,nt=0,Sa=0,ce=null,wl=null,Mc=!1,hn=0,ny=0,gn=1/0,Sn=null,du=null,_l=0,vu=null,ra=null,wt=0,Dc=0,pc=null,fy=null,ie=0,Uc=null;function ft(){return(I&2)!==0&&J!==0?J&-J:r.T!==null?Bc():Ei()}function cy(){if(nt===0)if((J&536870912)===0||$){var l=_e;_e<<=1,(_e&3932160)===0&&(_e=262144),nt=l}else nt=536870912;return l=ut.current,l!==null&&(l.flags|=32),nt}function Wl(l,t,u){(l===sl&&(tl===2||tl===9)||l.cancelPendingCommit!==null)&&(ba(l,0),mu(l,J,nt,!1)),Ua(l,u),((I&2)===0||l!==sl)&&(l===sl&&((I&2)===0&&(Qu|=u),hl===4&&mu(l,J,nt,!1)),pt(l))}function iy(l,t,u){if((I&6)!==0)throw Error(o(327));var a=!u&&(t&127)===0&&(t&l.expiredLanes)===0||pa(l,t),e=a?nm(l,t):Nc(l,t,!0),n=a;do{if(e===0){ga&&!a&&mu(l,t,0,!1);break}else{if(u=l.current.alternate,n&&!am(u)){e=Nc(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var f=0;else f=l.pendingLanes&-536870913,f=f!==0?f:f&536870912?536870912:0;if(f!==0){t=f;l:{var c=l;e=ce;var i=c.current.memoizedState.isDehydrated;if(i&&(ba(c,f).flags|=256),f=Nc(c,f,!1),f!==2){if(_c&&!i){c.errorRecoveryDisabledLanes|=n,Qu|=n,e=4;break l}n=wl,wl=e,n!==null&&(wl===null?wl=n:wl.push.apply(wl,n))}e=f}if(n=!1,e!==2)continue}}if(e===1){ba(l,0),mu(l,t,0,!0);break}l:{switch(a=l,n=e,n){case 0:case 1:throw Error(o(345));case 4:if((t&4194048)!==t)break;case 6:mu(a,t,nt,!su);break l;case 2:wl=null;break;case 3:case 5:break;default:throw Error(o(329))}if((t&62914560)===t&&(e=hn+300-kl(),10<e)){if(mu(a,t,nt,!su),Me(a,0,!0)!==0)break l;wt=t,a.timeoutHandle=Xy(sy.bind(null,a,u,wl,Sn,Mc,t,nt,Qu,Sa,su,n,"Throttled",-0,0),e);break l}sy(a,u,wl,Sn,Mc,t,nt,Qu,Sa,su,n,null,-0,0)}}break}while(!0);pt(l)}function sy(l,t,u,a,e,n,f,c,i,m,S,z,h,g){if(l.timeoutHandle=-1,z=t.subtreeFlags,z&8192||(z&16785408)===16785408){z={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Rt},ty(t,n,z);var D=(n&62914560)===n?hn-kl():(n&4194048)===n?ny-kl():0;if(D=xm(z,D),D!==null){wt=n,l.cancelPendingCommit=D(Sy.bind(null,l,t,n,u,a,e,f,c,i,S,z,null,h,g)),mu(l,n,f,!m);return}}Sy(l,t,n,u,a,e,f,c,i)}function am(l){for(var t=l;;){var u=t.tag;if((u===0||u===11||u===15)&&t.flags&16384&&(u=t.updateQueue,u!==null&&(u=u.stores,u!==null)))for(var a=0;a<u.length;a++){var e=u[a],n=e.getSnapshot;e=e.value;try{if(!lt(n(),e))return!1}catch{return!1}}if(u=t.child,t.subtreeFlags&16384&&u!==null)u.return=t,t=u;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function mu(l,t,u,a){t&=~Oc,t&=~Qu,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var e=t;0<e;){var n=31-Pl(e),f=1<<n;a[n]=-1,e&=~f}u!==0&&bi(l,u,t)}function rn(){return(I&6)===0?(se(0),!1):!0}function Hc(){if(V!==null){if(tl===0)var l=V.return;else l=V,Yt=Nu=null,Jf(l),sa=null,Ka=0,l=V;for(;l!==null;)Q0(l.alternate,l),l=l.return;V=null}}function ba(l,t){var u=l.timeoutHandle;u!==-1&&(l.timeoutHandle=-1,Am(u)),u=l.cancelPendingCommit,u!==null&&(l.cancelPendingCommit=null,u()),wt=0,Hc(),sl=l,V=u=Ct(l.current,null),J=t,tl=0,et=null,su=!1,ga=pa(l,t),_c=!1,Sa=nt=Oc=Qu=yu=hl=0,wl=ce=null,Mc=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var e=31-Pl(a),n=1<<e;t|=l[e],a&=~n}return Jt=t,Ge(),u}function yy(l,t){X=null,r.H=Pa,t===ia||t===Je?(t=Ms(),tl=3):t===Cf?(t=Ms(),tl=4):tl=t===ic?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,et=t,V===null&&(hl=1,fn(l,dt(t,l.current)))}function dy(){var l=ut.current;return l===null?!0:(J&4194048)===J?ht===null:(J&62914560)===J||(J&536870912)!==0?l===ht:!1}function vy(){var l=r.H;return r.H=Pa,l===null?Pa:l}function my(){var l=r.A;return r.A=tm,l}function bn(){hl=4,su||(J&4194048)!==J&&ut.current!==null||(ga=!0),(yu&134217727)===0&&(Qu&134217727)===0||sl===null||mu(sl,J,nt,!1)}function Nc(l,t,u){var a=I;I|=2;var e=vy(),n=my();(sl!==l||J!==t)&&(Sn=null,ba(l,t)),t=!1;var f=hl;l:do try{if(tl!==0&&V!==null){var c=V,i=et;switch(tl){case 8:Hc(),f=6;break l;case 3:case 2:case 9:case 6:ut.current===null&&(t=!0);var m=tl;if(tl=0,et=null,za(l,c,i,m),u&&ga){f=0;break l}break;default:m=tl,tl=0,et=null,za(l,c,i,m)}}em(),f=hl;break}catch(S){yy(l,S)}while(!0);return t&&l.shellSuspendCounter++,Yt=Nu=null,I=a,r.H=e,r.A=n,V===null&&(sl=null,J=0,Ge()),f}function em(){for(;V!==null;)oy(V)}function nm(l,t){var u=I;I|=2;var a=vy(),e=my();sl!==l||J!==t?(Sn=null,gn=kl()+500,ba(l,t)):ga=pa(l,t);l:do try{if(tl!==0&&V!==null){t=V;var n=et;t:switch(tl){case 1:tl=0,et=null,za(l,t,n,1);break;case 2:case 9:if(_s(n)){tl=0,et=null,hy(t);break}t=function(){tl!==2&&tl!==9||sl!==l||(tl=7),pt(l)},n.then(t,t);break l;case 3:tl=7;break l;case 4:tl=5;break l;case 7:_s(n)?(tl=0,et=null,hy(t)):(tl=0,et=null,za(l,t,n,7));break;case 5:var f=null;switch(V.tag){case 26:f=V.memoizedState;case 5:case 27:var c=V;if(f?ld(f):c.stateNode.complete){tl=0,et=null;var i=c.sibling;if(i!==null)V=i;else{var m=c.return;m!==null?(V=m,zn(m)):V=null}break t}}tl=0,et=null,za(l,t,n,5);break;case 6:tl=0,et=null,za(l,t,n,6);break;case 8:Hc(),hl=6;break l;default:throw Error(o(462))}}fm();break}catch(S){yy(l,S)}while(!0);return Yt=Nu=null,r.H=a,r.A=e,I=u,V!==null?0:(sl=null,J=0,Ge(),hl)}function fm(){for(;V!==null&&!Ud();)oy(V)}function oy(l){var t=G0(l.alternate,l,Jt);l.memoizedProps=l.pendingProps,t===null?zn(l):V=t}function hy(l){var t=l,u=t.alternate;switch(t.tag){case 15:case 0:t=R0(u,t,t.pendingProps,t.type,void 0,J);break;case 11:t=R0(u,t,t.pendingProps,t.type.render,t.ref,J);break;case 5:Jf(t);default:Q0(u,t),t=V=ms(t,Jt),t=G0(u,t,Jt)}l.memoizedProps=l.pendingProps,t===null?zn(l):V=t}function za(l,t,u,a){Yt=Nu=null,Jf(t),sa=null,Ka=0;var e=t.return;try{if(Wv(l,e,t,u,J)){hl=1,fn(l,dt(u,l.current)),V=null;return}}catch(n){if(e!==null)throw V=e,n;hl=1,fn(l,dt(u,l.current)),V=null;return}t.flags&32768?($||a===1?l=!0:ga||(J&536870912)!==0?l=!1:(su=l=!0,(a===2||a===9||a===3||a===6)&&(a=ut.current,a!==null&&a.tag===13&&(a.flags|=16384))),gy(t,l)):zn(t)}function zn(l){var t=l;do{if((t.flags&32768)!==0){gy(t,su);return}l=t.return;var u=kv(t.alternate,t,Jt);if(u!==null){V=u;return}if(t=t.sibling,t!==null){V=t;return}V=t=l}while(t!==null);hl===0&&(hl=5)}function gy(l,t){do{var u=Iv(l.alternate,l);if(u!==null){u.flags&=32767,V=u;return}if(u=l.return,u!==null&&(u.flags|=32768,u.subtreeFlags=0,u.deletions=null),!t&&(l=l.sibling,l!==null)){V=l;return}V=l=u}while(l!==null);hl=6,V=null}function Sy(l,t,u,a,e,n,f,c,i){l.cancelPendingCommit=null;do Tn();while(_l!==0);if((I&6)!==0)throw Error(o(327));if(t!==null){if(t===l.current)throw Error(o(177));if(n=t.lanes|t.childLanes,n|=bf,Xd(l,u,n,f,c,i),l===sl&&(V=sl=null,J=0),ra=t,vu=l,wt=u,Dc=n,pc=e,fy=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,ym(Ee,function(){return Ey(),null})):(l.callbackNode=null,l.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=r.T,r.T=null,e=O.p,O.p=2,f=I,I|=4;try{Pv(l,t,u)}finally{I=f,O.p=e,r.T=a}}_l=1,ry(),by(),zy()}}function ry(){if(_l===1){_l=0;var l=vu,t=ra,u=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||u){u=r.T,r.T=null;var a=O.p;O.p=2;var e=I;I|=4;try{I0(t,l);var n=Vc,f=es(l.containerInfo),c=n.focusedElem,i=n.selectionRange;if(f!==c&&c&&c.ownerDocument&&as(c.ownerDocument.documentElement,c)){if(i!==null&&of(c)){var m=i.start,S=i.end;if(S===void 0&&(S=m),"selectionStart"in c)c.selectionStart=m,c.selectionEnd=Math.min(S,c.value.length);else{var z=c.ownerDocument||document,h=z&&z.defaultView||window;if(h.getSelection){var g=h.getSelection(),D=c.textContent.length,R=Math.min(i.start,D),fl=i.end===void 0?R:Math.min(i.end,D);!g.extend&&R>fl&&(f=fl,fl=R,R=f);var d=us(c,R),s=us(c,fl);if(d&&s&&(g.rangeCount!==1||g.anchorNode!==d.node||g.anchorOffset!==d.offset||g.focusNode!==s.node||g.focusOffset!==s.offset)){var v=z.createRange();v.setStart(d.node,d.offset),g.removeAllRanges(),R>fl?(g.addRange(v),g.extend(s.node,s.offset)):(v.setEnd(s.node,s.offset),g.addRange(v))}}}}for(z=[],g=c;g=g.parentNode;)g.nodeType===1&&z.push({element:g,left:g.scrollLeft,top:g.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<z.length;c++){var b=z[c];b.element.scrollLeft=b.left,b.element.scrollTop=b.top}}qn=!!Zc,Vc=Zc=null}finally{I=e,O.p=a,r.T=u}}l.current=t,_l=2}}function by(){if(_l===2){_l=0;var l=vu,t=ra,u=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||u){u=r.T,r.T=null;var a=O.p;O.p=2;var e=I;I|=4;try{w0(l,t.alternate,t)}finally{I=e,O.p=a,r.T=u}}_l=3}}function zy(){if(_l===4||_l===3){_l=0,Hd();var l=vu,t=ra,u=wt,a=fy;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?_l=5:(_l=0,ra=vu=null,Ty(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(du=null),Wn(u),t=t.stateNode,Il&&typeof Il.onCommitFiberRoot=="function")try{Il.onCommitFiberRoot(Da,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=r.T,e=O.p,O.p=2,r.T=null;try{for(var n=l.onRecoverableError,f=0;f<a.length;f++){var c=a[f];n(c.value,{componentStack:c.stack})}}finally{r.T=t,O.p=e}}(wt&3)!==0&&Tn(),pt(l),e=l.pendingLanes,(u&261930)!==0&&(e&42)!==0?l===Uc?ie++:(ie=0,Uc=l):ie=0,se(0)}}function Ty(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Va(t)))}function Tn(){return ry(),by(),zy(),Ey()}function Ey(){if(_l!==5)return!1;var l=vu,t=Dc;Dc=0;var u=Wn(wt),a=r.T,e=O.p;try{O.p=32>u?32:u,r.T=null,u=pc,pc=null;var n=vu,f=wt;if(_l=0,ra=vu=null,wt=0,(I&6)!==0)throw Error(o(331));var c=I;if(I|=4,ay(n.current),ly(n,n.current,f,u),I=c,se(0,!1),Il&&typeof Il.onPostCommitFiberRoot=="function")try{Il.onPostCommitFiberRoot(Da,n)}catch{}return!0}finally{O.p=e,r.T=a,Ty(l,t)}}function Ay(l,t,u){t=dt(u,t),t=cc(l.stateNode,t,2),l=nu(l,t,2),l!==null&&(Ua(l,2),pt(l))}function ul(l,t,u){if(l.tag===3)Ay(l,l,u);else for(;t!==null;){if(t.tag===3){Ay(t,l,u);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(du===null||!du.has(a))){l=dt(u,l),u=_0(2),a=nu(t,u,2),a!==null&&(O0(u,a,t,l),Ua(a,2),pt(a));break}}t=t.return}}function Rc(l,t,u){var a=l.pingCache;if(a===null){a=l.pingCache=new um;var e=new Set;a.set(t,e)}else e=a.get(t),e===void 0&&(e=new Set,a.set(t,e));e.has(u)||(_c=!0,e.add(u),l=cm.bind(null,l,t,u),t.then(l,l))}function cm(l,t,u){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&u,l.warmLanes&=~u,sl===l&&(J&u)===u&&(hl===4||hl===3&&(J&62914560)===J&&300>kl()-hn?(I&2)===0&&ba(l,0):Oc|=u,Sa===J&&(Sa=0)),pt(l)}function _y(l,t){t===0&&(t=ri()),l=pu(l,t),l!==null&&(Ua(l,t),pt(l))}function im(l){var t=l.memoizedState,u=0;t!==null&&(u=t.retryLane),_y(l,u)}function sm(l,t){var u=0;switch(l.tag){case 31:case 13:var a=l.stateNode,e=l.memoizedState;e!==null&&(u=e.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(o(314))}a!==null&&a.delete(t),_y(l,u)}function ym(l,t){return Ln(l,t)}var En=null,Ta=null,qc=!1,An=!1,Cc=!1,ou=0;function pt(l){l!==Ta&&l.next===null&&(Ta===null?En=Ta=l:Ta=Ta.next=l),An=!0,qc||(qc=!0,vm())}function se(l,t){if(!Cc&&An){Cc=!0;do for(var u=!1,a=En;a!==null;){if(l!==0){var e=a.pendingLanes;if(e===0)var n=0;else{var f=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-Pl(42|l)+1)-1,n&=e&~(f&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(u=!0,py(a,n))}else n=J,n=Me(a,a===sl?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||pa(a,n)||(u=!0,py(a,n));a=a.next}while(u);Cc=!1}}function dm(){Oy()}function Oy(){An=qc=!1;var l=0;ou!==0&&Em()&&(l=ou);for(var t=kl(),u=null,a=En;a!==null;){var e=a.next,n=My(a,t);n===0?(a.next=null,u===null?En=e:u.next=e,e===null&&(Ta=u)):(u=a,(l!==0||(n&3)!==0)&&(An=!0)),a=e}_l!==0&&_l!==5||se(l),ou!==0&&(ou=0)}function My(l,t){for(var u=l.suspendedLanes,a=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var f=31-Pl(n),c=1<<f,i=e[f];i===-1?((c&u)===0||(c&a)!==0)&&(e[f]=Gd(c,t)):i<=t&&(l.expiredLanes|=c),n&=~c}if(t=sl,u=J,u=Me(l,l===t?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a=l.callbackNode,u===0||l===t&&(tl===2||tl===9)||l.cancelPendingCommit!==null)return a!==null&&a!==null&&Kn(a),l.callbackNode=null,l.callbackPriority=0;if((u&3)===0||pa(l,u)){if(t=u&-u,t===l.callbackPriority)return t;switch(a!==null&&Kn(a),Wn(u)){case 2:case 8:u=gi;break;case 32:u=Ee;break;case 268435456:u=Si;break;default:u=Ee}return a=Dy.bind(null,l),u=Ln(u,a),l.callbackPriority=t,l.callbackNode=u,t}return a!==null&&a!==null&&Kn(a),l.callbackPriority=2,l.callbackNode=null,2}function Dy(l,t){if(_l!==0&&_l!==5)return l.callbackNode=null,l.callbackPriority=0,null;var u=l.callbackNode;if(Tn()&&l.callbackNode!==u)return null;var a=J;return a=Me(l,l===sl?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a===0?null:(iy(l,a,t),My(l,kl()),l.callbackNode!=null&&l.callbackNode===u?Dy.bind(null,l):null)}function py(l,t){if(Tn())return null;iy(l,t,!0)}function vm(){_m(function(){(I&6)!==0?Ln(hi,dm):Oy()})}function Bc(){if(ou===0){var l=fa;l===0&&(l=Ae,Ae<<=1,(Ae&261888)===0&&(Ae=256)),ou=l}return ou}function Uy(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:He(""+l)}function Hy(l,t){var u=t.ownerDocument.createElement("input");return u.name=t.name,u.value=t.value,l.id&&u.setAttribute("form",l.id),t.parentNode.insertBefore(u,t),l=new FormData(l),u.parentNode.removeChild(u),l}function mm(l,t,u,a,e){if(t==="submit"&&u&&u.stateNode===e){var n=Uy((e[Zl]||null).action),f=a.submitter;f&&(t=(t=f[Zl]||null)?Uy(t.formAction):f.getAttribute("formAction"),t!==null&&(n=t,f=null));var c=new Ce("action","action",null,a,e);l.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(ou!==0){var i=f?Hy(e,f):new FormData(e);tc(u,{pending:!0,data:i,method:e.method,action:n},null,i)}}else typeof n=="function"&&(c.preventDefault(),i=f?Hy(e,f):new FormData(e),tc(u,{pending:!0,data:i,method:e.method,action:n},n,i))},currentTarget:e}]})}}for(var Yc=0;Yc<rf.length;Yc++){var jc=rf[Yc],om=jc.toLowerCase(),hm=jc[0].toUpperCase()+jc.slice(1);bt(om,"on"+hm)}bt(cs,"onAnimationEnd"),bt(is,"onAnimationIteration"),bt(ss,"onAnimationStart"),bt("dblclick","onDoubleClick"),bt("focusin","onFocus"),bt("focusout","onBlur"),bt(Nv,"onTransitionRun"),bt(Rv,"onTransitionStart"),bt(qv,"onTransitionCancel"),bt(ys,"onTransitionEnd"),Ju("onMouseEnter",["mouseout","mouseover"]),Ju("onMouseLeave",["mouseout","mouseover"]),Ju("onPointerEnter",["pointerout","pointerover"]),Ju("onPointerLeave",["pointerout","pointerover"]),_u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),_u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),_u("onBeforeInput",["compositionend","keypress","textInput","paste"]),_u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),_u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),_u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var ye="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),gm=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(ye));function Ny(l,t){t=(t&4)!==0;for(var u=0;u<l.length;u++){var a=l[u],e=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var f=a.length-1;0<=f;f--){var c=a[f],i=c.instance,m=c.currentTarget;if(c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(S){je(S)}e.currentTarget=null,n=i}else for(f=0;f<a.length;f++){if(c=a[f],i=c.instance,m=c.currentTarget,c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(S){je(S)}e.currentTarget=null,n=i}}}}function L(l,t){var u=t[$n];u===void 0&&(u=t[$n]=new Set);var a=l+"__bubble";u.has(a)||(Ry(t,l,2,!1),u.add(a))}function Gc(l,t,u){var a=0;t&&(a|=4),Ry(u,l,a,t)}var _n="_reactListening"+Math.random().toString(36).slice(2);function Xc(l){if(!l[_n]){l[_n]=!0,Oi.forEach(function(u){u!=="selectionchange"&&(gm.has(u)||Gc(u,!1,l),Gc(u,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[_n]||(t[_n]=!0,Gc("selectionchange",!1,t))}}function Ry(l,t,u,a){switch(cd(t)){case 2:var e=Lm;break;case 8:e=Km;break;default:e=li}u=e.bind(null,t,u,l),e=void 0,!ef||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),a?e!==void 0?l.addEventListener(t,u,{capture:!0,passive:e}):l.addEventListener(t,u,!0):e!==void 0?l.addEventListener(t,u,{passive:e}):l.addEventListener(t,u,!1)}function Qc(l,t,u,a,e){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var f=a.tag;if(f===3||f===4){var c=a.stateNode.containerInfo;if(c===e)break;if(f===4)for(f=a.return;f!==null;){var i=f.tag;if((i===3||i===4)&&f.stateNode.containerInfo===e)return;f=f.return}for(;c!==null;){if(f=Vu(c),f===null)return;if(i=f.tag,i===5||i===6||i===26||i===27){a=n=f;continue l}c=c.parentNode}}a=a.return}ji(function(){var m=n,S=uf(u),z=[];l:{var h=ds.get(l);if(h!==void 0){var g=Ce,D=l;switch(l){case"keypress":if(Re(u)===0)break l;case"keydown":case"keyup":g=sv;break;case"focusin":D="focus",g=sf;break;case"focusout":D="blur",g=sf;break;case"beforeblur":case"afterblur":g=sf;break;case"click":if(u.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Qi;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=kd;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=vv;break;case cs:case is:case ss:g=lv;break;case ys:g=ov;break;case"scroll":case"scrollend":g=$d;break;case"wheel":g=gv;break;case"copy":case"cut":case"paste":g=uv;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=Zi;break;case"toggle":case"beforetoggle":g=rv}var R=(t&4)!==0,fl=!R&&(l==="scroll"||l==="scrollend"),d=R?h!==null?h+"Capture":null:h;R=[];for(var s=m,v;s!==null;){var b=s;if(v=b.stateNode,b=b.tag,b!==5&&b!==26&&b!==27||v===null||d===null||(b=Ra(s,d),b!=null&&R.push(de(s,b,v))),fl)break;s=s.return}0<R.length&&(h=new g(h,D,null,u,S),z.push({event:h,listeners:R}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",g=l==="mouseout"||l==="pointerout",h&&u!==tf&&(D=u.relatedTarget||u.fromElement)&&(Vu(D)||D[Zu]))break l;if((g||h)&&(h=S.window===S?S:(h=S.ownerDocument)?h.defaultView||h.parentWindow:window,g?(D=u.relatedTarget||u.toElement,g=m,D=D?Vu(D):null,D!==null&&(fl=j(D),R=D.tag,D!==fl||R!==5&&R!==27&&R!==6)&&(D=null)):(g=null,D=m),g!==D)){if(R=Qi,b="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(R=Zi,b="onPointerLeave",d="onPointerEnter",s="pointer"),fl=g==null?h:Na(g),v=D==null?h:Na(D),h=new R(b,s+"leave",g,u,S),h.target=fl,h.relatedTarget=v,b=null,Vu(S)===m&&(R=new R(d,s+"enter",D,u,S),R.target=v,R.relatedTarget=fl,b=R),fl=b,g&&D)t:{for(R=Sm,d=g,s=D,v=0,b=d;b;b=R(b))v++;b=0;for(var H=s;H;H=R(H))b++;for(;0<v-b;)d=R(d),v--;for(;0<b-v;)s=R(s),b--;for(;v--;){if(d===s||s!==null&&d===s.alternate){R=d;break t}d=R(d),s=R(s)}R=null}else R=null;g!==null&&qy(z,h,g,R,!1),D!==null&&fl!==null&&qy(z,fl,D,R,!0)}}l:{if(h=m?Na(m):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var F=Fi;else if(Wi(h))if(ki)F=pv;else{F=Mv;var U=Ov}else g=h.nodeName,!g||g.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?m&&lf(m.elementType)&&(F=Fi):F=Dv;if(F&&(F=F(l,m))){$i(z,F,u,S);break l}U&&U(l,h,m),l==="focusout"&&m&&h.type==="number"&&m.memoizedProps.value!=null&&Pn(h,"number",h.value)}switch(U=m?Na(m):window,l){case"focusin":(Wi(U)||U.contentEditable==="true")&&(Iu=U,hf=m,Qa=null);break;case"focusout":Qa=hf=Iu=null;break;case"mousedown":gf=!0;break;case"contextmenu":case"mouseup":case"dragend":gf=!1,ns(z,u,S);break;case"selectionchange":if(Hv)break;case"keydown":case"keyup":ns(z,u,S)}var Q;if(df)l:{switch(l){case"compositionstart":var w="onCompositionStart";break l;case"compositionend":w="onCompositionEnd";break l;case"compositionupdate":w="onCompositionUpdate";break l}w=void 0}else ku?Ji(l,u)&&(w="onCompositionEnd"):l==="keydown"&&u.keyCode===229&&(w="onCompositionStart");w&&(Vi&&u.locale!=="ko"&&(ku||w!=="onCompositionStart"?w==="onCompositionEnd"&&ku&&(Q=Gi()):(It=S,nf="value"in It?It.value:It.textContent,ku=!0)),U=On(m,w),0<U.length&&(w=new xi(w,l,null,u,S),z.push({event:w,listeners:U}),Q?w.data=Q:(Q=wi(u),Q!==null&&(w.data=Q)))),(Q=zv?Tv(l,u):Ev(l,u))&&(w=On(m,"onBeforeInput"),0<w.length&&(U=new xi("onBeforeInput","beforeinput",null,u,S),z.push({event:U,listeners:w}),U.data=Q)),mm(z,l,m,u,S)}Ny(z,t)})}function de(l,t,u){return{instance:l,listener:t,currentTarget:u}}function On(l,t){for(var u=t+"Capture",a=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=Ra(l,u),e!=null&&a.unshift(de(l,e,n)),e=Ra(l,t),e!=null&&a.push(de(l,e,n))),l.tag===3)return a;l=l.return}return[]}function Sm(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function qy(l,t,u,a,e){for(var n=t._reactName,f=[];u!==null&&u!==a;){var c=u,i=c.alternate,m=c.stateNode;if(c=c.tag,i!==null&&i===a)break;c!==5&&c!==26&&c!==27||m===null||(i=m,e?(m=Ra(u,n),m!=null&&f.unshift(de(u,m,i))):e||(m=Ra(u,n),m!=null&&f.push(de(u,m,i)))),u=u.return}f.length!==0&&l.push({event:t,listeners:f})}var rm=/\r\n?/g,bm=/\u0000|\uFFFD/g;function Cy(l){return(typeof l=="string"?l:""+l).replace(rm,`
-`).replace(bm,"")}function By(l,t){return t=Cy(t),Cy(l)===t}function nl(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&Wu(l,""+a);break;case"className":pe(l,"class",a);break;case"tabIndex":pe(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":pe(l,u,a);break;case"style":Bi(l,a,n);break;case"data":if(t!=="object"){pe(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&nl(l,t,"name",e.name,e,null),nl(l,t,"formEncType",e.formEncType,e,null),nl(l,t,"formMethod",e.formMethod,e,null),nl(l,t,"formTarget",e.formTarget,e,null)):(nl(l,t,"encType",e.encType,e,null),nl(l,t,"method",e.method,e,null),nl(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Rt);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=He(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":L("beforetoggle",l),L("toggle",l),De(l,"popover",a);break;case"xlinkActuate":Nt(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Nt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Nt(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Nt(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Nt(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Nt(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":De(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=wd.get(u)||u,De(l,u,a))}}function xc(l,t,u,a,e,n){switch(u){case"style":Bi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"children":typeof a=="string"?Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&Wu(l,""+a);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Rt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Mi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Zl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):De(l,u,a)}}}function Nl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":L("error",l),L("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:nl(l,t,n,f,u,null)}}e&&nl(l,t,"srcSet",u.srcSet,u,null),a&&nl(l,t,"src",u.src,u,null);return;case"input":L("invalid",l);var c=n=f=e=null,i=null,m=null;for(a in u)if(u.hasOwnProperty(a)){var S=u[a];if(S!=null)switch(a){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":m=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(o(137,t));break;default:nl(l,t,a,S,u,null)}}Ni(l,n,c,i,m,f,e,!1);return;case"select":L("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:nl(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":L("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(o(91));break;default:nl(l,t,f,c,u,null)}qi(l,a,e,n);return;case"option":for(i in u)if(u.hasOwnProperty(i)&&(a=u[i],a!=null))switch(i){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:nl(l,t,i,a,u,null)}return;case"dialog":L("beforetoggle",l),L("toggle",l),L("cancel",l),L("close",l);break;case"iframe":case"object":L("load",l);break;case"video":case"audio":for(a=0;a<ye.length;a++)L(ye[a],l);break;case"image":L("error",l),L("load",l);break;case"details":L("toggle",l);break;case"embed":case"source":case"link":L("error",l),L("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in u)if(u.hasOwnProperty(m)&&(a=u[m],a!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:nl(l,t,m,a,u,null)}return;default:if(lf(t)){for(S in u)u.hasOwnProperty(S)&&(a=u[S],a!==void 0&&xc(l,t,S,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&nl(l,t,c,a,u,null))}function zm(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,S=null;for(g in u){var z=u[g];if(u.hasOwnProperty(g)&&z!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=z;default:a.hasOwnProperty(g)||nl(l,t,g,null,a,z)}}for(var h in a){var g=a[h];if(z=u[h],a.hasOwnProperty(h)&&(g!=null||z!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(o(137,t));break;default:g!==z&&nl(l,t,h,g,a,z)}}In(l,f,c,i,m,S,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||nl(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&nl(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:nl(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(o(91));break;default:e!==n&&nl(l,t,f,e,a,n)}Ri(l,h,g);return;case"option":for(var D in u)if(h=u[D],u.hasOwnProperty(D)&&h!=null&&!a.hasOwnProperty(D))switch(D){case"selected":l.selected=!1;break;default:nl(l,t,D,null,a,h)}for(i in a)if(h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:nl(l,t,i,h,a,g)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var R in u)h=u[R],u.hasOwnProperty(R)&&h!=null&&!a.hasOwnProperty(R)&&nl(l,t,R,null,a,h);for(m in a)if(h=a[m],g=u[m],a.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(o(137,t));break;default:nl(l,t,m,h,a,g)}return;default:if(lf(t)){for(var fl in u)h=u[fl],u.hasOwnProperty(fl)&&h!==void 0&&!a.hasOwnProperty(fl)&&xc(l,t,fl,void 0,a,h);for(S in a)h=a[S],g=u[S],!a.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||xc(l,t,S,h,a,g);return}}for(var d in u)h=u[d],u.hasOwnProperty(d)&&h!=null&&!a.hasOwnProperty(d)&&nl(l,t,d,null,a,h);for(z in a)h=a[z],g=u[z],!a.hasOwnProperty(z)||h===g||h==null&&g==null||nl(l,t,z,h,a,g)}function Yy(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Tm(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&Yy(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],m=i.startTime;if(m>c)break;var S=i.transferSize,z=i.initiatorType;S&&Yy(z)&&(i=i.responseEnd,f+=S*(i<c?1:(c-m)/(i-m)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Zc=null,Vc=null;function Mn(l){return l.nodeType===9?l:l.ownerDocument}function jy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Gy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function Em(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Xy=typeof setTimeout=="function"?setTimeout:void 0,Am=typeof clearTimeout=="function"?clearTimeout:void 0,Qy=typeof Promise=="function"?Promise:void 0,_m=typeof queueMicrotask=="function"?queueMicrotask:typeof Qy<"u"?function(l){return Qy.resolve(null).then(l).catch(Om)}:Xy;function Om(l){setTimeout(function(){throw l})}function hu(l){return l==="head"}function xy(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),Oa(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")ve(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,ve(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Ha]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&ve(l.ownerDocument.body);u=e}while(u);Oa(t)}function Zy(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),Fn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Mm(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Ha])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=gt(l.nextSibling),l===null)break}return null}function Dm(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=gt(l.nextSibling),l===null))return null;return l}function Vy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=gt(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function pm(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function gt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Ly(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return gt(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Ky(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Jy(l,t,u){switch(t=Mn(u),l){case"html":if(l=t.documentElement,!l)throw Error(o(452));return l;case"head":if(l=t.head,!l)throw Error(o(453));return l;case"body":if(l=t.body,!l)throw Error(o(454));return l;default:throw Error(o(451))}}function ve(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var St=new Map,wy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Wt=O.d;O.d={f:Um,r:Hm,D:Nm,C:Rm,L:qm,m:Cm,X:Ym,S:Bm,M:jm};function Um(){var l=Wt.f(),t=rn();return l||t}function Hm(l){var t=Lu(l);t!==null&&t.tag===5&&t.type==="form"?y0(t):Wt.r(l)}var Ea=typeof document>"u"?null:document;function Wy(l,t,u){var a=Ea;if(a&&typeof t=="string"&&t){var e=st(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),wy.has(e)||(wy.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),Nl(t,"link",l),Ol(t),a.head.appendChild(t)))}}function Nm(l){Wt.D(l),Wy("dns-prefetch",l,null)}function Rm(l,t){Wt.C(l,t),Wy("preconnect",l,t)}function qm(l,t,u){Wt.L(l,t,u);var a=Ea;if(a&&l&&t){var e='link[rel="preload"][as="'+st(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+st(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+st(u.imageSizes)+'"]')):e+='[href="'+st(l)+'"]';var n=e;switch(t){case"style":n=Aa(l);break;case"script":n=_a(l)}St.has(n)||(l=q({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),St.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(me(n))||t==="script"&&a.querySelector(oe(n))||(t=a.createElement("link"),Nl(t,"link",l),Ol(t),a.head.appendChild(t)))}}function Cm(l,t){Wt.m(l,t);var u=Ea;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+st(a)+'"][href="'+st(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=_a(l)}if(!St.has(n)&&(l=q({rel:"modulepreload",href:l},t),St.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(oe(n)))return}a=u.createElement("link"),Nl(a,"link",l),Ol(a),u.head.appendChild(a)}}}function Bm(l,t,u){Wt.S(l,t,u);var a=Ea;if(a&&l){var e=Ku(a).hoistableStyles,n=Aa(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(me(n)))c.loading=5;else{l=q({rel:"stylesheet",href:l,"data-precedence":t},u),(u=St.get(n))&&Fc(l,u);var i=f=a.createElement("link");Ol(i),Nl(i,"link",l),i._p=new Promise(function(m,S){i.onload=m,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,pn(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Ym(l,t){Wt.X(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Ol(n),Nl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function jm(l,t){Wt.M(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0,type:"module"},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Ol(n),Nl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function $y(l,t,u,a){var e=(e=Z.current)?Dn(e):null;if(!e)throw Error(o(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Aa(u.href),u=Ku(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Aa(u.href);var n=Ku(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(me(l)))&&!n._p&&(f.instance=n,f.state.loading=5),St.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},St.set(l,u),n||Gm(e,l,u,f.state))),t&&a===null)throw Error(o(528,""));return f}if(t&&a!==null)throw Error(o(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(u),u=Ku(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,l))}}function Aa(l){return'href="'+st(l)+'"'}function me(l){return'link[rel="stylesheet"]['+l+"]"}function Fy(l){return q({},l,{"data-precedence":l.precedence,precedence:null})}function Gm(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Nl(t,"link",u),Ol(t),l.head.appendChild(t))}function _a(l){return'[src="'+st(l)+'"]'}function oe(l){return"script[async]"+l}function ky(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+st(u.href)+'"]');if(a)return t.instance=a,Ol(a),a;var e=q({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Ol(a),Nl(a,"style",e),pn(a,u.precedence,l),t.instance=a;case"stylesheet":e=Aa(u.href);var n=l.querySelector(me(e));if(n)return t.state.loading|=4,t.instance=n,Ol(n),n;a=Fy(u),(e=St.get(e))&&Fc(a,e),n=(l.ownerDocument||l).createElement("link"),Ol(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Nl(n,"link",a),t.state.loading|=4,pn(n,u.precedence,l),t.instance=n;case"script":return n=_a(u.src),(e=l.querySelector(oe(n)))?(t.instance=e,Ol(e),e):(a=u,(e=St.get(n))&&(a=q({},u),kc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),Ol(e),Nl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(o(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,pn(a,u.precedence,l));return t.instance}function pn(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Un=null;function Iy(l,t,u){if(Un===null){var a=new Map,e=Un=new Map;e.set(u,a)}else e=Un,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Ha]||n[Dl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Py(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Xm(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function ld(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qm(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Aa(a.href),n=t.querySelector(me(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Hn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,Ol(n);return}n=t.ownerDocument||t,a=Fy(a),(e=St.get(e))&&Fc(a,e),n=n.createElement("link"),Ol(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Nl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Hn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function xm(l,t){return l.stylesheets&&l.count===0&&Rn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*Tm());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Hn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Rn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Nn=null;function Rn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Nn=new Map,t.forEach(Zm,l),Nn=null,Hn.call(l))}function Zm(l,t){if(!(t.state.loading&4)){var u=Nn.get(l);if(u)var a=u.get(null);else{u=new Map,Nn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Hn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var he={$$typeof:ql,Provider:null,Consumer:null,_currentValue:C,_currentValue2:C,_threadCount:0};function Vm(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function td(l,t,u,a,e,n,f,c,i,m,S,z){return l=new Vm(l,t,u,f,i,m,S,z,c),t=1,n===!0&&(t|=24),n=tt(3,null,null,t),l.current=n,n.stateNode=l,t=Nf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},Bf(n),l}function ud(l){return l?(l=ta,l):ta}function ad(l,t,u,a,e,n){e=ud(e),a.context===null?a.context=e:a.pendingContext=e,a=eu(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=nu(l,a,t),u!==null&&(Wl(u,l,t),wa(u,l,t))}function ed(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){ed(l,t),(l=l.alternate)&&ed(l,t)}function nd(l){if(l.tag===13||l.tag===31){var t=pu(l,67108864);t!==null&&Wl(t,l,67108864),Pc(l,67108864)}}function fd(l){if(l.tag===13||l.tag===31){var t=ft();t=wn(t);var u=pu(l,t);u!==null&&Wl(u,l,t),Pc(l,t)}}var qn=!0;function Lm(l,t,u,a){var e=r.T;r.T=null;var n=O.p;try{O.p=2,li(l,t,u,a)}finally{O.p=n,r.T=e}}function Km(l,t,u,a){var e=r.T;r.T=null;var n=O.p;try{O.p=8,li(l,t,u,a)}finally{O.p=n,r.T=e}}function li(l,t,u,a){if(qn){var e=ti(a);if(e===null)Qc(l,t,a,Cn,u),id(l,a);else if(wm(e,l,t,u,a))a.stopPropagation();else if(id(l,a),t&4&&-1<Jm.indexOf(l)){for(;e!==null;){var n=Lu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Au(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Pl(f);c.entanglements[1]|=i,f&=~i}pt(n),(I&6)===0&&(gn=kl()+500,se(0))}}break;case 31:case 13:c=pu(n,2),c!==null&&Wl(c,n,2),rn(),Pc(n,2)}if(n=ti(a),n===null&&Qc(l,t,a,Cn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Qc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var Cn=null;function ui(l){if(Cn=null,l=Vu(l),l!==null){var t=j(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=cl(t),l!==null)return l;l=null}else if(u===31){if(l=Al(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Cn=l,null}function cd(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Nd()){case hi:return 2;case gi:return 8;case Ee:case Rd:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,gu=null,Su=null,ru=null,ge=new Map,Se=new Map,bu=[],Jm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function id(l,t){switch(l){case"focusin":case"focusout":gu=null;break;case"dragenter":case"dragleave":Su=null;break;case"mouseover":case"mouseout":ru=null;break;case"pointerover":case"pointerout":ge.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Se.delete(t.pointerId)}}function re(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Lu(t),t!==null&&nd(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function wm(l,t,u,a,e){switch(t){case"focusin":return gu=re(gu,l,t,u,a,e),!0;case"dragenter":return Su=re(Su,l,t,u,a,e),!0;case"mouseover":return ru=re(ru,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ge.set(n,re(ge.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,Se.set(n,re(Se.get(n)||null,l,t,u,a,e)),!0}return!1}function sd(l){var t=Vu(l.target);if(t!==null){var u=j(t);if(u!==null){if(t=u.tag,t===13){if(t=cl(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fd(u)});return}}else if(t===31){if(t=Al(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fd(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Lu(u),t!==null&&nd(t),l.blockedOn=u,!1;t.shift()}return!0}function yd(l,t,u){Bn(l)&&u.delete(t)}function Wm(){ai=!1,gu!==null&&Bn(gu)&&(gu=null),Su!==null&&Bn(Su)&&(Su=null),ru!==null&&Bn(ru)&&(ru=null),ge.forEach(yd),Se.forEach(yd)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,A.unstable_scheduleCallback(A.unstable_NormalPriority,Wm)))}var jn=null;function dd(l){jn!==l&&(jn=l,A.unstable_scheduleCallback(A.unstable_NormalPriority,function(){jn===l&&(jn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Lu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function Oa(l){function t(i){return Yn(i,l)}gu!==null&&Yn(gu,l),Su!==null&&Yn(Su,l),ru!==null&&Yn(ru,l),ge.forEach(t),Se.forEach(t);for(var u=0;u<bu.length;u++){var a=bu[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<bu.length&&(u=bu[0],u.blockedOn===null);)sd(u),u.blockedOn===null&&bu.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[Zl]||null;if(typeof n=="function")f||dd(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Zl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),dd(u)}}}function vd(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}Gn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(o(409));var u=t.current,a=ft();ad(u,a,l,t,null,null)},Gn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;ad(l.current,2,null,l,null,null),rn(),t[Zu]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var u=0;u<bu.length&&t!==0&&t<bu[u].priority;u++);bu.splice(u,0,l),u===0&&sd(l)}};var md=x.version;if(md!=="19.2.4")throw Error(o(527,md,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(o(188)):(l=Object.keys(l).join(","),Error(o(268,l)));return l=E(t),l=l!==null?P(l):null,l=l===null?null:l.stateNode,l};var $m={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:r,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Da=Xn.inject($m),Il=Xn}catch{}}return ze.createRoot=function(l,t){if(!_(l))throw Error(o(299));var u=!1,a="",e=z0,n=T0,f=E0;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=td(l,1,!1,null,null,u,a,null,e,n,f,vd),l[Zu]=t.current,Xc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!_(l))throw Error(o(299));var a=!1,e="",n=z0,f=T0,c=E0,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=td(l,1,!0,t,u??null,a,e,i,n,f,c,vd),t.context=ud(null),u=t.current,a=ft(),a=wn(a),e=eu(a),e.callback=null,nu(u,e,a),u=a,t.current.lanes=u,Ua(t,u),pt(t),l[Zu]=t.current,Xc(l),new Gn(t)},ze.version="19.2.4",ze}var Ad;function no(){if(Ad)return fi.exports;Ad=1;function A(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(A)}catch(x){console.error(x)}}return A(),fi.exports=eo(),fi.exports}var fo=no(),_d=vi();let co=1;const di=new Map;function io(A,x){const B=co++,o={jsonrpc:"2.0",id:B,method:A,params:x??{}};return new Promise((_,j)=>{di.set(B,{resolve:_,reject:j}),window.parent.postMessage(o,"*")})}function so(A,x){window.parent.postMessage({jsonrpc:"2.0",method:A,params:{}},"*")}function yo(A){let x=null;const B=o=>{var j,cl;const _=o.data;if(!(!_||_.jsonrpc!=="2.0")){if(_.id!==void 0&&(_.result!==void 0||_.error)){const Al=di.get(_.id);Al&&(di.delete(_.id),_.error?Al.reject(new Error(_.error.message??"Unknown error")):Al.resolve(_.result));return}if(_.method)switch(_.method){case"ui/notifications/tool-input":(j=_.params)!=null&&j.arguments;break;case"ui/notifications/tool-result":(cl=_.params)!=null&&cl.structuredContent&&A.onData(_.params.structuredContent);break;case"ui/notifications/tool-input-partial":break;case"ui/notifications/host-context-changed":_.params&&(x={...x,..._.params},Od(x));break}}};return window.addEventListener("message",B),(async()=>{try{x=(await io("ui/initialize",{protocolVersion:"2025-06-18",capabilities:{},clientInfo:{name:A.name,version:"1.0.0"}})).hostContext??null,x&&Od(x),so("ui/notifications/initialized")}catch{console.warn("MCP Apps init failed — running standalone")}})(),()=>window.removeEventListener("message",B)}const vo={"--sw-fg":"#1a1a1a","--sw-fg-muted":"#666","--sw-fg-faint":"#888","--sw-bg":"#ffffff","--sw-bg-surface":"#f5f5f5","--sw-bg-card":"#fafafa","--sw-border":"#e5e5e5","--sw-row-border":"#eee","--sw-header-border":"#ddd","--sw-progress-bg":"#e5e5e5"},mo={"--sw-fg":"#e0e0e0","--sw-fg-muted":"#a0a0a0","--sw-fg-faint":"#888","--sw-bg":"#1e1e1e","--sw-bg-surface":"#2a2a2a","--sw-bg-card":"#252525","--sw-border":"#404040","--sw-row-border":"#333","--sw-header-border":"#444","--sw-progress-bg":"#333"};function Dd(A){const x=A==="dark"?mo:vo,B=document.documentElement;for(const[o,_]of Object.entries(x))B.style.setProperty(o,_)}function oo(){const A=window.matchMedia("(prefers-color-scheme: dark)").matches;Dd(A?"dark":"light")}oo();function Od(A){var x,B,o;if(A.theme&&(document.documentElement.style.colorScheme=A.theme,Dd(A.theme)),(x=A.styles)!=null&&x.variables){const _=document.documentElement;for(const[j,cl]of Object.entries(A.styles.variables))cl&&_.style.setProperty(j,cl)}if((o=(B=A.styles)==null?void 0:B.css)!=null&&o.fonts){const _=document.createElement("style");_.textContent=A.styles.css.fonts,document.head.appendChild(_)}}function ho(){const[A,x]=_d.useState(null);if(_d.useEffect(()=>yo({name:"swarmia-commit-hygiene",onData:_=>x(_)}),[]),!A)return K.jsxs("div",{style:Rl.container,children:[K.jsx("h3",{style:Rl.heading,children:"🔍 Commit Hygiene Check"}),K.jsx("p",{style:{color:"var(--sw-fg-faint)"},children:"Waiting for data from tool..."})]});const B=A.commits.filter(_=>_.ids.length>0).length,o=A.commits.length;return K.jsxs("div",{style:Rl.container,children:[K.jsx("h3",{style:Rl.heading,children:"🔍 Commit Hygiene Check"}),K.jsxs("div",{style:Rl.branchRow,children:[K.jsx("strong",{children:"Branch:"})," ",K.jsx("code",{children:A.branch}),A.branch_ids.length>0?K.jsxs("span",{style:{color:"#22c55e",marginLeft:8},children:["✅ ",A.branch_ids.join(", ")]}):K.jsx("span",{style:{color:"#f59e0b",marginLeft:8},children:"⚠️ No issue key"})]}),K.jsxs("div",{style:{marginBottom:12},children:[K.jsxs("div",{style:Rl.progressBar,children:[K.jsx("div",{style:{flex:B,background:"#22c55e",borderRadius:4}}),o-B>0&&K.jsx("div",{style:{flex:o-B,background:"#ef4444",borderRadius:4}})]}),K.jsxs("small",{style:{color:"var(--sw-fg-muted)"},children:[B,"/",o," commits have issue keys"]})]}),K.jsxs("table",{style:Rl.table,children:[K.jsx("thead",{children:K.jsxs("tr",{style:Rl.headerRow,children:[K.jsx("th",{style:Rl.cell}),K.jsx("th",{style:Rl.cell,children:"SHA"}),K.jsx("th",{style:Rl.cell,children:"Message"}),K.jsx("th",{style:Rl.cell,children:"Issues"})]})}),K.jsx("tbody",{children:A.commits.map(_=>K.jsxs("tr",{style:Rl.row,children:[K.jsx("td",{style:Rl.cell,children:_.ids.length>0?"✅":"⚠️"}),K.jsx("td",{style:Rl.cell,children:K.jsx("code",{style:{fontSize:12},children:_.sha.slice(0,7)})}),K.jsx("td",{style:Rl.cell,children:_.message}),K.jsx("td",{style:Rl.cell,children:_.ids.join(", ")||"—"})]},_.sha))})]}),Object.keys(A.linear_data).length>0&&K.jsxs("div",{style:{marginTop:12},children:[K.jsx("h4",{style:{margin:"0 0 8px"},children:"Linear Verification"}),Object.entries(A.linear_data).map(([_,j])=>K.jsxs("div",{style:{padding:"4px 0",fontSize:13},children:[K.jsx("strong",{children:_}),": ",j.title," — ",K.jsx("em",{children:j.state}),j.assigned_to_you===!0&&K.jsx("span",{style:{color:"#22c55e"},children:" (yours ✅)"}),j.assigned_to_you===!1&&K.jsx("span",{style:{color:"#f59e0b"},children:" (⚠️ not yours)"})]},_))]})]})}const Rl={container:{padding:16,fontFamily:"system-ui, -apple-system, sans-serif",maxWidth:640,color:"var(--sw-fg)"},heading:{margin:"0 0 12px",fontSize:16},branchRow:{marginBottom:12,padding:8,background:"var(--sw-bg-surface)",borderRadius:6},progressBar:{display:"flex",gap:2,height:8,borderRadius:4,overflow:"hidden",background:"var(--sw-progress-bg)"},table:{width:"100%",borderCollapse:"collapse",fontSize:13},headerRow:{borderBottom:"2px solid var(--sw-header-border)",textAlign:"left"},row:{borderBottom:"1px solid var(--sw-row-border)"},cell:{padding:"6px 8px"}},Md=document.getElementById("commit-hygiene-root");Md&&fo.createRoot(Md).render(K.jsx(ho,{}));
+`).replace(bm,"")}function By(l,t){return t=Cy(t),Cy(l)===t}function nl(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&Wu(l,""+a);break;case"className":pe(l,"class",a);break;case"tabIndex":pe(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":pe(l,u,a);break;case"style":Bi(l,a,n);break;case"data":if(t!=="object"){pe(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&nl(l,t,"name",e.name,e,null),nl(l,t,"formEncType",e.formEncType,e,null),nl(l,t,"formMethod",e.formMethod,e,null),nl(l,t,"formTarget",e.formTarget,e,null)):(nl(l,t,"encType",e.encType,e,null),nl(l,t,"method",e.method,e,null),nl(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Rt);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=He(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":L("beforetoggle",l),L("toggle",l),De(l,"popover",a);break;case"xlinkActuate":Nt(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Nt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Nt(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Nt(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Nt(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Nt(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":De(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=wd.get(u)||u,De(l,u,a))}}function xc(l,t,u,a,e,n){switch(u){case"style":Bi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"children":typeof a=="string"?Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&Wu(l,""+a);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Rt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Mi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Zl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):De(l,u,a)}}}function Nl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":L("error",l),L("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:nl(l,t,n,f,u,null)}}e&&nl(l,t,"srcSet",u.srcSet,u,null),a&&nl(l,t,"src",u.src,u,null);return;case"input":L("invalid",l);var c=n=f=e=null,i=null,m=null;for(a in u)if(u.hasOwnProperty(a)){var S=u[a];if(S!=null)switch(a){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":m=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(o(137,t));break;default:nl(l,t,a,S,u,null)}}Ni(l,n,c,i,m,f,e,!1);return;case"select":L("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:nl(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":L("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(o(91));break;default:nl(l,t,f,c,u,null)}qi(l,a,e,n);return;case"option":for(i in u)if(u.hasOwnProperty(i)&&(a=u[i],a!=null))switch(i){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:nl(l,t,i,a,u,null)}return;case"dialog":L("beforetoggle",l),L("toggle",l),L("cancel",l),L("close",l);break;case"iframe":case"object":L("load",l);break;case"video":case"audio":for(a=0;a<ye.length;a++)L(ye[a],l);break;case"image":L("error",l),L("load",l);break;case"details":L("toggle",l);break;case"embed":case"source":case"link":L("error",l),L("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in u)if(u.hasOwnProperty(m)&&(a=u[m],a!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:nl(l,t,m,a,u,null)}return;default:if(lf(t)){for(S in u)u.hasOwnProperty(S)&&(a=u[S],a!==void 0&&xc(l,t,S,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&nl(l,t,c,a,u,null))}function zm(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,S=null;for(g in u){var z=u[g];if(u.hasOwnProperty(g)&&z!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=z;default:a.hasOwnProperty(g)||nl(l,t,g,null,a,z)}}for(var h in a){var g=a[h];if(z=u[h],a.hasOwnProperty(h)&&(g!=null||z!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(o(137,t));break;default:g!==z&&nl(l,t,h,g,a,z)}}In(l,f,c,i,m,S,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||nl(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&nl(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:nl(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(o(91));break;default:e!==n&&nl(l,t,f,e,a,n)}Ri(l,h,g);return;case"option":for(var D in u)if(h=u[D],u.hasOwnProperty(D)&&h!=null&&!a.hasOwnProperty(D))switch(D){case"selected":l.selected=!1;break;default:nl(l,t,D,null,a,h)}for(i in a)if(h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:nl(l,t,i,h,a,g)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var R in u)h=u[R],u.hasOwnProperty(R)&&h!=null&&!a.hasOwnProperty(R)&&nl(l,t,R,null,a,h);for(m in a)if(h=a[m],g=u[m],a.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(o(137,t));break;default:nl(l,t,m,h,a,g)}return;default:if(lf(t)){for(var fl in u)h=u[fl],u.hasOwnProperty(fl)&&h!==void 0&&!a.hasOwnProperty(fl)&&xc(l,t,fl,void 0,a,h);for(S in a)h=a[S],g=u[S],!a.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||xc(l,t,S,h,a,g);return}}for(var d in u)h=u[d],u.hasOwnProperty(d)&&h!=null&&!a.hasOwnProperty(d)&&nl(l,t,d,null,a,h);for(z in a)h=a[z],g=u[z],!a.hasOwnProperty(z)||h===g||h==null&&g==null||nl(l,t,z,h,a,g)}function Yy(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Tm(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&Yy(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],m=i.startTime;if(m>c)break;var S=i.transferSize,z=i.initiatorType;S&&Yy(z)&&(i=i.responseEnd,f+=S*(i<c?1:(c-m)/(i-m)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Zc=null,Vc=null;function Mn(l){return l.nodeType===9?l:l.ownerDocument}function jy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Gy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function Em(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Xy=typeof setTimeout=="function"?setTimeout:void 0,Am=typeof clearTimeout=="function"?clearTimeout:void 0,Qy=typeof Promise=="function"?Promise:void 0,_m=typeof queueMicrotask=="function"?queueMicrotask:typeof Qy<"u"?function(l){return Qy.resolve(null).then(l).catch(Om)}:Xy;function Om(l){setTimeout(function(){throw l})}function hu(l){return l==="head"}function xy(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),Oa(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")ve(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,ve(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Ha]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&ve(l.ownerDocument.body);u=e}while(u);Oa(t)}function Zy(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),Fn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Mm(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Ha])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=gt(l.nextSibling),l===null)break}return null}function Dm(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=gt(l.nextSibling),l===null))return null;return l}function Vy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=gt(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function pm(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function gt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Ly(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return gt(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Ky(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Jy(l,t,u){switch(t=Mn(u),l){case"html":if(l=t.documentElement,!l)throw Error(o(452));return l;case"head":if(l=t.head,!l)throw Error(o(453));return l;case"body":if(l=t.body,!l)throw Error(o(454));return l;default:throw Error(o(451))}}function ve(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var St=new Map,wy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Wt=O.d;O.d={f:Um,r:Hm,D:Nm,C:Rm,L:qm,m:Cm,X:Ym,S:Bm,M:jm};function Um(){var l=Wt.f(),t=rn();return l||t}function Hm(l){var t=Lu(l);t!==null&&t.tag===5&&t.type==="form"?y0(t):Wt.r(l)}var Ea=typeof document>"u"?null:document;function Wy(l,t,u){var a=Ea;if(a&&typeof t=="string"&&t){var e=st(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),wy.has(e)||(wy.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),Nl(t,"link",l),Ol(t),a.head.appendChild(t)))}}function Nm(l){Wt.D(l),Wy("dns-prefetch",l,null)}function Rm(l,t){Wt.C(l,t),Wy("preconnect",l,t)}function qm(l,t,u){Wt.L(l,t,u);var a=Ea;if(a&&l&&t){var e='link[rel="preload"][as="'+st(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+st(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+st(u.imageSizes)+'"]')):e+='[href="'+st(l)+'"]';var n=e;switch(t){case"style":n=Aa(l);break;case"script":n=_a(l)}St.has(n)||(l=q({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),St.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(me(n))||t==="script"&&a.querySelector(oe(n))||(t=a.createElement("link"),Nl(t,"link",l),Ol(t),a.head.appendChild(t)))}}function Cm(l,t){Wt.m(l,t);var u=Ea;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+st(a)+'"][href="'+st(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=_a(l)}if(!St.has(n)&&(l=q({rel:"modulepreload",href:l},t),St.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(oe(n)))return}a=u.createElement("link"),Nl(a,"link",l),Ol(a),u.head.appendChild(a)}}}function Bm(l,t,u){Wt.S(l,t,u);var a=Ea;if(a&&l){var e=Ku(a).hoistableStyles,n=Aa(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(me(n)))c.loading=5;else{l=q({rel:"stylesheet",href:l,"data-precedence":t},u),(u=St.get(n))&&Fc(l,u);var i=f=a.createElement("link");Ol(i),Nl(i,"link",l),i._p=new Promise(function(m,S){i.onload=m,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,pn(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Ym(l,t){Wt.X(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Ol(n),Nl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function jm(l,t){Wt.M(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0,type:"module"},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Ol(n),Nl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function $y(l,t,u,a){var e=(e=Z.current)?Dn(e):null;if(!e)throw Error(o(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Aa(u.href),u=Ku(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Aa(u.href);var n=Ku(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(me(l)))&&!n._p&&(f.instance=n,f.state.loading=5),St.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},St.set(l,u),n||Gm(e,l,u,f.state))),t&&a===null)throw Error(o(528,""));return f}if(t&&a!==null)throw Error(o(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(u),u=Ku(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,l))}}function Aa(l){return'href="'+st(l)+'"'}function me(l){return'link[rel="stylesheet"]['+l+"]"}function Fy(l){return q({},l,{"data-precedence":l.precedence,precedence:null})}function Gm(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Nl(t,"link",u),Ol(t),l.head.appendChild(t))}function _a(l){return'[src="'+st(l)+'"]'}function oe(l){return"script[async]"+l}function ky(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+st(u.href)+'"]');if(a)return t.instance=a,Ol(a),a;var e=q({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Ol(a),Nl(a,"style",e),pn(a,u.precedence,l),t.instance=a;case"stylesheet":e=Aa(u.href);var n=l.querySelector(me(e));if(n)return t.state.loading|=4,t.instance=n,Ol(n),n;a=Fy(u),(e=St.get(e))&&Fc(a,e),n=(l.ownerDocument||l).createElement("link"),Ol(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Nl(n,"link",a),t.state.loading|=4,pn(n,u.precedence,l),t.instance=n;case"script":return n=_a(u.src),(e=l.querySelector(oe(n)))?(t.instance=e,Ol(e),e):(a=u,(e=St.get(n))&&(a=q({},u),kc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),Ol(e),Nl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(o(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,pn(a,u.precedence,l));return t.instance}function pn(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Un=null;function Iy(l,t,u){if(Un===null){var a=new Map,e=Un=new Map;e.set(u,a)}else e=Un,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Ha]||n[Dl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Py(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Xm(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function ld(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qm(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Aa(a.href),n=t.querySelector(me(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Hn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,Ol(n);return}n=t.ownerDocument||t,a=Fy(a),(e=St.get(e))&&Fc(a,e),n=n.createElement("link"),Ol(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Nl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Hn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function xm(l,t){return l.stylesheets&&l.count===0&&Rn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*Tm());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Hn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Rn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Nn=null;function Rn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Nn=new Map,t.forEach(Zm,l),Nn=null,Hn.call(l))}function Zm(l,t){if(!(t.state.loading&4)){var u=Nn.get(l);if(u)var a=u.get(null);else{u=new Map,Nn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Hn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var he={$$typeof:ql,Provider:null,Consumer:null,_currentValue:C,_currentValue2:C,_threadCount:0};function Vm(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function td(l,t,u,a,e,n,f,c,i,m,S,z){return l=new Vm(l,t,u,f,i,m,S,z,c),t=1,n===!0&&(t|=24),n=tt(3,null,null,t),l.current=n,n.stateNode=l,t=Nf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},Bf(n),l}function ud(l){return l?(l=ta,l):ta}function ad(l,t,u,a,e,n){e=ud(e),a.context===null?a.context=e:a.pendingContext=e,a=eu(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=nu(l,a,t),u!==null&&(Wl(u,l,t),wa(u,l,t))}function ed(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){ed(l,t),(l=l.alternate)&&ed(l,t)}function nd(l){if(l.tag===13||l.tag===31){var t=pu(l,67108864);t!==null&&Wl(t,l,67108864),Pc(l,67108864)}}function fd(l){if(l.tag===13||l.tag===31){var t=ft();t=wn(t);var u=pu(l,t);u!==null&&Wl(u,l,t),Pc(l,t)}}var qn=!0;function Lm(l,t,u,a){var e=r.T;r.T=null;var n=O.p;try{O.p=2,li(l,t,u,a)}finally{O.p=n,r.T=e}}function Km(l,t,u,a){var e=r.T;r.T=null;var n=O.p;try{O.p=8,li(l,t,u,a)}finally{O.p=n,r.T=e}}function li(l,t,u,a){if(qn){var e=ti(a);if(e===null)Qc(l,t,a,Cn,u),id(l,a);else if(wm(e,l,t,u,a))a.stopPropagation();else if(id(l,a),t&4&&-1<Jm.indexOf(l)){for(;e!==null;){var n=Lu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Au(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Pl(f);c.entanglements[1]|=i,f&=~i}pt(n),(I&6)===0&&(gn=kl()+500,se(0))}}break;case 31:case 13:c=pu(n,2),c!==null&&Wl(c,n,2),rn(),Pc(n,2)}if(n=ti(a),n===null&&Qc(l,t,a,Cn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Qc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var Cn=null;function ui(l){if(Cn=null,l=Vu(l),l!==null){var t=j(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=cl(t),l!==null)return l;l=null}else if(u===31){if(l=Al(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Cn=l,null}function cd(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Nd()){case hi:return 2;case gi:return 8;case Ee:case Rd:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,gu=null,Su=null,ru=null,ge=new Map,Se=new Map,bu=[],Jm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function id(l,t){switch(l){case"focusin":case"focusout":gu=null;break;case"dragenter":case"dragleave":Su=null;break;case"mouseover":case"mouseout":ru=null;break;case"pointerover":case"pointerout":ge.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Se.delete(t.pointerId)}}function re(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Lu(t),t!==null&&nd(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function wm(l,t,u,a,e){switch(t){case"focusin":return gu=re(gu,l,t,u,a,e),!0;case"dragenter":return Su=re(Su,l,t,u,a,e),!0;case"mouseover":return ru=re(ru,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ge.set(n,re(ge.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,Se.set(n,re(Se.get(n)||null,l,t,u,a,e)),!0}return!1}function sd(l){var t=Vu(l.target);if(t!==null){var u=j(t);if(u!==null){if(t=u.tag,t===13){if(t=cl(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fd(u)});return}}else if(t===31){if(t=Al(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fd(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Lu(u),t!==null&&nd(t),l.blockedOn=u,!1;t.shift()}return!0}function yd(l,t,u){Bn(l)&&u.delete(t)}function Wm(){ai=!1,gu!==null&&Bn(gu)&&(gu=null),Su!==null&&Bn(Su)&&(Su=null),ru!==null&&Bn(ru)&&(ru=null),ge.forEach(yd),Se.forEach(yd)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,A.unstable_scheduleCallback(A.unstable_NormalPriority,Wm)))}var jn=null;function dd(l){jn!==l&&(jn=l,A.unstable_scheduleCallback(A.unstable_NormalPriority,function(){jn===l&&(jn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Lu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function Oa(l){function t(i){return Yn(i,l)}gu!==null&&Yn(gu,l),Su!==null&&Yn(Su,l),ru!==null&&Yn(ru,l),ge.forEach(t),Se.forEach(t);for(var u=0;u<bu.length;u++){var a=bu[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<bu.length&&(u=bu[0],u.blockedOn===null);)sd(u),u.blockedOn===null&&bu.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[Zl]||null;if(typeof n=="function")f||dd(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Zl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),dd(u)}}}function vd(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}Gn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(o(409));var u=t.current,a=ft();ad(u,a,l,t,null,null)},Gn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;ad(l.current,2,null,l,null,null),rn(),t[Zu]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var u=0;u<bu.length&&t!==0&&t<bu[u].priority;u++);bu.splice(u,0,l),u===0&&sd(l)}};var md=x.version;if(md!=="19.2.4")throw Error(o(527,md,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(o(188)):(l=Object.keys(l).join(","),Error(o(268,l)));return l=E(t),l=l!==null?P(l):null,l=l===null?null:l.stateNode,l};var $m={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:r,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Da=Xn.inject($m),Il=Xn}catch{}}return ze.createRoot=function(l,t){if(!_(l))throw Error(o(299));var u=!1,a="",e=z0,n=T0,f=E0;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=td(l,1,!1,null,null,u,a,null,e,n,f,vd),l[Zu]=t.current,Xc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!_(l))throw Error(o(299));var a=!1,e="",n=z0,f=T0,c=E0,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=td(l,1,!0,t,u??null,a,e,i,n,f,c,vd),t.context=ud(null),u=t.current,a=ft(),a=wn(a),e=eu(a),e.callback=null,nu(u,e,a),u=a,t.current.lanes=u,Ua(t,u),pt(t),l[Zu]=t.current,Xc(l),new Gn(t)},ze.version="19.2.4",ze}var Ad;function no(){if(Ad)return fi.exports;Ad=1;function A(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(A)}catch(x){console.error(x)}}return A(),fi.exports=eo(),fi.exports}var fo=no(),_d=vi();((R, J, D) => {
+const __m0 = (() => {
+/**
+ * MCP Apps Extension (SEP-1865) communication utilities.
+ *
+ * Handles the JSON-RPC 2.0 handshake and notification protocol
+ * between the widget (View) and the VS Code host.
+ */ let nextRequestId = 1;
+const pendingRequests = new Map();
+/** Send a JSON-RPC request and wait for the host's response. */ function sendRequest(method, params) {
+  const id = nextRequestId++;
+  const request = {
+    jsonrpc: "2.0",
+    id,
+    method,
+    params: params ?? {}
+  };
+  return new Promise((resolve, reject)=>{
+    pendingRequests.set(id, {
+      resolve: resolve,
+      reject
+    });
+    window.parent.postMessage(request, "*");
+  });
+}
+/** Send a JSON-RPC notification (fire-and-forget). */ function sendNotification(method, params) {
+  window.parent.postMessage({
+    jsonrpc: "2.0",
+    method,
+    params: params ?? {}
+  }, "*");
+}
+/**
+ * Call a tool on this widget's MCP server through the host (tools/call).
+ * Resolves to the tool's structuredContent, or null when it returned none.
+ */ async function callServerTool(name, args) {
+  const result = await sendRequest("tools/call", {
+    name,
+    arguments: args
+  });
+  if (result.isError) {
+    throw new Error(result.content?.[0]?.text ?? `${name} failed`);
+  }
+  return result.structuredContent ?? null;
+}
+/**
+ * Run the SEP-1865 lifecycle:
+ *  1. ui/initialize  →  receive McpUiInitializeResult
+ *  2. ui/notifications/initialized
+ *  3. listen for tool-input / tool-result / host-context-changed
+ *
+ * Returns a cleanup function to remove the message listener.
+ */ function initMcpApp(opts) {
+  let hostContext = null;
+  // ---- message listener -----------------------------------------------
+  const handler = (event)=>{
+    const msg = event.data;
+    if (!msg || msg.jsonrpc !== "2.0") return;
+    // Response to one of our requests
+    if (msg.id !== undefined && (msg.result !== undefined || msg.error)) {
+      const pending = pendingRequests.get(msg.id);
+      if (pending) {
+        pendingRequests.delete(msg.id);
+        if (msg.error) {
+          pending.reject(new Error(msg.error.message ?? "Unknown error"));
+        } else {
+          pending.resolve(msg.result);
+        }
+      }
+      return;
+    }
+    // Notifications from host
+    if (msg.method) {
+      switch(msg.method){
+        case "ui/notifications/tool-input":
+          if (msg.params?.arguments) {
+          // Tool arguments — some servers pass data here too
+          }
+          break;
+        case "ui/notifications/tool-result":
+          if (msg.params?.structuredContent) {
+            opts.onData(msg.params.structuredContent);
+          }
+          break;
+        case "ui/notifications/tool-input-partial":
+          break;
+        case "ui/notifications/host-context-changed":
+          if (msg.params) {
+            hostContext = {
+              ...hostContext,
+              ...msg.params
+            };
+            applyHostContext(hostContext);
+          }
+          break;
+        case "ui/resource-teardown":
+          break;
+      }
+    }
+  };
+  window.addEventListener("message", handler);
+  // ---- initialize handshake -------------------------------------------
+  (async ()=>{
+    try {
+      const result = await sendRequest("ui/initialize", {
+        protocolVersion: "2025-06-18",
+        capabilities: {},
+        clientInfo: {
+          name: opts.name,
+          version: "1.0.0"
+        }
+      });
+      hostContext = result.hostContext ?? null;
+      if (hostContext) applyHostContext(hostContext);
+      sendNotification("ui/notifications/initialized");
+    } catch  {
+      // Host may not support MCP Apps — widget still works in standalone mode
+      console.warn("MCP Apps init failed — running standalone");
+    }
+  })();
+  return ()=>window.removeEventListener("message", handler);
+}
+// ---- theme tokens -----------------------------------------------------
+const LIGHT_TOKENS = {
+  "--sw-fg": "#1a1a1a",
+  "--sw-fg-muted": "#666",
+  "--sw-fg-faint": "#888",
+  "--sw-bg": "#ffffff",
+  "--sw-bg-surface": "#f5f5f5",
+  "--sw-bg-card": "#fafafa",
+  "--sw-border": "#e5e5e5",
+  "--sw-row-border": "#eee",
+  "--sw-header-border": "#ddd",
+  "--sw-progress-bg": "#e5e5e5"
+};
+const DARK_TOKENS = {
+  "--sw-fg": "#e0e0e0",
+  "--sw-fg-muted": "#a0a0a0",
+  "--sw-fg-faint": "#888",
+  "--sw-bg": "#1e1e1e",
+  "--sw-bg-surface": "#2a2a2a",
+  "--sw-bg-card": "#252525",
+  "--sw-border": "#404040",
+  "--sw-row-border": "#333",
+  "--sw-header-border": "#444",
+  "--sw-progress-bg": "#333"
+};
+function applyThemeTokens(theme) {
+  const tokens = theme === "dark" ? DARK_TOKENS : LIGHT_TOKENS;
+  const root = document.documentElement;
+  for (const [key, value] of Object.entries(tokens)){
+    root.style.setProperty(key, value);
+  }
+}
+/** Inject fallback tokens based on prefers-color-scheme before host context arrives. */ function injectFallbackTheme() {
+  const prefersDark = window.matchMedia("(prefers-color-scheme: dark)").matches;
+  applyThemeTokens(prefersDark ? "dark" : "light");
+}
+// Apply fallback immediately so widgets have theme tokens on first render
+injectFallbackTheme();
+/** Apply host theme CSS variables. */ function applyHostContext(ctx) {
+  if (ctx.theme) {
+    document.documentElement.style.colorScheme = ctx.theme;
+    applyThemeTokens(ctx.theme);
+  }
+  if (ctx.styles?.variables) {
+    const root = document.documentElement;
+    for (const [key, value] of Object.entries(ctx.styles.variables)){
+      if (value) root.style.setProperty(key, value);
+    }
+  }
+  if (ctx.styles?.css?.fonts) {
+    const style = document.createElement("style");
+    style.textContent = ctx.styles.css.fonts;
+    document.head.appendChild(style);
+  }
+}
+
+return { sendRequest, sendNotification, callServerTool, initMcpApp };
+})();
+const __m1 = (() => {
+const { jsx: _jsx, jsxs: _jsxs } = J;
+const { useState, useEffect } = R;
+const { callServerTool, initMcpApp } = __m0;
+function App() {
+  const [data, setData] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const [pageError, setPageError] = useState(null);
+  useEffect(()=>{
+    return initMcpApp({
+      name: "swarmia-commit-hygiene",
+      onData: (d)=>setData(d)
+    });
+  }, []);
+  if (!data) {
+    return /*#__PURE__*/ _jsxs("div", {
+      style: styles.container,
+      children: [
+        /*#__PURE__*/ _jsx("h3", {
+          style: styles.heading,
+          children: "Commit Hygiene Check"
+        }),
+        /*#__PURE__*/ _jsx("p", {
+          style: {
+            color: "var(--sw-fg-faint)"
+          },
+          children: "Waiting for data from tool..."
+        })
+      ]
+    });
+  }
+  // Totals cover the whole scan; only the loaded pages are in data.commits
+  const passCount = data.with_keys ?? data.commits.filter((c)=>c.ids.length > 0).length;
+  const total = data.commit_count ?? data.commits.length;
+  const loadMore = async ()=>{
+    if (!data.next_cursor) return;
+    setLoading(true);
+    setPageError(null);
+    try {
+      const page = await callServerTool("get_swarmia_commit_hygiene_page", {
+        cursor: data.next_cursor
+      });
+      if (page) {
+        setData({
+          ...data,
+          commits: [
+            ...data.commits,
+            ...page.commits
+          ],
+          linear_data: {
+            ...data.linear_data,
+            ...page.linear_data
+          },
+          linear_rate_limited: [
+            ...data.linear_rate_limited ?? [],
+            ...page.linear_rate_limited ?? []
+          ],
+          next_cursor: page.next_cursor
+        });
+      }
+    } catch (e) {
+      setPageError(e.message);
+    } finally{
+      setLoading(false);
+    }
+  };
+  return /*#__PURE__*/ _jsxs("div", {
+    style: styles.container,
+    children: [
+      /*#__PURE__*/ _jsx("h3", {
+        style: styles.heading,
+        children: "Commit Hygiene Check"
+      }),
+      /*#__PURE__*/ _jsxs("div", {
+        style: styles.branchRow,
+        children: [
+          /*#__PURE__*/ _jsx("strong", {
+            children: "Branch:"
+          }),
+          " ",
+          /*#__PURE__*/ _jsx("code", {
+            children: data.branch
+          }),
+          data.branch_ids.length > 0 ? /*#__PURE__*/ _jsx("span", {
+            style: {
+              color: "#22c55e",
+              marginLeft: 8
+            },
+            children: data.branch_ids.join(", ")
+          }) : /*#__PURE__*/ _jsx("span", {
+            style: {
+              color: "#f59e0b",
+              marginLeft: 8
+            },
+            children: "No issue key"
+          })
+        ]
+      }),
+      /*#__PURE__*/ _jsxs("div", {
+        style: {
+          marginBottom: 12
+        },
+        children: [
+          /*#__PURE__*/ _jsxs("div", {
+            style: styles.progressBar,
+            children: [
+              /*#__PURE__*/ _jsx("div", {
+                style: {
+                  flex: passCount,
+                  background: "#22c55e",
+                  borderRadius: 4
+                }
+              }),
+              total - passCount > 0 && /*#__PURE__*/ _jsx("div", {
+                style: {
+                  flex: total - passCount,
+                  background: "#ef4444",
+                  borderRadius: 4
+                }
+              })
+            ]
+          }),
+          /*#__PURE__*/ _jsxs("small", {
+            style: {
+              color: "var(--sw-fg-muted)"
+            },
+            children: [
+              passCount,
+              "/",
+              total,
+              " commits have issue keys"
+            ]
+          })
+        ]
+      }),
+      /*#__PURE__*/ _jsxs("table", {
+        style: styles.table,
+        children: [
+          /*#__PURE__*/ _jsx("thead", {
+            children: /*#__PURE__*/ _jsxs("tr", {
+              style: styles.headerRow,
+              children: [
+                /*#__PURE__*/ _jsx("th", {
+                  style: styles.cell
+                }),
+                /*#__PURE__*/ _jsx("th", {
+                  style: styles.cell,
+                  children: "SHA"
+                }),
+                /*#__PURE__*/ _jsx("th", {
+                  style: styles.cell,
+                  children: "Message"
+                }),
+                /*#__PURE__*/ _jsx("th", {
+                  style: styles.cell,
+                  children: "Issues"
+                })
+              ]
+            })
+          }),
+          /*#__PURE__*/ _jsx("tbody", {
+            children: data.commits.map((c)=>/*#__PURE__*/ _jsxs("tr", {
+                style: styles.row,
+                children: [
+                  /*#__PURE__*/ _jsx("td", {
+                    style: styles.cell,
+                    children: c.ids.length > 0 ? "Pass" : "Missing"
+                  }),
+                  /*#__PURE__*/ _jsx("td", {
+                    style: styles.cell,
+                    children: /*#__PURE__*/ _jsx("code", {
+                      style: {
+                        fontSize: 12
+                      },
+                      children: c.sha.slice(0, 7)
+                    })
+                  }),
+                  /*#__PURE__*/ _jsx("td", {
+                    style: styles.cell,
+                    children: c.message
+                  }),
+                  /*#__PURE__*/ _jsx("td", {
+                    style: styles.cell,
+                    children: c.ids.join(", ") || "—"
+                  })
+                ]
+              }, c.sha))
+          })
+        ]
+      }),
+      data.next_cursor && /*#__PURE__*/ _jsxs("div", {
+        style: {
+          marginTop: 8
+        },
+        children: [
+          /*#__PURE__*/ _jsx("button", {
+            style: styles.button,
+            onClick: loadMore,
+            disabled: loading,
+            children: loading ? "Loading..." : `Show more (${data.commits.length} of ${total})`
+          }),
+          pageError && /*#__PURE__*/ _jsx("small", {
+            style: {
+              color: "#ef4444",
+              marginLeft: 8
+            },
+            children: pageError
+          })
+        ]
+      }),
+      Object.keys(data.linear_data).length > 0 && /*#__PURE__*/ _jsxs("div", {
+        style: {
+          marginTop: 12
+        },
+        children: [
+          /*#__PURE__*/ _jsx("h4", {
+            style: {
+              margin: "0 0 8px"
+            },
+            children: "Linear Verification"
+          }),
+          Object.entries(data.linear_data).map(([id, info])=>/*#__PURE__*/ _jsxs("div", {
+              style: {
+                padding: "4px 0",
+                fontSize: 13
+              },
+              children: [
+                /*#__PURE__*/ _jsx("strong", {
+                  children: id
+                }),
+                ": ",
+                info.title,
+                " — ",
+                /*#__PURE__*/ _jsx("em", {
+                  children: info.state
+                }),
+                info.assigned_to_you === true && /*#__PURE__*/ _jsx("span", {
+                  style: {
+                    color: "#22c55e"
+                  },
+                  children: " (yours)"
+                }),
+                info.assigned_to_you === false && /*#__PURE__*/ _jsx("span", {
+                  style: {
+                    color: "#f59e0b"
+                  },
+                  children: " (not yours)"
+                }),
+                info.fresh === false && info.age_seconds !== undefined && /*#__PURE__*/ _jsxs("small", {
+                  style: {
+                    color: "var(--sw-fg-faint)"
+                  },
+                  children: [
+                    " ",
+                    "(cached ",
+                    formatAge(info.age_seconds),
+                    " ago, refreshing)"
+                  ]
+                })
+              ]
+            }, id))
+        ]
+      }),
+      data.linear_rate_limited && data.linear_rate_limited.length > 0 && /*#__PURE__*/ _jsxs("div", {
+        style: {
+          marginTop: 8,
+          fontSize: 13,
+          color: "#f59e0b"
+        },
+        children: [
+          "Linear rate limit reached, not checked yet: ",
+          data.linear_rate_limited.join(", ")
+        ]
+      })
+    ]
+  });
+}
+function formatAge(seconds) {
+  if (seconds < 60) return `${seconds}s`;
+  if (seconds < 3600) return `${Math.round(seconds / 60)}m`;
+  if (seconds < 86400) return `${Math.round(seconds / 3600)}h`;
+  return `${Math.round(seconds / 86400)}d`;
+}
+const styles = {
+  container: {
+    padding: 16,
+    fontFamily: "system-ui, -apple-system, sans-serif",
+    maxWidth: 640,
+    color: "var(--sw-fg)"
+  },
+  heading: {
+    margin: "0 0 12px",
+    fontSize: 16
+  },
+  branchRow: {
+    marginBottom: 12,
+    padding: 8,
+    background: "var(--sw-bg-surface)",
+    borderRadius: 6
+  },
+  progressBar: {
+    display: "flex",
+    gap: 2,
+    height: 8,
+    borderRadius: 4,
+    overflow: "hidden",
+    background: "var(--sw-progress-bg)"
+  },
+  table: {
+    width: "100%",
+    borderCollapse: "collapse",
+    fontSize: 13
+  },
+  headerRow: {
+    borderBottom: "2px solid var(--sw-header-border)",
+    textAlign: "left"
+  },
+  row: {
+    borderBottom: "1px solid var(--sw-row-border)"
+  },
+  cell: {
+    padding: "6px 8px"
+  },
+  button: {
+    padding: "4px 12px",
+    fontSize: 13,
+    borderRadius: 4,
+    border: "1px solid var(--sw-header-border)",
+    background: "var(--sw-bg-surface)",
+    color: "var(--sw-fg)",
+    cursor: "pointer"
+  }
+};
+
+return { App };
+})();
+const __m2 = (() => {
+const { jsx: _jsx } = J;
+const { createRoot } = D;
+const { App } = __m1;
+const root = document.getElementById("commit-hygiene-root");
+if (root) {
+  createRoot(root).render(/*#__PURE__*/ _jsx(App, {}));
+}
+
+return {  };
+})();
+})(_d, K, fo);
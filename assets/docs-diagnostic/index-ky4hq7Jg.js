@@ -46,4 +46,325 @@
 `+i[a].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=a&&0<=e);break}}}finally{Zn=!1,Error.prepareStackTrace=u}return(u=l?l.displayName||l.name:"")?Eu(u):""}function Uv(l,t){switch(l.tag){case 26:case 27:case 5:return Eu(l.type);case 16:return Eu("Lazy");case 13:return l.child!==t&&t!==null?Eu("Suspense Fallback"):Eu("Suspense");case 19:return Eu("SuspenseList");case 0:case 15:return xn(l.type,!1);case 11:return xn(l.type.render,!1);case 1:return xn(l.type,!0);case 31:return Eu("Activity");default:return""}}function oi(l){try{var t="",u=null;do t+=Uv(l,u),u=l,l=l.return;while(l);return t}catch(a){return`
 Error generating stack: `+a.message+`
 `+a.stack}}var Vn=Object.prototype.hasOwnProperty,Ln=A.unstable_scheduleCallback,Kn=A.unstable_cancelCallback,pv=A.unstable_shouldYield,Hv=A.unstable_requestPaint,Fl=A.unstable_now,Nv=A.unstable_getCurrentPriorityLevel,hi=A.unstable_ImmediatePriority,gi=A.unstable_UserBlockingPriority,Te=A.unstable_NormalPriority,Rv=A.unstable_LowPriority,Si=A.unstable_IdlePriority,qv=A.log,Cv=A.unstable_setDisableYieldValue,Da=null,kl=null;function $t(l){if(typeof qv=="function"&&Cv(l),kl&&typeof kl.setStrictMode=="function")try{kl.setStrictMode(Da,l)}catch{}}var Il=Math.clz32?Math.clz32:jv,Bv=Math.log,Yv=Math.LN2;function jv(l){return l>>>=0,l===0?32:31-(Bv(l)/Yv|0)|0}var Ae=256,_e=262144,Oe=4194304;function Tu(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Me(l,t,u){var a=l.pendingLanes;if(a===0)return 0;var e=0,n=l.suspendedLanes,f=l.pingedLanes;l=l.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?e=Tu(a):(f&=c,f!==0?e=Tu(f):u||(u=c&~l,u!==0&&(e=Tu(u))))):(c=a&~n,c!==0?e=Tu(c):f!==0?e=Tu(f):u||(u=a&~l,u!==0&&(e=Tu(u)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,u=t&-t,n>=u||n===32&&(u&4194048)!==0)?t:e}function Ua(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Gv(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function bi(){var l=Oe;return Oe<<=1,(Oe&62914560)===0&&(Oe=4194304),l}function Jn(l){for(var t=[],u=0;31>u;u++)t.push(l);return t}function pa(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Xv(l,t,u,a,e,n){var f=l.pendingLanes;l.pendingLanes=u,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=u,l.entangledLanes&=u,l.errorRecoveryDisabledLanes&=u,l.shellSuspendCounter=0;var c=l.entanglements,i=l.expirationTimes,d=l.hiddenUpdates;for(u=f&~u;0<u;){var S=31-Il(u),z=1<<S;c[S]=0,i[S]=-1;var h=d[S];if(h!==null)for(d[S]=null,S=0;S<h.length;S++){var g=h[S];g!==null&&(g.lane&=-536870913)}u&=~z}a!==0&&ri(l,a,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(f&~t))}function ri(l,t,u){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-Il(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|u&261930}function zi(l,t){var u=l.entangledLanes|=t;for(l=l.entanglements;u;){var a=31-Il(u),e=1<<a;e&t|l[a]&t&&(l[a]|=t),u&=~e}}function Ei(l,t){var u=t&-t;return u=(u&42)!==0?1:wn(u),(u&(l.suspendedLanes|t))!==0?0:u}function wn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function Wn(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Ti(){var l=_.p;return l!==0?l:(l=window.event,l===void 0?32:cv(l.type))}function Ai(l,t){var u=_.p;try{return _.p=l,t()}finally{_.p=u}}var Ft=Math.random().toString(36).slice(2),Ml="__reactFiber$"+Ft,Zl="__reactProps$"+Ft,Zu="__reactContainer$"+Ft,$n="__reactEvents$"+Ft,Qv="__reactListeners$"+Ft,Zv="__reactHandles$"+Ft,_i="__reactResources$"+Ft,Ha="__reactMarker$"+Ft;function Fn(l){delete l[Ml],delete l[Zl],delete l[$n],delete l[Qv],delete l[Zv]}function xu(l){var t=l[Ml];if(t)return t;for(var u=l.parentNode;u;){if(t=u[Zu]||u[Ml]){if(u=t.alternate,t.child!==null||u!==null&&u.child!==null)for(l=Ky(l);l!==null;){if(u=l[Ml])return u;l=Ky(l)}return t}l=u,u=l.parentNode}return null}function Vu(l){if(l=l[Ml]||l[Zu]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Na(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(o(33))}function Lu(l){var t=l[_i];return t||(t=l[_i]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function _l(l){l[Ha]=!0}var Oi=new Set,Mi={};function Au(l,t){Ku(l,t),Ku(l+"Capture",t)}function Ku(l,t){for(Mi[l]=t,l=0;l<t.length;l++)Oi.add(t[l])}var xv=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Di={},Ui={};function Vv(l){return Vn.call(Ui,l)?!0:Vn.call(Di,l)?!1:xv.test(l)?Ui[l]=!0:(Di[l]=!0,!1)}function De(l,t,u){if(Vv(t))if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+u)}}function Ue(l,t,u){if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+u)}}function Ht(l,t,u,a){if(a===null)l.removeAttribute(u);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(u);return}l.setAttributeNS(t,u,""+a)}}function ct(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function pi(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Lv(l,t,u){var a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var e=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(f){u=""+f,n.call(this,f)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return u},setValue:function(f){u=""+f},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function kn(l){if(!l._valueTracker){var t=pi(l)?"checked":"value";l._valueTracker=Lv(l,t,""+l[t])}}function Hi(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var u=t.getValue(),a="";return l&&(a=pi(l)?l.checked?"true":"false":l.value),l=a,l!==u?(t.setValue(l),!0):!1}function pe(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var Kv=/[\n"\\]/g;function it(l){return l.replace(Kv,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function In(l,t,u,a,e,n,f,c){l.name="",f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.type=f:l.removeAttribute("type"),t!=null?f==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+ct(t)):l.value!==""+ct(t)&&(l.value=""+ct(t)):f!=="submit"&&f!=="reset"||l.removeAttribute("value"),t!=null?Pn(l,f,ct(t)):u!=null?Pn(l,f,ct(u)):a!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+ct(c):l.removeAttribute("name")}function Ni(l,t,u,a,e,n,f,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||u!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){kn(l);return}u=u!=null?""+ct(u):"",t=t!=null?""+ct(t):u,c||t===l.value||(l.value=t),l.defaultValue=t}a=a??e,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=c?l.checked:!!a,l.defaultChecked=!!a,f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"&&(l.name=f),kn(l)}function Pn(l,t,u){t==="number"&&pe(l.ownerDocument)===l||l.defaultValue===""+u||(l.defaultValue=""+u)}function Ju(l,t,u,a){if(l=l.options,t){t={};for(var e=0;e<u.length;e++)t["$"+u[e]]=!0;for(u=0;u<l.length;u++)e=t.hasOwnProperty("$"+l[u].value),l[u].selected!==e&&(l[u].selected=e),e&&a&&(l[u].defaultSelected=!0)}else{for(u=""+ct(u),t=null,e=0;e<l.length;e++){if(l[e].value===u){l[e].selected=!0,a&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Ri(l,t,u){if(t!=null&&(t=""+ct(t),t!==l.value&&(l.value=t),u==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=u!=null?""+ct(u):""}function qi(l,t,u,a){if(t==null){if(a!=null){if(u!=null)throw Error(o(92));if(St(a)){if(1<a.length)throw Error(o(93));a=a[0]}u=a}u==null&&(u=""),t=u}u=ct(t),l.defaultValue=u,a=l.textContent,a===u&&a!==""&&a!==null&&(l.value=a),kn(l)}function wu(l,t){if(t){var u=l.firstChild;if(u&&u===l.lastChild&&u.nodeType===3){u.nodeValue=t;return}}l.textContent=t}var Jv=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Ci(l,t,u){var a=t.indexOf("--")===0;u==null||typeof u=="boolean"||u===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,u):typeof u!="number"||u===0||Jv.has(t)?t==="float"?l.cssFloat=u:l[t]=(""+u).trim():l[t]=u+"px"}function Bi(l,t,u){if(t!=null&&typeof t!="object")throw Error(o(62));if(l=l.style,u!=null){for(var a in u)!u.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var e in t)a=t[e],t.hasOwnProperty(e)&&u[e]!==a&&Ci(l,e,a)}else for(var n in t)t.hasOwnProperty(n)&&Ci(l,n,t[n])}function lf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wv=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Wv=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function He(l){return Wv.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Nt(){}var tf=null;function uf(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var Wu=null,$u=null;function Yi(l){var t=Vu(l);if(t&&(l=t.stateNode)){var u=l[Zl]||null;l:switch(l=t.stateNode,t.type){case"input":if(In(l,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name),t=u.name,u.type==="radio"&&t!=null){for(u=l;u.parentNode;)u=u.parentNode;for(u=u.querySelectorAll('input[name="'+it(""+t)+'"][type="radio"]'),t=0;t<u.length;t++){var a=u[t];if(a!==l&&a.form===l.form){var e=a[Zl]||null;if(!e)throw Error(o(90));In(a,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<u.length;t++)a=u[t],a.form===l.form&&Hi(a)}break l;case"textarea":Ri(l,u.value,u.defaultValue);break l;case"select":t=u.value,t!=null&&Ju(l,!!u.multiple,t,!1)}}}var af=!1;function ji(l,t,u){if(af)return l(t,u);af=!0;try{var a=l(t);return a}finally{if(af=!1,(Wu!==null||$u!==null)&&(bn(),Wu&&(t=Wu,l=$u,$u=Wu=null,Yi(t),l)))for(t=0;t<l.length;t++)Yi(l[t])}}function Ra(l,t){var u=l.stateNode;if(u===null)return null;var a=u[Zl]||null;if(a===null)return null;u=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(u&&typeof u!="function")throw Error(o(231,t,typeof u));return u}var Rt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ef=!1;if(Rt)try{var qa={};Object.defineProperty(qa,"passive",{get:function(){ef=!0}}),window.addEventListener("test",qa,qa),window.removeEventListener("test",qa,qa)}catch{ef=!1}var kt=null,nf=null,Ne=null;function Gi(){if(Ne)return Ne;var l,t=nf,u=t.length,a,e="value"in kt?kt.value:kt.textContent,n=e.length;for(l=0;l<u&&t[l]===e[l];l++);var f=u-l;for(a=1;a<=f&&t[u-a]===e[n-a];a++);return Ne=e.slice(l,1<a?1-a:void 0)}function Re(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function qe(){return!0}function Xi(){return!1}function xl(l){function t(u,a,e,n,f){this._reactName=u,this._targetInst=e,this.type=a,this.nativeEvent=n,this.target=f,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(u=l[c],this[c]=u?u(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?qe:Xi,this.isPropagationStopped=Xi,this}return q(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var u=this.nativeEvent;u&&(u.preventDefault?u.preventDefault():typeof u.returnValue!="unknown"&&(u.returnValue=!1),this.isDefaultPrevented=qe)},stopPropagation:function(){var u=this.nativeEvent;u&&(u.stopPropagation?u.stopPropagation():typeof u.cancelBubble!="unknown"&&(u.cancelBubble=!0),this.isPropagationStopped=qe)},persist:function(){},isPersistent:qe}),t}var _u={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Ce=xl(_u),Ca=q({},_u,{view:0,detail:0}),$v=xl(Ca),ff,cf,Ba,Be=q({},Ca,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:yf,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Ba&&(Ba&&l.type==="mousemove"?(ff=l.screenX-Ba.screenX,cf=l.screenY-Ba.screenY):cf=ff=0,Ba=l),ff)},movementY:function(l){return"movementY"in l?l.movementY:cf}}),Qi=xl(Be),Fv=q({},Be,{dataTransfer:0}),kv=xl(Fv),Iv=q({},Ca,{relatedTarget:0}),sf=xl(Iv),Pv=q({},_u,{animationName:0,elapsedTime:0,pseudoElement:0}),lm=xl(Pv),tm=q({},_u,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),um=xl(tm),am=q({},_u,{data:0}),Zi=xl(am),em={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},nm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function cm(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=fm[l])?!!t[l]:!1}function yf(){return cm}var im=q({},Ca,{key:function(l){if(l.key){var t=em[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=Re(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?nm[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:yf,charCode:function(l){return l.type==="keypress"?Re(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?Re(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),sm=xl(im),ym=q({},Be,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),xi=xl(ym),vm=q({},Ca,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:yf}),mm=xl(vm),dm=q({},_u,{propertyName:0,elapsedTime:0,pseudoElement:0}),om=xl(dm),hm=q({},Be,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),gm=xl(hm),Sm=q({},_u,{newState:0,oldState:0}),bm=xl(Sm),rm=[9,13,27,32],vf=Rt&&"CompositionEvent"in window,Ya=null;Rt&&"documentMode"in document&&(Ya=document.documentMode);var zm=Rt&&"TextEvent"in window&&!Ya,Vi=Rt&&(!vf||Ya&&8<Ya&&11>=Ya),Li=" ",Ki=!1;function Ji(l,t){switch(l){case"keyup":return rm.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function wi(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var Fu=!1;function Em(l,t){switch(l){case"compositionend":return wi(t);case"keypress":return t.which!==32?null:(Ki=!0,Li);case"textInput":return l=t.data,l===Li&&Ki?null:l;default:return null}}function Tm(l,t){if(Fu)return l==="compositionend"||!vf&&Ji(l,t)?(l=Gi(),Ne=nf=kt=null,Fu=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Vi&&t.locale!=="ko"?null:t.data;default:return null}}var Am={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Am[l.type]:t==="textarea"}function $i(l,t,u,a){Wu?$u?$u.push(a):$u=[a]:Wu=a,t=On(t,"onChange"),0<t.length&&(u=new Ce("onChange","change",null,u,a),l.push({event:u,listeners:t}))}var ja=null,Ga=null;function _m(l){Ny(l,0)}function Ye(l){var t=Na(l);if(Hi(t))return l}function Fi(l,t){if(l==="change")return t}var ki=!1;if(Rt){var mf;if(Rt){var df="oninput"in document;if(!df){var Ii=document.createElement("div");Ii.setAttribute("oninput","return;"),df=typeof Ii.oninput=="function"}mf=df}else mf=!1;ki=mf&&(!document.documentMode||9<document.documentMode)}function Pi(){ja&&(ja.detachEvent("onpropertychange",l0),Ga=ja=null)}function l0(l){if(l.propertyName==="value"&&Ye(Ga)){var t=[];$i(t,Ga,l,uf(l)),ji(_m,t)}}function Om(l,t,u){l==="focusin"?(Pi(),ja=t,Ga=u,ja.attachEvent("onpropertychange",l0)):l==="focusout"&&Pi()}function Mm(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Ye(Ga)}function Dm(l,t){if(l==="click")return Ye(t)}function Um(l,t){if(l==="input"||l==="change")return Ye(t)}function pm(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var Pl=typeof Object.is=="function"?Object.is:pm;function Xa(l,t){if(Pl(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var u=Object.keys(l),a=Object.keys(t);if(u.length!==a.length)return!1;for(a=0;a<u.length;a++){var e=u[a];if(!Vn.call(t,e)||!Pl(l[e],t[e]))return!1}return!0}function t0(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function u0(l,t){var u=t0(l);l=0;for(var a;u;){if(u.nodeType===3){if(a=l+u.textContent.length,l<=t&&a>=t)return{node:u,offset:t-l};l=a}l:{for(;u;){if(u.nextSibling){u=u.nextSibling;break l}u=u.parentNode}u=void 0}u=t0(u)}}function a0(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?a0(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function e0(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=pe(l.document);t instanceof l.HTMLIFrameElement;){try{var u=typeof t.contentWindow.location.href=="string"}catch{u=!1}if(u)l=t.contentWindow;else break;t=pe(l.document)}return t}function of(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Hm=Rt&&"documentMode"in document&&11>=document.documentMode,ku=null,hf=null,Qa=null,gf=!1;function n0(l,t,u){var a=u.window===u?u.document:u.nodeType===9?u:u.ownerDocument;gf||ku==null||ku!==pe(a)||(a=ku,"selectionStart"in a&&of(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Qa&&Xa(Qa,a)||(Qa=a,a=On(hf,"onSelect"),0<a.length&&(t=new Ce("onSelect","select",null,t,u),l.push({event:t,listeners:a}),t.target=ku)))}function Ou(l,t){var u={};return u[l.toLowerCase()]=t.toLowerCase(),u["Webkit"+l]="webkit"+t,u["Moz"+l]="moz"+t,u}var Iu={animationend:Ou("Animation","AnimationEnd"),animationiteration:Ou("Animation","AnimationIteration"),animationstart:Ou("Animation","AnimationStart"),transitionrun:Ou("Transition","TransitionRun"),transitionstart:Ou("Transition","TransitionStart"),transitioncancel:Ou("Transition","TransitionCancel"),transitionend:Ou("Transition","TransitionEnd")},Sf={},f0={};Rt&&(f0=document.createElement("div").style,"AnimationEvent"in window||(delete Iu.animationend.animation,delete Iu.animationiteration.animation,delete Iu.animationstart.animation),"TransitionEvent"in window||delete Iu.transitionend.transition);function Mu(l){if(Sf[l])return Sf[l];if(!Iu[l])return l;var t=Iu[l],u;for(u in t)if(t.hasOwnProperty(u)&&u in f0)return Sf[l]=t[u];return l}var c0=Mu("animationend"),i0=Mu("animationiteration"),s0=Mu("animationstart"),Nm=Mu("transitionrun"),Rm=Mu("transitionstart"),qm=Mu("transitioncancel"),y0=Mu("transitionend"),v0=new Map,bf="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");bf.push("scrollEnd");function bt(l,t){v0.set(l,t),Au(t,[l])}var je=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},st=[],Pu=0,rf=0;function Ge(){for(var l=Pu,t=rf=Pu=0;t<l;){var u=st[t];st[t++]=null;var a=st[t];st[t++]=null;var e=st[t];st[t++]=null;var n=st[t];if(st[t++]=null,a!==null&&e!==null){var f=a.pending;f===null?e.next=e:(e.next=f.next,f.next=e),a.pending=e}n!==0&&m0(u,e,n)}}function Xe(l,t,u,a){st[Pu++]=l,st[Pu++]=t,st[Pu++]=u,st[Pu++]=a,rf|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function zf(l,t,u,a){return Xe(l,t,u,a),Qe(l)}function Du(l,t){return Xe(l,null,null,t),Qe(l)}function m0(l,t,u){l.lanes|=u;var a=l.alternate;a!==null&&(a.lanes|=u);for(var e=!1,n=l.return;n!==null;)n.childLanes|=u,a=n.alternate,a!==null&&(a.childLanes|=u),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-Il(u),l=n.hiddenUpdates,a=l[e],a===null?l[e]=[t]:a.push(t),t.lane=u|536870912),n):null}function Qe(l){if(50<ie)throw ie=0,pc=null,Error(o(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var la={};function Cm(l,t,u,a){this.tag=l,this.key=u,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function lt(l,t,u,a){return new Cm(l,t,u,a)}function Ef(l){return l=l.prototype,!(!l||!l.isReactComponent)}function qt(l,t){var u=l.alternate;return u===null?(u=lt(l.tag,t,l.key,l.mode),u.elementType=l.elementType,u.type=l.type,u.stateNode=l.stateNode,u.alternate=l,l.alternate=u):(u.pendingProps=t,u.type=l.type,u.flags=0,u.subtreeFlags=0,u.deletions=null),u.flags=l.flags&65011712,u.childLanes=l.childLanes,u.lanes=l.lanes,u.child=l.child,u.memoizedProps=l.memoizedProps,u.memoizedState=l.memoizedState,u.updateQueue=l.updateQueue,t=l.dependencies,u.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},u.sibling=l.sibling,u.index=l.index,u.ref=l.ref,u.refCleanup=l.refCleanup,u}function d0(l,t){l.flags&=65011714;var u=l.alternate;return u===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,t=u.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Ze(l,t,u,a,e,n){var f=0;if(a=l,typeof l=="function")Ef(l)&&(f=1);else if(typeof l=="string")f=Xd(l,u,U.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case Tt:return l=lt(31,u,t,e),l.elementType=Tt,l.lanes=n,l;case Cl:return Uu(u.children,e,n,t);case Ut:f=8,e|=24;break;case $l:return l=lt(12,u,t,e|2),l.elementType=$l,l.lanes=n,l;case Et:return l=lt(13,u,t,e),l.elementType=Et,l.lanes=n,l;case Gl:return l=lt(19,u,t,e),l.elementType=Gl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case Nl:f=10;break l;case Wt:f=9;break l;case ft:f=11;break l;case w:f=14;break l;case Xl:f=16,a=null;break l}f=29,u=Error(o(130,l===null?"null":typeof l,"")),a=null}return t=lt(f,u,t,e),t.elementType=l,t.type=a,t.lanes=n,t}function Uu(l,t,u,a){return l=lt(7,l,a,t),l.lanes=u,l}function Tf(l,t,u){return l=lt(6,l,null,t),l.lanes=u,l}function o0(l){var t=lt(18,null,null,0);return t.stateNode=l,t}function Af(l,t,u){return t=lt(4,l.children!==null?l.children:[],l.key,t),t.lanes=u,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var h0=new WeakMap;function yt(l,t){if(typeof l=="object"&&l!==null){var u=h0.get(l);return u!==void 0?u:(t={value:l,source:t,stack:oi(t)},h0.set(l,t),t)}return{value:l,source:t,stack:oi(t)}}var ta=[],ua=0,xe=null,Za=0,vt=[],mt=0,It=null,_t=1,Ot="";function Ct(l,t){ta[ua++]=Za,ta[ua++]=xe,xe=l,Za=t}function g0(l,t,u){vt[mt++]=_t,vt[mt++]=Ot,vt[mt++]=It,It=l;var a=_t;l=Ot;var e=32-Il(a)-1;a&=~(1<<e),u+=1;var n=32-Il(t)+e;if(30<n){var f=e-e%5;n=(a&(1<<f)-1).toString(32),a>>=f,e-=f,_t=1<<32-Il(t)+e|u<<e|a,Ot=n+l}else _t=1<<n|u<<e|a,Ot=l}function _f(l){l.return!==null&&(Ct(l,1),g0(l,1,0))}function Of(l){for(;l===xe;)xe=ta[--ua],ta[ua]=null,Za=ta[--ua],ta[ua]=null;for(;l===It;)It=vt[--mt],vt[mt]=null,Ot=vt[--mt],vt[mt]=null,_t=vt[--mt],vt[mt]=null}function S0(l,t){vt[mt++]=_t,vt[mt++]=Ot,vt[mt++]=It,_t=t.id,Ot=t.overflow,It=l}var Dl=null,sl=null,W=!1,Pt=null,dt=!1,Mf=Error(o(519));function lu(l){var t=Error(o(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw xa(yt(t,l)),Mf}function b0(l){var t=l.stateNode,u=l.type,a=l.memoizedProps;switch(t[Ml]=l,t[Zl]=a,u){case"dialog":L("cancel",t),L("close",t);break;case"iframe":case"object":case"embed":L("load",t);break;case"video":case"audio":for(u=0;u<ye.length;u++)L(ye[u],t);break;case"source":L("error",t);break;case"img":case"image":case"link":L("error",t),L("load",t);break;case"details":L("toggle",t);break;case"input":L("invalid",t),Ni(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":L("invalid",t);break;case"textarea":L("invalid",t),qi(t,a.value,a.defaultValue,a.children)}u=a.children,typeof u!="string"&&typeof u!="number"&&typeof u!="bigint"||t.textContent===""+u||a.suppressHydrationWarning===!0||By(t.textContent,u)?(a.popover!=null&&(L("beforetoggle",t),L("toggle",t)),a.onScroll!=null&&L("scroll",t),a.onScrollEnd!=null&&L("scrollend",t),a.onClick!=null&&(t.onclick=Nt),t=!0):t=!1,t||lu(l,!0)}function r0(l){for(Dl=l.return;Dl;)switch(Dl.tag){case 5:case 31:case 13:dt=!1;return;case 27:case 3:dt=!0;return;default:Dl=Dl.return}}function aa(l){if(l!==Dl)return!1;if(!W)return r0(l),W=!0,!1;var t=l.tag,u;if((u=t!==3&&t!==27)&&((u=t===5)&&(u=l.type,u=!(u!=="form"&&u!=="button")||Lc(l.type,l.memoizedProps)),u=!u),u&&sl&&lu(l),r0(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(o(317));sl=Ly(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(o(317));sl=Ly(l)}else t===27?(t=sl,ou(l.type)?(l=$c,$c=null,sl=l):sl=t):sl=Dl?ht(l.stateNode.nextSibling):null;return!0}function pu(){sl=Dl=null,W=!1}function Df(){var l=Pt;return l!==null&&(Jl===null?Jl=l:Jl.push.apply(Jl,l),Pt=null),l}function xa(l){Pt===null?Pt=[l]:Pt.push(l)}var Uf=y(null),Hu=null,Bt=null;function tu(l,t,u){O(Uf,t._currentValue),t._currentValue=u}function Yt(l){l._currentValue=Uf.current,E(Uf)}function pf(l,t,u){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===u)break;l=l.return}}function Hf(l,t,u,a){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var f=e.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=e;for(var i=0;i<t.length;i++)if(c.context===t[i]){n.lanes|=u,c=n.alternate,c!==null&&(c.lanes|=u),pf(n.return,u,l),a||(f=null);break l}n=c.next}}else if(e.tag===18){if(f=e.return,f===null)throw Error(o(341));f.lanes|=u,n=f.alternate,n!==null&&(n.lanes|=u),pf(f,u,l),f=null}else f=e.child;if(f!==null)f.return=e;else for(f=e;f!==null;){if(f===l){f=null;break}if(e=f.sibling,e!==null){e.return=f.return,f=e;break}f=f.return}e=f}}function ea(l,t,u,a){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var f=e.alternate;if(f===null)throw Error(o(387));if(f=f.memoizedProps,f!==null){var c=e.type;Pl(e.pendingProps.value,f.value)||(l!==null?l.push(c):l=[c])}}else if(e===P.current){if(f=e.alternate,f===null)throw Error(o(387));f.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(he):l=[he])}e=e.return}l!==null&&Hf(t,l,u,a),t.flags|=262144}function Ve(l){for(l=l.firstContext;l!==null;){if(!Pl(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Nu(l){Hu=l,Bt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Ul(l){return z0(Hu,l)}function Le(l,t){return Hu===null&&Nu(l),z0(l,t)}function z0(l,t){var u=t._currentValue;if(t={context:t,memoizedValue:u,next:null},Bt===null){if(l===null)throw Error(o(308));Bt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Bt=Bt.next=t;return u}var Bm=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(u,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(u){return u()})}},Ym=A.unstable_scheduleCallback,jm=A.unstable_NormalPriority,bl={$$typeof:Nl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Nf(){return{controller:new Bm,data:new Map,refCount:0}}function Va(l){l.refCount--,l.refCount===0&&Ym(jm,function(){l.controller.abort()})}var La=null,Rf=0,na=0,fa=null;function Gm(l,t){if(La===null){var u=La=[];Rf=0,na=Bc(),fa={status:"pending",value:void 0,then:function(a){u.push(a)}}}return Rf++,t.then(E0,E0),t}function E0(){if(--Rf===0&&La!==null){fa!==null&&(fa.status="fulfilled");var l=La;La=null,na=0,fa=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Xm(l,t){var u=[],a={status:"pending",value:null,reason:null,then:function(e){u.push(e)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var e=0;e<u.length;e++)(0,u[e])(t)},function(e){for(a.status="rejected",a.reason=e,e=0;e<u.length;e++)(0,u[e])(void 0)}),a}var T0=b.S;b.S=function(l,t){ny=Fl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Gm(l,t),T0!==null&&T0(l,t)};var Ru=y(null);function qf(){var l=Ru.current;return l!==null?l:il.pooledCache}function Ke(l,t){t===null?O(Ru,Ru.current):O(Ru,t.pool)}function A0(){var l=qf();return l===null?null:{parent:bl._currentValue,pool:l}}var ca=Error(o(460)),Cf=Error(o(474)),Je=Error(o(542)),we={then:function(){}};function _0(l){return l=l.status,l==="fulfilled"||l==="rejected"}function O0(l,t,u){switch(u=l[u],u===void 0?l.push(t):u!==t&&(t.then(Nt,Nt),t=u),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,D0(l),l;default:if(typeof t.status=="string")t.then(Nt,Nt);else{if(l=il,l!==null&&100<l.shellSuspendCounter)throw Error(o(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=a}},function(a){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,D0(l),l}throw Cu=t,ca}}function qu(l){try{var t=l._init;return t(l._payload)}catch(u){throw u!==null&&typeof u=="object"&&typeof u.then=="function"?(Cu=u,ca):u}}var Cu=null;function M0(){if(Cu===null)throw Error(o(459));var l=Cu;return Cu=null,l}function D0(l){if(l===ca||l===Je)throw Error(o(483))}var ia=null,Ka=0;function We(l){var t=Ka;return Ka+=1,ia===null&&(ia=[]),O0(ia,l,t)}function Ja(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function $e(l,t){throw t.$$typeof===vl?Error(o(525)):(l=Object.prototype.toString.call(t),Error(o(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function U0(l){function t(v,s){if(l){var m=v.deletions;m===null?(v.deletions=[s],v.flags|=16):m.push(s)}}function u(v,s){if(!l)return null;for(;s!==null;)t(v,s),s=s.sibling;return null}function a(v){for(var s=new Map;v!==null;)v.key!==null?s.set(v.key,v):s.set(v.index,v),v=v.sibling;return s}function e(v,s){return v=qt(v,s),v.index=0,v.sibling=null,v}function n(v,s,m){return v.index=m,l?(m=v.alternate,m!==null?(m=m.index,m<s?(v.flags|=67108866,s):m):(v.flags|=67108866,s)):(v.flags|=1048576,s)}function f(v){return l&&v.alternate===null&&(v.flags|=67108866),v}function c(v,s,m,r){return s===null||s.tag!==6?(s=Tf(m,v.mode,r),s.return=v,s):(s=e(s,m),s.return=v,s)}function i(v,s,m,r){var H=m.type;return H===Cl?S(v,s,m.props.children,r,m.key):s!==null&&(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===Xl&&qu(H)===s.type)?(s=e(s,m.props),Ja(s,m),s.return=v,s):(s=Ze(m.type,m.key,m.props,null,v.mode,r),Ja(s,m),s.return=v,s)}function d(v,s,m,r){return s===null||s.tag!==4||s.stateNode.containerInfo!==m.containerInfo||s.stateNode.implementation!==m.implementation?(s=Af(m,v.mode,r),s.return=v,s):(s=e(s,m.children||[]),s.return=v,s)}function S(v,s,m,r,H){return s===null||s.tag!==7?(s=Uu(m,v.mode,r,H),s.return=v,s):(s=e(s,m),s.return=v,s)}function z(v,s,m){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Tf(""+s,v.mode,m),s.return=v,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Wl:return m=Ze(s.type,s.key,s.props,null,v.mode,m),Ja(m,s),m.return=v,m;case jl:return s=Af(s,v.mode,m),s.return=v,s;case Xl:return s=qu(s),z(v,s,m)}if(St(s)||Ql(s))return s=Uu(s,v.mode,m,null),s.return=v,s;if(typeof s.then=="function")return z(v,We(s),m);if(s.$$typeof===Nl)return z(v,Le(v,s),m);$e(v,s)}return null}function h(v,s,m,r){var H=s!==null?s.key:null;if(typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint")return H!==null?null:c(v,s,""+m,r);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case Wl:return m.key===H?i(v,s,m,r):null;case jl:return m.key===H?d(v,s,m,r):null;case Xl:return m=qu(m),h(v,s,m,r)}if(St(m)||Ql(m))return H!==null?null:S(v,s,m,r,null);if(typeof m.then=="function")return h(v,s,We(m),r);if(m.$$typeof===Nl)return h(v,s,Le(v,m),r);$e(v,m)}return null}function g(v,s,m,r,H){if(typeof r=="string"&&r!==""||typeof r=="number"||typeof r=="bigint")return v=v.get(m)||null,c(s,v,""+r,H);if(typeof r=="object"&&r!==null){switch(r.$$typeof){case Wl:return v=v.get(r.key===null?m:r.key)||null,i(s,v,r,H);case jl:return v=v.get(r.key===null?m:r.key)||null,d(s,v,r,H);case Xl:return r=qu(r),g(v,s,m,r,H)}if(St(r)||Ql(r))return v=v.get(m)||null,S(s,v,r,H,null);if(typeof r.then=="function")return g(v,s,m,We(r),H);if(r.$$typeof===Nl)return g(v,s,m,Le(s,r),H);$e(s,r)}return null}function D(v,s,m,r){for(var H=null,$=null,p=s,X=s=0,J=null;p!==null&&X<m.length;X++){p.index>X?(J=p,p=null):J=p.sibling;var F=h(v,p,m[X],r);if(F===null){p===null&&(p=J);break}l&&p&&F.alternate===null&&t(v,p),s=n(F,s,X),$===null?H=F:$.sibling=F,$=F,p=J}if(X===m.length)return u(v,p),W&&Ct(v,X),H;if(p===null){for(;X<m.length;X++)p=z(v,m[X],r),p!==null&&(s=n(p,s,X),$===null?H=p:$.sibling=p,$=p);return W&&Ct(v,X),H}for(p=a(p);X<m.length;X++)J=g(p,v,X,m[X],r),J!==null&&(l&&J.alternate!==null&&p.delete(J.key===null?X:J.key),s=n(J,s,X),$===null?H=J:$.sibling=J,$=J);return l&&p.forEach(function(ru){return t(v,ru)}),W&&Ct(v,X),H}function R(v,s,m,r){if(m==null)throw Error(o(151));for(var H=null,$=null,p=s,X=s=0,J=null,F=m.next();p!==null&&!F.done;X++,F=m.next()){p.index>X?(J=p,p=null):J=p.sibling;var ru=h(v,p,F.value,r);if(ru===null){p===null&&(p=J);break}l&&p&&ru.alternate===null&&t(v,p),s=n(ru,s,X),$===null?H=ru:$.sibling=ru,$=ru,p=J}if(F.done)return u(v,p),W&&Ct(v,X),H;if(p===null){for(;!F.done;X++,F=m.next())F=z(v,F.value,r),F!==null&&(s=n(F,s,X),$===null?H=F:$.sibling=F,$=F);return W&&Ct(v,X),H}for(p=a(p);!F.done;X++,F=m.next())F=g(p,v,X,F.value,r),F!==null&&(l&&F.alternate!==null&&p.delete(F.key===null?X:F.key),s=n(F,s,X),$===null?H=F:$.sibling=F,$=F);return l&&p.forEach(function(Fd){return t(v,Fd)}),W&&Ct(v,X),H}function nl(v,s,m,r){if(typeof m=="object"&&m!==null&&m.type===Cl&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case Wl:l:{for(var H=m.key;s!==null;){if(s.key===H){if(H=m.type,H===Cl){if(s.tag===7){u(v,s.sibling),r=e(s,m.props.children),r.return=v,v=r;break l}}else if(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===Xl&&qu(H)===s.type){u(v,s.sibling),r=e(s,m.props),Ja(r,m),r.return=v,v=r;break l}u(v,s);break}else t(v,s);s=s.sibling}m.type===Cl?(r=Uu(m.props.children,v.mode,r,m.key),r.return=v,v=r):(r=Ze(m.type,m.key,m.props,null,v.mode,r),Ja(r,m),r.return=v,v=r)}return f(v);case jl:l:{for(H=m.key;s!==null;){if(s.key===H)if(s.tag===4&&s.stateNode.containerInfo===m.containerInfo&&s.stateNode.implementation===m.implementation){u(v,s.sibling),r=e(s,m.children||[]),r.return=v,v=r;break l}else{u(v,s);break}else t(v,s);s=s.sibling}r=Af(m,v.mode,r),r.return=v,v=r}return f(v);case Xl:return m=qu(m),nl(v,s,m,r)}if(St(m))return D(v,s,m,r);if(Ql(m)){if(H=Ql(m),typeof H!="function")throw Error(o(150));return m=H.call(m),R(v,s,m,r)}if(typeof m.then=="function")return nl(v,s,We(m),r);if(m.$$typeof===Nl)return nl(v,s,Le(v,m),r);$e(v,m)}return typeof m=="string"&&m!==""||typeof m=="number"||typeof m=="bigint"?(m=""+m,s!==null&&s.tag===6?(u(v,s.sibling),r=e(s,m),r.return=v,v=r):(u(v,s),r=Tf(m,v.mode,r),r.return=v,v=r),f(v)):u(v,s)}return function(v,s,m,r){try{Ka=0;var H=nl(v,s,m,r);return ia=null,H}catch(p){if(p===ca||p===Je)throw p;var $=lt(29,p,null,v.mode);return $.lanes=r,$.return=v,$}finally{}}}var Bu=U0(!0),p0=U0(!1),uu=!1;function Bf(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Yf(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function au(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function eu(l,t,u){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,(k&2)!==0){var e=a.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),a.pending=t,t=Qe(l),m0(l,null,u),t}return Xe(l,a,t,u),Qe(l)}function wa(l,t,u){if(t=t.updateQueue,t!==null&&(t=t.shared,(u&4194048)!==0)){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,zi(l,u)}}function jf(l,t){var u=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,u===a)){var e=null,n=null;if(u=u.firstBaseUpdate,u!==null){do{var f={lane:u.lane,tag:u.tag,payload:u.payload,callback:null,next:null};n===null?e=n=f:n=n.next=f,u=u.next}while(u!==null);n===null?e=n=t:n=n.next=t}else e=n=t;u={baseState:a.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=u;return}l=u.lastBaseUpdate,l===null?u.firstBaseUpdate=t:l.next=t,u.lastBaseUpdate=t}var Gf=!1;function Wa(){if(Gf){var l=fa;if(l!==null)throw l}}function $a(l,t,u,a){Gf=!1;var e=l.updateQueue;uu=!1;var n=e.firstBaseUpdate,f=e.lastBaseUpdate,c=e.shared.pending;if(c!==null){e.shared.pending=null;var i=c,d=i.next;i.next=null,f===null?n=d:f.next=d,f=i;var S=l.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==f&&(c===null?S.firstBaseUpdate=d:c.next=d,S.lastBaseUpdate=i))}if(n!==null){var z=e.baseState;f=0,S=d=i=null,c=n;do{var h=c.lane&-536870913,g=h!==c.lane;if(g?(K&h)===h:(a&h)===h){h!==0&&h===na&&(Gf=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var D=l,R=c;h=t;var nl=u;switch(R.tag){case 1:if(D=R.payload,typeof D=="function"){z=D.call(nl,z,h);break l}z=D;break l;case 3:D.flags=D.flags&-65537|128;case 0:if(D=R.payload,h=typeof D=="function"?D.call(nl,z,h):D,h==null)break l;z=q({},z,h);break l;case 2:uu=!0}}h=c.callback,h!==null&&(l.flags|=64,g&&(l.flags|=8192),g=e.callbacks,g===null?e.callbacks=[h]:g.push(h))}else g={lane:h,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(d=S=g,i=z):S=S.next=g,f|=h;if(c=c.next,c===null){if(c=e.shared.pending,c===null)break;g=c,c=g.next,g.next=null,e.lastBaseUpdate=g,e.shared.pending=null}}while(!0);S===null&&(i=z),e.baseState=i,e.firstBaseUpdate=d,e.lastBaseUpdate=S,n===null&&(e.shared.lanes=0),su|=f,l.lanes=f,l.memoizedState=z}}function H0(l,t){if(typeof l!="function")throw Error(o(191,l));l.call(t)}function N0(l,t){var u=l.callbacks;if(u!==null)for(l.callbacks=null,l=0;l<u.length;l++)H0(u[l],t)}var sa=y(null),Fe=y(0);function R0(l,t){l=Kt,O(Fe,l),O(sa,t),Kt=l|t.baseLanes}function Xf(){O(Fe,Kt),O(sa,sa.current)}function Qf(){Kt=Fe.current,E(sa),E(Fe)}var tt=y(null),ot=null;function nu(l){var t=l.alternate;O(gl,gl.current&1),O(tt,l),ot===null&&(t===null||sa.current!==null||t.memoizedState!==null)&&(ot=l)}function Zf(l){O(gl,gl.current),O(tt,l),ot===null&&(ot=l)}function q0(l){l.tag===22?(O(gl,gl.current),O(tt,l),ot===null&&(ot=l)):fu()}function fu(){O(gl,gl.current),O(tt,tt.current)}function ut(l){E(tt),ot===l&&(ot=null),E(gl)}var gl=y(0);function ke(l){for(var t=l;t!==null;){if(t.tag===13){var u=t.memoizedState;if(u!==null&&(u=u.dehydrated,u===null||wc(u)||Wc(u)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var jt=0,j=null,al=null,rl=null,Ie=!1,ya=!1,Yu=!1,Pe=0,Fa=0,va=null,Qm=0;function dl(){throw Error(o(321))}function xf(l,t){if(t===null)return!1;for(var u=0;u<t.length&&u<l.length;u++)if(!Pl(l[u],t[u]))return!1;return!0}function Vf(l,t,u,a,e,n){return jt=n,j=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,b.H=l===null||l.memoizedState===null?gs:ec,Yu=!1,n=u(a,e),Yu=!1,ya&&(n=B0(t,u,a,e)),C0(l),n}function C0(l){b.H=Pa;var t=al!==null&&al.next!==null;if(jt=0,rl=al=j=null,Ie=!1,Fa=0,va=null,t)throw Error(o(300));l===null||zl||(l=l.dependencies,l!==null&&Ve(l)&&(zl=!0))}function B0(l,t,u,a){j=l;var e=0;do{if(ya&&(va=null),Fa=0,ya=!1,25<=e)throw Error(o(301));if(e+=1,rl=al=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}b.H=Ss,n=t(u,a)}while(ya);return n}function Zm(){var l=b.H,t=l.useState()[0];return t=typeof t.then=="function"?ka(t):t,l=l.useState()[0],(al!==null?al.memoizedState:null)!==l&&(j.flags|=1024),t}function Lf(){var l=Pe!==0;return Pe=0,l}function Kf(l,t,u){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~u}function Jf(l){if(Ie){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}Ie=!1}jt=0,rl=al=j=null,ya=!1,Fa=Pe=0,va=null}function Yl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return rl===null?j.memoizedState=rl=l:rl=rl.next=l,rl}function Sl(){if(al===null){var l=j.alternate;l=l!==null?l.memoizedState:null}else l=al.next;var t=rl===null?j.memoizedState:rl.next;if(t!==null)rl=t,al=l;else{if(l===null)throw j.alternate===null?Error(o(467)):Error(o(310));al=l,l={memoizedState:al.memoizedState,baseState:al.baseState,baseQueue:al.baseQueue,queue:al.queue,next:null},rl===null?j.memoizedState=rl=l:rl=rl.next=l}return rl}function ln(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function ka(l){var t=Fa;return Fa+=1,va===null&&(va=[]),l=O0(va,l,t),t=j,(rl===null?t.memoizedState:rl.next)===null&&(t=t.alternate,b.H=t===null||t.memoizedState===null?gs:ec),l}function tn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return ka(l);if(l.$$typeof===Nl)return Ul(l)}throw Error(o(438,String(l)))}function wf(l){var t=null,u=j.updateQueue;if(u!==null&&(t=u.memoCache),t==null){var a=j.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),u===null&&(u=ln(),j.updateQueue=u),u.memoCache=t,u=t.data[t.index],u===void 0)for(u=t.data[t.index]=Array(l),a=0;a<l;a++)u[a]=Qu;return t.index++,u}function Gt(l,t){return typeof t=="function"?t(l):t}function un(l){var t=Sl();return Wf(t,al,l)}function Wf(l,t,u){var a=l.queue;if(a===null)throw Error(o(311));a.lastRenderedReducer=u;var e=l.baseQueue,n=a.pending;if(n!==null){if(e!==null){var f=e.next;e.next=n.next,n.next=f}t.baseQueue=e=n,a.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var c=f=null,i=null,d=t,S=!1;do{var z=d.lane&-536870913;if(z!==d.lane?(K&z)===z:(jt&z)===z){var h=d.revertLane;if(h===0)i!==null&&(i=i.next={lane:0,revertLane:0,gesture:null,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null}),z===na&&(S=!0);else if((jt&h)===h){d=d.next,h===na&&(S=!0);continue}else z={lane:0,revertLane:d.revertLane,gesture:null,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null},i===null?(c=i=z,f=n):i=i.next=z,j.lanes|=h,su|=h;z=d.action,Yu&&u(n,z),n=d.hasEagerState?d.eagerState:u(n,z)}else h={lane:z,revertLane:d.revertLane,gesture:d.gesture,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null},i===null?(c=i=h,f=n):i=i.next=h,j.lanes|=z,su|=z;d=d.next}while(d!==null&&d!==t);if(i===null?f=n:i.next=c,!Pl(n,l.memoizedState)&&(zl=!0,S&&(u=fa,u!==null)))throw u;l.memoizedState=n,l.baseState=f,l.baseQueue=i,a.lastRenderedState=n}return e===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function $f(l){var t=Sl(),u=t.queue;if(u===null)throw Error(o(311));u.lastRenderedReducer=l;var a=u.dispatch,e=u.pending,n=t.memoizedState;if(e!==null){u.pending=null;var f=e=e.next;do n=l(n,f.action),f=f.next;while(f!==e);Pl(n,t.memoizedState)||(zl=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),u.lastRenderedState=n}return[n,a]}function Y0(l,t,u){var a=j,e=Sl(),n=W;if(n){if(u===void 0)throw Error(o(407));u=u()}else u=t();var f=!Pl((al||e).memoizedState,u);if(f&&(e.memoizedState=u,zl=!0),e=e.queue,If(X0.bind(null,a,e,l),[l]),e.getSnapshot!==t||f||rl!==null&&rl.memoizedState.tag&1){if(a.flags|=2048,ma(9,{destroy:void 0},G0.bind(null,a,e,u,t),null),il===null)throw Error(o(349));n||(jt&127)!==0||j0(a,t,u)}return u}function j0(l,t,u){l.flags|=16384,l={getSnapshot:t,value:u},t=j.updateQueue,t===null?(t=ln(),j.updateQueue=t,t.stores=[l]):(u=t.stores,u===null?t.stores=[l]:u.push(l))}function G0(l,t,u,a){t.value=u,t.getSnapshot=a,Q0(t)&&Z0(l)}function X0(l,t,u){return u(function(){Q0(t)&&Z0(l)})}function Q0(l){var t=l.getSnapshot;l=l.value;try{var u=t();return!Pl(l,u)}catch{return!0}}function Z0(l){var t=Du(l,2);t!==null&&wl(t,l,2)}function Ff(l){var t=Yl();if(typeof l=="function"){var u=l;if(l=u(),Yu){$t(!0);try{u()}finally{$t(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:l},t}function x0(l,t,u,a){return l.baseState=u,Wf(l,al,typeof a=="function"?a:Gt)}function xm(l,t,u,a,e){if(nn(l))throw Error(o(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(f){n.listeners.push(f)}};b.T!==null?u(!0):n.isTransition=!1,a(n),u=t.pending,u===null?(n.next=t.pending=n,V0(t,n)):(n.next=u.next,t.pending=u.next=n)}}function V0(l,t){var u=t.action,a=t.payload,e=l.state;if(t.isTransition){var n=b.T,f={};b.T=f;try{var c=u(e,a),i=b.S;i!==null&&i(f,c),L0(l,t,c)}catch(d){kf(l,t,d)}finally{n!==null&&f.types!==null&&(n.types=f.types),b.T=n}}else try{n=u(e,a),L0(l,t,n)}catch(d){kf(l,t,d)}}function L0(l,t,u){u!==null&&typeof u=="object"&&typeof u.then=="function"?u.then(function(a){K0(l,t,a)},function(a){return kf(l,t,a)}):K0(l,t,u)}function K0(l,t,u){t.status="fulfilled",t.value=u,J0(t),l.state=u,t=l.pending,t!==null&&(u=t.next,u===t?l.pending=null:(u=u.next,t.next=u,V0(l,u)))}function kf(l,t,u){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=u,J0(t),t=t.next;while(t!==a)}l.action=null}function J0(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function w0(l,t){return t}function W0(l,t){if(W){var u=il.formState;if(u!==null){l:{var a=j;if(W){if(sl){t:{for(var e=sl,n=dt;e.nodeType!==8;){if(!n){e=null;break t}if(e=ht(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){sl=ht(e.nextSibling),a=e.data==="F!";break l}}lu(a)}a=!1}a&&(t=u[0])}}return u=Yl(),u.memoizedState=u.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:w0,lastRenderedState:t},u.queue=a,u=ds.bind(null,j,a),a.dispatch=u,a=Ff(!1),n=ac.bind(null,j,!1,a.queue),a=Yl(),e={state:t,dispatch:null,action:l,pending:null},a.queue=e,u=xm.bind(null,j,e,n,u),e.dispatch=u,a.memoizedState=l,[t,u,!1]}function $0(l){var t=Sl();return F0(t,al,l)}function F0(l,t,u){if(t=Wf(l,t,w0)[0],l=un(Gt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=ka(t)}catch(f){throw f===ca?Je:f}else a=t;t=Sl();var e=t.queue,n=e.dispatch;return u!==t.memoizedState&&(j.flags|=2048,ma(9,{destroy:void 0},Vm.bind(null,e,u),null)),[a,n,l]}function Vm(l,t){l.action=t}function k0(l){var t=Sl(),u=al;if(u!==null)return F0(t,u,l);Sl(),t=t.memoizedState,u=Sl();var a=u.queue.dispatch;return u.memoizedState=l,[t,a,!1]}function ma(l,t,u,a){return l={tag:l,create:u,deps:a,inst:t,next:null},t=j.updateQueue,t===null&&(t=ln(),j.updateQueue=t),u=t.lastEffect,u===null?t.lastEffect=l.next=l:(a=u.next,u.next=l,l.next=a,t.lastEffect=l),l}function I0(){return Sl().memoizedState}function an(l,t,u,a){var e=Yl();j.flags|=l,e.memoizedState=ma(1|t,{destroy:void 0},u,a===void 0?null:a)}function en(l,t,u,a){var e=Sl();a=a===void 0?null:a;var n=e.memoizedState.inst;al!==null&&a!==null&&xf(a,al.memoizedState.deps)?e.memoizedState=ma(t,n,u,a):(j.flags|=l,e.memoizedState=ma(1|t,n,u,a))}function P0(l,t){an(8390656,8,l,t)}function If(l,t){en(2048,8,l,t)}function Lm(l){j.flags|=4;var t=j.updateQueue;if(t===null)t=ln(),j.updateQueue=t,t.events=[l];else{var u=t.events;u===null?t.events=[l]:u.push(l)}}function ls(l){var t=Sl().memoizedState;return Lm({ref:t,nextImpl:l}),function(){if((k&2)!==0)throw Error(o(440));return t.impl.apply(void 0,arguments)}}function ts(l,t){return en(4,2,l,t)}function us(l,t){return en(4,4,l,t)}function as(l,t){if(typeof t=="function"){l=l();var u=t(l);return function(){typeof u=="function"?u():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function es(l,t,u){u=u!=null?u.concat([l]):null,en(4,4,as.bind(null,t,l),u)}function Pf(){}function ns(l,t){var u=Sl();t=t===void 0?null:t;var a=u.memoizedState;return t!==null&&xf(t,a[1])?a[0]:(u.memoizedState=[l,t],l)}function fs(l,t){var u=Sl();t=t===void 0?null:t;var a=u.memoizedState;if(t!==null&&xf(t,a[1]))return a[0];if(a=l(),Yu){$t(!0);try{l()}finally{$t(!1)}}return u.memoizedState=[a,t],a}function lc(l,t,u){return u===void 0||(jt&1073741824)!==0&&(K&261930)===0?l.memoizedState=t:(l.memoizedState=u,l=cy(),j.lanes|=l,su|=l,u)}function cs(l,t,u,a){return Pl(u,t)?u:sa.current!==null?(l=lc(l,u,a),Pl(l,t)||(zl=!0),l):(jt&42)===0||(jt&1073741824)!==0&&(K&261930)===0?(zl=!0,l.memoizedState=u):(l=cy(),j.lanes|=l,su|=l,t)}function is(l,t,u,a,e){var n=_.p;_.p=n!==0&&8>n?n:8;var f=b.T,c={};b.T=c,ac(l,!1,t,u);try{var i=e(),d=b.S;if(d!==null&&d(c,i),i!==null&&typeof i=="object"&&typeof i.then=="function"){var S=Xm(i,a);Ia(l,t,S,nt(l))}else Ia(l,t,a,nt(l))}catch(z){Ia(l,t,{then:function(){},status:"rejected",reason:z},nt())}finally{_.p=n,f!==null&&c.types!==null&&(f.types=c.types),b.T=f}}function Km(){}function tc(l,t,u,a){if(l.tag!==5)throw Error(o(476));var e=ss(l).queue;is(l,e,t,C,u===null?Km:function(){return ys(l),u(a)})}function ss(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:C,baseState:C,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:C},next:null};var u={};return t.next={memoizedState:u,baseState:u,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:u},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function ys(l){var t=ss(l);t.next===null&&(t=l.alternate.memoizedState),Ia(l,t.next.queue,{},nt())}function uc(){return Ul(he)}function vs(){return Sl().memoizedState}function ms(){return Sl().memoizedState}function Jm(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var u=nt();l=au(u);var a=eu(t,l,u);a!==null&&(wl(a,t,u),wa(a,t,u)),t={cache:Nf()},l.payload=t;return}t=t.return}}function wm(l,t,u){var a=nt();u={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},nn(l)?os(t,u):(u=zf(l,t,u,a),u!==null&&(wl(u,l,a),hs(u,t,a)))}function ds(l,t,u){var a=nt();Ia(l,t,u,a)}function Ia(l,t,u,a){var e={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null};if(nn(l))os(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var f=t.lastRenderedState,c=n(f,u);if(e.hasEagerState=!0,e.eagerState=c,Pl(c,f))return Xe(l,t,e,0),il===null&&Ge(),!1}catch{}finally{}if(u=zf(l,t,e,a),u!==null)return wl(u,l,a),hs(u,t,a),!0}return!1}function ac(l,t,u,a){if(a={lane:2,revertLane:Bc(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},nn(l)){if(t)throw Error(o(479))}else t=zf(l,u,a,2),t!==null&&wl(t,l,2)}function nn(l){var t=l.alternate;return l===j||t!==null&&t===j}function os(l,t){ya=Ie=!0;var u=l.pending;u===null?t.next=t:(t.next=u.next,u.next=t),l.pending=t}function hs(l,t,u){if((u&4194048)!==0){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,zi(l,u)}}var Pa={readContext:Ul,use:tn,useCallback:dl,useContext:dl,useEffect:dl,useImperativeHandle:dl,useLayoutEffect:dl,useInsertionEffect:dl,useMemo:dl,useReducer:dl,useRef:dl,useState:dl,useDebugValue:dl,useDeferredValue:dl,useTransition:dl,useSyncExternalStore:dl,useId:dl,useHostTransitionStatus:dl,useFormState:dl,useActionState:dl,useOptimistic:dl,useMemoCache:dl,useCacheRefresh:dl};Pa.useEffectEvent=dl;var gs={readContext:Ul,use:tn,useCallback:function(l,t){return Yl().memoizedState=[l,t===void 0?null:t],l},useContext:Ul,useEffect:P0,useImperativeHandle:function(l,t,u){u=u!=null?u.concat([l]):null,an(4194308,4,as.bind(null,t,l),u)},useLayoutEffect:function(l,t){return an(4194308,4,l,t)},useInsertionEffect:function(l,t){an(4,2,l,t)},useMemo:function(l,t){var u=Yl();t=t===void 0?null:t;var a=l();if(Yu){$t(!0);try{l()}finally{$t(!1)}}return u.memoizedState=[a,t],a},useReducer:function(l,t,u){var a=Yl();if(u!==void 0){var e=u(t);if(Yu){$t(!0);try{u(t)}finally{$t(!1)}}}else e=t;return a.memoizedState=a.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},a.queue=l,l=l.dispatch=wm.bind(null,j,l),[a.memoizedState,l]},useRef:function(l){var t=Yl();return l={current:l},t.memoizedState=l},useState:function(l){l=Ff(l);var t=l.queue,u=ds.bind(null,j,t);return t.dispatch=u,[l.memoizedState,u]},useDebugValue:Pf,useDeferredValue:function(l,t){var u=Yl();return lc(u,l,t)},useTransition:function(){var l=Ff(!1);return l=is.bind(null,j,l.queue,!0,!1),Yl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,u){var a=j,e=Yl();if(W){if(u===void 0)throw Error(o(407));u=u()}else{if(u=t(),il===null)throw Error(o(349));(K&127)!==0||j0(a,t,u)}e.memoizedState=u;var n={value:u,getSnapshot:t};return e.queue=n,P0(X0.bind(null,a,n,l),[l]),a.flags|=2048,ma(9,{destroy:void 0},G0.bind(null,a,n,u,t),null),u},useId:function(){var l=Yl(),t=il.identifierPrefix;if(W){var u=Ot,a=_t;u=(a&~(1<<32-Il(a)-1)).toString(32)+u,t="_"+t+"R_"+u,u=Pe++,0<u&&(t+="H"+u.toString(32)),t+="_"}else u=Qm++,t="_"+t+"r_"+u.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:uc,useFormState:W0,useActionState:W0,useOptimistic:function(l){var t=Yl();t.memoizedState=t.baseState=l;var u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=u,t=ac.bind(null,j,!0,u),u.dispatch=t,[l,t]},useMemoCache:wf,useCacheRefresh:function(){return Yl().memoizedState=Jm.bind(null,j)},useEffectEvent:function(l){var t=Yl(),u={impl:l};return t.memoizedState=u,function(){if((k&2)!==0)throw Error(o(440));return u.impl.apply(void 0,arguments)}}},ec={readContext:Ul,use:tn,useCallback:ns,useContext:Ul,useEffect:If,useImperativeHandle:es,useInsertionEffect:ts,useLayoutEffect:us,useMemo:fs,useReducer:un,useRef:I0,useState:function(){return un(Gt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=Sl();return cs(u,al.memoizedState,l,t)},useTransition:function(){var l=un(Gt)[0],t=Sl().memoizedState;return[typeof l=="boolean"?l:ka(l),t]},useSyncExternalStore:Y0,useId:vs,useHostTransitionStatus:uc,useFormState:$0,useActionState:$0,useOptimistic:function(l,t){var u=Sl();return x0(u,al,l,t)},useMemoCache:wf,useCacheRefresh:ms};ec.useEffectEvent=ls;var Ss={readContext:Ul,use:tn,useCallback:ns,useContext:Ul,useEffect:If,useImperativeHandle:es,useInsertionEffect:ts,useLayoutEffect:us,useMemo:fs,useReducer:$f,useRef:I0,useState:function(){return $f(Gt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=Sl();return al===null?lc(u,l,t):cs(u,al.memoizedState,l,t)},useTransition:function(){var l=$f(Gt)[0],t=Sl().memoizedState;return[typeof l=="boolean"?l:ka(l),t]},useSyncExternalStore:Y0,useId:vs,useHostTransitionStatus:uc,useFormState:k0,useActionState:k0,useOptimistic:function(l,t){var u=Sl();return al!==null?x0(u,al,l,t):(u.baseState=l,[l,u.queue.dispatch])},useMemoCache:wf,useCacheRefresh:ms};Ss.useEffectEvent=ls;function nc(l,t,u,a){t=l.memoizedState,u=u(a,t),u=u==null?t:q({},t,u),l.memoizedState=u,l.lanes===0&&(l.updateQueue.baseState=u)}var fc={enqueueSetState:function(l,t,u){l=l._reactInternals;var a=nt(),e=au(a);e.payload=t,u!=null&&(e.callback=u),t=eu(l,e,a),t!==null&&(wl(t,l,a),wa(t,l,a))},enqueueReplaceState:function(l,t,u){l=l._reactInternals;var a=nt(),e=au(a);e.tag=1,e.payload=t,u!=null&&(e.callback=u),t=eu(l,e,a),t!==null&&(wl(t,l,a),wa(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var u=nt(),a=au(u);a.tag=2,t!=null&&(a.callback=t),t=eu(l,a,u),t!==null&&(wl(t,l,u),wa(t,l,u))}};function bs(l,t,u,a,e,n,f){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,f):t.prototype&&t.prototype.isPureReactComponent?!Xa(u,a)||!Xa(e,n):!0}function rs(l,t,u,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(u,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(u,a),t.state!==l&&fc.enqueueReplaceState(t,t.state,null)}function ju(l,t){var u=t;if("ref"in t){u={};for(var a in t)a!=="ref"&&(u[a]=t[a])}if(l=l.defaultProps){u===t&&(u=q({},u));for(var e in l)u[e]===void 0&&(u[e]=l[e])}return u}function zs(l){je(l)}function Es(l){console.error(l)}function Ts(l){je(l)}function fn(l,t){try{var u=l.onUncaughtError;u(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function As(l,t,u){try{var a=l.onCaughtError;a(u.value,{componentStack:u.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function cc(l,t,u){return u=au(u),u.tag=3,u.payload={element:null},u.callback=function(){fn(l,t)},u}function _s(l){return l=au(l),l.tag=3,l}function Os(l,t,u,a){var e=u.type.getDerivedStateFromError;if(typeof e=="function"){var n=a.value;l.payload=function(){return e(n)},l.callback=function(){As(t,u,a)}}var f=u.stateNode;f!==null&&typeof f.componentDidCatch=="function"&&(l.callback=function(){As(t,u,a),typeof e!="function"&&(yu===null?yu=new Set([this]):yu.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function Wm(l,t,u,a,e){if(u.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=u.alternate,t!==null&&ea(t,u,e,!0),u=tt.current,u!==null){switch(u.tag){case 31:case 13:return ot===null?rn():u.alternate===null&&ol===0&&(ol=3),u.flags&=-257,u.flags|=65536,u.lanes=e,a===we?u.flags|=16384:(t=u.updateQueue,t===null?u.updateQueue=new Set([a]):t.add(a),Rc(l,a,e)),!1;case 22:return u.flags|=65536,a===we?u.flags|=16384:(t=u.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},u.updateQueue=t):(u=t.retryQueue,u===null?t.retryQueue=new Set([a]):u.add(a)),Rc(l,a,e)),!1}throw Error(o(435,u.tag))}return Rc(l,a,e),rn(),!1}if(W)return t=tt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,a!==Mf&&(l=Error(o(422),{cause:a}),xa(yt(l,u)))):(a!==Mf&&(t=Error(o(423),{cause:a}),xa(yt(t,u))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,a=yt(a,u),e=cc(l.stateNode,a,e),jf(l,e),ol!==4&&(ol=2)),!1;var n=Error(o(520),{cause:a});if(n=yt(n,u),ce===null?ce=[n]:ce.push(n),ol!==4&&(ol=2),t===null)return!0;a=yt(a,u),u=t;do{switch(u.tag){case 3:return u.flags|=65536,l=e&-e,u.lanes|=l,l=cc(u.stateNode,a,l),jf(u,l),!1;case 1:if(t=u.type,n=u.stateNode,(u.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(yu===null||!yu.has(n))))return u.flags|=65536,e&=-e,u.lanes|=e,e=_s(e),Os(e,l,u,a),jf(u,e),!1}u=u.return}while(u!==null);return!1}var ic=Error(o(461)),zl=!1;function pl(l,t,u,a){t.child=l===null?p0(t,null,u,a):Bu(t,l.child,u,a)}function Ms(l,t,u,a,e){u=u.render;var n=t.ref;if("ref"in a){var f={};for(var c in a)c!=="ref"&&(f[c]=a[c])}else f=a;return Nu(t),a=Vf(l,t,u,f,n,e),c=Lf(),l!==null&&!zl?(Kf(l,t,e),Xt(l,t,e)):(W&&c&&_f(t),t.flags|=1,pl(l,t,a,e),t.child)}function Ds(l,t,u,a,e){if(l===null){var n=u.type;return typeof n=="function"&&!Ef(n)&&n.defaultProps===void 0&&u.compare===null?(t.tag=15,t.type=n,Us(l,t,n,a,e)):(l=Ze(u.type,null,a,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!gc(l,e)){var f=n.memoizedProps;if(u=u.compare,u=u!==null?u:Xa,u(f,a)&&l.ref===t.ref)return Xt(l,t,e)}return t.flags|=1,l=qt(n,a),l.ref=t.ref,l.return=t,t.child=l}function Us(l,t,u,a,e){if(l!==null){var n=l.memoizedProps;if(Xa(n,a)&&l.ref===t.ref)if(zl=!1,t.pendingProps=a=n,gc(l,e))(l.flags&131072)!==0&&(zl=!0);else return t.lanes=l.lanes,Xt(l,t,e)}return sc(l,t,u,a,e)}function ps(l,t,u,a){var e=a.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|u:u,l!==null){for(a=t.child=l.child,e=0;a!==null;)e=e|a.lanes|a.childLanes,a=a.sibling;a=e&~n}else a=0,t.child=null;return Hs(l,t,n,u,a)}if((u&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Ke(t,n!==null?n.cachePool:null),n!==null?R0(t,n):Xf(),q0(t);else return a=t.lanes=536870912,Hs(l,t,n!==null?n.baseLanes|u:u,u,a)}else n!==null?(Ke(t,n.cachePool),R0(t,n),fu(),t.memoizedState=null):(l!==null&&Ke(t,null),Xf(),fu());return pl(l,t,e,u),t.child}function le(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Hs(l,t,u,a,e){var n=qf();return n=n===null?null:{parent:bl._currentValue,pool:n},t.memoizedState={baseLanes:u,cachePool:n},l!==null&&Ke(t,null),Xf(),q0(t),l!==null&&ea(l,t,a,!0),t.childLanes=e,null}function cn(l,t){return t=yn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Ns(l,t,u){return Bu(t,l.child,null,u),l=cn(t,t.pendingProps),l.flags|=2,ut(t),t.memoizedState=null,l}function $m(l,t,u){var a=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(W){if(a.mode==="hidden")return l=cn(t,a),t.lanes=536870912,le(null,l);if(Zf(t),(l=sl)?(l=Vy(l,dt),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:It!==null?{id:_t,overflow:Ot}:null,retryLane:536870912,hydrationErrors:null},u=o0(l),u.return=t,t.child=u,Dl=t,sl=null)):l=null,l===null)throw lu(t);return t.lanes=536870912,null}return cn(t,a)}var n=l.memoizedState;if(n!==null){var f=n.dehydrated;if(Zf(t),e)if(t.flags&256)t.flags&=-257,t=Ns(l,t,u);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(o(558));else if(zl||ea(l,t,u,!1),e=(u&l.childLanes)!==0,zl||e){if(a=il,a!==null&&(f=Ei(a,u),f!==0&&f!==n.retryLane))throw n.retryLane=f,Du(l,f),wl(a,l,f),ic;rn(),t=Ns(l,t,u)}else l=n.treeContext,sl=ht(f.nextSibling),Dl=t,W=!0,Pt=null,dt=!1,l!==null&&S0(t,l),t=cn(t,a),t.flags|=4096;return t}return l=qt(l.child,{mode:a.mode,children:a.children}),l.ref=t.ref,t.child=l,l.return=t,l}function sn(l,t){var u=t.ref;if(u===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof u!="function"&&typeof u!="object")throw Error(o(284));(l===null||l.ref!==u)&&(t.flags|=4194816)}}function sc(l,t,u,a,e){return Nu(t),u=Vf(l,t,u,a,void 0,e),a=Lf(),l!==null&&!zl?(Kf(l,t,e),Xt(l,t,e)):(W&&a&&_f(t),t.flags|=1,pl(l,t,u,e),t.child)}function Rs(l,t,u,a,e,n){return Nu(t),t.updateQueue=null,u=B0(t,a,u,e),C0(l),a=Lf(),l!==null&&!zl?(Kf(l,t,n),Xt(l,t,n)):(W&&a&&_f(t),t.flags|=1,pl(l,t,u,n),t.child)}function qs(l,t,u,a,e){if(Nu(t),t.stateNode===null){var n=la,f=u.contextType;typeof f=="object"&&f!==null&&(n=Ul(f)),n=new u(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=fc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},Bf(t),f=u.contextType,n.context=typeof f=="object"&&f!==null?Ul(f):la,n.state=t.memoizedState,f=u.getDerivedStateFromProps,typeof f=="function"&&(nc(t,u,f,a),n.state=t.memoizedState),typeof u.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(f=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),f!==n.state&&fc.enqueueReplaceState(n,n.state,null),$a(t,a,n,e),Wa(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,i=ju(u,c);n.props=i;var d=n.context,S=u.contextType;f=la,typeof S=="object"&&S!==null&&(f=Ul(S));var z=u.getDerivedStateFromProps;S=typeof z=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||d!==f)&&rs(t,n,a,f),uu=!1;var h=t.memoizedState;n.state=h,$a(t,a,n,e),Wa(),d=t.memoizedState,c||h!==d||uu?(typeof z=="function"&&(nc(t,u,z,a),d=t.memoizedState),(i=uu||bs(t,u,i,a,h,d,f))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=d),n.props=a,n.state=d,n.context=f,a=i):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,Yf(l,t),f=t.memoizedProps,S=ju(u,f),n.props=S,z=t.pendingProps,h=n.context,d=u.contextType,i=la,typeof d=="object"&&d!==null&&(i=Ul(d)),c=u.getDerivedStateFromProps,(d=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f!==z||h!==i)&&rs(t,n,a,i),uu=!1,h=t.memoizedState,n.state=h,$a(t,a,n,e),Wa();var g=t.memoizedState;f!==z||h!==g||uu||l!==null&&l.dependencies!==null&&Ve(l.dependencies)?(typeof c=="function"&&(nc(t,u,c,a),g=t.memoizedState),(S=uu||bs(t,u,S,a,h,g,i)||l!==null&&l.dependencies!==null&&Ve(l.dependencies))?(d||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,g,i),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,g,i)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=g),n.props=a,n.state=g,n.context=i,a=S):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,sn(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,u=a&&typeof u.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=Bu(t,l.child,null,e),t.child=Bu(t,null,u,e)):pl(l,t,u,e),t.memoizedState=n.state,l=t.child):l=Xt(l,t,e),l}function Cs(l,t,u,a){return pu(),t.flags|=256,pl(l,t,u,a),t.child}var yc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function vc(l){return{baseLanes:l,cachePool:A0()}}function mc(l,t,u){return l=l!==null?l.childLanes&~u:0,t&&(l|=et),l}function Bs(l,t,u){var a=t.pendingProps,e=!1,n=(t.flags&128)!==0,f;if((f=n)||(f=l!==null&&l.memoizedState===null?!1:(gl.current&2)!==0),f&&(e=!0,t.flags&=-129),f=(t.flags&32)!==0,t.flags&=-33,l===null){if(W){if(e?nu(t):fu(),(l=sl)?(l=Vy(l,dt),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:It!==null?{id:_t,overflow:Ot}:null,retryLane:536870912,hydrationErrors:null},u=o0(l),u.return=t,t.child=u,Dl=t,sl=null)):l=null,l===null)throw lu(t);return Wc(l)?t.lanes=32:t.lanes=536870912,null}var c=a.children;return a=a.fallback,e?(fu(),e=t.mode,c=yn({mode:"hidden",children:c},e),a=Uu(a,e,u,null),c.return=t,a.return=t,c.sibling=a,t.child=c,a=t.child,a.memoizedState=vc(u),a.childLanes=mc(l,f,u),t.memoizedState=yc,le(null,a)):(nu(t),dc(t,c))}var i=l.memoizedState;if(i!==null&&(c=i.dehydrated,c!==null)){if(n)t.flags&256?(nu(t),t.flags&=-257,t=oc(l,t,u)):t.memoizedState!==null?(fu(),t.child=l.child,t.flags|=128,t=null):(fu(),c=a.fallback,e=t.mode,a=yn({mode:"visible",children:a.children},e),c=Uu(c,e,u,null),c.flags|=2,a.return=t,c.return=t,a.sibling=c,t.child=a,Bu(t,l.child,null,u),a=t.child,a.memoizedState=vc(u),a.childLanes=mc(l,f,u),t.memoizedState=yc,t=le(null,a));else if(nu(t),Wc(c)){if(f=c.nextSibling&&c.nextSibling.dataset,f)var d=f.dgst;f=d,a=Error(o(419)),a.stack="",a.digest=f,xa({value:a,source:null,stack:null}),t=oc(l,t,u)}else if(zl||ea(l,t,u,!1),f=(u&l.childLanes)!==0,zl||f){if(f=il,f!==null&&(a=Ei(f,u),a!==0&&a!==i.retryLane))throw i.retryLane=a,Du(l,a),wl(f,l,a),ic;wc(c)||rn(),t=oc(l,t,u)}else wc(c)?(t.flags|=192,t.child=l.child,t=null):(l=i.treeContext,sl=ht(c.nextSibling),Dl=t,W=!0,Pt=null,dt=!1,l!==null&&S0(t,l),t=dc(t,a.children),t.flags|=4096);return t}return e?(fu(),c=a.fallback,e=t.mode,i=l.child,d=i.sibling,a=qt(i,{mode:"hidden",children:a.children}),a.subtreeFlags=i.subtreeFlags&65011712,d!==null?c=qt(d,c):(c=Uu(c,e,u,null),c.flags|=2),c.return=t,a.return=t,a.sibling=c,t.child=a,le(null,a),a=t.child,c=l.child.memoizedState,c===null?c=vc(u):(e=c.cachePool,e!==null?(i=bl._currentValue,e=e.parent!==i?{parent:i,pool:i}:e):e=A0(),c={baseLanes:c.baseLanes|u,cachePool:e}),a.memoizedState=c,a.childLanes=mc(l,f,u),t.memoizedState=yc,le(l.child,a)):(nu(t),u=l.child,l=u.sibling,u=qt(u,{mode:"visible",children:a.children}),u.return=t,u.sibling=null,l!==null&&(f=t.deletions,f===null?(t.deletions=[l],t.flags|=16):f.push(l)),t.child=u,t.memoizedState=null,u)}function dc(l,t){return t=yn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function yn(l,t){return l=lt(22,l,null,t),l.lanes=0,l}function oc(l,t,u){return Bu(t,l.child,null,u),l=dc(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Ys(l,t,u){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),pf(l.return,t,u)}function hc(l,t,u,a,e,n){var f=l.memoizedState;f===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:u,tailMode:e,treeForkCount:n}:(f.isBackwards=t,f.rendering=null,f.renderingStartTime=0,f.last=a,f.tail=u,f.tailMode=e,f.treeForkCount=n)}function js(l,t,u){var a=t.pendingProps,e=a.revealOrder,n=a.tail;a=a.children;var f=gl.current,c=(f&2)!==0;if(c?(f=f&1|2,t.flags|=128):f&=1,O(gl,f),pl(l,t,a,u),a=W?Za:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Ys(l,u,t);else if(l.tag===19)Ys(l,u,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(u=t.child,e=null;u!==null;)l=u.alternate,l!==null&&ke(l)===null&&(e=u),u=u.sibling;u=e,u===null?(e=t.child,t.child=null):(e=u.sibling,u.sibling=null),hc(t,!1,e,u,n,a);break;case"backwards":case"unstable_legacy-backwards":for(u=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&ke(l)===null){t.child=e;break}l=e.sibling,e.sibling=u,u=e,e=l}hc(t,!0,u,null,n,a);break;case"together":hc(t,!1,null,null,void 0,a);break;default:t.memoizedState=null}return t.child}function Xt(l,t,u){if(l!==null&&(t.dependencies=l.dependencies),su|=t.lanes,(u&t.childLanes)===0)if(l!==null){if(ea(l,t,u,!1),(u&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(o(153));if(t.child!==null){for(l=t.child,u=qt(l,l.pendingProps),t.child=u,u.return=t;l.sibling!==null;)l=l.sibling,u=u.sibling=qt(l,l.pendingProps),u.return=t;u.sibling=null}return t.child}function gc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&Ve(l)))}function Fm(l,t,u){switch(t.tag){case 3:Bl(t,t.stateNode.containerInfo),tu(t,bl,l.memoizedState.cache),pu();break;case 27:case 5:Ma(t);break;case 4:Bl(t,t.stateNode.containerInfo);break;case 10:tu(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Zf(t),null;break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(nu(t),t.flags|=128,null):(u&t.child.childLanes)!==0?Bs(l,t,u):(nu(t),l=Xt(l,t,u),l!==null?l.sibling:null);nu(t);break;case 19:var e=(l.flags&128)!==0;if(a=(u&t.childLanes)!==0,a||(ea(l,t,u,!1),a=(u&t.childLanes)!==0),e){if(a)return js(l,t,u);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),O(gl,gl.current),a)break;return null;case 22:return t.lanes=0,ps(l,t,u,t.pendingProps);case 24:tu(t,bl,l.memoizedState.cache)}return Xt(l,t,u)}function Gs(l,t,u){if(l!==null)if(l.memoizedProps!==t.pendingProps)zl=!0;else{if(!gc(l,u)&&(t.flags&128)===0)return zl=!1,Fm(l,t,u);zl=(l.flags&131072)!==0}else zl=!1,W&&(t.flags&1048576)!==0&&g0(t,Za,t.index);switch(t.lanes=0,t.tag){case 16:l:{var a=t.pendingProps;if(l=qu(t.elementType),t.type=l,typeof l=="function")Ef(l)?(a=ju(l,a),t.tag=1,t=qs(null,t,l,a,u)):(t.tag=0,t=sc(null,t,l,a,u));else{if(l!=null){var e=l.$$typeof;if(e===ft){t.tag=11,t=Ms(null,t,l,a,u);break l}else if(e===w){t.tag=14,t=Ds(null,t,l,a,u);break l}}throw t=pt(l)||l,Error(o(306,t,""))}}return t;case 0:return sc(l,t,t.type,t.pendingProps,u);case 1:return a=t.type,e=ju(a,t.pendingProps),qs(l,t,a,e,u);case 3:l:{if(Bl(t,t.stateNode.containerInfo),l===null)throw Error(o(387));a=t.pendingProps;var n=t.memoizedState;e=n.element,Yf(l,t),$a(t,a,null,u);var f=t.memoizedState;if(a=f.cache,tu(t,bl,a),a!==n.cache&&Hf(t,[bl],u,!0),Wa(),a=f.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:f.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Cs(l,t,a,u);break l}else if(a!==e){e=yt(Error(o(424)),t),xa(e),t=Cs(l,t,a,u);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(sl=ht(l.firstChild),Dl=t,W=!0,Pt=null,dt=!0,u=p0(t,null,a,u),t.child=u;u;)u.flags=u.flags&-3|4096,u=u.sibling}else{if(pu(),a===e){t=Xt(l,t,u);break l}pl(l,t,a,u)}t=t.child}return t;case 26:return sn(l,t),l===null?(u=$y(t.type,null,t.pendingProps,null))?t.memoizedState=u:W||(u=t.type,l=t.pendingProps,a=Mn(x.current).createElement(u),a[Ml]=t,a[Zl]=l,Hl(a,u,l),_l(a),t.stateNode=a):t.memoizedState=$y(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return Ma(t),l===null&&W&&(a=t.stateNode=Jy(t.type,t.pendingProps,x.current),Dl=t,dt=!0,e=sl,ou(t.type)?($c=e,sl=ht(a.firstChild)):sl=e),pl(l,t,t.pendingProps.children,u),sn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&W&&((e=a=sl)&&(a=Md(a,t.type,t.pendingProps,dt),a!==null?(t.stateNode=a,Dl=t,sl=ht(a.firstChild),dt=!1,e=!0):e=!1),e||lu(t)),Ma(t),e=t.type,n=t.pendingProps,f=l!==null?l.memoizedProps:null,a=n.children,Lc(e,n)?a=null:f!==null&&Lc(e,f)&&(t.flags|=32),t.memoizedState!==null&&(e=Vf(l,t,Zm,null,null,u),he._currentValue=e),sn(l,t),pl(l,t,a,u),t.child;case 6:return l===null&&W&&((l=u=sl)&&(u=Dd(u,t.pendingProps,dt),u!==null?(t.stateNode=u,Dl=t,sl=null,l=!0):l=!1),l||lu(t)),null;case 13:return Bs(l,t,u);case 4:return Bl(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=Bu(t,null,a,u):pl(l,t,a,u),t.child;case 11:return Ms(l,t,t.type,t.pendingProps,u);case 7:return pl(l,t,t.pendingProps,u),t.child;case 8:return pl(l,t,t.pendingProps.children,u),t.child;case 12:return pl(l,t,t.pendingProps.children,u),t.child;case 10:return a=t.pendingProps,tu(t,t.type,a.value),pl(l,t,a.children,u),t.child;case 9:return e=t.type._context,a=t.pendingProps.children,Nu(t),e=Ul(e),a=a(e),t.flags|=1,pl(l,t,a,u),t.child;case 14:return Ds(l,t,t.type,t.pendingProps,u);case 15:return Us(l,t,t.type,t.pendingProps,u);case 19:return js(l,t,u);case 31:return $m(l,t,u);case 22:return ps(l,t,u,t.pendingProps);case 24:return Nu(t),a=Ul(bl),l===null?(e=qf(),e===null&&(e=il,n=Nf(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=u),e=n),t.memoizedState={parent:a,cache:e},Bf(t),tu(t,bl,e)):((l.lanes&u)!==0&&(Yf(l,t),$a(t,null,null,u),Wa()),e=l.memoizedState,n=t.memoizedState,e.parent!==a?(e={parent:a,cache:a},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),tu(t,bl,a)):(a=n.cache,tu(t,bl,a),a!==e.cache&&Hf(t,[bl],u,!0))),pl(l,t,t.pendingProps.children,u),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}function Qt(l){l.flags|=4}function Sc(l,t,u,a,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(vy())l.flags|=8192;else throw Cu=we,Cf}else l.flags&=-16777217}function Xs(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!lv(t))if(vy())l.flags|=8192;else throw Cu=we,Cf}function vn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?bi():536870912,l.lanes|=t,ga|=t)}function te(l,t){if(!W)switch(l.tailMode){case"hidden":t=l.tail;for(var u=null;t!==null;)t.alternate!==null&&(u=t),t=t.sibling;u===null?l.tail=null:u.sibling=null;break;case"collapsed":u=l.tail;for(var a=null;u!==null;)u.alternate!==null&&(a=u),u=u.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function yl(l){var t=l.alternate!==null&&l.alternate.child===l.child,u=0,a=0;if(t)for(var e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags&65011712,a|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags,a|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=a,l.childLanes=u,t}function km(l,t,u){var a=t.pendingProps;switch(Of(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return yl(t),null;case 1:return yl(t),null;case 3:return u=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Yt(bl),hl(),u.pendingContext&&(u.context=u.pendingContext,u.pendingContext=null),(l===null||l.child===null)&&(aa(t)?Qt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Df())),yl(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(Qt(t),n!==null?(yl(t),Xs(t,n)):(yl(t),Sc(t,e,null,a,u))):n?n!==l.memoizedState?(Qt(t),yl(t),Xs(t,n)):(yl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==a&&Qt(t),yl(t),Sc(t,e,l,a,u)),null;case 27:if(Ee(t),u=x.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(!a){if(t.stateNode===null)throw Error(o(166));return yl(t),null}l=U.current,aa(t)?b0(t):(l=Jy(e,a,u),t.stateNode=l,Qt(t))}return yl(t),null;case 5:if(Ee(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(!a){if(t.stateNode===null)throw Error(o(166));return yl(t),null}if(n=U.current,aa(t))b0(t);else{var f=Mn(x.current);switch(n){case 1:n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=f.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?f.createElement("select",{is:a.is}):f.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?f.createElement(e,{is:a.is}):f.createElement(e)}}n[Ml]=t,n[Zl]=a;l:for(f=t.child;f!==null;){if(f.tag===5||f.tag===6)n.appendChild(f.stateNode);else if(f.tag!==4&&f.tag!==27&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===t)break l;for(;f.sibling===null;){if(f.return===null||f.return===t)break l;f=f.return}f.sibling.return=f.return,f=f.sibling}t.stateNode=n;l:switch(Hl(n,e,a),e){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break l;case"img":a=!0;break l;default:a=!1}a&&Qt(t)}}return yl(t),Sc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,u),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(o(166));if(l=x.current,aa(t)){if(l=t.stateNode,u=t.memoizedProps,a=null,e=Dl,e!==null)switch(e.tag){case 27:case 5:a=e.memoizedProps}l[Ml]=t,l=!!(l.nodeValue===u||a!==null&&a.suppressHydrationWarning===!0||By(l.nodeValue,u)),l||lu(t,!0)}else l=Mn(l).createTextNode(a),l[Ml]=t,t.stateNode=l}return yl(t),null;case 31:if(u=t.memoizedState,l===null||l.memoizedState!==null){if(a=aa(t),u!==null){if(l===null){if(!a)throw Error(o(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(o(557));l[Ml]=t}else pu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;yl(t),l=!1}else u=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),l=!0;if(!l)return t.flags&256?(ut(t),t):(ut(t),null);if((t.flags&128)!==0)throw Error(o(558))}return yl(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=aa(t),a!==null&&a.dehydrated!==null){if(l===null){if(!e)throw Error(o(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(o(317));e[Ml]=t}else pu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;yl(t),e=!1}else e=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(ut(t),t):(ut(t),null)}return ut(t),(t.flags&128)!==0?(t.lanes=u,t):(u=a!==null,l=l!==null&&l.memoizedState!==null,u&&(a=t.child,e=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(e=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==e&&(a.flags|=2048)),u!==l&&u&&(t.child.flags|=8192),vn(t,t.updateQueue),yl(t),null);case 4:return hl(),l===null&&Xc(t.stateNode.containerInfo),yl(t),null;case 10:return Yt(t.type),yl(t),null;case 19:if(E(gl),a=t.memoizedState,a===null)return yl(t),null;if(e=(t.flags&128)!==0,n=a.rendering,n===null)if(e)te(a,!1);else{if(ol!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=ke(l),n!==null){for(t.flags|=128,te(a,!1),l=n.updateQueue,t.updateQueue=l,vn(t,l),t.subtreeFlags=0,l=u,u=t.child;u!==null;)d0(u,l),u=u.sibling;return O(gl,gl.current&1|2),W&&Ct(t,a.treeForkCount),t.child}l=l.sibling}a.tail!==null&&Fl()>gn&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304)}else{if(!e)if(l=ke(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,vn(t,l),te(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!W)return yl(t),null}else 2*Fl()-a.renderingStartTime>gn&&u!==536870912&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304);a.isBackwards?(n.sibling=t.child,t.child=n):(l=a.last,l!==null?l.sibling=n:t.child=n,a.last=n)}return a.tail!==null?(l=a.tail,a.rendering=l,a.tail=l.sibling,a.renderingStartTime=Fl(),l.sibling=null,u=gl.current,O(gl,e?u&1|2:u&1),W&&Ct(t,a.treeForkCount),l):(yl(t),null);case 22:case 23:return ut(t),Qf(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(u&536870912)!==0&&(t.flags&128)===0&&(yl(t),t.subtreeFlags&6&&(t.flags|=8192)):yl(t),u=t.updateQueue,u!==null&&vn(t,u.retryQueue),u=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==u&&(t.flags|=2048),l!==null&&E(Ru),null;case 24:return u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Yt(bl),yl(t),null;case 25:return null;case 30:return null}throw Error(o(156,t.tag))}function Im(l,t){switch(Of(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Yt(bl),hl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return Ee(t),null;case 31:if(t.memoizedState!==null){if(ut(t),t.alternate===null)throw Error(o(340));pu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(ut(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(o(340));pu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return E(gl),null;case 4:return hl(),null;case 10:return Yt(t.type),null;case 22:case 23:return ut(t),Qf(),l!==null&&E(Ru),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Yt(bl),null;case 25:return null;default:return null}}function Qs(l,t){switch(Of(t),t.tag){case 3:Yt(bl),hl();break;case 26:case 27:case 5:Ee(t);break;case 4:hl();break;case 31:t.memoizedState!==null&&ut(t);break;case 13:ut(t);break;case 19:E(gl);break;case 10:Yt(t.type);break;case 22:case 23:ut(t),Qf(),l!==null&&E(Ru);break;case 24:Yt(bl)}}function ue(l,t){try{var u=t.updateQueue,a=u!==null?u.lastEffect:null;if(a!==null){var e=a.next;u=e;do{if((u.tag&l)===l){a=void 0;var n=u.create,f=u.inst;a=n(),f.destroy=a}u=u.next}while(u!==e)}}catch(c){tl(t,t.return,c)}}function cu(l,t,u){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var n=e.next;a=n;do{if((a.tag&l)===l){var f=a.inst,c=f.destroy;if(c!==void 0){f.destroy=void 0,e=t;var i=u,d=c;try{d()}catch(S){tl(e,i,S)}}}a=a.next}while(a!==n)}}catch(S){tl(t,t.return,S)}}function Zs(l){var t=l.updateQueue;if(t!==null){var u=l.stateNode;try{N0(t,u)}catch(a){tl(l,l.return,a)}}}function xs(l,t,u){u.props=ju(l.type,l.memoizedProps),u.state=l.memoizedState;try{u.componentWillUnmount()}catch(a){tl(l,t,a)}}function ae(l,t){try{var u=l.ref;if(u!==null){switch(l.tag){case 26:case 27:case 5:var a=l.stateNode;break;case 30:a=l.stateNode;break;default:a=l.stateNode}typeof u=="function"?l.refCleanup=u(a):u.current=a}}catch(e){tl(l,t,e)}}function Mt(l,t){var u=l.ref,a=l.refCleanup;if(u!==null)if(typeof a=="function")try{a()}catch(e){tl(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof u=="function")try{u(null)}catch(e){tl(l,t,e)}else u.current=null}function Vs(l){var t=l.type,u=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":u.autoFocus&&a.focus();break l;case"img":u.src?a.src=u.src:u.srcSet&&(a.srcset=u.srcSet)}}catch(e){tl(l,l.return,e)}}function bc(l,t,u){try{var a=l.stateNode;zd(a,l.type,u,t),a[Zl]=t}catch(e){tl(l,l.return,e)}}function Ls(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&ou(l.type)||l.tag===4}function rc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Ls(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&ou(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function zc(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?(u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u).insertBefore(l,t):(t=u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u,t.appendChild(l),u=u._reactRootContainer,u!=null||t.onclick!==null||(t.onclick=Nt));else if(a!==4&&(a===27&&ou(l.type)&&(u=l.stateNode,t=null),l=l.child,l!==null))for(zc(l,t,u),l=l.sibling;l!==null;)zc(l,t,u),l=l.sibling}function mn(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?u.insertBefore(l,t):u.appendChild(l);else if(a!==4&&(a===27&&ou(l.type)&&(u=l.stateNode),l=l.child,l!==null))for(mn(l,t,u),l=l.sibling;l!==null;)mn(l,t,u),l=l.sibling}function Ks(l){var t=l.stateNode,u=l.memoizedProps;try{for(var a=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);Hl(t,a,u),t[Ml]=l,t[Zl]=u}catch(n){tl(l,l.return,n)}}var Zt=!1,El=!1,Ec=!1,Js=typeof WeakSet=="function"?WeakSet:Set,Ol=null;function Pm(l,t){if(l=l.containerInfo,xc=qn,l=e0(l),of(l)){if("selectionStart"in l)var u={start:l.selectionStart,end:l.selectionEnd};else l:{u=(u=l.ownerDocument)&&u.defaultView||window;var a=u.getSelection&&u.getSelection();if(a&&a.rangeCount!==0){u=a.anchorNode;var e=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{u.nodeType,n.nodeType}catch{u=null;break l}var f=0,c=-1,i=-1,d=0,S=0,z=l,h=null;t:for(;;){for(var g;z!==u||e!==0&&z.nodeType!==3||(c=f+e),z!==n||a!==0&&z.nodeType!==3||(i=f+a),z.nodeType===3&&(f+=z.nodeValue.length),(g=z.firstChild)!==null;)h=z,z=g;for(;;){if(z===l)break t;if(h===u&&++d===e&&(c=f),h===n&&++S===a&&(i=f),(g=z.nextSibling)!==null)break;z=h,h=z.parentNode}z=g}u=c===-1||i===-1?null:{start:c,end:i}}else u=null}u=u||{start:0,end:0}}else u=null;for(Vc={focusedElem:l,selectionRange:u},qn=!1,Ol=t;Ol!==null;)if(t=Ol,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Ol=l;else for(;Ol!==null;){switch(t=Ol,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(u=0;u<l.length;u++)e=l[u],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,u=t,e=n.memoizedProps,n=n.memoizedState,a=u.stateNode;try{var D=ju(u.type,e);l=a.getSnapshotBeforeUpdate(D,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(R){tl(u,u.return,R)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,u=l.nodeType,u===9)Jc(l);else if(u===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":Jc(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(o(163))}if(l=t.sibling,l!==null){l.return=t.return,Ol=l;break}Ol=t.return}}function ws(l,t,u){var a=u.flags;switch(u.tag){case 0:case 11:case 15:Vt(l,u),a&4&&ue(5,u);break;case 1:if(Vt(l,u),a&4)if(l=u.stateNode,t===null)try{l.componentDidMount()}catch(f){tl(u,u.return,f)}else{var e=ju(u.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(f){tl(u,u.return,f)}}a&64&&Zs(u),a&512&&ae(u,u.return);break;case 3:if(Vt(l,u),a&64&&(l=u.updateQueue,l!==null)){if(t=null,u.child!==null)switch(u.child.tag){case 27:case 5:t=u.child.stateNode;break;case 1:t=u.child.stateNode}try{N0(l,t)}catch(f){tl(u,u.return,f)}}break;case 27:t===null&&a&4&&Ks(u);case 26:case 5:Vt(l,u),t===null&&a&4&&Vs(u),a&512&&ae(u,u.return);break;case 12:Vt(l,u);break;case 31:Vt(l,u),a&4&&Fs(l,u);break;case 13:Vt(l,u),a&4&&ks(l,u),a&64&&(l=u.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(u=id.bind(null,u),Ud(l,u))));break;case 22:if(a=u.memoizedState!==null||Zt,!a){t=t!==null&&t.memoizedState!==null||El,e=Zt;var n=El;Zt=a,(El=t)&&!n?Lt(l,u,(u.subtreeFlags&8772)!==0):Vt(l,u),Zt=e,El=n}break;case 30:break;default:Vt(l,u)}}function Ws(l){var t=l.alternate;t!==null&&(l.alternate=null,Ws(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&Fn(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var ml=null,Vl=!1;function xt(l,t,u){for(u=u.child;u!==null;)$s(l,t,u),u=u.sibling}function $s(l,t,u){if(kl&&typeof kl.onCommitFiberUnmount=="function")try{kl.onCommitFiberUnmount(Da,u)}catch{}switch(u.tag){case 26:El||Mt(u,t),xt(l,t,u),u.memoizedState?u.memoizedState.count--:u.stateNode&&(u=u.stateNode,u.parentNode.removeChild(u));break;case 27:El||Mt(u,t);var a=ml,e=Vl;ou(u.type)&&(ml=u.stateNode,Vl=!1),xt(l,t,u),me(u.stateNode),ml=a,Vl=e;break;case 5:El||Mt(u,t);case 6:if(a=ml,e=Vl,ml=null,xt(l,t,u),ml=a,Vl=e,ml!==null)if(Vl)try{(ml.nodeType===9?ml.body:ml.nodeName==="HTML"?ml.ownerDocument.body:ml).removeChild(u.stateNode)}catch(n){tl(u,t,n)}else try{ml.removeChild(u.stateNode)}catch(n){tl(u,t,n)}break;case 18:ml!==null&&(Vl?(l=ml,Zy(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,u.stateNode),_a(l)):Zy(ml,u.stateNode));break;case 4:a=ml,e=Vl,ml=u.stateNode.containerInfo,Vl=!0,xt(l,t,u),ml=a,Vl=e;break;case 0:case 11:case 14:case 15:cu(2,u,t),El||cu(4,u,t),xt(l,t,u);break;case 1:El||(Mt(u,t),a=u.stateNode,typeof a.componentWillUnmount=="function"&&xs(u,t,a)),xt(l,t,u);break;case 21:xt(l,t,u);break;case 22:El=(a=El)||u.memoizedState!==null,xt(l,t,u),El=a;break;default:xt(l,t,u)}}function Fs(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{_a(l)}catch(u){tl(t,t.return,u)}}}function ks(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{_a(l)}catch(u){tl(t,t.return,u)}}function ld(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new Js),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new Js),t;default:throw Error(o(435,l.tag))}}function dn(l,t){var u=ld(l);t.forEach(function(a){if(!u.has(a)){u.add(a);var e=sd.bind(null,l,a);a.then(e,e)}})}function Ll(l,t){var u=t.deletions;if(u!==null)for(var a=0;a<u.length;a++){var e=u[a],n=l,f=t,c=f;l:for(;c!==null;){switch(c.tag){case 27:if(ou(c.type)){ml=c.stateNode,Vl=!1;break l}break;case 5:ml=c.stateNode,Vl=!1;break l;case 3:case 4:ml=c.stateNode.containerInfo,Vl=!0;break l}c=c.return}if(ml===null)throw Error(o(160));$s(n,f,e),ml=null,Vl=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)Is(t,l),t=t.sibling}var rt=null;function Is(l,t){var u=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:Ll(t,l),Kl(l),a&4&&(cu(3,l,l.return),ue(3,l),cu(5,l,l.return));break;case 1:Ll(t,l),Kl(l),a&512&&(El||u===null||Mt(u,u.return)),a&64&&Zt&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(u=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=u===null?a:u.concat(a))));break;case 26:var e=rt;if(Ll(t,l),Kl(l),a&512&&(El||u===null||Mt(u,u.return)),a&4){var n=u!==null?u.memoizedState:null;if(a=l.memoizedState,u===null)if(a===null)if(l.stateNode===null){l:{a=l.type,u=l.memoizedProps,e=e.ownerDocument||e;t:switch(a){case"title":n=e.getElementsByTagName("title")[0],(!n||n[Ha]||n[Ml]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(a),e.head.insertBefore(n,e.querySelector("head > title"))),Hl(n,a,u),n[Ml]=l,_l(n),a=n;break l;case"link":var f=Iy("link","href",e).get(a+(u.href||""));if(f){for(var c=0;c<f.length;c++)if(n=f[c],n.getAttribute("href")===(u.href==null||u.href===""?null:u.href)&&n.getAttribute("rel")===(u.rel==null?null:u.rel)&&n.getAttribute("title")===(u.title==null?null:u.title)&&n.getAttribute("crossorigin")===(u.crossOrigin==null?null:u.crossOrigin)){f.splice(c,1);break t}}n=e.createElement(a),Hl(n,a,u),e.head.appendChild(n);break;case"meta":if(f=Iy("meta","content",e).get(a+(u.content||""))){for(c=0;c<f.length;c++)if(n=f[c],n.getAttribute("content")===(u.content==null?null:""+u.content)&&n.getAttribute("name")===(u.name==null?null:u.name)&&n.getAttribute("property")===(u.property==null?null:u.property)&&n.getAttribute("http-equiv")===(u.httpEquiv==null?null:u.httpEquiv)&&n.getAttribute("charset")===(u.charSet==null?null:u.charSet)){f.splice(c,1);break t}}n=e.createElement(a),Hl(n,a,u),e.head.appendChild(n);break;default:throw Error(o(468,a))}n[Ml]=l,_l(n),a=n}l.stateNode=a}else Py(e,l.type,l.stateNode);else l.stateNode=ky(e,a,l.memoizedProps);else n!==a?(n===null?u.stateNode!==null&&(u=u.stateNode,u.parentNode.removeChild(u)):n.count--,a===null?Py(e,l.type,l.stateNode):ky(e,a,l.memoizedProps)):a===null&&l.stateNode!==null&&bc(l,l.memoizedProps,u.memoizedProps)}break;case 27:Ll(t,l),Kl(l),a&512&&(El||u===null||Mt(u,u.return)),u!==null&&a&4&&bc(l,l.memoizedProps,u.memoizedProps);break;case 5:if(Ll(t,l),Kl(l),a&512&&(El||u===null||Mt(u,u.return)),l.flags&32){e=l.stateNode;try{wu(e,"")}catch(D){tl(l,l.return,D)}}a&4&&l.stateNode!=null&&(e=l.memoizedProps,bc(l,e,u!==null?u.memoizedProps:e)),a&1024&&(Ec=!0);break;case 6:if(Ll(t,l),Kl(l),a&4){if(l.stateNode===null)throw Error(o(162));a=l.memoizedProps,u=l.stateNode;try{u.nodeValue=a}catch(D){tl(l,l.return,D)}}break;case 3:if(pn=null,e=rt,rt=Dn(t.containerInfo),Ll(t,l),rt=e,Kl(l),a&4&&u!==null&&u.memoizedState.isDehydrated)try{_a(t.containerInfo)}catch(D){tl(l,l.return,D)}Ec&&(Ec=!1,Ps(l));break;case 4:a=rt,rt=Dn(l.stateNode.containerInfo),Ll(t,l),Kl(l),rt=a;break;case 12:Ll(t,l),Kl(l);break;case 31:Ll(t,l),Kl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,dn(l,a)));break;case 13:Ll(t,l),Kl(l),l.child.flags&8192&&l.memoizedState!==null!=(u!==null&&u.memoizedState!==null)&&(hn=Fl()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,dn(l,a)));break;case 22:e=l.memoizedState!==null;var i=u!==null&&u.memoizedState!==null,d=Zt,S=El;if(Zt=d||e,El=S||i,Ll(t,l),El=S,Zt=d,Kl(l),a&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(u===null||i||Zt||El||Gu(l)),u=null,t=l;;){if(t.tag===5||t.tag===26){if(u===null){i=u=t;try{if(n=i.stateNode,e)f=n.style,typeof f.setProperty=="function"?f.setProperty("display","none","important"):f.display="none";else{c=i.stateNode;var z=i.memoizedProps.style,h=z!=null&&z.hasOwnProperty("display")?z.display:null;c.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(D){tl(i,i.return,D)}}}else if(t.tag===6){if(u===null){i=t;try{i.stateNode.nodeValue=e?"":i.memoizedProps}catch(D){tl(i,i.return,D)}}}else if(t.tag===18){if(u===null){i=t;try{var g=i.stateNode;e?xy(g,!0):xy(i.stateNode,!1)}catch(D){tl(i,i.return,D)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;u===t&&(u=null),t=t.return}u===t&&(u=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(u=a.retryQueue,u!==null&&(a.retryQueue=null,dn(l,u))));break;case 19:Ll(t,l),Kl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,dn(l,a)));break;case 30:break;case 21:break;default:Ll(t,l),Kl(l)}}function Kl(l){var t=l.flags;if(t&2){try{for(var u,a=l.return;a!==null;){if(Ls(a)){u=a;break}a=a.return}if(u==null)throw Error(o(160));switch(u.tag){case 27:var e=u.stateNode,n=rc(l);mn(l,n,e);break;case 5:var f=u.stateNode;u.flags&32&&(wu(f,""),u.flags&=-33);var c=rc(l);mn(l,c,f);break;case 3:case 4:var i=u.stateNode.containerInfo,d=rc(l);zc(l,d,i);break;default:throw Error(o(161))}}catch(S){tl(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function Ps(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;Ps(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function Vt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)ws(l,t.alternate,t),t=t.sibling}function Gu(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:cu(4,t,t.return),Gu(t);break;case 1:Mt(t,t.return);var u=t.stateNode;typeof u.componentWillUnmount=="function"&&xs(t,t.return,u),Gu(t);break;case 27:me(t.stateNode);case 26:case 5:Mt(t,t.return),Gu(t);break;case 22:t.memoizedState===null&&Gu(t);break;case 30:Gu(t);break;default:Gu(t)}l=l.sibling}}function Lt(l,t,u){for(u=u&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,e=l,n=t,f=n.flags;switch(n.tag){case 0:case 11:case 15:Lt(e,n,u),ue(4,n);break;case 1:if(Lt(e,n,u),a=n,e=a.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(d){tl(a,a.return,d)}if(a=n,e=a.updateQueue,e!==null){var c=a.stateNode;try{var i=e.shared.hiddenCallbacks;if(i!==null)for(e.shared.hiddenCallbacks=null,e=0;e<i.length;e++)H0(i[e],c)}catch(d){tl(a,a.return,d)}}u&&f&64&&Zs(n),ae(n,n.return);break;case 27:Ks(n);case 26:case 5:Lt(e,n,u),u&&a===null&&f&4&&Vs(n),ae(n,n.return);break;case 12:Lt(e,n,u);break;case 31:Lt(e,n,u),u&&f&4&&Fs(e,n);break;case 13:Lt(e,n,u),u&&f&4&&ks(e,n);break;case 22:n.memoizedState===null&&Lt(e,n,u),ae(n,n.return);break;case 30:break;default:Lt(e,n,u)}t=t.sibling}}function Tc(l,t){var u=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==u&&(l!=null&&l.refCount++,u!=null&&Va(u))}function Ac(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l))}function zt(l,t,u,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)ly(l,t,u,a),t=t.sibling}function ly(l,t,u,a){var e=t.flags;switch(t.tag){case 0:case 11:case 15:zt(l,t,u,a),e&2048&&ue(9,t);break;case 1:zt(l,t,u,a);break;case 3:zt(l,t,u,a),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l)));break;case 12:if(e&2048){zt(l,t,u,a),l=t.stateNode;try{var n=t.memoizedProps,f=n.id,c=n.onPostCommit;typeof c=="function"&&c(f,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(i){tl(t,t.return,i)}}else zt(l,t,u,a);break;case 31:zt(l,t,u,a);break;case 13:zt(l,t,u,a);break;case 23:break;case 22:n=t.stateNode,f=t.alternate,t.memoizedState!==null?n._visibility&2?zt(l,t,u,a):ee(l,t):n._visibility&2?zt(l,t,u,a):(n._visibility|=2,da(l,t,u,a,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Tc(f,t);break;case 24:zt(l,t,u,a),e&2048&&Ac(t.alternate,t);break;default:zt(l,t,u,a)}}function da(l,t,u,a,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,f=t,c=u,i=a,d=f.flags;switch(f.tag){case 0:case 11:case 15:da(n,f,c,i,e),ue(8,f);break;case 23:break;case 22:var S=f.stateNode;f.memoizedState!==null?S._visibility&2?da(n,f,c,i,e):ee(n,f):(S._visibility|=2,da(n,f,c,i,e)),e&&d&2048&&Tc(f.alternate,f);break;case 24:da(n,f,c,i,e),e&&d&2048&&Ac(f.alternate,f);break;default:da(n,f,c,i,e)}t=t.sibling}}function ee(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var u=l,a=t,e=a.flags;switch(a.tag){case 22:ee(u,a),e&2048&&Tc(a.alternate,a);break;case 24:ee(u,a),e&2048&&Ac(a.alternate,a);break;default:ee(u,a)}t=t.sibling}}var ne=8192;function oa(l,t,u){if(l.subtreeFlags&ne)for(l=l.child;l!==null;)ty(l,t,u),l=l.sibling}function ty(l,t,u){switch(l.tag){case 26:oa(l,t,u),l.flags&ne&&l.memoizedState!==null&&Qd(u,rt,l.memoizedState,l.memoizedProps);break;case 5:oa(l,t,u);break;case 3:case 4:var a=rt;rt=Dn(l.stateNode.containerInfo),oa(l,t,u),rt=a;break;case 22:l.memoizedState===null&&(a=l.alternate,a!==null&&a.memoizedState!==null?(a=ne,ne=16777216,oa(l,t,u),ne=a):oa(l,t,u));break;default:oa(l,t,u)}}function uy(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function fe(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ol=a,ey(a,l)}uy(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)ay(l),l=l.sibling}function ay(l){switch(l.tag){case 0:case 11:case 15:fe(l),l.flags&2048&&cu(9,l,l.return);break;case 3:fe(l);break;case 12:fe(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,on(l)):fe(l);break;default:fe(l)}}function on(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ol=a,ey(a,l)}uy(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:cu(8,t,t.return),on(t);break;case 22:u=t.stateNode,u._visibility&2&&(u._visibility&=-3,on(t));break;default:on(t)}l=l.sibling}}function ey(l,t){for(;Ol!==null;){var u=Ol;switch(u.tag){case 0:case 11:case 15:cu(8,u,t);break;case 23:case 22:if(u.memoizedState!==null&&u.memoizedState.cachePool!==null){var a=u.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:Va(u.memoizedState.cache)}if(a=u.child,a!==null)a.return=u,Ol=a;else l:for(u=l;Ol!==null;){a=Ol;var e=a.sibling,n=a.return;if(Ws(a),a===u){Ol=null;break l}if(e!==null){e.return=n,Ol=e;break l}Ol=n}}}var td={getCacheForType:function(l){var t=Ul(bl),u=t.data.get(l);return u===void 0&&(u=l(),t.data.set(l,u)),u},cacheSignal:function(){return Ul(bl).controller.signal}},ud=typeof WeakMap=="function"?WeakMap:Map,k=0,il=null,V=null,K=0,ll=0,at=null,iu=!1,ha=!1,_c=!1,Kt=0,ol=0,su=0,Xu=0,Oc=0,et=0,ga=0,ce=null,Jl=null,Mc=!1,hn=0,ny=0,gn=1/0,Sn=null,yu=null,Al=0,vu=null,Sa=null,Jt=0,Dc=0,Uc=null,fy=null,ie=0,pc=null;function nt(){return(k&2)!==0&&K!==0?K&-K:b.T!==null?Bc():Ti()}function cy(){if(et===0)if((K&536870912)===0||W){var l=_e;_e<<=1,(_e&3932160)===0&&(_e=262144),et=l}else et=536870912;return l=tt.current,l!==null&&(l.flags|=32),et}function wl(l,t,u){(l===il&&(ll===2||ll===9)||l.cancelPendingCommit!==null)&&(ba(l,0),mu(l,K,et,!1)),pa(l,u),((k&2)===0||l!==il)&&(l===il&&((k&2)===0&&(Xu|=u),ol===4&&mu(l,K,et,!1)),Dt(l))}function iy(l,t,u){if((k&6)!==0)throw Error(o(327));var a=!u&&(t&127)===0&&(t&l.expiredLanes)===0||Ua(l,t),e=a?nd(l,t):Nc(l,t,!0),n=a;do{if(e===0){ha&&!a&&mu(l,t,0,!1);break}else{if(u=l.current.alternate,n&&!ad(u)){e=Nc(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var f=0;else f=l.pendingLanes&-536870913,f=f!==0?f:f&536870912?536870912:0;if(f!==0){t=f;l:{var c=l;e=ce;var i=c.current.memoizedState.isDehydrated;if(i&&(ba(c,f).flags|=256),f=Nc(c,f,!1),f!==2){if(_c&&!i){c.errorRecoveryDisabledLanes|=n,Xu|=n,e=4;break l}n=Jl,Jl=e,n!==null&&(Jl===null?Jl=n:Jl.push.apply(Jl,n))}e=f}if(n=!1,e!==2)continue}}if(e===1){ba(l,0),mu(l,t,0,!0);break}l:{switch(a=l,n=e,n){case 0:case 1:throw Error(o(345));case 4:if((t&4194048)!==t)break;case 6:mu(a,t,et,!iu);break l;case 2:Jl=null;break;case 3:case 5:break;default:throw Error(o(329))}if((t&62914560)===t&&(e=hn+300-Fl(),10<e)){if(mu(a,t,et,!iu),Me(a,0,!0)!==0)break l;Jt=t,a.timeoutHandle=Xy(sy.bind(null,a,u,Jl,Sn,Mc,t,et,Xu,ga,iu,n,"Throttled",-0,0),e);break l}sy(a,u,Jl,Sn,Mc,t,et,Xu,ga,iu,n,null,-0,0)}}break}while(!0);Dt(l)}function sy(l,t,u,a,e,n,f,c,i,d,S,z,h,g){if(l.timeoutHandle=-1,z=t.subtreeFlags,z&8192||(z&16785408)===16785408){z={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Nt},ty(t,n,z);var D=(n&62914560)===n?hn-Fl():(n&4194048)===n?ny-Fl():0;if(D=Zd(z,D),D!==null){Jt=n,l.cancelPendingCommit=D(Sy.bind(null,l,t,n,u,a,e,f,c,i,S,z,null,h,g)),mu(l,n,f,!d);return}}Sy(l,t,n,u,a,e,f,c,i)}function ad(l){for(var t=l;;){var u=t.tag;if((u===0||u===11||u===15)&&t.flags&16384&&(u=t.updateQueue,u!==null&&(u=u.stores,u!==null)))for(var a=0;a<u.length;a++){var e=u[a],n=e.getSnapshot;e=e.value;try{if(!Pl(n(),e))return!1}catch{return!1}}if(u=t.child,t.subtreeFlags&16384&&u!==null)u.return=t,t=u;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function mu(l,t,u,a){t&=~Oc,t&=~Xu,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var e=t;0<e;){var n=31-Il(e),f=1<<n;a[n]=-1,e&=~f}u!==0&&ri(l,u,t)}function bn(){return(k&6)===0?(se(0),!1):!0}function Hc(){if(V!==null){if(ll===0)var l=V.return;else l=V,Bt=Hu=null,Jf(l),ia=null,Ka=0,l=V;for(;l!==null;)Qs(l.alternate,l),l=l.return;V=null}}function ba(l,t){var u=l.timeoutHandle;u!==-1&&(l.timeoutHandle=-1,Ad(u)),u=l.cancelPendingCommit,u!==null&&(l.cancelPendingCommit=null,u()),Jt=0,Hc(),il=l,V=u=qt(l.current,null),K=t,ll=0,at=null,iu=!1,ha=Ua(l,t),_c=!1,ga=et=Oc=Xu=su=ol=0,Jl=ce=null,Mc=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var e=31-Il(a),n=1<<e;t|=l[e],a&=~n}return Kt=t,Ge(),u}function yy(l,t){j=null,b.H=Pa,t===ca||t===Je?(t=M0(),ll=3):t===Cf?(t=M0(),ll=4):ll=t===ic?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,at=t,V===null&&(ol=1,fn(l,yt(t,l.current)))}function vy(){var l=tt.current;return l===null?!0:(K&4194048)===K?ot===null:(K&62914560)===K||(K&536870912)!==0?l===ot:!1}function my(){var l=b.H;return b.H=Pa,l===null?Pa:l}function dy(){var l=b.A;return b.A=td,l}function rn(){ol=4,iu||(K&4194048)!==K&&tt.current!==null||(ha=!0),(su&134217727)===0&&(Xu&134217727)===0||il===null||mu(il,K,et,!1)}function Nc(l,t,u){var a=k;k|=2;var e=my(),n=dy();(il!==l||K!==t)&&(Sn=null,ba(l,t)),t=!1;var f=ol;l:do try{if(ll!==0&&V!==null){var c=V,i=at;switch(ll){case 8:Hc(),f=6;break l;case 3:case 2:case 9:case 6:tt.current===null&&(t=!0);var d=ll;if(ll=0,at=null,ra(l,c,i,d),u&&ha){f=0;break l}break;default:d=ll,ll=0,at=null,ra(l,c,i,d)}}ed(),f=ol;break}catch(S){yy(l,S)}while(!0);return t&&l.shellSuspendCounter++,Bt=Hu=null,k=a,b.H=e,b.A=n,V===null&&(il=null,K=0,Ge()),f}function ed(){for(;V!==null;)oy(V)}function nd(l,t){var u=k;k|=2;var a=my(),e=dy();il!==l||K!==t?(Sn=null,gn=Fl()+500,ba(l,t)):ha=Ua(l,t);l:do try{if(ll!==0&&V!==null){t=V;var n=at;t:switch(ll){case 1:ll=0,at=null,ra(l,t,n,1);break;case 2:case 9:if(_0(n)){ll=0,at=null,hy(t);break}t=function(){ll!==2&&ll!==9||il!==l||(ll=7),Dt(l)},n.then(t,t);break l;case 3:ll=7;break l;case 4:ll=5;break l;case 7:_0(n)?(ll=0,at=null,hy(t)):(ll=0,at=null,ra(l,t,n,7));break;case 5:var f=null;switch(V.tag){case 26:f=V.memoizedState;case 5:case 27:var c=V;if(f?lv(f):c.stateNode.complete){ll=0,at=null;var i=c.sibling;if(i!==null)V=i;else{var d=c.return;d!==null?(V=d,zn(d)):V=null}break t}}ll=0,at=null,ra(l,t,n,5);break;case 6:ll=0,at=null,ra(l,t,n,6);break;case 8:Hc(),ol=6;break l;default:throw Error(o(462))}}fd();break}catch(S){yy(l,S)}while(!0);return Bt=Hu=null,b.H=a,b.A=e,k=u,V!==null?0:(il=null,K=0,Ge(),ol)}function fd(){for(;V!==null&&!pv();)oy(V)}function oy(l){var t=Gs(l.alternate,l,Kt);l.memoizedProps=l.pendingProps,t===null?zn(l):V=t}function hy(l){var t=l,u=t.alternate;switch(t.tag){case 15:case 0:t=Rs(u,t,t.pendingProps,t.type,void 0,K);break;case 11:t=Rs(u,t,t.pendingProps,t.type.render,t.ref,K);break;case 5:Jf(t);default:Qs(u,t),t=V=d0(t,Kt),t=Gs(u,t,Kt)}l.memoizedProps=l.pendingProps,t===null?zn(l):V=t}function ra(l,t,u,a){Bt=Hu=null,Jf(t),ia=null,Ka=0;var e=t.return;try{if(Wm(l,e,t,u,K)){ol=1,fn(l,yt(u,l.current)),V=null;return}}catch(n){if(e!==null)throw V=e,n;ol=1,fn(l,yt(u,l.current)),V=null;return}t.flags&32768?(W||a===1?l=!0:ha||(K&536870912)!==0?l=!1:(iu=l=!0,(a===2||a===9||a===3||a===6)&&(a=tt.current,a!==null&&a.tag===13&&(a.flags|=16384))),gy(t,l)):zn(t)}function zn(l){var t=l;do{if((t.flags&32768)!==0){gy(t,iu);return}l=t.return;var u=km(t.alternate,t,Kt);if(u!==null){V=u;return}if(t=t.sibling,t!==null){V=t;return}V=t=l}while(t!==null);ol===0&&(ol=5)}function gy(l,t){do{var u=Im(l.alternate,l);if(u!==null){u.flags&=32767,V=u;return}if(u=l.return,u!==null&&(u.flags|=32768,u.subtreeFlags=0,u.deletions=null),!t&&(l=l.sibling,l!==null)){V=l;return}V=l=u}while(l!==null);ol=6,V=null}function Sy(l,t,u,a,e,n,f,c,i){l.cancelPendingCommit=null;do En();while(Al!==0);if((k&6)!==0)throw Error(o(327));if(t!==null){if(t===l.current)throw Error(o(177));if(n=t.lanes|t.childLanes,n|=rf,Xv(l,u,n,f,c,i),l===il&&(V=il=null,K=0),Sa=t,vu=l,Jt=u,Dc=n,Uc=e,fy=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,yd(Te,function(){return Ty(),null})):(l.callbackNode=null,l.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=b.T,b.T=null,e=_.p,_.p=2,f=k,k|=4;try{Pm(l,t,u)}finally{k=f,_.p=e,b.T=a}}Al=1,by(),ry(),zy()}}function by(){if(Al===1){Al=0;var l=vu,t=Sa,u=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||u){u=b.T,b.T=null;var a=_.p;_.p=2;var e=k;k|=4;try{Is(t,l);var n=Vc,f=e0(l.containerInfo),c=n.focusedElem,i=n.selectionRange;if(f!==c&&c&&c.ownerDocument&&a0(c.ownerDocument.documentElement,c)){if(i!==null&&of(c)){var d=i.start,S=i.end;if(S===void 0&&(S=d),"selectionStart"in c)c.selectionStart=d,c.selectionEnd=Math.min(S,c.value.length);else{var z=c.ownerDocument||document,h=z&&z.defaultView||window;if(h.getSelection){var g=h.getSelection(),D=c.textContent.length,R=Math.min(i.start,D),nl=i.end===void 0?R:Math.min(i.end,D);!g.extend&&R>nl&&(f=nl,nl=R,R=f);var v=u0(c,R),s=u0(c,nl);if(v&&s&&(g.rangeCount!==1||g.anchorNode!==v.node||g.anchorOffset!==v.offset||g.focusNode!==s.node||g.focusOffset!==s.offset)){var m=z.createRange();m.setStart(v.node,v.offset),g.removeAllRanges(),R>nl?(g.addRange(m),g.extend(s.node,s.offset)):(m.setEnd(s.node,s.offset),g.addRange(m))}}}}for(z=[],g=c;g=g.parentNode;)g.nodeType===1&&z.push({element:g,left:g.scrollLeft,top:g.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<z.length;c++){var r=z[c];r.element.scrollLeft=r.left,r.element.scrollTop=r.top}}qn=!!xc,Vc=xc=null}finally{k=e,_.p=a,b.T=u}}l.current=t,Al=2}}function ry(){if(Al===2){Al=0;var l=vu,t=Sa,u=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||u){u=b.T,b.T=null;var a=_.p;_.p=2;var e=k;k|=4;try{ws(l,t.alternate,t)}finally{k=e,_.p=a,b.T=u}}Al=3}}function zy(){if(Al===4||Al===3){Al=0,Hv();var l=vu,t=Sa,u=Jt,a=fy;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Al=5:(Al=0,Sa=vu=null,Ey(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(yu=null),Wn(u),t=t.stateNode,kl&&typeof kl.onCommitFiberRoot=="function")try{kl.onCommitFiberRoot(Da,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=b.T,e=_.p,_.p=2,b.T=null;try{for(var n=l.onRecoverableError,f=0;f<a.length;f++){var c=a[f];n(c.value,{componentStack:c.stack})}}finally{b.T=t,_.p=e}}(Jt&3)!==0&&En(),Dt(l),e=l.pendingLanes,(u&261930)!==0&&(e&42)!==0?l===pc?ie++:(ie=0,pc=l):ie=0,se(0)}}function Ey(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Va(t)))}function En(){return by(),ry(),zy(),Ty()}function Ty(){if(Al!==5)return!1;var l=vu,t=Dc;Dc=0;var u=Wn(Jt),a=b.T,e=_.p;try{_.p=32>u?32:u,b.T=null,u=Uc,Uc=null;var n=vu,f=Jt;if(Al=0,Sa=vu=null,Jt=0,(k&6)!==0)throw Error(o(331));var c=k;if(k|=4,ay(n.current),ly(n,n.current,f,u),k=c,se(0,!1),kl&&typeof kl.onPostCommitFiberRoot=="function")try{kl.onPostCommitFiberRoot(Da,n)}catch{}return!0}finally{_.p=e,b.T=a,Ey(l,t)}}function Ay(l,t,u){t=yt(u,t),t=cc(l.stateNode,t,2),l=eu(l,t,2),l!==null&&(pa(l,2),Dt(l))}function tl(l,t,u){if(l.tag===3)Ay(l,l,u);else for(;t!==null;){if(t.tag===3){Ay(t,l,u);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(yu===null||!yu.has(a))){l=yt(u,l),u=_s(2),a=eu(t,u,2),a!==null&&(Os(u,a,t,l),pa(a,2),Dt(a));break}}t=t.return}}function Rc(l,t,u){var a=l.pingCache;if(a===null){a=l.pingCache=new ud;var e=new Set;a.set(t,e)}else e=a.get(t),e===void 0&&(e=new Set,a.set(t,e));e.has(u)||(_c=!0,e.add(u),l=cd.bind(null,l,t,u),t.then(l,l))}function cd(l,t,u){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&u,l.warmLanes&=~u,il===l&&(K&u)===u&&(ol===4||ol===3&&(K&62914560)===K&&300>Fl()-hn?(k&2)===0&&ba(l,0):Oc|=u,ga===K&&(ga=0)),Dt(l)}function _y(l,t){t===0&&(t=bi()),l=Du(l,t),l!==null&&(pa(l,t),Dt(l))}function id(l){var t=l.memoizedState,u=0;t!==null&&(u=t.retryLane),_y(l,u)}function sd(l,t){var u=0;switch(l.tag){case 31:case 13:var a=l.stateNode,e=l.memoizedState;e!==null&&(u=e.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(o(314))}a!==null&&a.delete(t),_y(l,u)}function yd(l,t){return Ln(l,t)}var Tn=null,za=null,qc=!1,An=!1,Cc=!1,du=0;function Dt(l){l!==za&&l.next===null&&(za===null?Tn=za=l:za=za.next=l),An=!0,qc||(qc=!0,md())}function se(l,t){if(!Cc&&An){Cc=!0;do for(var u=!1,a=Tn;a!==null;){if(l!==0){var e=a.pendingLanes;if(e===0)var n=0;else{var f=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-Il(42|l)+1)-1,n&=e&~(f&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(u=!0,Uy(a,n))}else n=K,n=Me(a,a===il?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||Ua(a,n)||(u=!0,Uy(a,n));a=a.next}while(u);Cc=!1}}function vd(){Oy()}function Oy(){An=qc=!1;var l=0;du!==0&&Td()&&(l=du);for(var t=Fl(),u=null,a=Tn;a!==null;){var e=a.next,n=My(a,t);n===0?(a.next=null,u===null?Tn=e:u.next=e,e===null&&(za=u)):(u=a,(l!==0||(n&3)!==0)&&(An=!0)),a=e}Al!==0&&Al!==5||se(l),du!==0&&(du=0)}function My(l,t){for(var u=l.suspendedLanes,a=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var f=31-Il(n),c=1<<f,i=e[f];i===-1?((c&u)===0||(c&a)!==0)&&(e[f]=Gv(c,t)):i<=t&&(l.expiredLanes|=c),n&=~c}if(t=il,u=K,u=Me(l,l===t?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a=l.callbackNode,u===0||l===t&&(ll===2||ll===9)||l.cancelPendingCommit!==null)return a!==null&&a!==null&&Kn(a),l.callbackNode=null,l.callbackPriority=0;if((u&3)===0||Ua(l,u)){if(t=u&-u,t===l.callbackPriority)return t;switch(a!==null&&Kn(a),Wn(u)){case 2:case 8:u=gi;break;case 32:u=Te;break;case 268435456:u=Si;break;default:u=Te}return a=Dy.bind(null,l),u=Ln(u,a),l.callbackPriority=t,l.callbackNode=u,t}return a!==null&&a!==null&&Kn(a),l.callbackPriority=2,l.callbackNode=null,2}function Dy(l,t){if(Al!==0&&Al!==5)return l.callbackNode=null,l.callbackPriority=0,null;var u=l.callbackNode;if(En()&&l.callbackNode!==u)return null;var a=K;return a=Me(l,l===il?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a===0?null:(iy(l,a,t),My(l,Fl()),l.callbackNode!=null&&l.callbackNode===u?Dy.bind(null,l):null)}function Uy(l,t){if(En())return null;iy(l,t,!0)}function md(){_d(function(){(k&6)!==0?Ln(hi,vd):Oy()})}function Bc(){if(du===0){var l=na;l===0&&(l=Ae,Ae<<=1,(Ae&261888)===0&&(Ae=256)),du=l}return du}function py(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:He(""+l)}function Hy(l,t){var u=t.ownerDocument.createElement("input");return u.name=t.name,u.value=t.value,l.id&&u.setAttribute("form",l.id),t.parentNode.insertBefore(u,t),l=new FormData(l),u.parentNode.removeChild(u),l}function dd(l,t,u,a,e){if(t==="submit"&&u&&u.stateNode===e){var n=py((e[Zl]||null).action),f=a.submitter;f&&(t=(t=f[Zl]||null)?py(t.formAction):f.getAttribute("formAction"),t!==null&&(n=t,f=null));var c=new Ce("action","action",null,a,e);l.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(du!==0){var i=f?Hy(e,f):new FormData(e);tc(u,{pending:!0,data:i,method:e.method,action:n},null,i)}}else typeof n=="function"&&(c.preventDefault(),i=f?Hy(e,f):new FormData(e),tc(u,{pending:!0,data:i,method:e.method,action:n},n,i))},currentTarget:e}]})}}for(var Yc=0;Yc<bf.length;Yc++){var jc=bf[Yc],od=jc.toLowerCase(),hd=jc[0].toUpperCase()+jc.slice(1);bt(od,"on"+hd)}bt(c0,"onAnimationEnd"),bt(i0,"onAnimationIteration"),bt(s0,"onAnimationStart"),bt("dblclick","onDoubleClick"),bt("focusin","onFocus"),bt("focusout","onBlur"),bt(Nm,"onTransitionRun"),bt(Rm,"onTransitionStart"),bt(qm,"onTransitionCancel"),bt(y0,"onTransitionEnd"),Ku("onMouseEnter",["mouseout","mouseover"]),Ku("onMouseLeave",["mouseout","mouseover"]),Ku("onPointerEnter",["pointerout","pointerover"]),Ku("onPointerLeave",["pointerout","pointerover"]),Au("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Au("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Au("onBeforeInput",["compositionend","keypress","textInput","paste"]),Au("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Au("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Au("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var ye="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),gd=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(ye));function Ny(l,t){t=(t&4)!==0;for(var u=0;u<l.length;u++){var a=l[u],e=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var f=a.length-1;0<=f;f--){var c=a[f],i=c.instance,d=c.currentTarget;if(c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=d;try{n(e)}catch(S){je(S)}e.currentTarget=null,n=i}else for(f=0;f<a.length;f++){if(c=a[f],i=c.instance,d=c.currentTarget,c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=d;try{n(e)}catch(S){je(S)}e.currentTarget=null,n=i}}}}function L(l,t){var u=t[$n];u===void 0&&(u=t[$n]=new Set);var a=l+"__bubble";u.has(a)||(Ry(t,l,2,!1),u.add(a))}function Gc(l,t,u){var a=0;t&&(a|=4),Ry(u,l,a,t)}var _n="_reactListening"+Math.random().toString(36).slice(2);function Xc(l){if(!l[_n]){l[_n]=!0,Oi.forEach(function(u){u!=="selectionchange"&&(gd.has(u)||Gc(u,!1,l),Gc(u,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[_n]||(t[_n]=!0,Gc("selectionchange",!1,t))}}function Ry(l,t,u,a){switch(cv(t)){case 2:var e=Ld;break;case 8:e=Kd;break;default:e=li}u=e.bind(null,t,u,l),e=void 0,!ef||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),a?e!==void 0?l.addEventListener(t,u,{capture:!0,passive:e}):l.addEventListener(t,u,!0):e!==void 0?l.addEventListener(t,u,{passive:e}):l.addEventListener(t,u,!1)}function Qc(l,t,u,a,e){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var f=a.tag;if(f===3||f===4){var c=a.stateNode.containerInfo;if(c===e)break;if(f===4)for(f=a.return;f!==null;){var i=f.tag;if((i===3||i===4)&&f.stateNode.containerInfo===e)return;f=f.return}for(;c!==null;){if(f=xu(c),f===null)return;if(i=f.tag,i===5||i===6||i===26||i===27){a=n=f;continue l}c=c.parentNode}}a=a.return}ji(function(){var d=n,S=uf(u),z=[];l:{var h=v0.get(l);if(h!==void 0){var g=Ce,D=l;switch(l){case"keypress":if(Re(u)===0)break l;case"keydown":case"keyup":g=sm;break;case"focusin":D="focus",g=sf;break;case"focusout":D="blur",g=sf;break;case"beforeblur":case"afterblur":g=sf;break;case"click":if(u.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Qi;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=kv;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=mm;break;case c0:case i0:case s0:g=lm;break;case y0:g=om;break;case"scroll":case"scrollend":g=$v;break;case"wheel":g=gm;break;case"copy":case"cut":case"paste":g=um;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=xi;break;case"toggle":case"beforetoggle":g=bm}var R=(t&4)!==0,nl=!R&&(l==="scroll"||l==="scrollend"),v=R?h!==null?h+"Capture":null:h;R=[];for(var s=d,m;s!==null;){var r=s;if(m=r.stateNode,r=r.tag,r!==5&&r!==26&&r!==27||m===null||v===null||(r=Ra(s,v),r!=null&&R.push(ve(s,r,m))),nl)break;s=s.return}0<R.length&&(h=new g(h,D,null,u,S),z.push({event:h,listeners:R}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",g=l==="mouseout"||l==="pointerout",h&&u!==tf&&(D=u.relatedTarget||u.fromElement)&&(xu(D)||D[Zu]))break l;if((g||h)&&(h=S.window===S?S:(h=S.ownerDocument)?h.defaultView||h.parentWindow:window,g?(D=u.relatedTarget||u.toElement,g=d,D=D?xu(D):null,D!==null&&(nl=Z(D),R=D.tag,D!==nl||R!==5&&R!==27&&R!==6)&&(D=null)):(g=null,D=d),g!==D)){if(R=Qi,r="onMouseLeave",v="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(R=xi,r="onPointerLeave",v="onPointerEnter",s="pointer"),nl=g==null?h:Na(g),m=D==null?h:Na(D),h=new R(r,s+"leave",g,u,S),h.target=nl,h.relatedTarget=m,r=null,xu(S)===d&&(R=new R(v,s+"enter",D,u,S),R.target=m,R.relatedTarget=nl,r=R),nl=r,g&&D)t:{for(R=Sd,v=g,s=D,m=0,r=v;r;r=R(r))m++;r=0;for(var H=s;H;H=R(H))r++;for(;0<m-r;)v=R(v),m--;for(;0<r-m;)s=R(s),r--;for(;m--;){if(v===s||s!==null&&v===s.alternate){R=v;break t}v=R(v),s=R(s)}R=null}else R=null;g!==null&&qy(z,h,g,R,!1),D!==null&&nl!==null&&qy(z,nl,D,R,!0)}}l:{if(h=d?Na(d):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var $=Fi;else if(Wi(h))if(ki)$=Um;else{$=Mm;var p=Om}else g=h.nodeName,!g||g.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?d&&lf(d.elementType)&&($=Fi):$=Dm;if($&&($=$(l,d))){$i(z,$,u,S);break l}p&&p(l,h,d),l==="focusout"&&d&&h.type==="number"&&d.memoizedProps.value!=null&&Pn(h,"number",h.value)}switch(p=d?Na(d):window,l){case"focusin":(Wi(p)||p.contentEditable==="true")&&(ku=p,hf=d,Qa=null);break;case"focusout":Qa=hf=ku=null;break;case"mousedown":gf=!0;break;case"contextmenu":case"mouseup":case"dragend":gf=!1,n0(z,u,S);break;case"selectionchange":if(Hm)break;case"keydown":case"keyup":n0(z,u,S)}var X;if(vf)l:{switch(l){case"compositionstart":var J="onCompositionStart";break l;case"compositionend":J="onCompositionEnd";break l;case"compositionupdate":J="onCompositionUpdate";break l}J=void 0}else Fu?Ji(l,u)&&(J="onCompositionEnd"):l==="keydown"&&u.keyCode===229&&(J="onCompositionStart");J&&(Vi&&u.locale!=="ko"&&(Fu||J!=="onCompositionStart"?J==="onCompositionEnd"&&Fu&&(X=Gi()):(kt=S,nf="value"in kt?kt.value:kt.textContent,Fu=!0)),p=On(d,J),0<p.length&&(J=new Zi(J,l,null,u,S),z.push({event:J,listeners:p}),X?J.data=X:(X=wi(u),X!==null&&(J.data=X)))),(X=zm?Em(l,u):Tm(l,u))&&(J=On(d,"onBeforeInput"),0<J.length&&(p=new Zi("onBeforeInput","beforeinput",null,u,S),z.push({event:p,listeners:J}),p.data=X)),dd(z,l,d,u,S)}Ny(z,t)})}function ve(l,t,u){return{instance:l,listener:t,currentTarget:u}}function On(l,t){for(var u=t+"Capture",a=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=Ra(l,u),e!=null&&a.unshift(ve(l,e,n)),e=Ra(l,t),e!=null&&a.push(ve(l,e,n))),l.tag===3)return a;l=l.return}return[]}function Sd(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function qy(l,t,u,a,e){for(var n=t._reactName,f=[];u!==null&&u!==a;){var c=u,i=c.alternate,d=c.stateNode;if(c=c.tag,i!==null&&i===a)break;c!==5&&c!==26&&c!==27||d===null||(i=d,e?(d=Ra(u,n),d!=null&&f.unshift(ve(u,d,i))):e||(d=Ra(u,n),d!=null&&f.push(ve(u,d,i)))),u=u.return}f.length!==0&&l.push({event:t,listeners:f})}var bd=/\r\n?/g,rd=/\u0000|\uFFFD/g;function Cy(l){return(typeof l=="string"?l:""+l).replace(bd,`
-`).replace(rd,"")}function By(l,t){return t=Cy(t),Cy(l)===t}function el(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&wu(l,""+a);break;case"className":Ue(l,"class",a);break;case"tabIndex":Ue(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Ue(l,u,a);break;case"style":Bi(l,a,n);break;case"data":if(t!=="object"){Ue(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&el(l,t,"name",e.name,e,null),el(l,t,"formEncType",e.formEncType,e,null),el(l,t,"formMethod",e.formMethod,e,null),el(l,t,"formTarget",e.formTarget,e,null)):(el(l,t,"encType",e.encType,e,null),el(l,t,"method",e.method,e,null),el(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Nt);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=He(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":L("beforetoggle",l),L("toggle",l),De(l,"popover",a);break;case"xlinkActuate":Ht(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Ht(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Ht(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Ht(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Ht(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Ht(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Ht(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Ht(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Ht(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":De(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=wv.get(u)||u,De(l,u,a))}}function Zc(l,t,u,a,e,n){switch(u){case"style":Bi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"children":typeof a=="string"?wu(l,a):(typeof a=="number"||typeof a=="bigint")&&wu(l,""+a);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Nt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Mi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Zl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):De(l,u,a)}}}function Hl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":L("error",l),L("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:el(l,t,n,f,u,null)}}e&&el(l,t,"srcSet",u.srcSet,u,null),a&&el(l,t,"src",u.src,u,null);return;case"input":L("invalid",l);var c=n=f=e=null,i=null,d=null;for(a in u)if(u.hasOwnProperty(a)){var S=u[a];if(S!=null)switch(a){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":d=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(o(137,t));break;default:el(l,t,a,S,u,null)}}Ni(l,n,c,i,d,f,e,!1);return;case"select":L("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:el(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?Ju(l,!!a,t,!1):u!=null&&Ju(l,!!a,u,!0);return;case"textarea":L("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(o(91));break;default:el(l,t,f,c,u,null)}qi(l,a,e,n);return;case"option":for(i in u)if(u.hasOwnProperty(i)&&(a=u[i],a!=null))switch(i){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:el(l,t,i,a,u,null)}return;case"dialog":L("beforetoggle",l),L("toggle",l),L("cancel",l),L("close",l);break;case"iframe":case"object":L("load",l);break;case"video":case"audio":for(a=0;a<ye.length;a++)L(ye[a],l);break;case"image":L("error",l),L("load",l);break;case"details":L("toggle",l);break;case"embed":case"source":case"link":L("error",l),L("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(d in u)if(u.hasOwnProperty(d)&&(a=u[d],a!=null))switch(d){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:el(l,t,d,a,u,null)}return;default:if(lf(t)){for(S in u)u.hasOwnProperty(S)&&(a=u[S],a!==void 0&&Zc(l,t,S,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&el(l,t,c,a,u,null))}function zd(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,d=null,S=null;for(g in u){var z=u[g];if(u.hasOwnProperty(g)&&z!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=z;default:a.hasOwnProperty(g)||el(l,t,g,null,a,z)}}for(var h in a){var g=a[h];if(z=u[h],a.hasOwnProperty(h)&&(g!=null||z!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":d=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(o(137,t));break;default:g!==z&&el(l,t,h,g,a,z)}}In(l,f,c,i,d,S,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||el(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&el(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?Ju(l,!!u,h,!1):!!a!=!!u&&(t!=null?Ju(l,!!u,t,!0):Ju(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:el(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(o(91));break;default:e!==n&&el(l,t,f,e,a,n)}Ri(l,h,g);return;case"option":for(var D in u)if(h=u[D],u.hasOwnProperty(D)&&h!=null&&!a.hasOwnProperty(D))switch(D){case"selected":l.selected=!1;break;default:el(l,t,D,null,a,h)}for(i in a)if(h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:el(l,t,i,h,a,g)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var R in u)h=u[R],u.hasOwnProperty(R)&&h!=null&&!a.hasOwnProperty(R)&&el(l,t,R,null,a,h);for(d in a)if(h=a[d],g=u[d],a.hasOwnProperty(d)&&h!==g&&(h!=null||g!=null))switch(d){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(o(137,t));break;default:el(l,t,d,h,a,g)}return;default:if(lf(t)){for(var nl in u)h=u[nl],u.hasOwnProperty(nl)&&h!==void 0&&!a.hasOwnProperty(nl)&&Zc(l,t,nl,void 0,a,h);for(S in a)h=a[S],g=u[S],!a.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||Zc(l,t,S,h,a,g);return}}for(var v in u)h=u[v],u.hasOwnProperty(v)&&h!=null&&!a.hasOwnProperty(v)&&el(l,t,v,null,a,h);for(z in a)h=a[z],g=u[z],!a.hasOwnProperty(z)||h===g||h==null&&g==null||el(l,t,z,h,a,g)}function Yy(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ed(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&Yy(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],d=i.startTime;if(d>c)break;var S=i.transferSize,z=i.initiatorType;S&&Yy(z)&&(i=i.responseEnd,f+=S*(i<c?1:(c-d)/(i-d)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var xc=null,Vc=null;function Mn(l){return l.nodeType===9?l:l.ownerDocument}function jy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Gy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function Td(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Xy=typeof setTimeout=="function"?setTimeout:void 0,Ad=typeof clearTimeout=="function"?clearTimeout:void 0,Qy=typeof Promise=="function"?Promise:void 0,_d=typeof queueMicrotask=="function"?queueMicrotask:typeof Qy<"u"?function(l){return Qy.resolve(null).then(l).catch(Od)}:Xy;function Od(l){setTimeout(function(){throw l})}function ou(l){return l==="head"}function Zy(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),_a(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")me(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,me(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Ha]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&me(l.ownerDocument.body);u=e}while(u);_a(t)}function xy(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),Fn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Md(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Ha])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=ht(l.nextSibling),l===null)break}return null}function Dd(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=ht(l.nextSibling),l===null))return null;return l}function Vy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=ht(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Ud(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function ht(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Ly(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return ht(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Ky(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Jy(l,t,u){switch(t=Mn(u),l){case"html":if(l=t.documentElement,!l)throw Error(o(452));return l;case"head":if(l=t.head,!l)throw Error(o(453));return l;case"body":if(l=t.body,!l)throw Error(o(454));return l;default:throw Error(o(451))}}function me(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var gt=new Map,wy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var wt=_.d;_.d={f:pd,r:Hd,D:Nd,C:Rd,L:qd,m:Cd,X:Yd,S:Bd,M:jd};function pd(){var l=wt.f(),t=bn();return l||t}function Hd(l){var t=Vu(l);t!==null&&t.tag===5&&t.type==="form"?ys(t):wt.r(l)}var Ea=typeof document>"u"?null:document;function Wy(l,t,u){var a=Ea;if(a&&typeof t=="string"&&t){var e=it(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),wy.has(e)||(wy.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),Hl(t,"link",l),_l(t),a.head.appendChild(t)))}}function Nd(l){wt.D(l),Wy("dns-prefetch",l,null)}function Rd(l,t){wt.C(l,t),Wy("preconnect",l,t)}function qd(l,t,u){wt.L(l,t,u);var a=Ea;if(a&&l&&t){var e='link[rel="preload"][as="'+it(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+it(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+it(u.imageSizes)+'"]')):e+='[href="'+it(l)+'"]';var n=e;switch(t){case"style":n=Ta(l);break;case"script":n=Aa(l)}gt.has(n)||(l=q({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),gt.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(de(n))||t==="script"&&a.querySelector(oe(n))||(t=a.createElement("link"),Hl(t,"link",l),_l(t),a.head.appendChild(t)))}}function Cd(l,t){wt.m(l,t);var u=Ea;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+it(a)+'"][href="'+it(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Aa(l)}if(!gt.has(n)&&(l=q({rel:"modulepreload",href:l},t),gt.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(oe(n)))return}a=u.createElement("link"),Hl(a,"link",l),_l(a),u.head.appendChild(a)}}}function Bd(l,t,u){wt.S(l,t,u);var a=Ea;if(a&&l){var e=Lu(a).hoistableStyles,n=Ta(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(de(n)))c.loading=5;else{l=q({rel:"stylesheet",href:l,"data-precedence":t},u),(u=gt.get(n))&&Fc(l,u);var i=f=a.createElement("link");_l(i),Hl(i,"link",l),i._p=new Promise(function(d,S){i.onload=d,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Un(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Yd(l,t){wt.X(l,t);var u=Ea;if(u&&l){var a=Lu(u).hoistableScripts,e=Aa(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0},t),(t=gt.get(e))&&kc(l,t),n=u.createElement("script"),_l(n),Hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function jd(l,t){wt.M(l,t);var u=Ea;if(u&&l){var a=Lu(u).hoistableScripts,e=Aa(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0,type:"module"},t),(t=gt.get(e))&&kc(l,t),n=u.createElement("script"),_l(n),Hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function $y(l,t,u,a){var e=(e=x.current)?Dn(e):null;if(!e)throw Error(o(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Ta(u.href),u=Lu(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Ta(u.href);var n=Lu(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(de(l)))&&!n._p&&(f.instance=n,f.state.loading=5),gt.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},gt.set(l,u),n||Gd(e,l,u,f.state))),t&&a===null)throw Error(o(528,""));return f}if(t&&a!==null)throw Error(o(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Aa(u),u=Lu(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,l))}}function Ta(l){return'href="'+it(l)+'"'}function de(l){return'link[rel="stylesheet"]['+l+"]"}function Fy(l){return q({},l,{"data-precedence":l.precedence,precedence:null})}function Gd(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Hl(t,"link",u),_l(t),l.head.appendChild(t))}function Aa(l){return'[src="'+it(l)+'"]'}function oe(l){return"script[async]"+l}function ky(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+it(u.href)+'"]');if(a)return t.instance=a,_l(a),a;var e=q({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),_l(a),Hl(a,"style",e),Un(a,u.precedence,l),t.instance=a;case"stylesheet":e=Ta(u.href);var n=l.querySelector(de(e));if(n)return t.state.loading|=4,t.instance=n,_l(n),n;a=Fy(u),(e=gt.get(e))&&Fc(a,e),n=(l.ownerDocument||l).createElement("link"),_l(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Hl(n,"link",a),t.state.loading|=4,Un(n,u.precedence,l),t.instance=n;case"script":return n=Aa(u.src),(e=l.querySelector(oe(n)))?(t.instance=e,_l(e),e):(a=u,(e=gt.get(n))&&(a=q({},u),kc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),_l(e),Hl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(o(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Un(a,u.precedence,l));return t.instance}function Un(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var pn=null;function Iy(l,t,u){if(pn===null){var a=new Map,e=pn=new Map;e.set(u,a)}else e=pn,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Ha]||n[Ml]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Py(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Xd(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function lv(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qd(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Ta(a.href),n=t.querySelector(de(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Hn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,_l(n);return}n=t.ownerDocument||t,a=Fy(a),(e=gt.get(e))&&Fc(a,e),n=n.createElement("link"),_l(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Hl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Hn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function Zd(l,t){return l.stylesheets&&l.count===0&&Rn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*Ed());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Hn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Rn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Nn=null;function Rn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Nn=new Map,t.forEach(xd,l),Nn=null,Hn.call(l))}function xd(l,t){if(!(t.state.loading&4)){var u=Nn.get(l);if(u)var a=u.get(null);else{u=new Map,Nn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Hn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var he={$$typeof:Nl,Provider:null,Consumer:null,_currentValue:C,_currentValue2:C,_threadCount:0};function Vd(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function tv(l,t,u,a,e,n,f,c,i,d,S,z){return l=new Vd(l,t,u,f,i,d,S,z,c),t=1,n===!0&&(t|=24),n=lt(3,null,null,t),l.current=n,n.stateNode=l,t=Nf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},Bf(n),l}function uv(l){return l?(l=la,l):la}function av(l,t,u,a,e,n){e=uv(e),a.context===null?a.context=e:a.pendingContext=e,a=au(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=eu(l,a,t),u!==null&&(wl(u,l,t),wa(u,l,t))}function ev(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){ev(l,t),(l=l.alternate)&&ev(l,t)}function nv(l){if(l.tag===13||l.tag===31){var t=Du(l,67108864);t!==null&&wl(t,l,67108864),Pc(l,67108864)}}function fv(l){if(l.tag===13||l.tag===31){var t=nt();t=wn(t);var u=Du(l,t);u!==null&&wl(u,l,t),Pc(l,t)}}var qn=!0;function Ld(l,t,u,a){var e=b.T;b.T=null;var n=_.p;try{_.p=2,li(l,t,u,a)}finally{_.p=n,b.T=e}}function Kd(l,t,u,a){var e=b.T;b.T=null;var n=_.p;try{_.p=8,li(l,t,u,a)}finally{_.p=n,b.T=e}}function li(l,t,u,a){if(qn){var e=ti(a);if(e===null)Qc(l,t,a,Cn,u),iv(l,a);else if(wd(e,l,t,u,a))a.stopPropagation();else if(iv(l,a),t&4&&-1<Jd.indexOf(l)){for(;e!==null;){var n=Vu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Tu(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Il(f);c.entanglements[1]|=i,f&=~i}Dt(n),(k&6)===0&&(gn=Fl()+500,se(0))}}break;case 31:case 13:c=Du(n,2),c!==null&&wl(c,n,2),bn(),Pc(n,2)}if(n=ti(a),n===null&&Qc(l,t,a,Cn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Qc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var Cn=null;function ui(l){if(Cn=null,l=xu(l),l!==null){var t=Z(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=fl(t),l!==null)return l;l=null}else if(u===31){if(l=Tl(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Cn=l,null}function cv(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Nv()){case hi:return 2;case gi:return 8;case Te:case Rv:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,hu=null,gu=null,Su=null,ge=new Map,Se=new Map,bu=[],Jd="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function iv(l,t){switch(l){case"focusin":case"focusout":hu=null;break;case"dragenter":case"dragleave":gu=null;break;case"mouseover":case"mouseout":Su=null;break;case"pointerover":case"pointerout":ge.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Se.delete(t.pointerId)}}function be(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Vu(t),t!==null&&nv(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function wd(l,t,u,a,e){switch(t){case"focusin":return hu=be(hu,l,t,u,a,e),!0;case"dragenter":return gu=be(gu,l,t,u,a,e),!0;case"mouseover":return Su=be(Su,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ge.set(n,be(ge.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,Se.set(n,be(Se.get(n)||null,l,t,u,a,e)),!0}return!1}function sv(l){var t=xu(l.target);if(t!==null){var u=Z(t);if(u!==null){if(t=u.tag,t===13){if(t=fl(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fv(u)});return}}else if(t===31){if(t=Tl(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fv(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Vu(u),t!==null&&nv(t),l.blockedOn=u,!1;t.shift()}return!0}function yv(l,t,u){Bn(l)&&u.delete(t)}function Wd(){ai=!1,hu!==null&&Bn(hu)&&(hu=null),gu!==null&&Bn(gu)&&(gu=null),Su!==null&&Bn(Su)&&(Su=null),ge.forEach(yv),Se.forEach(yv)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,A.unstable_scheduleCallback(A.unstable_NormalPriority,Wd)))}var jn=null;function vv(l){jn!==l&&(jn=l,A.unstable_scheduleCallback(A.unstable_NormalPriority,function(){jn===l&&(jn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Vu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function _a(l){function t(i){return Yn(i,l)}hu!==null&&Yn(hu,l),gu!==null&&Yn(gu,l),Su!==null&&Yn(Su,l),ge.forEach(t),Se.forEach(t);for(var u=0;u<bu.length;u++){var a=bu[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<bu.length&&(u=bu[0],u.blockedOn===null);)sv(u),u.blockedOn===null&&bu.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[Zl]||null;if(typeof n=="function")f||vv(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Zl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),vv(u)}}}function mv(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}Gn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(o(409));var u=t.current,a=nt();av(u,a,l,t,null,null)},Gn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;av(l.current,2,null,l,null,null),bn(),t[Zu]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ti();l={blockedOn:null,target:l,priority:t};for(var u=0;u<bu.length&&t!==0&&t<bu[u].priority;u++);bu.splice(u,0,l),u===0&&sv(l)}};var dv=Q.version;if(dv!=="19.2.4")throw Error(o(527,dv,"19.2.4"));_.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(o(188)):(l=Object.keys(l).join(","),Error(o(268,l)));return l=T(t),l=l!==null?I(l):null,l=l===null?null:l.stateNode,l};var $d={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:b,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Da=Xn.inject($d),kl=Xn}catch{}}return ze.createRoot=function(l,t){if(!M(l))throw Error(o(299));var u=!1,a="",e=zs,n=Es,f=Ts;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=tv(l,1,!1,null,null,u,a,null,e,n,f,mv),l[Zu]=t.current,Xc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!M(l))throw Error(o(299));var a=!1,e="",n=zs,f=Es,c=Ts,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=tv(l,1,!0,t,u??null,a,e,i,n,f,c,mv),t.context=uv(null),u=t.current,a=nt(),a=wn(a),e=au(a),e.callback=null,eu(u,e,a),u=a,t.current.lanes=u,pa(t,u),Dt(t),l[Zu]=t.current,Xc(l),new Gn(t)},ze.version="19.2.4",ze}var Av;function n1(){if(Av)return fi.exports;Av=1;function A(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(A)}catch(Q){console.error(Q)}}return A(),fi.exports=e1(),fi.exports}var f1=n1(),_v=mi();let c1=1;const vi=new Map;function i1(A,Q){const G=c1++,o={jsonrpc:"2.0",id:G,method:A,params:Q??{}};return new Promise((M,Z)=>{vi.set(G,{resolve:M,reject:Z}),window.parent.postMessage(o,"*")})}function s1(A,Q){window.parent.postMessage({jsonrpc:"2.0",method:A,params:{}},"*")}function y1(A){let Q=null;const G=o=>{var Z,fl;const M=o.data;if(!(!M||M.jsonrpc!=="2.0")){if(M.id!==void 0&&(M.result!==void 0||M.error)){const Tl=vi.get(M.id);Tl&&(vi.delete(M.id),M.error?Tl.reject(new Error(M.error.message??"Unknown error")):Tl.resolve(M.result));return}if(M.method)switch(M.method){case"ui/notifications/tool-input":(Z=M.params)!=null&&Z.arguments;break;case"ui/notifications/tool-result":(fl=M.params)!=null&&fl.structuredContent&&A.onData(M.params.structuredContent);break;case"ui/notifications/tool-input-partial":break;case"ui/notifications/host-context-changed":M.params&&(Q={...Q,...M.params},Ov(Q));break}}};return window.addEventListener("message",G),(async()=>{try{Q=(await i1("ui/initialize",{protocolVersion:"2025-06-18",capabilities:{},clientInfo:{name:A.name,version:"1.0.0"}})).hostContext??null,Q&&Ov(Q),s1("ui/notifications/initialized")}catch{console.warn("MCP Apps init failed — running standalone")}})(),()=>window.removeEventListener("message",G)}const v1={"--sw-fg":"#1a1a1a","--sw-fg-muted":"#666","--sw-fg-faint":"#888","--sw-bg":"#ffffff","--sw-bg-surface":"#f5f5f5","--sw-bg-card":"#fafafa","--sw-border":"#e5e5e5","--sw-row-border":"#eee","--sw-header-border":"#ddd","--sw-progress-bg":"#e5e5e5"},m1={"--sw-fg":"#e0e0e0","--sw-fg-muted":"#a0a0a0","--sw-fg-faint":"#888","--sw-bg":"#1e1e1e","--sw-bg-surface":"#2a2a2a","--sw-bg-card":"#252525","--sw-border":"#404040","--sw-row-border":"#333","--sw-header-border":"#444","--sw-progress-bg":"#333"};function Dv(A){const Q=A==="dark"?m1:v1,G=document.documentElement;for(const[o,M]of Object.entries(Q))G.style.setProperty(o,M)}function d1(){const A=window.matchMedia("(prefers-color-scheme: dark)").matches;Dv(A?"dark":"light")}d1();function Ov(A){var Q,G,o;if(A.theme&&(document.documentElement.style.colorScheme=A.theme,Dv(A.theme)),(Q=A.styles)!=null&&Q.variables){const M=document.documentElement;for(const[Z,fl]of Object.entries(A.styles.variables))fl&&M.style.setProperty(Z,fl)}if((o=(G=A.styles)==null?void 0:G.css)!=null&&o.fonts){const M=document.createElement("style");M.textContent=A.styles.css.fonts,document.head.appendChild(M)}}function o1(){const[A,Q]=_v.useState(null);if(_v.useEffect(()=>y1({name:"swarmia-docs-diagnostic",onData:M=>Q(M)}),[]),!A)return ql.jsxs("div",{style:Oa.container,children:[ql.jsx("h3",{style:Oa.heading,children:"📋 Swarmia Docs Diagnostic"}),ql.jsx("p",{style:{color:"var(--sw-fg-faint)"},children:"Waiting for data from tool..."})]});const G={green:"#22c55e",yellow:"#f59e0b",red:"#ef4444"},o={green:"✅",yellow:"⚠️",red:"❌"};return ql.jsxs("div",{style:Oa.container,children:[ql.jsx("h3",{style:Oa.heading,children:"📋 Swarmia Docs Diagnostic"}),ql.jsxs("div",{style:{marginBottom:12},children:[ql.jsx("div",{style:{fontWeight:600},children:A.query}),ql.jsx("a",{href:"https://help.swarmia.com/",target:"_blank",rel:"noopener noreferrer",style:{fontSize:13,color:"#3b82f6"},children:"help.swarmia.com"})]}),A.integrations.length>0&&ql.jsxs("div",{children:[ql.jsx("h4",{style:{margin:"0 0 4px",fontSize:13},children:"Integration Status"}),A.integrations.map(M=>ql.jsxs("div",{style:Oa.statusLine,children:[ql.jsx("span",{style:{...Oa.dot,background:G[M.status]}}),ql.jsx("strong",{style:{fontSize:13},children:M.name}),ql.jsx("span",{style:{fontSize:12,color:"var(--sw-fg-muted)"},children:M.detail}),ql.jsx("span",{style:{marginLeft:"auto",fontSize:12},children:o[M.status]})]},M.name))]})]})}const Oa={container:{padding:16,fontFamily:"system-ui, -apple-system, sans-serif",maxWidth:640,color:"var(--sw-fg)"},heading:{margin:"0 0 8px",fontSize:16},statusLine:{display:"flex",alignItems:"center",gap:8,padding:"3px 0"},dot:{width:8,height:8,borderRadius:"50%",display:"inline-block",flexShrink:0}},Mv=document.getElementById("docs-diagnostic-root");Mv&&f1.createRoot(Mv).render(ql.jsx(o1,{}));
+`).replace(rd,"")}function By(l,t){return t=Cy(t),Cy(l)===t}function el(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&wu(l,""+a);break;case"className":Ue(l,"class",a);break;case"tabIndex":Ue(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Ue(l,u,a);break;case"style":Bi(l,a,n);break;case"data":if(t!=="object"){Ue(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&el(l,t,"name",e.name,e,null),el(l,t,"formEncType",e.formEncType,e,null),el(l,t,"formMethod",e.formMethod,e,null),el(l,t,"formTarget",e.formTarget,e,null)):(el(l,t,"encType",e.encType,e,null),el(l,t,"method",e.method,e,null),el(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=He(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Nt);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=He(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":L("beforetoggle",l),L("toggle",l),De(l,"popover",a);break;case"xlinkActuate":Ht(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Ht(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Ht(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Ht(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Ht(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Ht(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Ht(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Ht(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Ht(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":De(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=wv.get(u)||u,De(l,u,a))}}function Zc(l,t,u,a,e,n){switch(u){case"style":Bi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(o(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(o(60));l.innerHTML=u}}break;case"children":typeof a=="string"?wu(l,a):(typeof a=="number"||typeof a=="bigint")&&wu(l,""+a);break;case"onScroll":a!=null&&L("scroll",l);break;case"onScrollEnd":a!=null&&L("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Nt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Mi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Zl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):De(l,u,a)}}}function Hl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":L("error",l),L("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:el(l,t,n,f,u,null)}}e&&el(l,t,"srcSet",u.srcSet,u,null),a&&el(l,t,"src",u.src,u,null);return;case"input":L("invalid",l);var c=n=f=e=null,i=null,d=null;for(a in u)if(u.hasOwnProperty(a)){var S=u[a];if(S!=null)switch(a){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":d=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(o(137,t));break;default:el(l,t,a,S,u,null)}}Ni(l,n,c,i,d,f,e,!1);return;case"select":L("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:el(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?Ju(l,!!a,t,!1):u!=null&&Ju(l,!!a,u,!0);return;case"textarea":L("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(o(91));break;default:el(l,t,f,c,u,null)}qi(l,a,e,n);return;case"option":for(i in u)if(u.hasOwnProperty(i)&&(a=u[i],a!=null))switch(i){case"selected":l.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:el(l,t,i,a,u,null)}return;case"dialog":L("beforetoggle",l),L("toggle",l),L("cancel",l),L("close",l);break;case"iframe":case"object":L("load",l);break;case"video":case"audio":for(a=0;a<ye.length;a++)L(ye[a],l);break;case"image":L("error",l),L("load",l);break;case"details":L("toggle",l);break;case"embed":case"source":case"link":L("error",l),L("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(d in u)if(u.hasOwnProperty(d)&&(a=u[d],a!=null))switch(d){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:el(l,t,d,a,u,null)}return;default:if(lf(t)){for(S in u)u.hasOwnProperty(S)&&(a=u[S],a!==void 0&&Zc(l,t,S,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&el(l,t,c,a,u,null))}function zd(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,d=null,S=null;for(g in u){var z=u[g];if(u.hasOwnProperty(g)&&z!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=z;default:a.hasOwnProperty(g)||el(l,t,g,null,a,z)}}for(var h in a){var g=a[h];if(z=u[h],a.hasOwnProperty(h)&&(g!=null||z!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":d=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(o(137,t));break;default:g!==z&&el(l,t,h,g,a,z)}}In(l,f,c,i,d,S,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||el(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&el(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?Ju(l,!!u,h,!1):!!a!=!!u&&(t!=null?Ju(l,!!u,t,!0):Ju(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:el(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(o(91));break;default:e!==n&&el(l,t,f,e,a,n)}Ri(l,h,g);return;case"option":for(var D in u)if(h=u[D],u.hasOwnProperty(D)&&h!=null&&!a.hasOwnProperty(D))switch(D){case"selected":l.selected=!1;break;default:el(l,t,D,null,a,h)}for(i in a)if(h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:el(l,t,i,h,a,g)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var R in u)h=u[R],u.hasOwnProperty(R)&&h!=null&&!a.hasOwnProperty(R)&&el(l,t,R,null,a,h);for(d in a)if(h=a[d],g=u[d],a.hasOwnProperty(d)&&h!==g&&(h!=null||g!=null))switch(d){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(o(137,t));break;default:el(l,t,d,h,a,g)}return;default:if(lf(t)){for(var nl in u)h=u[nl],u.hasOwnProperty(nl)&&h!==void 0&&!a.hasOwnProperty(nl)&&Zc(l,t,nl,void 0,a,h);for(S in a)h=a[S],g=u[S],!a.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||Zc(l,t,S,h,a,g);return}}for(var v in u)h=u[v],u.hasOwnProperty(v)&&h!=null&&!a.hasOwnProperty(v)&&el(l,t,v,null,a,h);for(z in a)h=a[z],g=u[z],!a.hasOwnProperty(z)||h===g||h==null&&g==null||el(l,t,z,h,a,g)}function Yy(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ed(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&Yy(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],d=i.startTime;if(d>c)break;var S=i.transferSize,z=i.initiatorType;S&&Yy(z)&&(i=i.responseEnd,f+=S*(i<c?1:(c-d)/(i-d)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var xc=null,Vc=null;function Mn(l){return l.nodeType===9?l:l.ownerDocument}function jy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Gy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function Td(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Xy=typeof setTimeout=="function"?setTimeout:void 0,Ad=typeof clearTimeout=="function"?clearTimeout:void 0,Qy=typeof Promise=="function"?Promise:void 0,_d=typeof queueMicrotask=="function"?queueMicrotask:typeof Qy<"u"?function(l){return Qy.resolve(null).then(l).catch(Od)}:Xy;function Od(l){setTimeout(function(){throw l})}function ou(l){return l==="head"}function Zy(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),_a(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")me(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,me(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Ha]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&me(l.ownerDocument.body);u=e}while(u);_a(t)}function xy(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),Fn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Md(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Ha])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=ht(l.nextSibling),l===null)break}return null}function Dd(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=ht(l.nextSibling),l===null))return null;return l}function Vy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=ht(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Ud(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function ht(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Ly(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return ht(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Ky(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Jy(l,t,u){switch(t=Mn(u),l){case"html":if(l=t.documentElement,!l)throw Error(o(452));return l;case"head":if(l=t.head,!l)throw Error(o(453));return l;case"body":if(l=t.body,!l)throw Error(o(454));return l;default:throw Error(o(451))}}function me(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var gt=new Map,wy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var wt=_.d;_.d={f:pd,r:Hd,D:Nd,C:Rd,L:qd,m:Cd,X:Yd,S:Bd,M:jd};function pd(){var l=wt.f(),t=bn();return l||t}function Hd(l){var t=Vu(l);t!==null&&t.tag===5&&t.type==="form"?ys(t):wt.r(l)}var Ea=typeof document>"u"?null:document;function Wy(l,t,u){var a=Ea;if(a&&typeof t=="string"&&t){var e=it(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),wy.has(e)||(wy.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),Hl(t,"link",l),_l(t),a.head.appendChild(t)))}}function Nd(l){wt.D(l),Wy("dns-prefetch",l,null)}function Rd(l,t){wt.C(l,t),Wy("preconnect",l,t)}function qd(l,t,u){wt.L(l,t,u);var a=Ea;if(a&&l&&t){var e='link[rel="preload"][as="'+it(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+it(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+it(u.imageSizes)+'"]')):e+='[href="'+it(l)+'"]';var n=e;switch(t){case"style":n=Ta(l);break;case"script":n=Aa(l)}gt.has(n)||(l=q({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),gt.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(de(n))||t==="script"&&a.querySelector(oe(n))||(t=a.createElement("link"),Hl(t,"link",l),_l(t),a.head.appendChild(t)))}}function Cd(l,t){wt.m(l,t);var u=Ea;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+it(a)+'"][href="'+it(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=Aa(l)}if(!gt.has(n)&&(l=q({rel:"modulepreload",href:l},t),gt.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(oe(n)))return}a=u.createElement("link"),Hl(a,"link",l),_l(a),u.head.appendChild(a)}}}function Bd(l,t,u){wt.S(l,t,u);var a=Ea;if(a&&l){var e=Lu(a).hoistableStyles,n=Ta(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(de(n)))c.loading=5;else{l=q({rel:"stylesheet",href:l,"data-precedence":t},u),(u=gt.get(n))&&Fc(l,u);var i=f=a.createElement("link");_l(i),Hl(i,"link",l),i._p=new Promise(function(d,S){i.onload=d,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Un(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Yd(l,t){wt.X(l,t);var u=Ea;if(u&&l){var a=Lu(u).hoistableScripts,e=Aa(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0},t),(t=gt.get(e))&&kc(l,t),n=u.createElement("script"),_l(n),Hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function jd(l,t){wt.M(l,t);var u=Ea;if(u&&l){var a=Lu(u).hoistableScripts,e=Aa(l),n=a.get(e);n||(n=u.querySelector(oe(e)),n||(l=q({src:l,async:!0,type:"module"},t),(t=gt.get(e))&&kc(l,t),n=u.createElement("script"),_l(n),Hl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function $y(l,t,u,a){var e=(e=x.current)?Dn(e):null;if(!e)throw Error(o(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Ta(u.href),u=Lu(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Ta(u.href);var n=Lu(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(de(l)))&&!n._p&&(f.instance=n,f.state.loading=5),gt.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},gt.set(l,u),n||Gd(e,l,u,f.state))),t&&a===null)throw Error(o(528,""));return f}if(t&&a!==null)throw Error(o(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Aa(u),u=Lu(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,l))}}function Ta(l){return'href="'+it(l)+'"'}function de(l){return'link[rel="stylesheet"]['+l+"]"}function Fy(l){return q({},l,{"data-precedence":l.precedence,precedence:null})}function Gd(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Hl(t,"link",u),_l(t),l.head.appendChild(t))}function Aa(l){return'[src="'+it(l)+'"]'}function oe(l){return"script[async]"+l}function ky(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+it(u.href)+'"]');if(a)return t.instance=a,_l(a),a;var e=q({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),_l(a),Hl(a,"style",e),Un(a,u.precedence,l),t.instance=a;case"stylesheet":e=Ta(u.href);var n=l.querySelector(de(e));if(n)return t.state.loading|=4,t.instance=n,_l(n),n;a=Fy(u),(e=gt.get(e))&&Fc(a,e),n=(l.ownerDocument||l).createElement("link"),_l(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Hl(n,"link",a),t.state.loading|=4,Un(n,u.precedence,l),t.instance=n;case"script":return n=Aa(u.src),(e=l.querySelector(oe(n)))?(t.instance=e,_l(e),e):(a=u,(e=gt.get(n))&&(a=q({},u),kc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),_l(e),Hl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(o(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Un(a,u.precedence,l));return t.instance}function Un(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var pn=null;function Iy(l,t,u){if(pn===null){var a=new Map,e=pn=new Map;e.set(u,a)}else e=pn,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Ha]||n[Ml]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Py(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Xd(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function lv(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qd(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Ta(a.href),n=t.querySelector(de(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Hn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,_l(n);return}n=t.ownerDocument||t,a=Fy(a),(e=gt.get(e))&&Fc(a,e),n=n.createElement("link"),_l(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Hl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Hn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function Zd(l,t){return l.stylesheets&&l.count===0&&Rn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*Ed());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Hn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Rn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Nn=null;function Rn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Nn=new Map,t.forEach(xd,l),Nn=null,Hn.call(l))}function xd(l,t){if(!(t.state.loading&4)){var u=Nn.get(l);if(u)var a=u.get(null);else{u=new Map,Nn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Hn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var he={$$typeof:Nl,Provider:null,Consumer:null,_currentValue:C,_currentValue2:C,_threadCount:0};function Vd(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function tv(l,t,u,a,e,n,f,c,i,d,S,z){return l=new Vd(l,t,u,f,i,d,S,z,c),t=1,n===!0&&(t|=24),n=lt(3,null,null,t),l.current=n,n.stateNode=l,t=Nf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},Bf(n),l}function uv(l){return l?(l=la,l):la}function av(l,t,u,a,e,n){e=uv(e),a.context===null?a.context=e:a.pendingContext=e,a=au(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=eu(l,a,t),u!==null&&(wl(u,l,t),wa(u,l,t))}function ev(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){ev(l,t),(l=l.alternate)&&ev(l,t)}function nv(l){if(l.tag===13||l.tag===31){var t=Du(l,67108864);t!==null&&wl(t,l,67108864),Pc(l,67108864)}}function fv(l){if(l.tag===13||l.tag===31){var t=nt();t=wn(t);var u=Du(l,t);u!==null&&wl(u,l,t),Pc(l,t)}}var qn=!0;function Ld(l,t,u,a){var e=b.T;b.T=null;var n=_.p;try{_.p=2,li(l,t,u,a)}finally{_.p=n,b.T=e}}function Kd(l,t,u,a){var e=b.T;b.T=null;var n=_.p;try{_.p=8,li(l,t,u,a)}finally{_.p=n,b.T=e}}function li(l,t,u,a){if(qn){var e=ti(a);if(e===null)Qc(l,t,a,Cn,u),iv(l,a);else if(wd(e,l,t,u,a))a.stopPropagation();else if(iv(l,a),t&4&&-1<Jd.indexOf(l)){for(;e!==null;){var n=Vu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Tu(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Il(f);c.entanglements[1]|=i,f&=~i}Dt(n),(k&6)===0&&(gn=Fl()+500,se(0))}}break;case 31:case 13:c=Du(n,2),c!==null&&wl(c,n,2),bn(),Pc(n,2)}if(n=ti(a),n===null&&Qc(l,t,a,Cn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Qc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var Cn=null;function ui(l){if(Cn=null,l=xu(l),l!==null){var t=Z(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=fl(t),l!==null)return l;l=null}else if(u===31){if(l=Tl(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return Cn=l,null}function cv(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Nv()){case hi:return 2;case gi:return 8;case Te:case Rv:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,hu=null,gu=null,Su=null,ge=new Map,Se=new Map,bu=[],Jd="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function iv(l,t){switch(l){case"focusin":case"focusout":hu=null;break;case"dragenter":case"dragleave":gu=null;break;case"mouseover":case"mouseout":Su=null;break;case"pointerover":case"pointerout":ge.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Se.delete(t.pointerId)}}function be(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Vu(t),t!==null&&nv(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function wd(l,t,u,a,e){switch(t){case"focusin":return hu=be(hu,l,t,u,a,e),!0;case"dragenter":return gu=be(gu,l,t,u,a,e),!0;case"mouseover":return Su=be(Su,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ge.set(n,be(ge.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,Se.set(n,be(Se.get(n)||null,l,t,u,a,e)),!0}return!1}function sv(l){var t=xu(l.target);if(t!==null){var u=Z(t);if(u!==null){if(t=u.tag,t===13){if(t=fl(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fv(u)});return}}else if(t===31){if(t=Tl(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fv(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Vu(u),t!==null&&nv(t),l.blockedOn=u,!1;t.shift()}return!0}function yv(l,t,u){Bn(l)&&u.delete(t)}function Wd(){ai=!1,hu!==null&&Bn(hu)&&(hu=null),gu!==null&&Bn(gu)&&(gu=null),Su!==null&&Bn(Su)&&(Su=null),ge.forEach(yv),Se.forEach(yv)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,A.unstable_scheduleCallback(A.unstable_NormalPriority,Wd)))}var jn=null;function vv(l){jn!==l&&(jn=l,A.unstable_scheduleCallback(A.unstable_NormalPriority,function(){jn===l&&(jn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Vu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function _a(l){function t(i){return Yn(i,l)}hu!==null&&Yn(hu,l),gu!==null&&Yn(gu,l),Su!==null&&Yn(Su,l),ge.forEach(t),Se.forEach(t);for(var u=0;u<bu.length;u++){var a=bu[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<bu.length&&(u=bu[0],u.blockedOn===null);)sv(u),u.blockedOn===null&&bu.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[Zl]||null;if(typeof n=="function")f||vv(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Zl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),vv(u)}}}function mv(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}Gn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(o(409));var u=t.current,a=nt();av(u,a,l,t,null,null)},Gn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;av(l.current,2,null,l,null,null),bn(),t[Zu]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ti();l={blockedOn:null,target:l,priority:t};for(var u=0;u<bu.length&&t!==0&&t<bu[u].priority;u++);bu.splice(u,0,l),u===0&&sv(l)}};var dv=Q.version;if(dv!=="19.2.4")throw Error(o(527,dv,"19.2.4"));_.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(o(188)):(l=Object.keys(l).join(","),Error(o(268,l)));return l=T(t),l=l!==null?I(l):null,l=l===null?null:l.stateNode,l};var $d={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:b,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Da=Xn.inject($d),kl=Xn}catch{}}return ze.createRoot=function(l,t){if(!M(l))throw Error(o(299));var u=!1,a="",e=zs,n=Es,f=Ts;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=tv(l,1,!1,null,null,u,a,null,e,n,f,mv),l[Zu]=t.current,Xc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!M(l))throw Error(o(299));var a=!1,e="",n=zs,f=Es,c=Ts,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=tv(l,1,!0,t,u??null,a,e,i,n,f,c,mv),t.context=uv(null),u=t.current,a=nt(),a=wn(a),e=au(a),e.callback=null,eu(u,e,a),u=a,t.current.lanes=u,pa(t,u),Dt(t),l[Zu]=t.current,Xc(l),new Gn(t)},ze.version="19.2.4",ze}var Av;function n1(){if(Av)return fi.exports;Av=1;function A(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(A)}catch(Q){console.error(Q)}}return A(),fi.exports=e1(),fi.exports}var f1=n1(),_v=mi();((R, J, D) => {
+const __m0 = (() => {
+/**
+ * MCP Apps Extension (SEP-1865) communication utilities.
+ *
+ * Handles the JSON-RPC 2.0 handshake and notification protocol
+ * between the widget (View) and the VS Code host.
+ */ let nextRequestId = 1;
+const pendingRequests = new Map();
+/** Send a JSON-RPC request and wait for the host's response. */ function sendRequest(method, params) {
+  const id = nextRequestId++;
+  const request = {
+    jsonrpc: "2.0",
+    id,
+    method,
+    params: params ?? {}
+  };
+  return new Promise((resolve, reject)=>{
+    pendingRequests.set(id, {
+      resolve: resolve,
+      reject
+    });
+    window.parent.postMessage(request, "*");
+  });
+}
+/** Send a JSON-RPC notification (fire-and-forget). */ function sendNotification(method, params) {
+  window.parent.postMessage({
+    jsonrpc: "2.0",
+    method,
+    params: params ?? {}
+  }, "*");
+}
+/**
+ * Call a tool on this widget's MCP server through the host (tools/call).
+ * Resolves to the tool's structuredContent, or null when it returned none.
+ */ async function callServerTool(name, args) {
+  const result = await sendRequest("tools/call", {
+    name,
+    arguments: args
+  });
+  if (result.isError) {
+    throw new Error(result.content?.[0]?.text ?? `${name} failed`);
+  }
+  return result.structuredContent ?? null;
+}
+/**
+ * Run the SEP-1865 lifecycle:
+ *  1. ui/initialize  →  receive McpUiInitializeResult
+ *  2. ui/notifications/initialized
+ *  3. listen for tool-input / tool-result / host-context-changed
+ *
+ * Returns a cleanup function to remove the message listener.
+ */ function initMcpApp(opts) {
+  let hostContext = null;
+  // ---- message listener -----------------------------------------------
+  const handler = (event)=>{
+    const msg = event.data;
+    if (!msg || msg.jsonrpc !== "2.0") return;
+    // Response to one of our requests
+    if (msg.id !== undefined && (msg.result !== undefined || msg.error)) {
+      const pending = pendingRequests.get(msg.id);
+      if (pending) {
+        pendingRequests.delete(msg.id);
+        if (msg.error) {
+          pending.reject(new Error(msg.error.message ?? "Unknown error"));
+        } else {
+          pending.resolve(msg.result);
+        }
+      }
+      return;
+    }
+    // Notifications from host
+    if (msg.method) {
+      switch(msg.method){
+        case "ui/notifications/tool-input":
+          if (msg.params?.arguments) {
+          // Tool arguments — some servers pass data here too
+          }
+          break;
+        case "ui/notifications/tool-result":
+          if (msg.params?.structuredContent) {
+            opts.onData(msg.params.structuredContent);
+          }
+          break;
+        case "ui/notifications/tool-input-partial":
+          break;
+        case "ui/notifications/host-context-changed":
+          if (msg.params) {
+            hostContext = {
+              ...hostContext,
+              ...msg.params
+            };
+            applyHostContext(hostContext);
+          }
+          break;
+        case "ui/resource-teardown":
+          break;
+      }
+    }
+  };
+  window.addEventListener("message", handler);
+  // ---- initialize handshake -------------------------------------------
+  (async ()=>{
+    try {
+      const result = await sendRequest("ui/initialize", {
+        protocolVersion: "2025-06-18",
+        capabilities: {},
+        clientInfo: {
+          name: opts.name,
+          version: "1.0.0"
+        }
+      });
+      hostContext = result.hostContext ?? null;
+      if (hostContext) applyHostContext(hostContext);
+      sendNotification("ui/notifications/initialized");
+    } catch  {
+      // Host may not support MCP Apps — widget still works in standalone mode
+      console.warn("MCP Apps init failed — running standalone");
+    }
+  })();
+  return ()=>window.removeEventListener("message", handler);
+}
+// ---- theme tokens -----------------------------------------------------
+const LIGHT_TOKENS = {
+  "--sw-fg": "#1a1a1a",
+  "--sw-fg-muted": "#666",
+  "--sw-fg-faint": "#888",
+  "--sw-bg": "#ffffff",
+  "--sw-bg-surface": "#f5f5f5",
+  "--sw-bg-card": "#fafafa",
+  "--sw-border": "#e5e5e5",
+  "--sw-row-border": "#eee",
+  "--sw-header-border": "#ddd",
+  "--sw-progress-bg": "#e5e5e5"
+};
+const DARK_TOKENS = {
+  "--sw-fg": "#e0e0e0",
+  "--sw-fg-muted": "#a0a0a0",
+  "--sw-fg-faint": "#888",
+  "--sw-bg": "#1e1e1e",
+  "--sw-bg-surface": "#2a2a2a",
+  "--sw-bg-card": "#252525",
+  "--sw-border": "#404040",
+  "--sw-row-border": "#333",
+  "--sw-header-border": "#444",
+  "--sw-progress-bg": "#333"
+};
+function applyThemeTokens(theme) {
+  const tokens = theme === "dark" ? DARK_TOKENS : LIGHT_TOKENS;
+  const root = document.documentElement;
+  for (const [key, value] of Object.entries(tokens)){
+    root.style.setProperty(key, value);
+  }
+}
+/** Inject fallback tokens based on prefers-color-scheme before host context arrives. */ function injectFallbackTheme() {
+  const prefersDark = window.matchMedia("(prefers-color-scheme: dark)").matches;
+  applyThemeTokens(prefersDark ? "dark" : "light");
+}
+// Apply fallback immediately so widgets have theme tokens on first render
+injectFallbackTheme();
+/** Apply host theme CSS variables. */ function applyHostContext(ctx) {
+  if (ctx.theme) {
+    document.documentElement.style.colorScheme = ctx.theme;
+    applyThemeTokens(ctx.theme);
+  }
+  if (ctx.styles?.variables) {
+    const root = document.documentElement;
+    for (const [key, value] of Object.entries(ctx.styles.variables)){
+      if (value) root.style.setProperty(key, value);
+    }
+  }
+  if (ctx.styles?.css?.fonts) {
+    const style = document.createElement("style");
+    style.textContent = ctx.styles.css.fonts;
+    document.head.appendChild(style);
+  }
+}
+
+return { sendRequest, sendNotification, callServerTool, initMcpApp };
+})();
+const __m1 = (() => {
+const { jsx: _jsx, jsxs: _jsxs } = J;
+const { useState, useEffect } = R;
+const { initMcpApp } = __m0;
+function App() {
+  const [data, setData] = useState(null);
+  useEffect(()=>{
+    return initMcpApp({
+      name: "swarmia-docs-diagnostic",
+      onData: (d)=>setData(d)
+    });
+  }, []);
+  if (!data) {
+    return /*#__PURE__*/ _jsxs("div", {
+      style: styles.container,
+      children: [
+        /*#__PURE__*/ _jsx("h3", {
+          style: styles.heading,
+          children: "Swarmia Docs Diagnostic"
+        }),
+        /*#__PURE__*/ _jsx("p", {
+          style: {
+            color: "var(--sw-fg-faint)"
+          },
+          children: "Waiting for data from tool..."
+        })
+      ]
+    });
+  }
+  const statusColors = {
+    green: "#22c55e",
+    yellow: "#f59e0b",
+    red: "#ef4444"
+  };
+  return /*#__PURE__*/ _jsxs("div", {
+    style: styles.container,
+    children: [
+      /*#__PURE__*/ _jsx("h3", {
+        style: styles.heading,
+        children: "Swarmia Docs Diagnostic"
+      }),
+      /*#__PURE__*/ _jsxs("div", {
+        style: {
+          marginBottom: 12
+        },
+        children: [
+          /*#__PURE__*/ _jsx("div", {
+            style: {
+              fontWeight: 600
+            },
+            children: data.query
+          }),
+          /*#__PURE__*/ _jsx("a", {
+            href: "https://help.swarmia.com/",
+            target: "_blank",
+            rel: "noopener noreferrer",
+            style: {
+              fontSize: 13,
+              color: "#3b82f6"
+            },
+            children: "help.swarmia.com"
+          })
+        ]
+      }),
+      data.integrations.length > 0 && /*#__PURE__*/ _jsxs("div", {
+        children: [
+          /*#__PURE__*/ _jsx("h4", {
+            style: {
+              margin: "0 0 4px",
+              fontSize: 13
+            },
+            children: "Integration Status"
+          }),
+          data.integrations.map((integ)=>/*#__PURE__*/ _jsxs("div", {
+              style: styles.statusLine,
+              children: [
+                /*#__PURE__*/ _jsx("span", {
+                  style: {
+                    ...styles.dot,
+                    background: statusColors[integ.status]
+                  }
+                }),
+                /*#__PURE__*/ _jsx("strong", {
+                  style: {
+                    fontSize: 13
+                  },
+                  children: integ.name
+                }),
+                /*#__PURE__*/ _jsx("span", {
+                  style: {
+                    fontSize: 12,
+                    color: "var(--sw-fg-muted)"
+                  },
+                  children: integ.detail
+                })
+              ]
+            }, integ.name))
+        ]
+      })
+    ]
+  });
+}
+const styles = {
+  container: {
+    padding: 16,
+    fontFamily: "system-ui, -apple-system, sans-serif",
+    maxWidth: 640,
+    color: "var(--sw-fg)"
+  },
+  heading: {
+    margin: "0 0 8px",
+    fontSize: 16
+  },
+  statusLine: {
+    display: "flex",
+    alignItems: "center",
+    gap: 8,
+    padding: "3px 0"
+  },
+  dot: {
+    width: 8,
+    height: 8,
+    borderRadius: "50%",
+    display: "inline-block",
+    flexShrink: 0
+  }
+};
+
+return { App };
+})();
+const __m2 = (() => {
+const { jsx: _jsx } = J;
+const { createRoot } = D;
+const { App } = __m1;
+const root = document.getElementById("docs-diagnostic-root");
+if (root) {
+  createRoot(root).render(/*#__PURE__*/ _jsx(App, {}));
+}
+
+return {  };
+})();
+})(_v, ql, f1);
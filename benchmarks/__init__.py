@@ -0,0 +1 @@
+"""Benchmark harness for the Swarmia MCP server (run: python -m benchmarks.run)."""
@@ -0,0 +1,130 @@
+"""
+Cold-start budget check; exits non-zero when start-up regresses.
+
+Two measurements, each the median of --runs fresh interpreters:
+
+- own import time: `python -X importtime` self-times of every module that
+  `import swarmia_mcp.server` loads on top of fastmcp (the framework itself is
+  a fixed cost this repo does not control)
+- time to the first `initialize` response over stdio
+
+Modules that must stay lazy (httpx, SQLite, git, docs, widgets, dotenv) are
+also checked: importing the server must not load them.
+
+Run: python -m benchmarks.import_budget --budget-ms 30 --initialize-budget-ms 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+LAZY_MODULES = (
+    "swarmia_mcp.issues",
+    "swarmia_mcp.keys",
+    "swarmia_mcp.linear",
+    "swarmia_mcp.jira",
+    "swarmia_mcp.github_issues",
+    "swarmia_mcp.cache",
+    "swarmia_mcp.git_backend",
+    "swarmia_mcp.docs_index",
+    "swarmia_mcp.docs_store",
+    "swarmia_mcp.widgets",
+    "swarmia_mcp.audit",
+    "swarmia_mcp.branches",
+    "swarmia_mcp.backfill",
+    "swarmia_mcp.ci_scan",
+    "swarmia_mcp.services",
+    "swarmia_mcp.memo",
+    "sqlite3",
+    "dotenv",
+)
+_PROBE = (
+    "import json, sys, fastmcp; before = set(sys.modules); import swarmia_mcp.server; "
+    "print(json.dumps(sorted(set(sys.modules) - before)))"
+)
+
+
+def _env() -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.getenv("PYTHONPATH")])),
+        "PYTHONWARNINGS": "ignore",
+    }
+
+
+def own_import_ms() -> tuple[float, list[str]]:
+    """(ms spent importing what the server adds on top of fastmcp, modules it added)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        capture_output=True, text=True, env=_env(), cwd=tempfile.gettempdir(), check=True,
+    )
+    added = set(json.loads(proc.stdout.strip().splitlines()[-1]))
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _cumulative, name = (part.strip() for part in line[12:].split("|"))
+        if name in added and self_us.isdigit():
+            total_us += int(self_us)
+    return total_us / 1000, sorted(added)
+
+
+def initialize_ms() -> float:
+    """Spawn `python -m swarmia_mcp`; ms until its first initialize response."""
+    from benchmarks.run import StdioServer
+
+    with tempfile.TemporaryDirectory() as workdir:
+        server = StdioServer(Path(workdir), _env(), Path(workdir) / "server.log")
+        try:
+            return server.initialize() * 1000
+        finally:
+            server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=30.0, help="own import time budget (median)")
+    parser.add_argument("--initialize-budget-ms", type=float, default=0.0,
+                        help="time-to-initialize budget (median); 0 only reports it")
+    args = parser.parse_args()
+
+    own = []
+    added: list[str] = []
+    for _ in range(args.runs):
+        ms, added = own_import_ms()
+        own.append(ms)
+    startup = [initialize_ms() for _ in range(args.runs)]
+    eager = [name for name in LAZY_MODULES if name in added]
+
+    result = {
+        "own_import_ms": round(statistics.median(own), 2),
+        "initialize_ms": round(statistics.median(startup), 1),
+        "eagerly_imported": eager,
+        "budget_ms": args.budget_ms,
+        "initialize_budget_ms": args.initialize_budget_ms or None,
+    }
+    print(json.dumps(result, indent=2))
+
+    failures = []
+    if eager:
+        failures.append(f"imported at start-up but should be lazy: {', '.join(eager)}")
+    if result["own_import_ms"] > args.budget_ms:
+        failures.append(f"own import time {result['own_import_ms']} ms > budget {args.budget_ms} ms")
+    if args.initialize_budget_ms and result["initialize_ms"] > args.initialize_budget_ms:
+        failures.append(f"time to initialize {result['initialize_ms']} ms > budget {args.initialize_budget_ms} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
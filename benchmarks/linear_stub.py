@@ -0,0 +1,221 @@
+"""
+Local stand-in for Linear's GraphQL API.
+
+Answers the shapes the server sends: `viewer { id }`, `teams { nodes { key } }`,
+`issues(filter: {or: [{team: {key: {eq}}, number: {eq}}]})` and the mirror's
+paged `issues(filter: {team, updatedAt: {gt}}, after)`. Whether an issue exists,
+its state, assignee and updatedAt are derived from a hash of the identifier,
+so answers are stable across runs. Latency and a fixed-window request limit
+are configurable; over the limit it replies like Linear does (HTTP 400,
+RATELIMITED error code, X-RateLimit-* headers).
+
+Run standalone: python -m benchmarks.linear_stub --port 8765 --latency-ms 80
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VIEWER_ID = "viewer-bench"
+TEAM_KEYS = ("ENG", "OPS", "WEB", "DATA", "MOBILE")  # as in synthetic_repo
+STATES = ("Todo", "In Progress", "In Review", "Done", "Canceled")
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    latency_ms: float = 50.0
+    jitter_ms: float = 10.0
+    rate_limit: int = 0           # requests per window (0 = unlimited)
+    rate_window: float = 60.0
+    known_ratio: float = 0.9      # share of issue identifiers that exist
+    assigned_ratio: float = 0.5   # share of existing issues assigned to the viewer
+    issue_pool: int = 2_000       # issue numbers per team listed to the mirror (as in synthetic_repo)
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    rate_limited: int = 0
+    issues_requested: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def as_dict(self) -> dict:
+        return {"requests": self.requests, "rate_limited": self.rate_limited, "issues_requested": self.issues_requested}
+
+
+def _bucket(identifier: str, salt: str) -> float:
+    digest = hashlib.sha256(f"{salt}:{identifier}".encode()).digest()
+    return int.from_bytes(digest[:4], "big") / 2**32
+
+
+def issue_node(identifier: str, config: StubConfig) -> dict | None:
+    if _bucket(identifier, "known") >= config.known_ratio:
+        return None
+    assigned = _bucket(identifier, "assignee") < config.assigned_ratio
+    updated = 1_700_000_000 + int(_bucket(identifier, "updated") * 365 * 86400)
+    return {
+        "id": f"issue-{identifier}",
+        "identifier": identifier,
+        "title": f"Synthetic issue {identifier}",
+        "updatedAt": datetime.fromtimestamp(updated, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "state": {"name": STATES[int(_bucket(identifier, "state") * len(STATES))]},
+        "assignee": {"id": VIEWER_ID if assigned else "someone-else"},
+    }
+
+
+@lru_cache(maxsize=4)
+def all_issues(config: StubConfig) -> list[dict]:
+    """Every existing issue of every team, newest updatedAt first (the mirror's order)."""
+    nodes = [issue_node(f"{team}-{n}", config) for team in TEAM_KEYS for n in range(1, config.issue_pool + 1)]
+    return sorted((node for node in nodes if node), key=lambda node: node["updatedAt"], reverse=True)
+
+
+def mirror_page(variables: dict, config: StubConfig) -> dict:
+    issue_filter = variables.get("filter") or {}
+    teams = ((issue_filter.get("team") or {}).get("key") or {}).get("in")
+    after = (issue_filter.get("updatedAt") or {}).get("gt") or ""
+    matching = [
+        node for node in all_issues(config)
+        if node["updatedAt"] > after and (teams is None or node["identifier"].split("-")[0] in teams)
+    ]
+    start = int(variables.get("after") or 0)
+    end = start + int(variables.get("first") or 50)
+    return {
+        "nodes": matching[start:end],
+        "pageInfo": {"hasNextPage": end < len(matching), "endCursor": str(end)},
+    }
+
+
+class LinearStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: StubConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.stats = StubStats()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/graphql"
+
+    def take_token(self) -> tuple[bool, int, float]:
+        """Count a request against the window. Returns (allowed, remaining, reset_epoch)."""
+        with self.stats.lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.config.rate_window:
+                self._window_start, self._window_count = now, 0
+            self._window_count += 1
+            reset = time.time() + self.config.rate_window - (now - self._window_start)
+            if not self.config.rate_limit:
+                return True, 1_000_000, reset
+            remaining = max(0, self.config.rate_limit - self._window_count)
+            return self._window_count <= self.config.rate_limit, remaining, reset
+
+    def start(self) -> LinearStub:
+        threading.Thread(target=self.serve_forever, name="linear-stub", daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: LinearStub
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _reply(self, status: int, body: dict, headers: dict[str, str]) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        config = self.server.config
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+        time.sleep(max(0.0, delay) / 1000)
+
+        allowed, remaining, reset = self.server.take_token()
+        headers = {
+            "X-RateLimit-Requests-Limit": str(config.rate_limit or 1_000_000),
+            "X-RateLimit-Requests-Remaining": str(remaining),
+            "X-RateLimit-Requests-Reset": str(int(reset * 1000)),
+        }
+        with self.server.stats.lock:
+            self.server.stats.requests += 1
+            self.server.stats.rate_limited += not allowed
+        if not allowed:
+            self._reply(400, {"errors": [{
+                "message": "Rate limit exceeded",
+                "extensions": {"code": "RATELIMITED"},
+            }]}, headers)
+            return
+        if not self.headers.get("Authorization"):
+            self._reply(401, {"errors": [{"message": "Authentication required"}]}, headers)
+            return
+
+        query = request.get("query", "")
+        data: dict = {}
+        if "viewer" in query:
+            data["viewer"] = {"id": VIEWER_ID}
+        if "teams" in query:
+            data["teams"] = {"nodes": [{"key": key} for key in TEAM_KEYS]}
+        if "pageInfo" in query:
+            data["issues"] = mirror_page(request.get("variables") or {}, config)
+        elif "issues" in query:
+            clauses = ((request.get("variables") or {}).get("filter") or {}).get("or") or []
+            identifiers = [f"{c['team']['key']['eq']}-{c['number']['eq']}" for c in clauses]
+            with self.server.stats.lock:
+                self.server.stats.issues_requested += len(identifiers)
+            nodes = [node for node in (issue_node(i, config) for i in identifiers) if node]
+            data["issues"] = {"nodes": nodes}
+        self._reply(200, {"data": data}, headers)
+
+
+def serve(config: StubConfig, host: str = "127.0.0.1", port: int = 0) -> LinearStub:
+    """Start the stub on a background thread (port 0 picks a free port)."""
+    return LinearStub((host, port), config).start()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = StubConfig()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--rate-limit", type=int, default=defaults.rate_limit)
+    parser.add_argument("--rate-window", type=float, default=defaults.rate_window)
+    parser.add_argument("--known-ratio", type=float, default=defaults.known_ratio)
+    args = parser.parse_args()
+    stub = LinearStub((args.host, args.port), StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        known_ratio=args.known_ratio,
+    ))
+    print(f"Linear stub listening on {stub.url}")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
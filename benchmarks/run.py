@@ -0,0 +1,326 @@
+"""
+End-to-end benchmarks over the real MCP stdio protocol.
+
+For each repository size a synthetic repo is generated (or reused), a local
+Linear stub is started, and `python -m swarmia_mcp` from this checkout is
+spawned with a fresh cache directory. Every scenario is called once cold and
+then --iterations times warm; latency is measured at the client, memory is
+the server's RSS (Linux /proc). Results, the stub's request counts and the
+server's own metrics://swarmia spans are written as JSON.
+
+Run: python -m benchmarks.run --sizes 1000,10000 --output bench.json
+     python -m benchmarks.run --sizes 1000 --baseline bench.json   # compare
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import queue
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from benchmarks.linear_stub import StubConfig, serve
+from benchmarks.synthetic_repo import RepoSpec, generate
+from benchmarks.webhook_stub import WebhookConfig
+from benchmarks.webhook_stub import serve as serve_webhook
+
+ROOT = Path(__file__).resolve().parent.parent
+PROTOCOL_VERSION = "2025-06-18"
+REQUEST_TIMEOUT = 600
+
+
+class StdioServer:
+    """Minimal JSON-RPC client for one server process (newline-delimited messages)."""
+
+    def __init__(self, cwd: Path, env: dict[str, str], log_path: Path):
+        self.cwd = cwd
+        self._log = open(log_path, "ab")
+        self.spawned_at = time.perf_counter()
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "swarmia_mcp"],
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._log,
+        )
+        self._next_id = 0
+        self._write_lock = threading.Lock()
+        self._responses: queue.Queue[dict] = queue.Queue()
+        threading.Thread(target=self._read, name="bench-reader", daemon=True).start()
+
+    def _send(self, message: dict) -> None:
+        assert self.proc.stdin is not None
+        with self._write_lock:
+            self.proc.stdin.write(json.dumps(message).encode() + b"\n")
+            self.proc.stdin.flush()
+
+    def _read(self) -> None:
+        assert self.proc.stdout is not None
+        for line in self.proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if "method" in message and "id" in message:
+                self._answer(message)
+            elif "id" in message:
+                self._responses.put(message)
+
+    def _answer(self, request: dict) -> None:
+        """Reply to server-initiated requests (roots/list from the audit tool, ping)."""
+        if request["method"] == "roots/list":
+            result: dict = {"roots": [{"uri": self.cwd.as_uri(), "name": self.cwd.name}]}
+        else:
+            result = {}
+        self._send({"jsonrpc": "2.0", "id": request["id"], "result": result})
+
+    def request(self, method: str, params: dict | None = None) -> tuple[dict, float]:
+        """Send a request and wait for its response. Returns (message, seconds)."""
+        self._next_id += 1
+        request_id = self._next_id
+        start = time.perf_counter()
+        self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        while True:
+            message = self._responses.get(timeout=REQUEST_TIMEOUT)
+            if message.get("id") == request_id:
+                return message, time.perf_counter() - start
+
+    def initialize(self) -> float:
+        """Handshake; returns seconds from process spawn to the initialize response."""
+        self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {"roots": {"listChanged": False}},
+            "clientInfo": {"name": "swarmia-bench", "version": "0"},
+        })
+        elapsed = time.perf_counter() - self.spawned_at
+        self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return elapsed
+
+    def memory(self) -> dict[str, float] | None:
+        """Current and peak RSS in MiB, from /proc (None where unavailable)."""
+        try:
+            status = Path(f"/proc/{self.proc.pid}/status").read_text()
+        except OSError:
+            return None
+        fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+        try:
+            return {
+                "rss_mb": round(int(fields["VmRSS"].split()[0]) / 1024, 1),
+                "peak_rss_mb": round(int(fields["VmHWM"].split()[0]) / 1024, 1),
+            }
+        except (KeyError, ValueError):
+            return None
+
+    def close(self) -> None:
+        if self.proc.stdin:
+            self.proc.stdin.close()
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self._log.close()
+
+
+def _stats(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    return {
+        "n": len(ordered),
+        "min_ms": round(ordered[0] * 1000, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+def _scenarios(repo: Path) -> list[tuple[str, str, dict]]:
+    """(name, method, params) in run order; earlier scenarios warm later ones."""
+    return [
+        ("hygiene_10", "tools/call", {"name": "check_swarmia_commit_hygiene", "arguments": {"num_commits": 10}}),
+        ("hygiene_1000", "tools/call", {"name": "check_swarmia_commit_hygiene", "arguments": {"num_commits": 1000}}),
+        ("hygiene_1000_refresh", "tools/call", {
+            "name": "check_swarmia_commit_hygiene",
+            "arguments": {"num_commits": 1000, "refresh_linear": True},
+        }),
+        ("docs_query", "tools/call", {
+            "name": "query_swarmia_docs",
+            "arguments": {"query": "How do I set up deployment tracking with GitHub Actions?"},
+        }),
+        ("scaffold", "tools/call", {"name": "scaffold_swarmia_deployment", "arguments": {"app_name": "bench"}}),
+        # Walks the repository for services; warm calls are answered by the response memo
+        ("scaffold_discover", "tools/call", {"name": "scaffold_swarmia_deployment", "arguments": {}}),
+        ("audit_full_history", "tools/call", {
+            "name": "audit_swarmia_commit_history",
+            "arguments": {"repositories": [str(repo)]},
+        }),
+        ("widget_commit_hygiene", "resources/read", {"uri": "ui://swarmia/commit-hygiene.html"}),
+        ("backfill_dry_run", "tools/call", {
+            "name": "backfill_swarmia_deployments",
+            "arguments": {"revision_range": "HEAD", "repository_full_name": "bench/repo"},
+        }),
+        # Cold posts every deployment to the webhook stub; warm runs resume from the checkpoint
+        ("backfill_post", "tools/call", {
+            "name": "backfill_swarmia_deployments",
+            "arguments": {"revision_range": "HEAD", "repository_full_name": "bench/repo", "dry_run": False},
+        }),
+        # Cold mirrors every stub issue; warm runs fetch only what changed since (nothing)
+        ("issue_mirror_sync", "tools/call", {"name": "sync_swarmia_issue_mirror", "arguments": {}}),
+    ]
+
+
+def run_one(spec: RepoSpec, stub_config: StubConfig, iterations: int, workdir: Path) -> dict[str, Any]:
+    repo = generate(workdir / f"repo-{spec.commits}-{spec.seed}", spec)
+    stub = serve(stub_config)
+    webhook = serve_webhook(WebhookConfig())
+    cache_dir = Path(tempfile.mkdtemp(prefix="cache-", dir=workdir))
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.getenv("PYTHONPATH")])),
+        "LINEAR_API_KEY": "bench-key",
+        "SWARMIA_MCP_LINEAR_API_URL": stub.url,
+        "SWARMIA_MCP_CACHE_DIR": str(cache_dir),
+        "SWARMIA_MCP_DEPLOYMENTS_URL": webhook.url,
+        "SWARMIA_DEPLOYMENTS_AUTHORIZATION": "bench-token",
+    }
+    env.pop("SWARMIA_MCP_METRICS_FILE", None)
+
+    server = StdioServer(repo, env, workdir / "server.log")
+    result: dict[str, Any] = {"repo": asdict(spec), "scenarios": {}}
+    try:
+        result["startup_ms"] = round(server.initialize() * 1000, 3)
+        result["memory_after_startup"] = server.memory()
+        _, seconds = server.request("tools/list")
+        result["tools_list_ms"] = round(seconds * 1000, 3)
+
+        for name, method, params in _scenarios(repo):
+            stub_before = stub.stats.as_dict()
+            cold, cold_seconds = server.request(method, params)
+            warm: list[float] = []
+            errors = int(bool(cold.get("error") or (cold.get("result") or {}).get("isError")))
+            for _ in range(iterations):
+                message, seconds = server.request(method, params)
+                warm.append(seconds)
+                errors += bool(message.get("error") or (message.get("result") or {}).get("isError"))
+            stub_after = stub.stats.as_dict()
+            result["scenarios"][name] = {
+                "cold_ms": round(cold_seconds * 1000, 3),
+                "warm": _stats(warm),
+                "errors": errors,
+                "linear_requests": stub_after["requests"] - stub_before["requests"],
+                "memory": server.memory(),
+            }
+            print(f"  {name}: cold {cold_seconds * 1000:.1f} ms, warm p50 "
+                  f"{result['scenarios'][name]['warm'].get('p50_ms', 0):.1f} ms", file=sys.stderr)
+
+        metrics, _ = server.request("resources/read", {"uri": "metrics://swarmia"})
+        contents = (metrics.get("result") or {}).get("contents") or [{}]
+        result["server_spans"] = json.loads(contents[0].get("text") or "{}").get("spans", {})
+        result["memory_final"] = server.memory()
+    finally:
+        server.close()
+        stub.shutdown()
+        webhook.shutdown()
+    result["linear_stub"] = stub.stats.as_dict()
+    result["webhook_stub"] = webhook.stats.as_dict()
+    return result
+
+
+def _git_revision() -> dict[str, Any]:
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--", "swarmia_mcp"))}
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    """Human-readable warm p50 deltas per (size, scenario) present in both result files."""
+    old = {(r["repo"]["commits"], n): s for r in baseline["runs"] for n, s in r["scenarios"].items()}
+    lines = []
+    for run in current["runs"]:
+        for name, scenario in run["scenarios"].items():
+            before = old.get((run["repo"]["commits"], name))
+            if not before or not before["warm"] or not scenario["warm"]:
+                continue
+            a, b = before["warm"]["p50_ms"], scenario["warm"]["p50_ms"]
+            change = f"{(b - a) / a * 100:+.1f}%" if a else "n/a"
+            lines.append(f"{run['repo']['commits']:>7} {name:<24} {a:>10.2f} -> {b:>10.2f} ms  {change}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    repo_defaults = RepoSpec()
+    stub_defaults = StubConfig()
+    parser.add_argument("--sizes", default="1000,10000,50000", help="comma-separated commit counts (up to 200000)")
+    parser.add_argument("--key-density", type=float, default=repo_defaults.key_density)
+    parser.add_argument("--branch-name-length", type=int, default=repo_defaults.branch_name_length)
+    parser.add_argument("--merge-every", type=int, default=repo_defaults.merge_every)
+    parser.add_argument("--seed", type=int, default=repo_defaults.seed)
+    parser.add_argument("--latency-ms", type=float, default=stub_defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=stub_defaults.jitter_ms)
+    parser.add_argument("--rate-limit", type=int, default=stub_defaults.rate_limit,
+                        help="Linear stub requests per window (0 = unlimited)")
+    parser.add_argument("--rate-window", type=float, default=stub_defaults.rate_window)
+    parser.add_argument("--known-ratio", type=float, default=stub_defaults.known_ratio)
+    parser.add_argument("--iterations", type=int, default=5, help="warm calls per scenario")
+    parser.add_argument("--workdir", type=Path, default=Path(tempfile.gettempdir()) / "swarmia-mcp-bench",
+                        help="generated repos are kept here and reused across runs")
+    parser.add_argument("--output", type=Path, help="write JSON results here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="previous results file to compare warm p50 against")
+    args = parser.parse_args()
+
+    args.workdir.mkdir(parents=True, exist_ok=True)
+    stub_config = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        known_ratio=args.known_ratio,
+    )
+    runs = []
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        spec = RepoSpec(
+            commits=size,
+            key_density=args.key_density,
+            merge_every=args.merge_every,
+            branch_name_length=args.branch_name_length,
+            seed=args.seed,
+        )
+        print(f"{size} commits", file=sys.stderr)
+        runs.append(run_one(spec, stub_config, args.iterations, args.workdir.resolve()))
+
+    results = {
+        "meta": {
+            **_git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "linear_stub": asdict(stub_config),
+        },
+        "runs": runs,
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.baseline:
+        print("\n".join(compare(json.loads(args.baseline.read_text(encoding="utf-8")), results)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
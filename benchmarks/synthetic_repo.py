@@ -0,0 +1,135 @@
+"""
+Synthetic git repositories for benchmarks.
+
+History is written in one `git fast-import` stream, so even 200k commits take
+seconds. Generation is deterministic for a given set of parameters, and a
+finished repository is reused on the next run (a marker file records the
+parameters it was built with).
+
+Run standalone: python -m benchmarks.synthetic_repo /tmp/bench-repo --commits 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+TEAM_KEYS = ("ENG", "OPS", "WEB", "DATA", "MOBILE")
+# Look-alikes the key regex also matches; real histories are full of them
+NOISE = ("bump UTF-8 handling", "switch to SHA-256", "fix ISO-8601 parsing", "update COVID-19 banner")
+_MARKER = ".swarmia-bench.json"
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    commits: int = 10_000
+    key_density: float = 0.7      # share of commits whose subject carries an issue key
+    noise_density: float = 0.05   # share of commits with a false-positive key look-alike
+    issue_pool: int = 2_000       # distinct issue numbers per team (keys repeat across commits)
+    merge_every: int = 50         # every Nth commit is a merge of a one-commit side branch (0 = linear)
+    branch_name_length: int = 200
+    seed: int = 0
+
+    @property
+    def branch(self) -> str:
+        name = "ENG-1-" + "long-branch-name-" * (self.branch_name_length // 17 + 1)
+        return name[: max(8, self.branch_name_length)].rstrip("-")
+
+
+def _subject(rng: random.Random, spec: RepoSpec, index: int) -> str:
+    words = f"change {index} in module {rng.randrange(500)}"
+    if rng.random() < spec.noise_density:
+        words = f"{rng.choice(NOISE)} ({index})"
+    if rng.random() < spec.key_density:
+        key = f"{rng.choice(TEAM_KEYS)}-{rng.randrange(1, spec.issue_pool + 1)}"
+        return f"{key}: {words}" if rng.random() < 0.8 else f"{words} [{key}]"
+    return words
+
+
+def _commit(out: list[bytes], ref: str, mark: int, when: int, subject: str, parents: list[int], path: str) -> None:
+    message = subject.encode()
+    out.append(f"commit {ref}\nmark :{mark}\n".encode())
+    out.append(f"author Bench <bench@example.com> {when} +0000\n".encode())
+    out.append(f"committer Bench <bench@example.com> {when} +0000\n".encode())
+    out.append(f"data {len(message)}\n".encode() + message + b"\n")
+    if parents:
+        out.append(f"from :{parents[0]}\n".encode())
+    for parent in parents[1:]:
+        out.append(f"merge :{parent}\n".encode())
+    content = f"{mark}\n".encode()
+    out.append(f"M 100644 inline {path}\ndata {len(content)}\n".encode() + content + b"\n")
+
+
+def fast_import_stream(spec: RepoSpec) -> bytes:
+    """fast-import input producing spec.commits commits on spec.branch."""
+    rng = random.Random(spec.seed)
+    ref = f"refs/heads/{spec.branch}"
+    out: list[bytes] = []
+    when = 1_600_000_000
+    mark = 0
+    tip = 0
+    while mark < spec.commits:
+        when += rng.randrange(30, 3600)
+        if spec.merge_every and tip > 1 and (mark + 2) % spec.merge_every == 0 and mark + 2 <= spec.commits:
+            # Side commit branching off the tip's parent, merged back right away
+            mark += 1
+            side = mark
+            _commit(out, "refs/heads/side", side, when, _subject(rng, spec, mark), [tip - 1], f"side/{mark % 64}.txt")
+            mark += 1
+            _commit(out, ref, mark, when + 1, f"Merge branch 'side' ({mark})", [tip, side], "merges.txt")
+        else:
+            mark += 1
+            _commit(out, ref, mark, when, _subject(rng, spec, mark), [tip] if tip else [], f"src/{mark % 256}.txt")
+        tip = mark
+    return b"".join(out)
+
+
+def generate(path: Path, spec: RepoSpec) -> Path:
+    """Create (or reuse) a repository at path matching spec. Returns path."""
+    marker = path / ".git" / _MARKER
+    if marker.is_file() and json.loads(marker.read_text()) == asdict(spec):
+        return path
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+    git = ["git", "-c", "init.defaultBranch=main"]
+    subprocess.run([*git, "init", "-q", str(path)], check=True)
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input=fast_import_stream(spec), check=True)
+    subprocess.run(["git", "symbolic-ref", "HEAD", f"refs/heads/{spec.branch}"], cwd=path, check=True)
+    subprocess.run(["git", "branch", "-q", "-D", "side"], cwd=path, check=False)
+    subprocess.run(["git", "reset", "-q", "--hard"], cwd=path, check=True)
+    marker.write_text(json.dumps(asdict(spec)))
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path)
+    defaults = RepoSpec()
+    parser.add_argument("--commits", type=int, default=defaults.commits)
+    parser.add_argument("--key-density", type=float, default=defaults.key_density)
+    parser.add_argument("--noise-density", type=float, default=defaults.noise_density)
+    parser.add_argument("--issue-pool", type=int, default=defaults.issue_pool)
+    parser.add_argument("--merge-every", type=int, default=defaults.merge_every)
+    parser.add_argument("--branch-name-length", type=int, default=defaults.branch_name_length)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+    spec = RepoSpec(
+        commits=args.commits,
+        key_density=args.key_density,
+        noise_density=args.noise_density,
+        issue_pool=args.issue_pool,
+        merge_every=args.merge_every,
+        branch_name_length=args.branch_name_length,
+        seed=args.seed,
+    )
+    print(generate(args.path.resolve(), spec))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Local stand-in for Swarmia's Deployments API (POST /deployments).
+
+Validates the payload the templates and the backfill tool send, records every
+accepted deployment, and can inject latency, transient failures (HTTP 503) and
+a fixed-window rate limit (HTTP 429 with Retry-After), so retries and the
+backfill checkpoint can be exercised without touching Swarmia.
+
+Run standalone: python -m benchmarks.webhook_stub --port 8766 --failure-rate 0.1
+Then: SWARMIA_MCP_DEPLOYMENTS_URL=http://127.0.0.1:8766/deployments
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REQUIRED_FIELDS = ("version", "appName", "commitSha", "repositoryFullName")
+
+
+@dataclass
+class WebhookConfig:
+    latency_ms: float = 20.0
+    jitter_ms: float = 5.0
+    failure_rate: float = 0.0     # share of requests answered with HTTP 503
+    rate_limit: int = 0           # requests per window (0 = unlimited)
+    rate_window: float = 1.0
+
+
+@dataclass
+class WebhookStats:
+    requests: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    rejected: int = 0
+    deployments: dict[tuple[str, str, str], dict] = field(default_factory=dict, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+            "rejected": self.rejected,
+        }
+
+
+class WebhookStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: WebhookConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.stats = WebhookStats()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/deployments"
+
+    def take_token(self) -> bool:
+        with self.stats.lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.config.rate_window:
+                self._window_start, self._window_count = now, 0
+            self._window_count += 1
+            return not self.config.rate_limit or self._window_count <= self.config.rate_limit
+
+    def start(self) -> WebhookStub:
+        threading.Thread(target=self.serve_forever, name="webhook-stub", daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: WebhookStub
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoint
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _reply(self, status: int, body: dict, headers: dict[str, str] | None = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        config = self.server.config
+        stats = self.server.stats
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+        time.sleep(max(0.0, delay) / 1000)
+        with stats.lock:
+            stats.requests += 1
+
+        if not self.server.take_token():
+            with stats.lock:
+                stats.rate_limited += 1
+            self._reply(429, {"error": "Too many requests"}, {"Retry-After": str(config.rate_window)})
+            return
+        if random.random() < config.failure_rate:
+            with stats.lock:
+                stats.failed += 1
+            self._reply(503, {"error": "Service unavailable"})
+            return
+        try:
+            body = json.loads(raw or b"{}")
+        except ValueError:
+            body = None
+        missing = [name for name in REQUIRED_FIELDS if not isinstance(body, dict) or not body.get(name)]
+        if not self.headers.get("Authorization") or missing:
+            with stats.lock:
+                stats.rejected += 1
+            status = 401 if not self.headers.get("Authorization") else 400
+            self._reply(status, {"error": f"Missing {', '.join(missing) or 'Authorization'}"})
+            return
+
+        key = (body.get("environment", ""), body["version"], body["commitSha"])
+        with stats.lock:
+            stats.duplicates += key in stats.deployments
+            stats.accepted += 1
+            stats.deployments[key] = body
+        self._reply(200, {"ok": True})
+
+
+def serve(config: WebhookConfig, host: str = "127.0.0.1", port: int = 0) -> WebhookStub:
+    """Start the stub on a background thread (port 0 picks a free port)."""
+    return WebhookStub((host, port), config).start()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = WebhookConfig()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--failure-rate", type=float, default=defaults.failure_rate)
+    parser.add_argument("--rate-limit", type=int, default=defaults.rate_limit)
+    parser.add_argument("--rate-window", type=float, default=defaults.rate_window)
+    args = parser.parse_args()
+    stub = WebhookStub((args.host, args.port), WebhookConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+    ))
+    print(f"Deployments webhook stub listening on {stub.url}")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(stub.stats.as_dict()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import { initMcpApp } from "../lib/mcp-apps";
+import { callServerTool, initMcpApp } from "../lib/mcp-apps";
 
 interface Commit {
   sha: string;
@@ -7,19 +7,36 @@ interface Commit {
   ids: string[];
 }
 
-interface HygieneData {
+type IssueData = Record<
+  string,
+  {
+    title: string;
+    state: string;
+    assigned_to_you: boolean | null;
+    age_seconds?: number;
+    fresh?: boolean;
+  }
+>;
+
+interface HygienePage {
+  commits: Commit[];
+  linear_data: IssueData;
+  commit_count?: number;
+  next_cursor?: string | null;
+  linear_rate_limited?: string[];
+}
+
+interface HygieneData extends HygienePage {
   branch: string;
   branch_ids: string[];
-  commits: Commit[];
-  linear_data: Record<
-    string,
-    { title: string; state: string; assigned_to_you: boolean | null }
-  >;
+  with_keys?: number;
   summary: string;
 }
 
 export function App() {
   const [data, setData] = useState<HygieneData | null>(null);
+  const [loading, setLoading] = useState(false);
+  const [pageError, setPageError] = useState<string | null>(null);
 
   useEffect(() => {
     return initMcpApp({
@@ -37,8 +54,36 @@ export function App() {
     );
   }
 
-  const passCount = data.commits.filter((c) => c.ids.length > 0).length;
-  const total = data.commits.length;
+  // Totals cover the whole scan; only the loaded pages are in data.commits
+  const passCount = data.with_keys ?? data.commits.filter((c) => c.ids.length > 0).length;
+  const total = data.commit_count ?? data.commits.length;
+
+  const loadMore = async () => {
+    if (!data.next_cursor) return;
+    setLoading(true);
+    setPageError(null);
+    try {
+      const page = (await callServerTool("get_swarmia_commit_hygiene_page", {
+        cursor: data.next_cursor,
+      })) as HygienePage | null;
+      if (page) {
+        setData({
+          ...data,
+          commits: [...data.commits, ...page.commits],
+          linear_data: { ...data.linear_data, ...page.linear_data },
+          linear_rate_limited: [
+            ...(data.linear_rate_limited ?? []),
+            ...(page.linear_rate_limited ?? []),
+          ],
+          next_cursor: page.next_cursor,
+        });
+      }
+    } catch (e) {
+      setPageError((e as Error).message);
+    } finally {
+      setLoading(false);
+    }
+  };
 
   return (
     <div style={styles.container}>
@@ -104,6 +149,16 @@ export function App() {
           ))}
         </tbody>
       </table>
+      {data.next_cursor && (
+        <div style={{ marginTop: 8 }}>
+          <button style={styles.button} onClick={loadMore} disabled={loading}>
+            {loading ? "Loading..." : `Show more (${data.commits.length} of ${total})`}
+          </button>
+          {pageError && (
+            <small style={{ color: "#ef4444", marginLeft: 8 }}>{pageError}</small>
+          )}
+        </div>
+      )}
 
       {/* Linear verification */}
       {Object.keys(data.linear_data).length > 0 && (
@@ -118,14 +173,32 @@ export function App() {
               {info.assigned_to_you === false && (
                 <span style={{ color: "#f59e0b" }}> (not yours)</span>
               )}
+              {info.fresh === false && info.age_seconds !== undefined && (
+                <small style={{ color: "var(--sw-fg-faint)" }}>
+                  {" "}
+                  (cached {formatAge(info.age_seconds)} ago, refreshing)
+                </small>
+              )}
             </div>
           ))}
         </div>
       )}
+      {data.linear_rate_limited && data.linear_rate_limited.length > 0 && (
+        <div style={{ marginTop: 8, fontSize: 13, color: "#f59e0b" }}>
+          Linear rate limit reached, not checked yet: {data.linear_rate_limited.join(", ")}
+        </div>
+      )}
     </div>
   );
 }
 
+function formatAge(seconds: number): string {
+  if (seconds < 60) return `${seconds}s`;
+  if (seconds < 3600) return `${Math.round(seconds / 60)}m`;
+  if (seconds < 86400) return `${Math.round(seconds / 3600)}h`;
+  return `${Math.round(seconds / 86400)}d`;
+}
+
 const styles: Record<string, React.CSSProperties> = {
   container: {
     padding: 16,
@@ -152,4 +225,13 @@ const styles: Record<string, React.CSSProperties> = {
   headerRow: { borderBottom: "2px solid var(--sw-header-border)", textAlign: "left" as const },
   row: { borderBottom: "1px solid var(--sw-row-border)" },
   cell: { padding: "6px 8px" },
+  button: {
+    padding: "4px 12px",
+    fontSize: 13,
+    borderRadius: 4,
+    border: "1px solid var(--sw-header-border)",
+    background: "var(--sw-bg-surface)",
+    color: "var(--sw-fg)",
+    cursor: "pointer",
+  },
 };
@@ -39,6 +39,21 @@ export function sendNotification(method: string, params?: AnyRecord): void {
   );
 }
 
+/**
+ * Call a tool on this widget's MCP server through the host (tools/call).
+ * Resolves to the tool's structuredContent, or null when it returned none.
+ */
+export async function callServerTool(
+  name: string,
+  args: AnyRecord
+): Promise<AnyRecord | null> {
+  const result = await sendRequest("tools/call", { name, arguments: args });
+  if (result.isError) {
+    throw new Error(result.content?.[0]?.text ?? `${name} failed`);
+  }
+  return (result.structuredContent as AnyRecord) ?? null;
+}
+
 export interface HostContext {
   theme?: "light" | "dark";
   styles?: {
@@ -0,0 +1,190 @@
+"""
+Whole-history commit hygiene audit across one or more repositories.
+
+`git log` output is consumed line by line through a generator, so memory stays
+bounded no matter how long the history is. Repositories are audited in
+parallel on a thread pool (git does the heavy lifting in its own process).
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from swarmia_mcp.keys import Extractor
+
+AUDIT_TIMEOUT = 300
+MAX_AUDIT_WORKERS = 8
+# Subjects scanned per regex pass (one joined buffer per batch)
+SCAN_BATCH = 4096
+_FORMAT = "--format=%H%x00%aN%x00%ct%x00%s"
+
+
+@dataclass
+class Coverage:
+    total: int = 0
+    with_keys: int = 0
+
+    def add(self, has_key: bool) -> None:
+        self.total += 1
+        self.with_keys += has_key
+
+    def merge(self, other: Coverage) -> None:
+        self.total += other.total
+        self.with_keys += other.with_keys
+
+    def as_dict(self) -> dict:
+        percent = round(100 * self.with_keys / self.total, 1) if self.total else 0.0
+        return {"commits": self.total, "with_keys": self.with_keys, "percent": percent}
+
+
+@dataclass
+class RepoAudit:
+    repo: str
+    overall: Coverage = field(default_factory=Coverage)
+    by_author: dict[str, Coverage] = field(default_factory=dict)
+    by_month: dict[str, Coverage] = field(default_factory=dict)
+    error: str | None = None
+
+
+def stream_log(
+    root: Path,
+    revision_range: str = "HEAD",
+    since: str = "",
+    until: str = "",
+    cancel: threading.Event | None = None,
+) -> Iterator[tuple[str, str, int, str]]:
+    """Yield (sha, author, commit_time, subject) for every commit, streaming from git log."""
+    args = ["git", "log", _FORMAT, revision_range]
+    if since:
+        args.append(f"--since={since}")
+    if until:
+        args.append(f"--until={until}")
+    proc = subprocess.Popen(
+        [*args, "--"],
+        cwd=root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    deadline = time.monotonic() + AUDIT_TIMEOUT
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            if (cancel is not None and cancel.is_set()) or time.monotonic() > deadline:
+                raise RuntimeError("audit cancelled or timed out")
+            parts = line.rstrip("\n").split("\0")
+            if len(parts) == 4:
+                yield parts[0], parts[1], int(parts[2] or 0), parts[3]
+        if proc.wait() != 0:
+            raise RuntimeError((proc.stderr.read() if proc.stderr else "").strip() or "git log failed")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def audit_repo(
+    root: Path,
+    extractor: Extractor,
+    revision_range: str = "HEAD",
+    since: str = "",
+    until: str = "",
+    cancel: threading.Event | None = None,
+) -> RepoAudit:
+    result = RepoAudit(repo=str(root))
+    batch: list[tuple[str, int]] = []
+    subjects: list[str] = []
+
+    def flush() -> None:
+        for (author, committed_at), has_key in zip(batch, extractor.has_keys(subjects)):
+            month = time.strftime("%Y-%m", time.gmtime(committed_at))
+            result.overall.add(has_key)
+            result.by_author.setdefault(author, Coverage()).add(has_key)
+            result.by_month.setdefault(month, Coverage()).add(has_key)
+        batch.clear()
+        subjects.clear()
+
+    try:
+        for _sha, author, committed_at, subject in stream_log(root, revision_range, since, until, cancel):
+            batch.append((author, committed_at))
+            subjects.append(subject)
+            if len(subjects) >= SCAN_BATCH:
+                flush()
+        flush()
+    except (OSError, RuntimeError) as exc:
+        result.error = str(exc)
+    return result
+
+
+def discover_repos(roots: list[Path]) -> list[Path]:
+    """Git repositories at each root or directly below it (multi-repo folders)."""
+    found: dict[Path, None] = {}
+    for root in roots:
+        root = root.resolve()
+        if (root / ".git").exists():
+            found[root] = None
+            continue
+        try:
+            children = sorted(p for p in root.iterdir() if p.is_dir())
+        except OSError:
+            continue
+        for child in children:
+            if (child / ".git").exists():
+                found[child] = None
+    return list(found)
+
+
+def audit_repos(
+    repos: list[Path],
+    extractor: Extractor,
+    revision_range: str = "HEAD",
+    since: str = "",
+    until: str = "",
+    cancel: threading.Event | None = None,
+) -> list[RepoAudit]:
+    """Audit repositories in parallel (thread pool, bounded by MAX_AUDIT_WORKERS)."""
+    if not repos:
+        return []
+    workers = min(MAX_AUDIT_WORKERS, len(repos))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="swarmia-audit") as pool:
+        return list(pool.map(
+            lambda repo: audit_repo(repo, extractor, revision_range, since, until, cancel),
+            repos,
+        ))
+
+
+def summarize(audits: list[RepoAudit], max_authors: int = 100) -> dict:
+    """Aggregate per-repo audits into overall, per-repo, per-author and per-month coverage."""
+    overall = Coverage()
+    by_author: dict[str, Coverage] = {}
+    by_month: dict[str, Coverage] = {}
+    for audit in audits:
+        overall.merge(audit.overall)
+        for author, coverage in audit.by_author.items():
+            by_author.setdefault(author, Coverage()).merge(coverage)
+        for month, coverage in audit.by_month.items():
+            by_month.setdefault(month, Coverage()).merge(coverage)
+
+    authors = Counter({author: c.total for author, c in by_author.items()})
+    return {
+        "overall": overall.as_dict(),
+        "by_repo": [
+            {"repo": a.repo, **a.overall.as_dict(), **({"error": a.error} if a.error else {})}
+            for a in audits
+        ],
+        "by_author": [
+            {"author": author, **by_author[author].as_dict()}
+            for author, _ in authors.most_common(max_authors)
+        ],
+        "by_month": [{"month": month, **by_month[month].as_dict()} for month in sorted(by_month)],
+    }
@@ -0,0 +1,198 @@
+"""
+Historical deployment backfill for Swarmia's Deployments API.
+
+Deployments are derived from git (tags, or first-parent commits of a release
+branch range) and sent with the same payload the scaffolded CI templates send,
+plus `deployedAt`. Requests go through one keep-alive client with bounded
+concurrency; 429s, 5xx and connection errors are retried with jittered
+exponential backoff. A checkpoint file records every accepted deployment, so
+an interrupted backfill resumes where it stopped and never posts twice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import random
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from swarmia_mcp import metrics
+from swarmia_mcp.cache import fingerprint, user_cache_dir
+
+DEFAULT_URL = "https://hook.swarmia.com/deployments"
+MAX_CONCURRENCY = 8
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 10.0
+
+# git for-each-ref / git log formats, NUL-separated
+TAG_FORMAT = "%(refname:short)%00%(objectname)%00%(*objectname)%00%(creatordate:iso-strict)"
+RANGE_FORMAT = "%H%x00%cI"
+
+_REMOTE = re.compile(r"[:/]([^/:]+/[^/]+?)(?:\.git)?/?$")
+
+
+def api_url() -> str:
+    """Deployments endpoint (SWARMIA_MCP_DEPLOYMENTS_URL overrides it, e.g. for a local stub)."""
+    return os.getenv("SWARMIA_MCP_DEPLOYMENTS_URL", DEFAULT_URL)
+
+
+def authorization() -> str | None:
+    """Same secret the CI templates use."""
+    return os.getenv("SWARMIA_DEPLOYMENTS_AUTHORIZATION")
+
+
+def repository_full_name(remote_url: str) -> str | None:
+    """Repository owner/name from an origin URL (git@host:owner/name.git, https://host/owner/name)."""
+    match = _REMOTE.search(remote_url.strip())
+    return match.group(1) if match else None
+
+
+def parse_tags(output: str) -> list[dict]:
+    """Deployments from `git for-each-ref --format=TAG_FORMAT` (annotated tags peeled to their commit)."""
+    deployments = []
+    for line in output.splitlines():
+        parts = line.split("\0")
+        if len(parts) != 4 or not parts[3]:
+            continue
+        name, target, peeled, created = parts
+        deployments.append({"version": name, "commitSha": peeled or target, "deployedAt": created})
+    return deployments
+
+
+def parse_range(output: str) -> list[dict]:
+    """Deployments from `git log --first-parent --format=RANGE_FORMAT` (one per commit)."""
+    deployments = []
+    for line in output.splitlines():
+        sha, _, committed = line.partition("\0")
+        if sha and committed:
+            deployments.append({"version": sha, "commitSha": sha, "deployedAt": committed})
+    return deployments
+
+
+def is_iso_date(value: str) -> bool:
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _utc(value: str) -> datetime:
+    """Parse an ISO timestamp as an aware UTC datetime; one without an offset is taken as UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def select(deployments: list[dict], since: str = "", limit: int = 0) -> list[dict]:
+    """Oldest first, optionally only those at or after `since` (ISO date) and the newest `limit`."""
+    ordered = sorted(deployments, key=lambda d: _utc(d["deployedAt"]))
+    if since:
+        cutoff = _utc(since)
+        ordered = [d for d in ordered if _utc(d["deployedAt"]) >= cutoff]
+    return ordered[-limit:] if limit else ordered
+
+
+def payload(deployment: dict, app_name: str, repository: str, environment: str = "") -> dict:
+    body = {
+        "version": deployment["version"],
+        "appName": app_name,
+        "commitSha": deployment["commitSha"],
+        "repositoryFullName": repository,
+        "deployedAt": deployment["deployedAt"],
+    }
+    if environment:
+        body["environment"] = environment
+    return body
+
+
+def _key(body: dict) -> str:
+    return f"{body.get('environment', '')}\t{body['version']}\t{body['commitSha']}"
+
+
+class Checkpoint:
+    """Deployments already accepted by the API; one line is appended per success."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            self.done: set[str] = set(path.read_text(encoding="utf-8").splitlines())
+        except OSError:
+            self.done = set()
+
+    @classmethod
+    def for_target(cls, root: Path, app_name: str, repository: str, url: str) -> Checkpoint:
+        name = fingerprint(f"{root}\0{app_name}\0{repository}\0{url}")
+        return cls(user_cache_dir() / "backfill" / f"{name}.txt")
+
+    def __contains__(self, body: dict) -> bool:
+        return _key(body) in self.done
+
+    def add(self, body: dict) -> None:
+        key = _key(body)
+        self.done.add(key)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(key + "\n")
+
+
+async def _post(client: httpx.AsyncClient, url: str, body: dict, headers: dict[str, str]) -> str | None:
+    """POST one deployment with retries. Returns None on success, else the error."""
+    error = "not sent"
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            with metrics.span("backfill.backoff"):
+                await asyncio.sleep(random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)))
+        try:
+            with metrics.span("backfill.http"):
+                resp = await client.post(url, json=body, headers=headers)
+        except httpx.RequestError as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            continue
+        if resp.is_success:
+            return None
+        error = f"HTTP {resp.status_code}: {resp.text[:200]}"
+        if resp.status_code != 429 and resp.status_code < 500:
+            return error  # not retryable (bad payload, bad token)
+        with contextlib.suppress(ValueError, TypeError):
+            await asyncio.sleep(min(BACKOFF_CAP, float(resp.headers.get("retry-after"))))
+    return error
+
+
+async def post_all(
+    bodies: list[dict], checkpoint: Checkpoint, concurrency: int = MAX_CONCURRENCY
+) -> dict:
+    """Send every body not yet in the checkpoint. Returns posted/skipped counts and failures."""
+    url = api_url()
+    headers = {"Authorization": authorization() or "", "Content-Type": "application/json"}
+    pending = [body for body in bodies if body not in checkpoint]
+    concurrency = max(1, min(concurrency, 32))
+    failures: list[dict] = []
+    posted = 0
+    limiter = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=15, limits=limits) as client:
+
+        async def _send(body: dict) -> None:
+            nonlocal posted
+            async with limiter:
+                error = await _post(client, url, body, headers)
+            if error is None:
+                checkpoint.add(body)
+                posted += 1
+            else:
+                failures.append({"version": body["version"], "commitSha": body["commitSha"], "error": error})
+
+        async with asyncio.TaskGroup() as group:
+            for body in pending:
+                group.create_task(_send(body))
+
+    return {"posted": posted, "skipped": len(bodies) - len(pending), "failed": failures}
@@ -0,0 +1,104 @@
+"""
+Branch audit: issue-key status of every local and remote branch.
+
+Refs are listed with one `git for-each-ref` pass. Each branch's unique commits
+(those not on the default branch) come from the git_backend walker, which keeps
+them per (tip, base) SHA pair, so re-auditing only walks refs that moved.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from swarmia_mcp.git_backend import GitRepo
+    from swarmia_mcp.keys import Extractor
+
+# git for-each-ref format, NUL-separated
+REF_FORMAT = "%(refname)%00%(objectname)%00%(symref)%00%(committerdate:unix)"
+DEFAULT_CANDIDATES = ("main", "master", "trunk", "develop")
+MISSING_SAMPLE = 3
+
+# Listed first in results: what needs attention
+STATUS_ORDER = ("untracked", "partial", "tracked", "merged")
+
+
+@dataclass(frozen=True)
+class Ref:
+    name: str          # full ref name, e.g. refs/remotes/origin/main
+    sha: str
+    symref: str        # target when this ref is symbolic (origin/HEAD)
+    committed_at: int
+
+    @property
+    def remote(self) -> bool:
+        return self.name.startswith("refs/remotes/")
+
+    @property
+    def short(self) -> str:
+        return self.name.split("/", 2)[2]
+
+
+def parse_refs(output: str) -> list[Ref]:
+    """Refs from `git for-each-ref --format=REF_FORMAT`."""
+    refs = []
+    for line in output.splitlines():
+        parts = line.split("\0")
+        if len(parts) != 4 or not parts[0].startswith(("refs/heads/", "refs/remotes/")):
+            continue
+        name, sha, symref, committed = parts
+        refs.append(Ref(name, sha, symref, int(committed or 0)))
+    return refs
+
+
+def default_branch(refs: list[Ref], requested: str = "") -> Ref | None:
+    """The requested branch, else origin/HEAD's target, else main/master/... (local before remote)."""
+    by_name = {ref.name: ref for ref in refs if not ref.symref}
+    if requested:
+        for name in (requested, f"refs/heads/{requested}", f"refs/remotes/{requested}"):
+            if name in by_name:
+                return by_name[name]
+        return None
+    for ref in refs:
+        if ref.name == "refs/remotes/origin/HEAD" and ref.symref in by_name:
+            return by_name[ref.symref]
+    for prefix in ("refs/heads/", "refs/remotes/origin/"):
+        for candidate in DEFAULT_CANDIDATES:
+            if prefix + candidate in by_name:
+                return by_name[prefix + candidate]
+    return None
+
+
+def _status(branch_ids: list[str], unique: int, with_keys: int) -> str:
+    if not unique:
+        return "merged"
+    if branch_ids or with_keys == unique:
+        return "tracked"
+    return "partial" if with_keys else "untracked"
+
+
+async def audit(repo: GitRepo, refs: list[Ref], base: Ref, extractor: Extractor, limit: int) -> list[dict]:
+    """One entry per branch (symbolic refs and the default branch skipped), neediest first."""
+    results = []
+    for ref in refs:
+        if ref.symref or ref.name == base.name:
+            continue
+        commits, complete = await repo.unique_commits(ref.sha, base.sha, limit)
+        has_keys = extractor.has_keys([c.subject for c in commits])
+        missing = [c.subject for c, keyed in zip(commits, has_keys) if not keyed]
+        branch_ids = extractor.findall(ref.short)
+        results.append({
+            "branch": ref.short,
+            "remote": ref.remote,
+            "tip": ref.sha,
+            "committed_at": ref.committed_at,
+            "branch_ids": branch_ids,
+            "unique_commits": len(commits),
+            "unique_complete": complete,
+            "missing_keys": len(missing),
+            "missing_sample": missing[:MISSING_SAMPLE],
+            "status": _status(branch_ids, len(commits), len(commits) - len(missing)),
+        })
+    results.sort(key=lambda b: (STATUS_ORDER.index(b["status"]), -b["committed_at"]))
+    return results
@@ -0,0 +1,327 @@
+"""
+On-disk caches (SQLite) shared by all server processes on this machine.
+
+TTLCache entries are grouped by namespace (e.g. a Linear workspace fingerprint)
+and carry the time they were fetched. Lookups report whether an entry is still
+fresh or only usable as a stale fallback while the caller revalidates it.
+
+CommitStore keeps immutable commit metadata by SHA so history is read from git
+only once.
+
+IssueMirror holds a copy of a tracker's issues, synced incrementally by
+`issues.sync_mirror`, so keys can be validated without a round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+def user_cache_dir() -> Path:
+    """Per-user cache directory (override with SWARMIA_MCP_CACHE_DIR)."""
+    override = os.getenv("SWARMIA_MCP_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    if sys.platform == "win32":
+        base = Path(os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "swarmia-mcp"
+
+
+def fingerprint(secret: str) -> str:
+    """Stable, non-reversible identifier for an API key."""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _connect(path: Path | str) -> sqlite3.Connection:
+    try:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        return db
+    except (OSError, sqlite3.Error):
+        # Read-only home, locked file, ... — degrade to a per-process cache
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    fetched_at: float
+    fresh: bool
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+
+class TTLCache:
+    """SQLite-backed key/value cache with fresh and stale TTLs and size-bounded eviction.
+
+    - younger than ``ttl``: fresh
+    - younger than ``ttl + stale_ttl``: stale (serve, then revalidate)
+    - older: treated as missing and pruned
+    """
+
+    def __init__(self, path: Path | str, ttl: float, stale_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = _connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_age ON entries (fetched_at)")
+        self._db.commit()
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, CacheEntry]:
+        if not keys:
+            return {}
+        now = time.time()
+        oldest = now - self.ttl - self.stale_ttl
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT key, value, fetched_at FROM entries"
+                f" WHERE namespace = ? AND fetched_at >= ? AND key IN ({placeholders})",
+                (namespace, oldest, *keys),
+            ).fetchall()
+        return {
+            key: CacheEntry(json.loads(value), fetched_at, now - fetched_at < self.ttl)
+            for key, value, fetched_at in rows
+        }
+
+    def get(self, namespace: str, key: str) -> CacheEntry | None:
+        return self.get_many(namespace, [key]).get(key)
+
+    def set_many(self, namespace: str, items: dict[str, Any]) -> None:
+        if not items:
+            return
+        now = time.time()
+        rows = [(namespace, key, json.dumps(value), now) for key, value in items.items()]
+        with self._lock:
+            self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows)
+            self._evict(now)
+            self._db.commit()
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self.set_many(namespace, {key: value})
+
+    def invalidate(self, namespace: str | None = None, keys: list[str] | None = None) -> None:
+        """Drop entries: everything, one namespace, or selected keys in a namespace."""
+        with self._lock:
+            if namespace is None:
+                self._db.execute("DELETE FROM entries")
+            elif keys is None:
+                self._db.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            else:
+                self._db.executemany(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                    [(namespace, key) for key in keys],
+                )
+            self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM entries WHERE fetched_at < ?", (now - self.ttl - self.stale_ttl,))
+        (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count > self.max_entries:
+            self._db.execute(
+                "DELETE FROM entries WHERE rowid IN"
+                " (SELECT rowid FROM entries ORDER BY fetched_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+
+class CommitStore:
+    """Persistent per-repository commit metadata keyed by SHA.
+
+    Commits are immutable, so rows never expire; the table is only trimmed
+    (oldest rows first) once it exceeds ``max_entries``.
+    """
+
+    def __init__(self, path: Path | str, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = _connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS commits ("
+            " repo TEXT NOT NULL, sha TEXT NOT NULL, parents TEXT NOT NULL,"
+            " committed_at INTEGER NOT NULL, subject TEXT NOT NULL,"
+            " PRIMARY KEY (repo, sha))"
+        )
+        self._db.commit()
+
+    def get(self, repo: str, sha: str) -> tuple[str, tuple[str, ...], int, str] | None:
+        """One commit of a repository as (sha, parents, committed_at, subject), None if unknown."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT parents, committed_at, subject FROM commits WHERE repo = ? AND sha = ?", (repo, sha)
+            ).fetchone()
+        if row is None:
+            return None
+        parents, committed_at, subject = row
+        return sha, tuple(parents.split()), committed_at, subject
+
+    def add(self, repo: str, commits: list[tuple[str, tuple[str, ...], int, str]]) -> None:
+        if not commits:
+            return
+        rows = [(repo, sha, " ".join(parents), committed_at, subject) for sha, parents, committed_at, subject in commits]
+        with self._lock:
+            self._db.executemany("INSERT OR IGNORE INTO commits VALUES (?, ?, ?, ?, ?)", rows)
+            (count,) = self._db.execute("SELECT COUNT(*) FROM commits").fetchone()
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM commits WHERE rowid IN (SELECT rowid FROM commits ORDER BY rowid LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._db.commit()
+
+
+@dataclass(frozen=True)
+class MirrorState:
+    teams: str          # comma-separated team keys mirrored, "" for all
+    cursor: str         # highest updatedAt of the last complete pass
+    page: str           # page cursor of an unfinished pass, "" when none
+    pass_max: str       # highest updatedAt seen so far in the unfinished pass
+    synced_at: float    # end of the last complete pass, 0 before the first
+
+
+class IssueMirror:
+    """Local copy of tracker issues per backend scope, indexed by identifier.
+
+    Rows are keyed by the tracker's own issue id, so an issue moved to another
+    team replaces its old identifier instead of leaving it behind.
+    """
+
+    def __init__(self, path: Path | str):
+        self._lock = threading.Lock()
+        self._db = _connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            " scope TEXT NOT NULL, id TEXT NOT NULL, identifier TEXT NOT NULL,"
+            " title TEXT NOT NULL, state TEXT NOT NULL, assignee_id TEXT,"
+            " updated_at TEXT NOT NULL, PRIMARY KEY (scope, id))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS issues_identifier ON issues (scope, identifier)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sync ("
+            " scope TEXT PRIMARY KEY, teams TEXT NOT NULL, cursor TEXT NOT NULL,"
+            " page TEXT NOT NULL, pass_max TEXT NOT NULL, synced_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def get_many(self, scope: str, identifiers: list[str]) -> dict[str, dict]:
+        """{identifier: {title, state, assignee_id}} for the mirrored ones."""
+        if not identifiers:
+            return {}
+        placeholders = ",".join("?" * len(identifiers))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT identifier, title, state, assignee_id FROM issues"
+                f" WHERE scope = ? AND identifier IN ({placeholders})",
+                (scope, *identifiers),
+            ).fetchall()
+        return {
+            identifier: {"title": title, "state": state, "assignee_id": assignee_id}
+            for identifier, title, state, assignee_id in rows
+        }
+
+    def count(self, scope: str) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM issues WHERE scope = ?", (scope,)).fetchone()
+        return count
+
+    def state(self, scope: str) -> MirrorState | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT teams, cursor, page, pass_max, synced_at FROM sync WHERE scope = ?", (scope,)
+            ).fetchone()
+        return MirrorState(*row) if row else None
+
+    def save_page(self, scope: str, issues: list[dict], state: MirrorState) -> None:
+        """Upsert one page of issues and the sync progress in one transaction."""
+        rows = [
+            (scope, i["id"], i["identifier"], i["title"], i["state"], i["assignee_id"], i["updated_at"])
+            for i in issues
+        ]
+        with self._lock:
+            self._db.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync VALUES (?, ?, ?, ?, ?, ?)",
+                (scope, state.teams, state.cursor, state.page, state.pass_max, state.synced_at),
+            )
+            self._db.commit()
+
+    def reset(self, scope: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM issues WHERE scope = ?", (scope,))
+            self._db.execute("DELETE FROM sync WHERE scope = ?", (scope,))
+            self._db.commit()
+
+
+_cache: TTLCache | None = None
+_commit_store: CommitStore | None = None
+_issue_mirror: IssueMirror | None = None
+
+
+def get_cache() -> TTLCache:
+    """Process-wide cache configured from the environment.
+
+    SWARMIA_MCP_CACHE_TTL        seconds an entry is fresh (default 600)
+    SWARMIA_MCP_CACHE_STALE_TTL  extra seconds a stale entry may be served (default 7 days)
+    SWARMIA_MCP_CACHE_MAX_ENTRIES  eviction bound (default 10000)
+    """
+    global _cache
+    if _cache is None:
+        _cache = TTLCache(
+            user_cache_dir() / "cache.sqlite3",
+            ttl=_env_number("SWARMIA_MCP_CACHE_TTL", 600),
+            stale_ttl=_env_number("SWARMIA_MCP_CACHE_STALE_TTL", 7 * 24 * 3600),
+            max_entries=int(_env_number("SWARMIA_MCP_CACHE_MAX_ENTRIES", 10_000)),
+        )
+    return _cache
+
+
+def get_commit_store() -> CommitStore:
+    """Process-wide commit store (SWARMIA_MCP_COMMIT_STORE_MAX bounds it, default 500000)."""
+    global _commit_store
+    if _commit_store is None:
+        _commit_store = CommitStore(
+            user_cache_dir() / "commits.sqlite3",
+            max_entries=int(_env_number("SWARMIA_MCP_COMMIT_STORE_MAX", 500_000)),
+        )
+    return _commit_store
+
+
+def get_issue_mirror(create: bool = True) -> IssueMirror | None:
+    """Process-wide issue mirror; with create=False, None until one has been synced."""
+    global _issue_mirror
+    if _issue_mirror is None:
+        path = user_cache_dir() / "mirror.sqlite3"
+        if not create and not path.exists():
+            return None
+        _issue_mirror = IssueMirror(path)
+    return _issue_mirror
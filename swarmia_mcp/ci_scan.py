@@ -0,0 +1,236 @@
+"""
+CI configuration discovery and Swarmia deployment-webhook detection.
+
+Each workspace gets one in-memory snapshot: the CI directories it has, the CI
+files in them with their content hash and whether they notify Swarmia. Tools
+answer from the snapshot; it is revalidated at most every WATCH_INTERVAL
+seconds by polling, and only incrementally: one stat per watched directory
+and CI file, a re-listing of directories whose mtime changed, and a re-read
+of files whose (mtime, size) changed. There is no globbing after the first
+scan, which matters on large monorepos and networked filesystems.
+
+CI files are memory-mapped and searched in place, so there is no size cap and
+no copy into Python strings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+
+DEPLOYMENT_MARKERS = (b"hook.swarmia.com", b"SWARMIA_DEPLOYMENTS_AUTHORIZATION")
+
+# (directory, glob) pairs searched recursively, relative to the workspace root
+_CI_TREES = (
+    (".github/workflows", "*.yml"),
+    (".github/workflows", "*.yaml"),
+    (".github/actions", "action.yml"),
+    (".github/actions", "action.yaml"),
+    (".gitlab", "*.yml"),
+    (".gitlab", "*.yaml"),
+)
+_CI_FILES = (
+    ".gitlab-ci.yml",
+    "Jenkinsfile",
+    "azure-pipelines.yml",
+    "bitbucket-pipelines.yml",
+    ".circleci/config.yml",
+)
+# Directories on the way to CI files; everything else in the workspace is never listed
+_CI_DIRS = {".github", ".circleci", *(directory for directory, _ in _CI_TREES)}
+
+# Seconds a snapshot is trusted without touching the filesystem
+WATCH_INTERVAL = float(os.getenv("SWARMIA_MCP_WATCH_INTERVAL") or 2.0)
+MAX_SNAPSHOTS = 64
+
+
+def _rule(rel: str) -> int | None:
+    """Ordering rank of a CI file path (relative, '/'-separated), None if it is not one."""
+    parent, _, name = rel.rpartition("/")
+    for rank, (directory, pattern) in enumerate(_CI_TREES):
+        if (parent == directory or parent.startswith(directory + "/")) and fnmatch(name, pattern):
+            return rank
+    if rel in _CI_FILES:
+        return len(_CI_TREES) + _CI_FILES.index(rel)
+    if not parent and name.startswith("Jenkinsfile."):
+        return len(_CI_TREES) + len(_CI_FILES)
+    return None
+
+
+def _descend(rel: str) -> bool:
+    return rel in _CI_DIRS or any(rel.startswith(directory + "/") for directory, _ in _CI_TREES)
+
+
+@dataclass(frozen=True)
+class CIFile:
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: str  # sha256 of the content
+    has_markers: bool
+
+
+def _index_file(path: Path, markers: tuple[bytes, ...] = DEPLOYMENT_MARKERS) -> CIFile | None:
+    """Hash a file and search it for any marker in one mapped pass."""
+    try:
+        stat = path.stat()
+        with open(path, "rb") as handle:
+            if not stat.st_size:
+                return CIFile(path, stat.st_mtime_ns, 0, hashlib.sha256().hexdigest(), False)
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                digest = hashlib.sha256(view).hexdigest()
+                found = any(view.find(marker) != -1 for marker in markers)
+    except (OSError, ValueError):
+        return None
+    return CIFile(path, stat.st_mtime_ns, stat.st_size, digest, found)
+
+
+class WorkspaceSnapshot:
+    """CI directories and files of one workspace, kept current by polling."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        # relative dir ("" = root) -> (mtime_ns, CI file names, CI subdirectories)
+        self._dirs: dict[str, tuple[int, list[str], list[str]]] = {}
+        self._files: dict[str, CIFile] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _scan_dir(self, rel: str) -> None:
+        path = self.root / rel if rel else self.root
+        try:
+            mtime = path.stat().st_mtime_ns
+            with os.scandir(path) as entries:
+                names = [(entry.name, entry.is_dir(), entry.is_file()) for entry in entries]
+        except OSError:
+            self._drop_dir(rel)
+            return
+        files, subdirs = [], []
+        for name, is_dir, is_file in names:
+            child = f"{rel}/{name}" if rel else name
+            if is_dir and _descend(child):
+                subdirs.append(child)
+            elif is_file and _rule(child) is not None:
+                files.append(child)
+
+        _, old_files, old_subdirs = self._dirs.get(rel, (0, [], []))
+        self._dirs[rel] = (mtime, files, subdirs)
+        for gone in set(old_files) - set(files):
+            self._files.pop(gone, None)
+        for gone in set(old_subdirs) - set(subdirs):
+            self._drop_dir(gone)
+        for child in files:
+            if child not in self._files:
+                self._index(child)
+        for child in subdirs:
+            if child not in self._dirs:
+                self._scan_dir(child)
+
+    def _drop_dir(self, rel: str) -> None:
+        _, files, subdirs = self._dirs.pop(rel, (0, [], []))
+        for child in files:
+            self._files.pop(child, None)
+        for child in subdirs:
+            self._drop_dir(child)
+
+    def _index(self, rel: str) -> None:
+        indexed = _index_file(self.root / rel)
+        if indexed is None:
+            self._files.pop(rel, None)
+        else:
+            self._files[rel] = indexed
+
+    def refresh(self, force: bool = False) -> WorkspaceSnapshot:
+        """Revalidate against the filesystem if WATCH_INTERVAL has passed (or force)."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._dirs and now - self._checked_at < WATCH_INTERVAL:
+                return self
+            if not self._dirs:
+                self._scan_dir("")
+            else:
+                for rel, (mtime, _, _) in list(self._dirs.items()):
+                    if rel not in self._dirs:
+                        continue  # dropped with a parent during this pass
+                    try:
+                        changed = (self.root / rel if rel else self.root).stat().st_mtime_ns != mtime
+                    except OSError:
+                        changed = True
+                    if changed:
+                        self._scan_dir(rel)
+                for rel, indexed in list(self._files.items()):
+                    try:
+                        stat = indexed.path.stat()
+                    except OSError:
+                        self._files.pop(rel, None)
+                        continue
+                    if (stat.st_mtime_ns, stat.st_size) != (indexed.mtime_ns, indexed.size):
+                        self._index(rel)
+            self._checked_at = time.monotonic()
+        return self
+
+    def has_dir(self, rel: str) -> bool:
+        return rel in self._dirs
+
+    def has_file(self, rel: str) -> bool:
+        return rel in self._files
+
+    @property
+    def ci_files(self) -> list[CIFile]:
+        """CI files in discovery order: workflows, composite actions, GitLab, Jenkins, ..."""
+        ordered = sorted(self._files.items(), key=lambda item: (_rule(item[0]), item[0]))
+        return [indexed for _, indexed in ordered]
+
+    def deploy_webhook(self) -> Path | None:
+        """First CI file that notifies Swarmia of deployments, or None."""
+        return next((indexed.path for indexed in self.ci_files if indexed.has_markers), None)
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever any CI directory or file is added or removed, or a CI file is edited."""
+        digest = hashlib.sha256()
+        for rel in sorted(self._dirs):
+            digest.update(f"{rel}/\0".encode())
+        for rel, indexed in sorted(self._files.items()):
+            digest.update(f"{rel}\0{indexed.digest}\0".encode())
+        return digest.hexdigest()
+
+
+_snapshots: OrderedDict[Path, WorkspaceSnapshot] = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def snapshot(workspace: Path) -> WorkspaceSnapshot:
+    """The workspace's CI snapshot, built on first use and revalidated by polling."""
+    with _snapshots_lock:
+        current = _snapshots.get(workspace)
+        if current is None:
+            current = _snapshots[workspace] = WorkspaceSnapshot(workspace)
+        _snapshots.move_to_end(workspace)
+        while len(_snapshots) > MAX_SNAPSHOTS:
+            _snapshots.popitem(last=False)
+    return current.refresh()
+
+
+def detect_ci(workspace: Path) -> tuple[bool, bool, bool]:
+    """Return (github, gitlab, jenkins) presence for the workspace."""
+    current = snapshot(workspace)
+    return (
+        current.has_dir(".github/workflows"),
+        current.has_file(".gitlab-ci.yml"),
+        current.has_file("Jenkinsfile"),
+    )
+
+
+def relative(path: Path, workspace: Path) -> str:
+    try:
+        return os.path.relpath(path, workspace)
+    except ValueError:
+        return str(path)
@@ -0,0 +1,143 @@
+"""
+Section-level BM25 retrieval over the bundled Swarmia documentation.
+
+docs_context.md is split at its ## / ### headings; each section is indexed once
+per process and queries return the best-scoring sections with their heading path.
+With SWARMIA_MCP_DOCS_DIR set, searches go to the on-disk index in `docs_store`
+(bundled docs plus those directories) instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+DOCS_PATH = Path(__file__).parent / "docs_context.md"
+
+_HEADING = re.compile(r"^(#{1,3})\s+(.*?)\s*$")
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it my of on or "
+    "the this to what when where which why with you your".split()
+)
+
+
+@dataclass(frozen=True)
+class Section:
+    heading_path: tuple[str, ...]
+    text: str
+    source: str = ""
+
+    @property
+    def title(self) -> str:
+        return " › ".join(self.heading_path)
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def split_sections(markdown: str, default_title: str | None = None) -> list[Section]:
+    """Split markdown into sections at #, ## and ### headings (code fences respected).
+
+    Text before the first heading is dropped, or kept under default_title if given.
+    """
+    sections: list[Section] = []
+    path: list[str] = [default_title] if default_title else []
+    lines: list[str] = []
+    in_fence = False
+
+    def _flush() -> None:
+        text = "\n".join(lines).strip().removesuffix("---").strip()
+        if text and path:
+            # Drop the document title (# heading) from nested section paths
+            sections.append(Section(tuple(path[1:] if len(path) > 1 else path), text))
+
+    for line in markdown.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING.match(line)
+        if match:
+            _flush()
+            level = len(match.group(1))
+            path = path[: level - 1] + [match.group(2)]
+            lines = []
+        lines.append(line)
+    _flush()
+    return sections
+
+
+class BM25Index:
+    """Okapi BM25 over sections; heading words count double."""
+
+    def __init__(self, sections: list[Section], k1: float = 1.5, b: float = 0.75):
+        self.sections = sections
+        self.k1 = k1
+        self.b = b
+        self._tf: list[Counter] = []
+        for section in sections:
+            tokens = tokenize(section.text) + tokenize(" ".join(section.heading_path))
+            self._tf.append(Counter(tokens))
+        self._lengths = [sum(tf.values()) for tf in self._tf]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        df = Counter(term for tf in self._tf for term in tf)
+        n = len(sections)
+        self._idf = {term: math.log(1 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()}
+
+    def search(self, query: str, top_k: int = 3) -> list[tuple[Section, float]]:
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        scored = []
+        for section, tf, length in zip(self.sections, self._tf, self._lengths):
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    norm = self.k1 * (1 - self.b + self.b * length / self._avg_length)
+                    score += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            if score > 0:
+                scored.append((section, score))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:top_k]
+
+
+@lru_cache(maxsize=1)
+def _bundled_index() -> BM25Index:
+    return BM25Index(split_sections(DOCS_PATH.read_text(encoding="utf-8")))
+
+
+def get_index():
+    """Index to search, loaded or built on first use. Raises FileNotFoundError.
+
+    The bundled docs in memory, or the on-disk index when SWARMIA_MCP_DOCS_DIR is set.
+    """
+    if not os.getenv("SWARMIA_MCP_DOCS_DIR"):
+        return _bundled_index()
+    from swarmia_mcp import docs_store
+
+    try:
+        return docs_store.open_index(docs_store.docs_dirs())
+    except (OSError, ValueError) as exc:
+        logging.getLogger("swarmia_mcp").warning("docs index unavailable, using bundled docs: %s", exc)
+        return _bundled_index()
+
+
+@lru_cache(maxsize=256)
+def _search(normalized_query: str, top_k: int, generation: int) -> tuple[tuple[Section, float], ...]:
+    return tuple(get_index().search(normalized_query, top_k))
+
+
+def search(query: str, top_k: int = 3) -> list[tuple[Section, float]]:
+    """Top-k sections for a query; recent queries are served from an LRU cache."""
+    generation = getattr(get_index(), "generation", 0)
+    return list(_search(" ".join(sorted(set(tokenize(query)))), max(1, top_k), generation))
+
+
+@lru_cache(maxsize=1)
+def full_corpus() -> str:
+    return DOCS_PATH.read_text(encoding="utf-8")
@@ -0,0 +1,314 @@
+"""
+On-disk BM25 index for large markdown corpora (help center exports, runbooks).
+
+Set SWARMIA_MCP_DOCS_DIR to one or more directories (path-separated) and
+`query_swarmia_docs` searches them together with the bundled docs. The index
+lives in the user cache directory:
+
+- segments/<sha256>.json: sections and term counts of one markdown file, keyed
+  by content hash, so a rebuild only re-tokenizes files that changed
+- manifest.json: path -> (mtime, size, sha256); files whose stat changed are
+  re-hashed, unchanged hashes reuse their segment
+- index.bin: the merged index, memory-mapped by readers. Queries binary-search
+  the sorted term table and read only their terms' postings, so start-up is
+  free and latency stays flat as the corpus grows.
+
+Prebuild from a shell: python -m swarmia_mcp.docs_store [DIR ...]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from swarmia_mcp.cache import fingerprint, user_cache_dir
+from swarmia_mcp.docs_index import DOCS_PATH, Section, split_sections, tokenize
+
+MAGIC = b"SWDX0001"
+# magic, build stamp, term count, doc count, avg length, then section offsets
+_HEADER = struct.Struct("=8sQQQd6Q")
+_SUFFIXES = (".md", ".markdown")
+# Seconds between checks of the corpus for changed files
+REFRESH_INTERVAL = 60.0
+
+
+def docs_dirs() -> list[Path]:
+    return [Path(p).expanduser() for p in os.getenv("SWARMIA_MCP_DOCS_DIR", "").split(os.pathsep) if p]
+
+
+def index_dir(dirs: list[Path]) -> Path:
+    key = os.pathsep.join(str(d.resolve()) for d in dirs)
+    return user_cache_dir() / "docs" / fingerprint(key)
+
+
+def _markdown_files(dirs: list[Path]) -> list[Path]:
+    files = [DOCS_PATH]
+    for directory in dirs:
+        for base, subdirs, names in os.walk(directory):
+            subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+            files.extend(Path(base) / n for n in sorted(names) if n.lower().endswith(_SUFFIXES))
+    return files
+
+
+def _segment(path: Path) -> list[dict]:
+    """Sections of one markdown file with their term counts (headings count double, as in BM25Index)."""
+    sections = split_sections(path.read_text(encoding="utf-8", errors="replace"), default_title=path.stem)
+    return [
+        {
+            "heading_path": list(section.heading_path),
+            "text": section.text,
+            "tf": Counter(tokenize(section.text) + tokenize(" ".join(section.heading_path))),
+        }
+        for section in sections
+    ]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _pad(blob: bytearray) -> int:
+    blob.extend(b"\0" * (-len(blob) % 8))
+    return len(blob)
+
+
+def build(dirs: list[Path], target: Path | None = None) -> dict:
+    """(Re)build the index for dirs incrementally. Returns counts of what was done."""
+    target = target or index_dir(dirs)
+    segments_dir = target / "segments"
+    segments_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = target / "manifest.json"
+    try:
+        old = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError):
+        old = {}
+
+    files: dict[str, dict] = {}
+    stats = {"files": 0, "hashed": 0, "tokenized": 0}
+    docs: list[tuple[str, dict]] = []
+    for path in _markdown_files(dirs):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        key = str(path)
+        entry = old.get(key)
+        if not entry or (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+            try:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+            stats["hashed"] += 1
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        files[key] = entry
+        segment_path = segments_dir / f"{entry['sha256']}.json"
+        try:
+            segment = json.loads(segment_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            segment = _segment(path)
+            _write_atomic(segment_path, json.dumps(segment).encode("utf-8"))
+            stats["tokenized"] += 1
+        docs.extend((key, section) for section in segment)
+    stats["files"] = len(files)
+
+    # Postings: term -> interleaved (doc, tf) pairs, terms sorted for binary search.
+    # Native byte order: the index is a per-machine cache, read back with memoryview.cast
+    postings: defaultdict[str, array] = defaultdict(lambda: array("I"))
+    lengths = array("I")
+    for doc_id, (_, section) in enumerate(docs):
+        lengths.append(sum(section["tf"].values()))
+        for term, freq in section["tf"].items():
+            postings[term].extend((doc_id, freq))
+    terms = sorted(postings)
+
+    string_offsets, posting_offsets, strings = array("I", [0]), array("Q", [0]), bytearray()
+    for term in terms:
+        strings += term.encode("utf-8")
+        string_offsets.append(len(strings))
+        posting_offsets.append(posting_offsets[-1] + len(postings[term]) // 2)
+    pairs = b"".join(postings[term].tobytes() for term in terms)
+    records, record_offsets = bytearray(), array("Q", [0])
+    for source, section in docs:
+        record = {"source": source, "heading_path": section["heading_path"], "text": section["text"]}
+        records += json.dumps(record).encode("utf-8")
+        record_offsets.append(len(records))
+
+    blob = bytearray(_HEADER.size)
+    term_table = _pad(blob)
+    blob += string_offsets.tobytes() + posting_offsets.tobytes() + strings
+    postings_at = _pad(blob)
+    blob += pairs
+    lengths_at = _pad(blob)
+    blob += lengths.tobytes()
+    docs_at = _pad(blob)
+    blob += record_offsets.tobytes() + records
+
+    avg_length = sum(lengths) / len(lengths) if lengths else 0.0
+    _HEADER.pack_into(
+        blob, 0, MAGIC, time.time_ns(), len(terms), len(docs), avg_length,
+        term_table, postings_at, lengths_at, docs_at, len(blob), len(strings),
+    )
+    _write_atomic(target / "index.bin", bytes(blob))
+    _write_atomic(manifest_path, json.dumps({"files": files}).encode("utf-8"))
+
+    live = {f"{entry['sha256']}.json" for entry in files.values()}
+    for stale in segments_dir.glob("*.json"):
+        if stale.name not in live:
+            stale.unlink(missing_ok=True)
+    return stats
+
+
+def _changed(dirs: list[Path], target: Path) -> bool:
+    """Whether any markdown file was added, removed or touched since the last build."""
+    try:
+        files = json.loads((target / "manifest.json").read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError):
+        return True
+    current = _markdown_files(dirs)
+    if len(current) != len(files):
+        return True
+    for path in current:
+        entry = files.get(str(path))
+        try:
+            stat = path.stat()
+        except OSError:
+            return True
+        if not entry or (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+            return True
+    return False
+
+
+class DiskIndex:
+    """Read side of index.bin: BM25 over memory-mapped postings (same scoring as BM25Index)."""
+
+    def __init__(self, path: Path, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.generation, self._terms, self._docs, self._avg_length,
+         term_table, postings_at, lengths_at, docs_at, _end, strings_len) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a docs index")
+        view = memoryview(self._map)
+        n = self._terms + 1
+        self._string_offsets = view[term_table:term_table + 4 * n].cast("I")
+        posting_table = term_table + 4 * n
+        self._posting_offsets = view[posting_table:posting_table + 8 * n].cast("Q")
+        self._strings = view[posting_table + 8 * n:posting_table + 8 * n + strings_len]
+        self._postings = view[postings_at:lengths_at].cast("I")
+        self._lengths = view[lengths_at:lengths_at + 4 * self._docs].cast("I")
+        self._record_offsets = view[docs_at:docs_at + 8 * (self._docs + 1)].cast("Q")
+        self._records_at = docs_at + 8 * (self._docs + 1)
+
+    def _term(self, index: int) -> bytes:
+        return bytes(self._strings[self._string_offsets[index]:self._string_offsets[index + 1]])
+
+    def _find(self, term: str) -> int | None:
+        wanted = term.encode("utf-8")
+        lo, hi = 0, self._terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < wanted:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._terms and self._term(lo) == wanted else None
+
+    def section(self, doc_id: int) -> Section:
+        start = self._records_at + self._record_offsets[doc_id]
+        end = self._records_at + self._record_offsets[doc_id + 1]
+        record = json.loads(self._map[start:end])
+        return Section(tuple(record["heading_path"]), record["text"], record["source"])
+
+    def search(self, query: str, top_k: int = 3) -> list[tuple[Section, float]]:
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            index = self._find(term)
+            if index is None:
+                continue
+            start, end = self._posting_offsets[index], self._posting_offsets[index + 1]
+            idf = math.log(1 + (self._docs - (end - start) + 0.5) / (end - start + 0.5))
+            pairs = self._postings[2 * start:2 * end]
+            for doc_id, freq in zip(pairs[::2], pairs[1::2]):
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / self._avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.section(doc_id), score) for doc_id, score in best]
+
+
+_lock = threading.Lock()  # guards _open, _building and _first_builds; never held across disk work
+_open: dict[Path, tuple[float, DiskIndex]] = {}
+_building: set[Path] = set()
+# One lock per index, held by the thread doing its first build so others wait for it
+_first_builds: dict[Path, threading.Lock] = {}
+
+
+def _refresh(dirs: list[Path], target: Path) -> None:
+    """Background check of the corpus; a changed one is rebuilt and swapped in."""
+    try:
+        if _changed(dirs, target):
+            build(dirs, target)
+            index = DiskIndex(target / "index.bin")
+            with _lock:
+                _open[target] = (time.monotonic(), index)
+        else:
+            with _lock:
+                _open[target] = (time.monotonic(), _open[target][1])
+    except (OSError, ValueError) as exc:
+        logging.getLogger("swarmia_mcp").warning("docs index rebuild failed: %s", exc)
+    finally:
+        with _lock:
+            _building.discard(target)
+
+
+def open_index(dirs: list[Path]) -> DiskIndex:
+    """Index over the bundled docs plus dirs, built on first use.
+
+    The corpus is re-checked at most every REFRESH_INTERVAL seconds, in a
+    background thread: when files changed, the index is rebuilt incrementally
+    and swapped in while queries keep using the previous one. Only the very
+    first build blocks, and only callers of the same index.
+    """
+    target = index_dir(dirs)
+    with _lock:
+        checked_at, index = _open.get(target, (0.0, None))
+        if index is not None:
+            if target not in _building and time.monotonic() - checked_at >= REFRESH_INTERVAL:
+                _building.add(target)
+                threading.Thread(target=_refresh, args=(dirs, target), name="docs-index", daemon=True).start()
+            return index
+        first_build = _first_builds.setdefault(target, threading.Lock())
+    with first_build:
+        with _lock:
+            opened = _open.get(target)
+        if opened is not None:
+            return opened[1]  # built by the thread this one waited for
+        if _changed(dirs, target):
+            build(dirs, target)
+        index = DiskIndex(target / "index.bin")
+        with _lock:
+            _open[target] = (time.monotonic(), index)
+        return index
+
+
+if __name__ == "__main__":
+    import sys
+
+    selected = [Path(arg) for arg in sys.argv[1:]] or docs_dirs()
+    started = time.perf_counter()
+    result = build(selected)
+    print(json.dumps({**result, "index": str(index_dir(selected)), "seconds": round(time.perf_counter() - started, 2)}))
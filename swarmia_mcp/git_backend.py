@@ -0,0 +1,423 @@
+"""
+Long-lived git backend: one `git cat-file --batch` worker per repository.
+
+HEAD and the current branch are read straight from the git directory, and
+commit objects are streamed from the worker, so a hygiene check costs no
+fork/exec once the worker is running. Parsed commits are kept by SHA (in memory
+and in the on-disk CommitStore, queried per SHA on a worker thread), so each
+commit is read from git only once. Workers are restarted when they die, and a
+new one is started when the server is pointed at a different repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from swarmia_mcp import metrics
+from swarmia_mcp.cache import get_commit_store
+
+logger = logging.getLogger("swarmia_mcp")
+
+GIT_TIMEOUT = 10
+MAX_WORKERS = 4  # default for SWARMIA_MCP_GIT_WORKERS
+MAX_UNIQUE_RESULTS = 4096  # (tip, base) pairs remembered per repository
+
+
+@dataclass(frozen=True)
+class Commit:
+    sha: str
+    parents: tuple[str, ...]
+    committed_at: int
+    subject: str
+
+
+def parse_commit(sha: str, body: bytes) -> Commit:
+    """Parse a raw commit object. The subject is the first message paragraph (git's %s)."""
+    header, _, message = body.decode("utf-8", errors="replace").partition("\n\n")
+    parents: list[str] = []
+    committed_at = 0
+    for line in header.splitlines():
+        if line.startswith("parent "):
+            parents.append(line[7:])
+        elif line.startswith("committer "):
+            with contextlib.suppress(ValueError, IndexError):
+                committed_at = int(line.rsplit(" ", 2)[1])
+    subject = " ".join(message.strip().split("\n\n", 1)[0].split())
+    return Commit(sha, tuple(parents), committed_at, subject)
+
+
+def find_repo(start: Path) -> tuple[Path, Path] | None:
+    """Locate (worktree root, git dir) for start or one of its parents."""
+    for directory in (start, *start.parents):
+        dotgit = directory / ".git"
+        if dotgit.is_dir():
+            return directory, dotgit
+        if dotgit.is_file():
+            # Worktrees and submodules: ".git" is a file containing "gitdir: <path>"
+            content = dotgit.read_text(encoding="utf-8", errors="replace").strip()
+            if content.startswith("gitdir:"):
+                return directory, (directory / content[7:].strip()).resolve()
+    return None
+
+
+class GitRepo:
+    """Persistent object reader for one repository."""
+
+    def __init__(self, root: Path, git_dir: Path):
+        self.root = root
+        self.git_dir = git_dir
+        self._proc: asyncio.subprocess.Process | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        # Commits are immutable: memoize them by SHA (backed by the on-disk store)
+        self._commits: dict[str, Commit] = {}
+        self._unsaved: list[Commit] = []
+        # Calls using the worker; an evicted repository is closed once the last one ends
+        self._readers = 0
+        self._retired = False
+        self._readers_lock = threading.Lock()
+        # rev -> (tip SHA, commits newest first, walk reached the root)
+        self._logs: dict[str, tuple[str, list[Commit], bool]] = {}
+        # (tip SHA, base SHA) -> (commits only on tip, walk was not cut off)
+        self._unique: OrderedDict[tuple[str, str], tuple[list[Commit], bool]] = OrderedDict()
+
+    @property
+    def common_dir(self) -> Path:
+        """Directory holding refs and objects (differs from git_dir in worktrees)."""
+        try:
+            common = (self.git_dir / "commondir").read_text(encoding="utf-8").strip()
+        except OSError:
+            return self.git_dir
+        return (self.git_dir / common).resolve()
+
+    # -- refs -------------------------------------------------------------
+
+    def head_ref(self) -> str:
+        """Raw HEAD content: "ref: refs/heads/<name>" or a detached SHA."""
+        try:
+            return (self.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError as exc:
+            raise RuntimeError(f"cannot read HEAD: {exc}") from exc
+
+    def current_branch(self) -> str:
+        """Same as `git branch --show-current` (empty when detached)."""
+        head = self.head_ref()
+        return head[16:] if head.startswith("ref: refs/heads/") else ""
+
+    def resolve_ref(self, name: str, depth: int = 0) -> str | None:
+        """Resolve HEAD or a full ref name to a SHA from loose/packed refs (None if unknown)."""
+        if depth > 5:
+            return None
+        content = None
+        for base in (self.git_dir, self.common_dir):
+            with contextlib.suppress(OSError):
+                content = (base / name).read_text(encoding="utf-8").strip()
+                break
+        if content is None:
+            with contextlib.suppress(OSError):
+                for line in (self.common_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+                    sha, _, ref = line.partition(" ")
+                    if ref == name:
+                        content = sha
+                        break
+        if content is None:
+            return None
+        if content.startswith("ref: "):
+            return self.resolve_ref(content[5:], depth + 1)
+        return content if len(content) in (40, 64) else None
+
+    # -- worker -----------------------------------------------------------
+
+    def _worker_lock(self) -> asyncio.Lock:
+        """Lock guarding the worker: held across the liveness check, the spawn and each request."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio locks and pipes belong to one event loop; a new loop gets both afresh
+            self.close()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        assert self._lock is not None
+        return self._lock
+
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        """The live worker, started if needed. Call with the worker lock held."""
+        if self._proc is not None and self._proc.returncode is not None:
+            self.close()
+        if self._proc is None:
+            try:
+                self._proc = await asyncio.create_subprocess_exec(
+                    "git", "cat-file", "--batch",
+                    cwd=self.root,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            except OSError as exc:
+                raise RuntimeError(f"git unavailable: {exc}") from exc
+        return self._proc
+
+    def close(self) -> None:
+        """Stop the worker; the next read starts a fresh one."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+
+    def retire(self) -> None:
+        """Close the worker now if idle, otherwise when the last reader finishes."""
+        with self._readers_lock:
+            self._retired = True
+            idle = not self._readers
+        if idle:
+            self.close()
+
+    @contextlib.contextmanager
+    def _reading(self):
+        """Lease held while a call uses the worker, so retire() does not kill it mid-call."""
+        with self._readers_lock:
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+                close = self._retired and not self._readers
+            if close:
+                self.close()
+
+    async def read_object(self, rev: str) -> tuple[str, str, bytes] | None:
+        """Return (sha, type, content) for rev, or None if it does not exist."""
+        with self._reading():
+            return await self._read_object(rev)
+
+    async def _read_object(self, rev: str) -> tuple[str, str, bytes] | None:
+        async with self._worker_lock():
+            proc = await self._ensure_worker()
+            assert proc.stdin and proc.stdout
+            try:
+                proc.stdin.write(rev.encode() + b"\n")
+                await proc.stdin.drain()
+                header = await asyncio.wait_for(proc.stdout.readline(), GIT_TIMEOUT)
+                parts = header.decode().split()
+                if len(parts) != 3:
+                    if not header:
+                        raise RuntimeError("git cat-file exited")
+                    return None  # "<rev> missing" / "<rev> ambiguous"
+                sha, kind, size = parts
+                content = await asyncio.wait_for(proc.stdout.readexactly(int(size) + 1), GIT_TIMEOUT)
+            except BaseException as exc:
+                # A half-read response would desync the stream: never reuse this worker
+                self.close()
+                if isinstance(exc, (OSError, TimeoutError, asyncio.IncompleteReadError, ValueError)):
+                    raise RuntimeError(f"git cat-file failed: {exc!r}") from exc
+                raise
+        return sha, kind, content[:-1]
+
+    # -- history ----------------------------------------------------------
+
+    async def commit(self, rev: str) -> Commit | None:
+        memo = self._commits
+        if rev in memo:
+            return memo[rev]
+        if _is_sha(rev):
+            row = await asyncio.to_thread(_stored_commit, str(self.common_dir), rev)
+            if row is not None:
+                commit = memo[rev] = Commit(*row)
+                return commit
+        obj = await self.read_object(rev)
+        if obj is None or obj[1] != "commit":
+            return None
+        commit = memo.get(obj[0])
+        if commit is None:
+            commit = memo[obj[0]] = parse_commit(obj[0], obj[2])
+            self._unsaved.append(commit)
+        return commit
+
+    async def _save(self) -> None:
+        unsaved, self._unsaved = self._unsaved, []
+        if unsaved:
+            await asyncio.to_thread(
+                _store_commits,
+                str(self.common_dir),
+                [(c.sha, c.parents, c.committed_at, c.subject) for c in unsaved],
+            )
+
+    @metrics.timed("git.log")
+    async def log(self, limit: int, rev: str = "HEAD") -> list[Commit]:
+        """First `limit` commits reachable from rev, newest first (like `git log -n`).
+
+        Incremental: the previous result for rev is reused when its tip has not
+        moved, and extended when the new tip fast-forwards it. Anything else
+        (rebase, amend, reset) is a rewrite and falls back to a full walk over
+        the SHA-keyed commit memo, so only unseen commits are read from git.
+        """
+        with self._reading():
+            return await self._log(limit, rev)
+
+    async def _log(self, limit: int, rev: str) -> list[Commit]:
+        tip = self.resolve_ref(rev) if rev == "HEAD" or rev.startswith("refs/") else None
+        try:
+            start = await self.commit(tip or rev)
+            if start is None:
+                return []
+            previous = self._logs.get(rev)
+            if previous is not None:
+                old_tip, old_commits, complete = previous
+                if old_tip == start.sha and (complete or len(old_commits) >= limit):
+                    return old_commits[:limit]
+                new = await self._fast_forward(start, old_tip, limit)
+                if new is not None and (complete or len(new) + len(old_commits) >= limit):
+                    commits = new + old_commits
+                    self._logs[rev] = (start.sha, commits, complete)
+                    return commits[:limit]
+                if new is None:
+                    logger.debug("%s: %s moved non-linearly (rewrite or merge), rescanning", self.root, rev)
+
+            commits = await self._walk(start, limit)
+            self._logs[rev] = (start.sha, commits, len(commits) < limit)
+            return commits
+        finally:
+            await self._save()
+
+    async def _fast_forward(self, start: Commit, old_tip: str, limit: int) -> list[Commit] | None:
+        """Linear commits from start down to old_tip, or None if old_tip is not reached."""
+        new: list[Commit] = []
+        commit: Commit | None = start
+        while commit is not None and commit.sha != old_tip:
+            if len(commit.parents) != 1 or len(new) >= limit:
+                return None
+            new.append(commit)
+            commit = await self.commit(commit.parents[0])
+        return new if commit is not None else None
+
+    async def _walk(self, start: Commit, limit: int) -> list[Commit]:
+        commits: list[Commit] = []
+        seen = {start.sha}
+        queue: list[tuple[int, int, Commit]] = [(-start.committed_at, 0, start)]
+        counter = 1
+        while queue and len(commits) < limit:
+            _, _, commit = heapq.heappop(queue)
+            commits.append(commit)
+            for parent_sha in commit.parents:
+                if parent_sha in seen:
+                    continue
+                seen.add(parent_sha)
+                parent = await self.commit(parent_sha)
+                if parent is not None:  # shallow clones end in missing parents
+                    heapq.heappush(queue, (-parent.committed_at, counter, parent))
+                    counter += 1
+        return commits
+
+    @metrics.timed("git.unique")
+    async def unique_commits(self, tip: str, base: str, limit: int) -> tuple[list[Commit], bool]:
+        """Commits reachable from tip but not from base (`git log base..tip`), newest first.
+
+        Both sides are walked together in commit-date order, base-side marks
+        spreading to every ancestor they reach; the walk stops once the queue
+        holds only base-side commits older than every unresolved found commit
+        (like git, this trusts commit dates to roughly follow ancestry). Returns (commits, complete), complete being
+        False when more than `limit` commits were found. Results are kept per
+        (tip, base) SHA pair, so refs that did not move cost nothing.
+        """
+        cached = self._unique.get((tip, base))
+        if cached is not None and (cached[1] or len(cached[0]) >= limit):
+            self._unique.move_to_end((tip, base))
+            return cached[0][:limit], cached[1] and len(cached[0]) <= limit
+        try:
+            with self._reading():
+                commits, complete = await self._walk_unique(tip, base, limit)
+        finally:
+            await self._save()
+        self._unique[(tip, base)] = (commits, complete)
+        while len(self._unique) > MAX_UNIQUE_RESULTS:
+            self._unique.popitem(last=False)
+        return commits, complete
+
+    async def _walk_unique(self, tip: str, base: str, limit: int) -> tuple[list[Commit], bool]:
+        on_tip, on_base = 1, 2
+        flags: dict[str, int] = {}
+        queue: list[tuple[int, int, Commit]] = []
+        counter = 0
+        for sha, flag in ((tip, on_tip), (base, on_base)):
+            commit = await self.commit(sha)
+            if commit is not None:
+                flags[commit.sha] = flags.get(commit.sha, 0) | flag
+                queue.append((-commit.committed_at, counter, commit))
+                counter += 1
+        heapq.heapify(queue)
+        found: list[Commit] = []
+        emitted: set[str] = set()
+        complete = True
+
+        def settled() -> bool:
+            # Only base-side commits left, and none of them can still reach a found commit
+            if not all(flags[c.sha] & on_base for _, _, c in queue):
+                return False
+            pending = [c.committed_at for c in found if not flags[c.sha] & on_base]
+            return not pending or -queue[0][0] < min(pending)
+
+        while queue and not settled():
+            _, _, commit = heapq.heappop(queue)
+            flag = flags[commit.sha]
+            if not flag & on_base and commit.sha not in emitted:
+                if len(found) >= limit:
+                    complete = False
+                    break
+                emitted.add(commit.sha)
+                found.append(commit)
+            inherited = on_base if flag & on_base else on_tip
+            for parent_sha in commit.parents:
+                old = flags.get(parent_sha, 0)
+                if old | inherited == old:
+                    continue
+                flags[parent_sha] = old | inherited
+                parent = await self.commit(parent_sha)
+                if parent is not None:  # shallow clones end in missing parents
+                    heapq.heappush(queue, (-parent.committed_at, counter, parent))
+                    counter += 1
+        # Commits reached from tip first may turn out to be on base as well
+        return [c for c in found if not flags[c.sha] & on_base], complete
+
+
+def _is_sha(rev: str) -> bool:
+    return len(rev) in (40, 64) and all(c in "0123456789abcdef" for c in rev)
+
+
+def _stored_commit(repo: str, sha: str) -> tuple[str, tuple[str, ...], int, str] | None:
+    return get_commit_store().get(repo, sha)
+
+
+def _store_commits(repo: str, commits: list[tuple[str, tuple[str, ...], int, str]]) -> None:
+    get_commit_store().add(repo, commits)
+
+
+_repos: OrderedDict[Path, GitRepo] = OrderedDict()
+_repos_lock = threading.Lock()  # get_repo also runs on worker threads (response memo keys)
+
+
+def get_repo(cwd: Path) -> GitRepo | None:
+    """Repository containing cwd, reusing its worker; None outside a git repository."""
+    located = find_repo(cwd.resolve())
+    if located is None:
+        return None
+    root, git_dir = located
+    with _repos_lock:
+        repo = _repos.get(git_dir)
+        if repo is None or repo.root != root:
+            if repo is not None:
+                repo.retire()
+            repo = _repos[git_dir] = GitRepo(root, git_dir)
+        _repos.move_to_end(git_dir)
+        limit = max(1, int(os.getenv("SWARMIA_MCP_GIT_WORKERS") or MAX_WORKERS))
+        while len(_repos) > limit:
+            # Calls still walking an evicted repository keep its worker until they finish
+            _repos.popitem(last=False)[1].retire()
+    return repo
@@ -0,0 +1,109 @@
+"""
+GitHub Issues resolver: issue keys resolved with one aliased GraphQL query per batch.
+
+A key prefix maps to a repository ("WEB=github:acme/web" makes WEB-42 mean
+acme/web#42). All repositories routed to GitHub share the same query, so a
+batch costs one request no matter how many repositories it touches.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+
+import httpx
+
+from swarmia_mcp.issues import Resolver
+
+# Overridable for GitHub Enterprise Server or a local stand-in
+API_URL = os.getenv("SWARMIA_MCP_GITHUB_API_URL", "https://api.github.com/graphql")
+
+_FIELDS = "title state assignees(first: 10) { nodes { login } }"
+
+
+class GitHubResolver(Resolver):
+    name = "github"
+    label = "GitHub"
+    # GraphQL node limit and query cost stay low with 50 aliased lookups
+    batch_size = 50
+
+    def __init__(self, repos: dict[str, str]):
+        # key prefix -> "owner/name"
+        self.repos = repos
+
+    def secret(self) -> str | None:
+        return os.getenv("GITHUB_TOKEN")
+
+    def handles(self, issue_id: str) -> bool:
+        return "/" in self.repos.get(issue_id.partition("-")[0], "")
+
+    def request(self, issue_ids: list[str], with_viewer: bool) -> tuple[str, str, dict]:
+        by_repo: dict[str, list[tuple[int, str]]] = {}
+        for index, issue_id in enumerate(issue_ids):
+            prefix, _, number = issue_id.partition("-")
+            by_repo.setdefault(self.repos[prefix], []).append((index, number))
+
+        params, selections, variables = [], [], {}
+        for r, (repo, numbers) in enumerate(by_repo.items()):
+            owner, name = repo.split("/", 1)
+            params.append(f"$o{r}: String!, $n{r}: String!")
+            variables[f"o{r}"], variables[f"n{r}"] = owner, name
+            nodes = " ".join(
+                f"i{index}: issueOrPullRequest(number: {int(number)}) "
+                f"{{ ... on Issue {{ {_FIELDS} }} ... on PullRequest {{ {_FIELDS} }} }}"
+                for index, number in numbers
+            )
+            selections.append(f"r{r}: repository(owner: $o{r}, name: $n{r}) {{ {nodes} }}")
+        # Always asked for (it is free), so assignee_id can prefer the viewer
+        selections.append("viewer { login }")
+        signature = f"({', '.join(params)})" if params else ""
+        query = f"query{signature} {{ {' '.join(selections)} }}"
+        return "POST", API_URL, {
+            "json": {"query": query, "variables": variables},
+            "headers": {"Authorization": f"Bearer {self.secret() or ''}"},
+        }
+
+    def parse(self, issue_ids: list[str], with_viewer: bool, resp: httpx.Response) -> tuple[str | None, dict]:
+        resp.raise_for_status()
+        data = resp.json().get("data") or {}
+        viewer = (data.get("viewer") or {}).get("login")
+        nodes: dict = {}
+        for alias, repo in data.items():
+            if alias.startswith("r"):
+                nodes.update(repo or {})
+
+        # Missing repositories or numbers come back as null (with a NOT_FOUND error)
+        results: dict = dict.fromkeys(issue_ids)
+        for index, issue_id in enumerate(issue_ids):
+            node = nodes.get(f"i{index}")
+            if not node:
+                continue
+            logins = [a.get("login") for a in (node.get("assignees") or {}).get("nodes") or []]
+            results[issue_id] = {
+                "title": node.get("title", ""),
+                "state": node.get("state", ""),
+                # The viewer if they are among the assignees, else the first one
+                "assignee_id": viewer if viewer in logins else (logins or [None])[0],
+            }
+        return viewer if with_viewer else None, results
+
+    def rate_budgets(self, headers: httpx.Headers) -> list[tuple[float, float]]:
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")  # epoch seconds
+        if remaining is None or reset is None:
+            return []
+        with contextlib.suppress(ValueError):
+            return [(float(remaining), float(reset))]
+        return []
+
+    def is_throttled(self, resp: httpx.Response) -> bool:
+        """HTTP 429, a 403 secondary rate limit, or a RATE_LIMITED GraphQL error."""
+        if resp.status_code == 429:
+            return True
+        if resp.status_code == 403:
+            return resp.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in resp.headers
+        try:
+            errors = resp.json().get("errors") or []
+        except ValueError:
+            return False
+        return any(e.get("type") == "RATE_LIMITED" for e in errors)
@@ -0,0 +1,742 @@
+"""
+Issue verification across trackers (Linear, Jira, GitHub Issues).
+
+Each team-key prefix is routed to one resolver via SWARMIA_MCP_ISSUE_TRACKERS,
+e.g. "ENG=linear,OPS=jira,WEB=github:acme/web,*=linear". A resolver only builds
+one bulk request for a batch of keys and parses the answer; everything else is
+shared here:
+
+- batching (one request per backend per batch_size keys)
+- singleflight: concurrent lookups of the same key share one request
+- pacing from the backend's rate-limit headers, jittered backoff on throttling
+- the on-disk cache (per backend and credential, stale-while-revalidate)
+- an optional local mirror of the tracker's issues, synced incrementally
+
+Keys still throttled after retries are reported as rate-limited, not unknown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import logging
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from functools import lru_cache
+from typing import Awaitable, Callable
+
+import httpx
+
+from swarmia_mcp import metrics
+from swarmia_mcp.cache import MirrorState, fingerprint, get_cache, get_issue_mirror
+
+logger = logging.getLogger("swarmia_mcp")
+
+# Requests in flight per backend
+MAX_CONCURRENCY = 4
+# Throttled requests: full-jitter exponential backoff, bounded per request
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+MAX_WAIT = 20.0
+# Below this many requests left in the window, spread them until it resets
+LOW_WATERMARK = 10
+# Mirror: resync in the background after this long; stop serving from it after MAX_AGE
+MIRROR_SYNC_INTERVAL = 300
+MIRROR_MAX_AGE = 24 * 3600
+
+# backend name -> (module, class)
+BACKENDS = {
+    "linear": ("swarmia_mcp.linear", "LinearResolver"),
+    "jira": ("swarmia_mcp.jira", "JiraResolver"),
+    "github": ("swarmia_mcp.github_issues", "GitHubResolver"),
+}
+
+
+class UnknownKeys(Exception):
+    """Raised by Resolver.parse when the backend rejected a batch because of these keys."""
+
+    def __init__(self, keys: set[str]):
+        super().__init__(", ".join(sorted(keys)))
+        self.keys = keys
+
+
+class Resolver(ABC):
+    """One issue tracker. Subclasses build and parse a single bulk request.
+
+    secret(), request() and parse() are required. parse() returns (viewer_id,
+    {key: {title, state, assignee_id} | None}) with None for keys the tracker
+    does not know, and raises ValueError or httpx.HTTPStatusError when the
+    response is unusable. The team-key and mirror hooks are optional: their
+    parse_* method is only called once the matching *_request returns a request.
+    """
+
+    name = ""
+    label = ""
+    batch_size = 50
+    # Whether the viewer lookup can ride along with an issue batch
+    viewer_in_batch = True
+
+    @abstractmethod
+    def secret(self) -> str | None:
+        """Credential for this backend; None when it is not configured."""
+
+    def handles(self, issue_id: str) -> bool:
+        return True
+
+    @abstractmethod
+    def request(self, issue_ids: list[str], with_viewer: bool) -> tuple[str, str, dict]:
+        """(method, url, httpx request kwargs) for one batch (or the viewer alone)."""
+
+    @abstractmethod
+    def parse(self, issue_ids: list[str], with_viewer: bool, resp: httpx.Response) -> tuple[str | None, dict]:
+        """(viewer_id, {key: info | None}) from the response to request()."""
+
+    def rate_budgets(self, headers: httpx.Headers) -> list[tuple[float, float]]:
+        """(requests of our size left, window reset epoch) per rate-limit bucket."""
+        return []
+
+    def is_throttled(self, resp: httpx.Response) -> bool:
+        return resp.status_code == 429
+
+    def teams_request(self) -> tuple[str, str, dict] | None:
+        """Request listing every key prefix this tracker issues, or None if it cannot."""
+        return None
+
+    def parse_teams(self, resp: httpx.Response) -> list[str]:
+        """Key prefixes from the response to teams_request(); required when that returns a request."""
+        raise NotImplementedError(f"{type(self).__name__} has a teams_request() but no parse_teams()")
+
+    def mirror_request(self, teams: list[str] | None, updated_after: str, page: str) -> tuple[str, str, dict] | None:
+        """One page of issues updated after updated_after ("" for all), in teams (None for all).
+
+        None when this tracker cannot be mirrored. page is the cursor returned
+        by parse_mirror for the previous page ("" for the first).
+        """
+        return None
+
+    def parse_mirror(self, resp: httpx.Response) -> tuple[list[dict], str]:
+        """([{id, identifier, title, state, assignee_id, updated_at}], next page cursor or "").
+
+        Required when mirror_request() returns a request.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has a mirror_request() but no parse_mirror()")
+
+    @property
+    def scope(self) -> str:
+        """Cache namespace and singleflight scope: backend plus credential fingerprint."""
+        return f"{self.name}:{fingerprint(self.secret() or '')}"
+
+
+# ---------------------------------------------------------------------------
+# Routing
+# ---------------------------------------------------------------------------
+
+
+def _spec() -> str:
+    spec = os.getenv("SWARMIA_MCP_ISSUE_TRACKERS")
+    if spec:
+        return spec
+    # Without explicit routing: Linear if it has a key, else Jira if it is set up
+    if not os.getenv("LINEAR_API_KEY") and os.getenv("JIRA_BASE_URL"):
+        return "*=jira"
+    return "*=linear"
+
+
+@lru_cache(maxsize=4)
+def _routing(spec: str) -> tuple[dict[str, Resolver], Resolver | None]:
+    """Parse "PREFIX=backend[:arg],..." into (prefix -> resolver, default resolver)."""
+    entries = []
+    for part in spec.split(","):
+        prefix, _, target = part.partition("=")
+        kind, _, arg = target.strip().partition(":")
+        if prefix.strip() and kind.lower() in BACKENDS:
+            entries.append((prefix.strip().upper(), kind.lower(), arg.strip()))
+        elif part.strip():
+            logger.warning("SWARMIA_MCP_ISSUE_TRACKERS: ignoring %r", part.strip())
+
+    instances: dict[str, Resolver] = {}
+    routes: dict[str, Resolver] = {}
+    default = None
+    for prefix, kind, _ in entries:
+        if kind not in instances:
+            module, cls = BACKENDS[kind]
+            resolver_cls = getattr(importlib.import_module(module), cls)
+            if kind == "github":
+                # One resolver for all GitHub-routed prefixes, so they share a request
+                instances[kind] = resolver_cls({p: a for p, k, a in entries if k == "github" and a})
+            else:
+                instances[kind] = resolver_cls()
+        if prefix == "*":
+            default = instances[kind]
+        else:
+            routes[prefix] = instances[kind]
+    return routes, default
+
+
+def resolver_for(issue_id: str) -> Resolver | None:
+    """Configured resolver for an issue key, or None (regex-only)."""
+    routes, default = _routing(_spec())
+    resolver = routes.get(issue_id.partition("-")[0], default)
+    if resolver is None or not resolver.secret() or not resolver.handles(issue_id):
+        return None
+    return resolver
+
+
+def _configured_resolvers() -> list[Resolver]:
+    """Every routed tracker with credentials, once each."""
+    routes, default = _routing(_spec())
+    unique = dict.fromkeys([*routes.values(), *([default] if default else [])])
+    return [r for r in unique if r.secret()]
+
+
+def configured() -> bool:
+    """Whether any routed tracker has credentials."""
+    return bool(_configured_resolvers())
+
+
+def label(name: str) -> str:
+    module, cls = BACKENDS.get(name, ("", ""))
+    return getattr(importlib.import_module(module), cls).label if module else name
+
+
+# ---------------------------------------------------------------------------
+# HTTP: shared pool, pacing, retries
+# ---------------------------------------------------------------------------
+
+_pool: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient, dict[str, asyncio.Semaphore]] | None = None
+
+
+def _client(backend: str) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """Shared keep-alive client (and per-backend request limiter) for the running event loop."""
+    global _pool
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool[0] is not loop:
+        client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENCY * len(BACKENDS),
+                max_keepalive_connections=MAX_CONCURRENCY * len(BACKENDS),
+            ),
+        )
+        _pool = (loop, client, {})
+    limiter = _pool[2].setdefault(backend, asyncio.Semaphore(MAX_CONCURRENCY))
+    return _pool[1], limiter
+
+
+class _Pacer:
+    """Request budget per backend and credential, as last reported by its headers."""
+
+    def __init__(self) -> None:
+        self.budgets: list[tuple[float, float]] = []
+
+    def update(self, budgets: list[tuple[float, float]]) -> None:
+        if budgets:
+            self.budgets = budgets
+
+    def delay(self) -> float:
+        """Seconds to wait so the remaining budget lasts until its window resets."""
+        now = time.time()
+        wait = 0.0
+        for left, reset_at in self.budgets:
+            window = reset_at - now
+            if window <= 0:
+                continue
+            if left < 1:
+                wait = max(wait, window)
+            elif left < LOW_WATERMARK:
+                wait = max(wait, window / left)
+        return wait
+
+
+_pacers: dict[str, _Pacer] = {}
+
+
+async def _send(resolver: Resolver, request: tuple[str, str, dict]) -> tuple[httpx.Response | None, bool]:
+    """One request, paced and retried while throttled. Returns (response, throttled)."""
+    method, url, kwargs = request
+    client, limiter = _client(resolver.name)
+    pacer = _pacers.setdefault(resolver.scope, _Pacer())
+    deadline = time.monotonic() + MAX_WAIT
+    resp: httpx.Response | None = None
+    for attempt in range(MAX_RETRIES + 1):
+        pause = pacer.delay()
+        if resp is not None:
+            with contextlib.suppress(ValueError, TypeError):
+                pause = max(pause, float(resp.headers.get("retry-after")))
+            pause += random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+        if pause:
+            if time.monotonic() + pause > deadline:
+                return resp, True
+            with metrics.span(f"{resolver.name}.backoff" if attempt else f"{resolver.name}.pacing"):
+                await asyncio.sleep(pause)
+        try:
+            async with limiter:
+                resp = await client.request(method, url, **kwargs)
+        except httpx.RequestError:
+            return None, False
+        pacer.update(resolver.rate_budgets(resp.headers))
+        if not resolver.is_throttled(resp):
+            return resp, False
+    return resp, True
+
+
+async def _query_chunk(resolver: Resolver, chunk: list[str], with_viewer: bool) -> tuple[str | None, dict, bool]:
+    """Resolve one batch. Returns (viewer_id, results, throttled)."""
+    rejected: dict = {}
+    with metrics.span(f"{resolver.name}.http"):
+        # A batch the backend rejects over unknown keys is retried without them
+        for _ in range(3):
+            # The viewer rides along with an issue batch or is requested alone
+            with metrics.span(f"{resolver.name}.issues" if chunk else f"{resolver.name}.viewer"):
+                resp, throttled = await _send(resolver, resolver.request(chunk, with_viewer))
+            if resp is None or throttled:
+                return None, rejected, throttled
+            try:
+                viewer_id, results = resolver.parse(chunk, with_viewer, resp)
+            except UnknownKeys as exc:
+                unknown = exc.keys & set(chunk)
+                if not unknown:
+                    break
+                rejected.update(dict.fromkeys(unknown))
+                chunk = [k for k in chunk if k not in unknown]
+                if not chunk and not with_viewer:
+                    break
+                continue
+            except (httpx.HTTPStatusError, ValueError, KeyError, TypeError, AttributeError):
+                # Will be handled in caller — missing entries = unverified
+                break
+            return viewer_id, {**rejected, **results}, False
+    return None, rejected, False
+
+
+# ---------------------------------------------------------------------------
+# Lookup: batching + singleflight
+# ---------------------------------------------------------------------------
+
+# Outcomes besides an issue dict (found) or None (the tracker does not know it)
+_FAILED = object()
+_THROTTLED = object()
+
+# (resolver scope, "viewer" | "issue:<ID>") -> in-flight result
+_inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def _fetch(resolver: Resolver, issue_ids: list[str], with_viewer: bool) -> dict[str, object]:
+    """Query the backend for issue_ids (and the viewer). Returns {item key: outcome}."""
+    size = resolver.batch_size
+    chunks = [issue_ids[i:i + size] for i in range(0, len(issue_ids), size)]
+    if with_viewer and (not chunks or not resolver.viewer_in_batch):
+        chunks.insert(0, [])
+
+    async with asyncio.TaskGroup() as group:
+        tasks = [
+            group.create_task(_query_chunk(resolver, chunk, with_viewer and index == 0))
+            for index, chunk in enumerate(chunks)
+        ]
+
+    outcomes: dict[str, object] = {}
+    for index, (chunk, task) in enumerate(zip(chunks, tasks)):
+        chunk_viewer, chunk_results, throttled = task.result()
+        if with_viewer and index == 0:
+            outcomes["viewer"] = _THROTTLED if throttled else chunk_viewer or _FAILED
+        for issue_id in chunk:
+            outcomes[f"issue:{issue_id}"] = (
+                _THROTTLED if throttled else chunk_results.get(issue_id, _FAILED)
+            )
+    return outcomes
+
+
+async def lookup(
+    resolver: Resolver, issue_ids: list[str], with_viewer: bool = True
+) -> tuple[str | None, dict, set[str]]:
+    """Resolve issues (and optionally the viewer) in as few round trips as possible.
+
+    Returns (viewer_id, {id: {title, state, assignee_id} | None}, rate_limited_ids).
+    Keys are sent in batches of resolver.batch_size, at most MAX_CONCURRENCY
+    requests at a time. Keys another lookup is already fetching are awaited
+    instead of requested again. Keys the tracker does not know map to None;
+    keys whose request failed are absent, and keys still throttled after
+    retries are also listed in rate_limited_ids.
+    """
+    if not resolver.secret():
+        return None, {}, set()
+
+    with metrics.span(f"{resolver.name}.query"):
+        loop = asyncio.get_running_loop()
+        scope = resolver.scope
+        items = [f"issue:{issue_id}" for issue_id in sorted(set(issue_ids))]
+        if with_viewer:
+            items.append("viewer")
+        owned: dict[str, asyncio.Future] = {}
+        joined: dict[str, asyncio.Future] = {}
+        for item in items:
+            future = _inflight.get((scope, item))
+            if future is not None and future.get_loop() is loop:
+                joined[item] = future
+            else:
+                owned[item] = _inflight[(scope, item)] = loop.create_future()
+
+        outcomes: dict[str, object] = {}
+        try:
+            if owned:
+                outcomes = await _fetch(
+                    resolver, [item[6:] for item in owned if item != "viewer"], "viewer" in owned
+                )
+        finally:
+            for item, future in owned.items():
+                # On error or cancellation, waiters see a failed (uncached) lookup
+                future.set_result(outcomes.get(item, _FAILED))
+                if _inflight.get((scope, item)) is future:
+                    del _inflight[(scope, item)]
+        for item, future in joined.items():
+            outcomes[item] = await asyncio.shield(future)
+
+    viewer = outcomes.get("viewer")
+    results: dict = {}
+    rate_limited: set[str] = set()
+    for item, outcome in outcomes.items():
+        if item == "viewer":
+            continue
+        if outcome is _THROTTLED:
+            rate_limited.add(item[6:])
+        elif outcome is not _FAILED:
+            results[item[6:]] = outcome
+    return (viewer if isinstance(viewer, str) else None), results, rate_limited
+
+
+# ---------------------------------------------------------------------------
+# Team keys (allowlist for key extraction)
+# ---------------------------------------------------------------------------
+
+
+async def _fetch_team_keys(resolver: Resolver) -> list[str] | None:
+    request = resolver.teams_request()
+    if request is None:
+        return None
+    resp, throttled = await _send(resolver, request)
+    if resp is None or throttled:
+        return None
+    try:
+        return resolver.parse_teams(resp) or None
+    except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+async def _refresh_team_keys(resolver: Resolver) -> list[str] | None:
+    fetched = await _fetch_team_keys(resolver)
+    if fetched:
+        get_cache().set(resolver.scope, "team_keys", fetched)
+    return fetched
+
+
+async def _cached_team_keys(resolver: Resolver) -> list[str] | None:
+    """Cached team keys; stale ones are served while a background refresh runs."""
+    entry = get_cache().get(resolver.scope, "team_keys")
+    if entry is None:
+        return await _refresh_team_keys(resolver)
+    marker = f"{resolver.scope}/team_keys"
+    if not entry.fresh and marker not in _refreshing:
+        _refreshing.add(marker)
+        task = asyncio.create_task(_refresh_team_keys(resolver))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        task.add_done_callback(lambda _task: _refreshing.discard(marker))
+    return entry.value
+
+
+@metrics.timed("issues.team_keys")
+async def team_keys() -> frozenset[str] | None:
+    """Issue key prefixes in use, or None when they cannot be known (extract generically).
+
+    SWARMIA_MCP_TEAM_KEYS ("ENG,OPS") wins. Otherwise: the prefixes routed
+    explicitly in SWARMIA_MCP_ISSUE_TRACKERS plus the team keys of the default
+    tracker, fetched once and cached like issues.
+    """
+    configured = os.getenv("SWARMIA_MCP_TEAM_KEYS")
+    if configured:
+        return frozenset(k.strip().upper() for k in configured.split(",") if k.strip())
+    routes, default = _routing(_spec())
+    keys = set(routes)
+    if default is not None:
+        fetched = await _cached_team_keys(default) if default.secret() else None
+        if fetched is None:
+            return None
+        keys.update(fetched)
+    return frozenset(keys) or None
+
+
+# ---------------------------------------------------------------------------
+# Mirror (local copy of a tracker's issues)
+# ---------------------------------------------------------------------------
+
+_syncing: dict[str, asyncio.Task] = {}
+
+
+def mirror_enabled() -> bool:
+    """SWARMIA_MCP_ISSUE_MIRROR=1 keeps the mirror synced in the background."""
+    return os.getenv("SWARMIA_MCP_ISSUE_MIRROR", "").strip().lower() in ("1", "true", "yes")
+
+
+def _mirrorable(resolver: Resolver) -> bool:
+    return resolver.mirror_request(None, "", "") is not None
+
+
+def _mirror_teams(resolver: Resolver) -> list[str] | None:
+    """Teams to mirror: SWARMIA_MCP_TEAM_KEYS routed here, else the prefixes routed here (None: all)."""
+    routes, default = _routing(_spec())
+    configured = os.getenv("SWARMIA_MCP_TEAM_KEYS")
+    if configured:
+        keys = {k.strip().upper() for k in configured.split(",") if k.strip()}
+        return sorted(k for k in keys if routes.get(k, default) is resolver)
+    if resolver is default:
+        return None
+    return sorted(prefix for prefix, routed in routes.items() if routed is resolver)
+
+
+def _mirror_usable(state: MirrorState | None) -> bool:
+    return bool(state and state.synced_at and time.time() - state.synced_at < MIRROR_MAX_AGE)
+
+
+def _mirror_status(resolver: Resolver) -> dict | None:
+    mirror = get_issue_mirror(create=False)
+    state = mirror.state(resolver.scope) if mirror else None
+    if mirror is None or state is None:
+        return None
+    return {
+        "tracker": resolver.name,
+        "teams": state.teams.split(",") if state.teams else "all",
+        "issues": mirror.count(resolver.scope),
+        "synced_at": state.synced_at or None,
+        "age_seconds": round(time.time() - state.synced_at) if state.synced_at else None,
+        "usable": _mirror_usable(state),
+        "syncing": resolver.scope in _syncing,
+    }
+
+
+async def _sync(resolver: Resolver, full: bool, on_page: Callable[[str, int], Awaitable[None]] | None) -> dict:
+    """Fetch issues updated since the last complete pass, page by page.
+
+    Progress is saved with every page, so an interrupted pass resumes where it
+    stopped; the updatedAt cursor only advances once a pass completes.
+    """
+    mirror = get_issue_mirror()
+    scope = resolver.scope
+    teams = _mirror_teams(resolver)
+    result: dict = {"tracker": resolver.name, "fetched": 0}
+
+    def finish(**extra: str) -> dict:
+        return {**result, **(_mirror_status(resolver) or {}), "syncing": False, **extra}
+
+    if teams == []:
+        return finish(error="no team keys are routed to this tracker")
+    teams_key = ",".join(teams or [])
+    state = mirror.state(scope)
+    if full or (state is not None and state.teams != teams_key):
+        mirror.reset(scope)
+        state = None
+    state = state or MirrorState(teams_key, "", "", "", 0.0)
+
+    while True:
+        request = resolver.mirror_request(teams, state.cursor, state.page)
+        if request is None:
+            return finish(error=f"{resolver.label} issues cannot be mirrored")
+        with metrics.span(f"{resolver.name}.mirror_page"):
+            resp, throttled = await _send(resolver, request)
+        if resp is None or throttled:
+            error = "rate limited" if throttled else "request failed"
+            return finish(error=error)
+        try:
+            page_issues, next_page = resolver.parse_mirror(resp)
+        except (httpx.HTTPStatusError, ValueError, KeyError, TypeError, AttributeError):
+            if state.page:
+                # Page cursors can expire; restart the pass from the updatedAt cursor
+                state = replace(state, page="", pass_max="")
+                continue
+            return finish(error=f"unexpected response (HTTP {resp.status_code})")
+        result["fetched"] += len(page_issues)
+        pass_max = max([state.pass_max, *(issue["updated_at"] for issue in page_issues)])
+        if next_page:
+            state = replace(state, page=next_page, pass_max=pass_max)
+        else:
+            state = MirrorState(teams_key, max(state.cursor, pass_max), "", "", time.time())
+        mirror.save_page(scope, page_issues, state)
+        if on_page is not None:
+            await on_page(resolver.label, result["fetched"])
+        if not next_page:
+            return finish()
+
+
+async def _sync_once(resolver: Resolver, full: bool = False, on_page: Callable[[str, int], Awaitable[None]] | None = None) -> dict:
+    """Singleflight: a sync already running for this scope is awaited instead of started again."""
+    scope = resolver.scope
+    task = _syncing.get(scope)
+    if task is None:
+        task = asyncio.create_task(_sync(resolver, full, on_page))
+        _syncing[scope] = task
+        task.add_done_callback(lambda _task: _syncing.pop(scope, None))
+    # Shielded: a cancelled tool call must not abort a sync others may be awaiting
+    return await asyncio.shield(task)
+
+
+@metrics.timed("issues.sync_mirror")
+async def sync_mirrors(full: bool = False, on_page: Callable[[str, int], Awaitable[None]] | None = None) -> list[dict]:
+    """Sync the mirror of every configured tracker that supports one. One result dict each."""
+    resolvers = [r for r in _configured_resolvers() if _mirrorable(r)]
+    results = await asyncio.gather(*(_sync_once(r, full, on_page) for r in resolvers))
+    return list(results)
+
+
+def mirror_status() -> list[dict]:
+    """Mirror state per configured tracker that has been synced at least once."""
+    return [status for r in _configured_resolvers() if (status := _mirror_status(r))]
+
+
+def _from_mirror(resolver: Resolver, issue_ids: list[str]) -> tuple[dict, float]:
+    """Issues found in a usable mirror and when it was synced; starts a background sync when due."""
+    if mirror_enabled() and resolver.scope not in _syncing and _mirrorable(resolver):
+        state = get_issue_mirror().state(resolver.scope)
+        if state is None or state.page or time.time() - state.synced_at >= MIRROR_SYNC_INTERVAL:
+            task = asyncio.create_task(_sync_once(resolver))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+    mirror = get_issue_mirror(create=False)
+    state = mirror.state(resolver.scope) if mirror else None
+    if mirror is None or not _mirror_usable(state):
+        return {}, 0.0
+    return mirror.get_many(resolver.scope, issue_ids), state.synced_at
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _store(namespace: str, viewer_id: str | None, issues: dict) -> None:
+    entries = {f"issue:{issue_id}": info for issue_id, info in issues.items()}
+    if viewer_id:
+        entries["viewer"] = viewer_id
+    get_cache().set_many(namespace, entries)
+
+
+def _revalidate(resolver: Resolver, keys: list[str]) -> None:
+    """Refresh stale cache entries in the background (stale-while-revalidate)."""
+    namespace = resolver.scope
+    keys = [k for k in keys if f"{namespace}/{k}" not in _refreshing]
+    if not keys:
+        return
+    _refreshing.update(f"{namespace}/{k}" for k in keys)
+
+    async def _run() -> None:
+        try:
+            issue_ids = [k.removeprefix("issue:") for k in keys if k != "viewer"]
+            viewer_id, issues, _ = await lookup(resolver, issue_ids, with_viewer="viewer" in keys)
+            _store(namespace, viewer_id, issues)
+        finally:
+            _refreshing.difference_update(f"{namespace}/{k}" for k in keys)
+
+    task = asyncio.create_task(_run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _cached_backend_lookup(
+    resolver: Resolver, issue_ids: list[str], refresh: bool
+) -> tuple[str | None, dict, dict[str, float], set[str]]:
+    namespace = resolver.scope
+    cache = get_cache()
+    mirrored: dict = {}
+    mirror_synced_at = 0.0
+    if not refresh:
+        mirrored, mirror_synced_at = _from_mirror(resolver, issue_ids)
+
+    keys = ["viewer", *(f"issue:{issue_id}" for issue_id in issue_ids if issue_id not in mirrored)]
+    if refresh:
+        # Only the entries refetched here: team_keys and other issues stay cached
+        cache.invalidate(namespace, keys)
+    cached = cache.get_many(namespace, keys)
+    missing = [k for k in keys if k not in cached]
+    stale = [k for k, entry in cached.items() if not entry.fresh]
+
+    rate_limited: set[str] = set()
+    if missing:
+        missing_ids = [k.removeprefix("issue:") for k in missing if k != "viewer"]
+        viewer_id, issues, rate_limited = await lookup(resolver, missing_ids, with_viewer="viewer" in missing)
+        _store(namespace, viewer_id, issues)
+        cached.update(cache.get_many(namespace, missing))
+    if stale:
+        _revalidate(resolver, stale)
+
+    viewer = cached.get("viewer")
+    data: dict = {}
+    fetched_at: dict[str, float] = {}
+    for issue_id in issue_ids:
+        entry = cached.get(f"issue:{issue_id}")
+        if issue_id in mirrored:
+            # Past the sync interval _from_mirror has already started a resync
+            fresh = time.time() - mirror_synced_at < MIRROR_SYNC_INTERVAL
+            data[issue_id] = {**mirrored[issue_id], "tracker": resolver.name, "fresh": fresh}
+            fetched_at[issue_id] = mirror_synced_at
+        elif entry and entry.value:
+            data[issue_id] = {**entry.value, "tracker": resolver.name, "fresh": entry.fresh}
+            fetched_at[issue_id] = entry.fetched_at
+    return (viewer.value if viewer else None), data, fetched_at, rate_limited
+
+
+@metrics.timed("issues.cached_lookup")
+async def cached_lookup(
+    issue_ids: list[str],
+    refresh: bool = False,
+    on_progress: Callable[[str, int, int], Awaitable[None]] | None = None,
+) -> tuple[dict[str, str], dict, dict[str, float], list[str]]:
+    """Verify issue keys through the on-disk cache, each with its routed tracker.
+
+    Issues in a recently synced local mirror are served from it (unless
+    refresh). Fresh cache entries are served as-is, stale ones are served and
+    refreshed in the background, and only missing entries cost a request (one per backend per
+    batch; backends run concurrently). Returns ({tracker: viewer_id},
+    {id: info + "tracker" + "fresh"}, {id: fetched_at}, rate_limited_ids); "fresh" is
+    False while a refresh of the entry (or its mirror) is under way; unknown
+    issues and keys without a configured tracker are left out. on_progress
+    is awaited with (tracker label, backends done, backends) as each finishes.
+    """
+    groups: dict[Resolver, list[str]] = {}
+    for issue_id in issue_ids:
+        resolver = resolver_for(issue_id)
+        if resolver is not None:
+            groups.setdefault(resolver, []).append(issue_id)
+    if not groups:
+        return {}, {}, {}, []
+
+    done = 0
+
+    async def _backend(resolver: Resolver, ids: list[str]) -> tuple:
+        nonlocal done
+        result = await _cached_backend_lookup(resolver, ids, refresh)
+        done += 1
+        if on_progress is not None:
+            await on_progress(resolver.label, done, len(groups))
+        return result
+
+    async with asyncio.TaskGroup() as group:
+        tasks = {resolver: group.create_task(_backend(resolver, ids)) for resolver, ids in groups.items()}
+
+    viewers: dict[str, str] = {}
+    data: dict = {}
+    fetched_at: dict[str, float] = {}
+    rate_limited: set[str] = set()
+    for resolver, task in tasks.items():
+        viewer_id, backend_data, backend_fetched, backend_limited = task.result()
+        if viewer_id:
+            viewers[resolver.name] = viewer_id
+        data.update(backend_data)
+        fetched_at.update(backend_fetched)
+        rate_limited |= backend_limited
+    return viewers, data, fetched_at, sorted(rate_limited)
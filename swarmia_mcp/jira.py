@@ -0,0 +1,94 @@
+"""
+Jira Cloud resolver: issue keys resolved with one JQL `key in (...)` search per batch.
+
+Configured with JIRA_BASE_URL plus JIRA_API_TOKEN (and JIRA_EMAIL for Atlassian
+Cloud basic auth; without it the token is sent as a bearer token, as Jira Data
+Center personal access tokens expect).
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import os
+import re
+from datetime import datetime
+
+import httpx
+
+from swarmia_mcp.issues import Resolver, UnknownKeys
+
+# Jira answers `key in (...)` with HTTP 400 if any key does not exist
+_UNKNOWN_KEY = re.compile(r"'([A-Z][A-Z0-9_]*-\d+)'")
+
+
+class JiraResolver(Resolver):
+    name = "jira"
+    label = "Jira"
+    # JQL search pages are capped at 100 issues
+    batch_size = 100
+    viewer_in_batch = False
+
+    def secret(self) -> str | None:
+        if not os.getenv("JIRA_BASE_URL") or not os.getenv("JIRA_API_TOKEN"):
+            return None
+        return f"{os.getenv('JIRA_EMAIL', '')}:{os.getenv('JIRA_API_TOKEN')}"
+
+    def _headers(self) -> dict[str, str]:
+        email = os.getenv("JIRA_EMAIL")
+        token = os.getenv("JIRA_API_TOKEN", "")
+        if email:
+            auth = "Basic " + base64.b64encode(f"{email}:{token}".encode()).decode()
+        else:
+            auth = f"Bearer {token}"
+        return {"Authorization": auth, "Accept": "application/json"}
+
+    def request(self, issue_ids: list[str], with_viewer: bool) -> tuple[str, str, dict]:
+        base = os.getenv("JIRA_BASE_URL", "").rstrip("/")
+        if not issue_ids:
+            return "GET", f"{base}/rest/api/3/myself", {"headers": self._headers()}
+        body = {
+            "jql": f"key in ({','.join(issue_ids)})",
+            "fields": ["summary", "status", "assignee"],
+            "maxResults": len(issue_ids),
+        }
+        return "POST", f"{base}/rest/api/3/search/jql", {"json": body, "headers": self._headers()}
+
+    def parse(self, issue_ids: list[str], with_viewer: bool, resp: httpx.Response) -> tuple[str | None, dict]:
+        if not issue_ids:
+            resp.raise_for_status()
+            return resp.json().get("accountId"), {}
+        if resp.status_code == 400:
+            with contextlib.suppress(ValueError):
+                messages = " ".join(resp.json().get("errorMessages") or [])
+                raise UnknownKeys(set(_UNKNOWN_KEY.findall(messages)))
+        resp.raise_for_status()
+        results: dict = dict.fromkeys(issue_ids)
+        for issue in resp.json().get("issues") or []:
+            key = issue.get("key")
+            if key not in results:
+                continue
+            fields = issue.get("fields") or {}
+            results[key] = {
+                "title": fields.get("summary", ""),
+                "state": (fields.get("status") or {}).get("name", ""),
+                "assignee_id": (fields.get("assignee") or {}).get("accountId"),
+            }
+        return None, results
+
+    def rate_budgets(self, headers: httpx.Headers) -> list[tuple[float, float]]:
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")  # ISO 8601
+        if remaining is None or reset is None:
+            return []
+        with contextlib.suppress(ValueError):
+            return [(float(remaining), datetime.fromisoformat(reset.replace("Z", "+00:00")).timestamp())]
+        return []
+
+    def teams_request(self) -> tuple[str, str, dict] | None:
+        base = os.getenv("JIRA_BASE_URL", "").rstrip("/")
+        return "GET", f"{base}/rest/api/3/project", {"headers": self._headers()}
+
+    def parse_teams(self, resp: httpx.Response) -> list[str]:
+        resp.raise_for_status()
+        return [project["key"] for project in resp.json()]
@@ -0,0 +1,68 @@
+"""
+Issue key extraction over many commit messages at once.
+
+Messages are joined into one buffer and scanned with a single compiled regex;
+each match is mapped back to its message by offset (bisect). With an allowlist
+of team keys the regex only knows those prefixes (one alternation, longest
+first), so tokens like UTF-8 or SHA-256 never match; without one, the generic
+pattern is used and well-known non-issue prefixes are dropped.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+ISSUE_KEY_PATTERN = re.compile(r"[A-Z]{2,10}-\d+")
+
+# Standards, encodings and the like that look like issue keys (UTF-8, SHA-256, ISO-8601, COVID-19, ...)
+DENYLIST = frozenset(
+    "UTF UCS SHA MD ISO RFC CVE CWE PEP COVID TLS SSL HTTP AES RSA ECMA ANSI IEEE GPT".split()
+)
+
+
+class Extractor:
+    """Finds issue keys in many messages with one regex pass over their concatenation."""
+
+    def __init__(self, allowlist: frozenset[str] | None = None):
+        self.allowlist = allowlist
+        if allowlist:
+            prefixes = "|".join(re.escape(k) for k in sorted(allowlist, key=lambda k: (-len(k), k)))
+            # A key must not be the tail of a longer token (XENG-1 is not ENG-1)
+            self.pattern = re.compile(rf"(?<![A-Za-z0-9])(?:{prefixes})-\d+")
+        else:
+            self.pattern = ISSUE_KEY_PATTERN
+
+    def _keep(self, key: str) -> bool:
+        return self.allowlist is not None or key.partition("-")[0] not in DENYLIST
+
+    def findall(self, text: str) -> list[str]:
+        return [key for key in self.pattern.findall(text) if self._keep(key)]
+
+    def extract(self, messages: list[str]) -> list[list[str]]:
+        """Issue keys per message, in order of appearance."""
+        results: list[list[str]] = [[] for _ in messages]
+        if not messages:
+            return results
+        # Newlines cannot be part of a key, so matches never span two messages
+        buffer = "\n".join(message.replace("\n", " ") for message in messages)
+        starts = []
+        offset = 0
+        for message in messages:
+            starts.append(offset)
+            offset += len(message) + 1
+        for match in self.pattern.finditer(buffer):
+            key = match.group()
+            if self._keep(key):
+                results[bisect_right(starts, match.start()) - 1].append(key)
+        return results
+
+    def has_keys(self, messages: list[str]) -> list[bool]:
+        return [bool(keys) for keys in self.extract(messages)]
+
+
+@lru_cache(maxsize=8)
+def extractor(allowlist: frozenset[str] | None = None) -> Extractor:
+    """Compiled extractor for a team-key allowlist (None: generic pattern + denylist)."""
+    return Extractor(allowlist)
@@ -0,0 +1,167 @@
+"""
+Linear resolver: issue keys resolved with one `or`-filtered GraphQL query per batch.
+
+Batching, singleflight, pacing, retries and caching live in `issues`; this
+module only builds the query and reads Linear's answer and rate-limit headers.
+The mirror pages through `issues` filtered by updatedAt, newest first.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+
+import httpx
+
+from swarmia_mcp.issues import Resolver
+
+# Overridable so benchmarks can point the server at a local stand-in
+API_URL = os.getenv("SWARMIA_MCP_LINEAR_API_URL", "https://api.linear.app/graphql")
+# Issues per mirror page (250 is Linear's maximum page size)
+MIRROR_PAGE_SIZE = 250
+
+MIRROR_QUERY = """
+query($filter: IssueFilter, $first: Int, $after: String) {
+    issues(filter: $filter, first: $first, after: $after, orderBy: updatedAt) {
+        nodes {
+            id
+            identifier
+            title
+            updatedAt
+            state { name }
+            assignee { id }
+        }
+        pageInfo { hasNextPage endCursor }
+    }
+}
+"""
+
+
+def _batch_query(issue_ids: list[str], with_viewer: bool) -> tuple[str, dict]:
+    """Build one GraphQL query resolving all issue_ids via an `or` filter."""
+    clauses = []
+    for issue_id in issue_ids:
+        team_key, number = issue_id.split("-", 1)
+        clauses.append({"team": {"key": {"eq": team_key}}, "number": {"eq": int(number)}})
+    query = """
+    query($filter: IssueFilter, $first: Int) {
+        %s
+        issues(filter: $filter, first: $first) {
+            nodes {
+                identifier
+                title
+                state { name }
+                assignee { id }
+            }
+        }
+    }
+    """ % ("viewer { id }" if with_viewer else "")
+    return query, {"filter": {"or": clauses}, "first": len(issue_ids)}
+
+
+class LinearResolver(Resolver):
+    name = "linear"
+    label = "Linear"
+    # Linear's complexity limit is 10,000 points per query; 50 issues per batch
+    # stays well below it even with the nested state/assignee selections.
+    batch_size = 50
+
+    def __init__(self) -> None:
+        self.cost = 1.0  # complexity points of our last query
+
+    def secret(self) -> str | None:
+        return os.getenv("LINEAR_API_KEY")
+
+    def request(self, issue_ids: list[str], with_viewer: bool) -> tuple[str, str, dict]:
+        if issue_ids:
+            query, variables = _batch_query(issue_ids, with_viewer)
+        else:
+            query, variables = "{ viewer { id } }", {}
+        return "POST", API_URL, {
+            "json": {"query": query, "variables": variables},
+            "headers": {"Authorization": self.secret() or "", "Content-Type": "application/json"},
+        }
+
+    def parse(self, issue_ids: list[str], with_viewer: bool, resp: httpx.Response) -> tuple[str | None, dict]:
+        resp.raise_for_status()
+        data = resp.json().get("data") or {}
+        viewer_id = (data.get("viewer") or {}).get("id") if with_viewer else None
+        if data.get("issues") is None:
+            return viewer_id, {}
+        results: dict = dict.fromkeys(issue_ids)
+        for node in data["issues"].get("nodes", []):
+            identifier = node.get("identifier")
+            if identifier not in results:
+                continue
+            results[identifier] = {
+                "title": node.get("title", ""),
+                "state": (node.get("state") or {}).get("name", ""),
+                "assignee_id": (node.get("assignee") or {}).get("id"),
+            }
+        return viewer_id, results
+
+    def rate_budgets(self, headers: httpx.Headers) -> list[tuple[float, float]]:
+        with contextlib.suppress(ValueError):
+            self.cost = max(1.0, float(headers.get("x-complexity") or self.cost))
+        budgets = []
+        for bucket in ("requests", "complexity"):
+            remaining = headers.get(f"x-ratelimit-{bucket}-remaining")
+            reset = headers.get(f"x-ratelimit-{bucket}-reset")
+            if remaining is None or reset is None:
+                continue
+            with contextlib.suppress(ValueError):
+                left = float(remaining) / (self.cost if bucket == "complexity" else 1)
+                budgets.append((left, float(reset) / 1000))  # reset is epoch ms
+        return budgets
+
+    def is_throttled(self, resp: httpx.Response) -> bool:
+        """HTTP 429, or Linear's RATELIMITED GraphQL error (sent with HTTP 400)."""
+        if resp.status_code == 429:
+            return True
+        if resp.status_code != 400:
+            return False
+        try:
+            errors = resp.json().get("errors") or []
+        except ValueError:
+            return False
+        return any((e.get("extensions") or {}).get("code") == "RATELIMITED" for e in errors)
+
+    def teams_request(self) -> tuple[str, str, dict] | None:
+        return "POST", API_URL, {
+            "json": {"query": "{ teams(first: 250) { nodes { key } } }"},
+            "headers": {"Authorization": self.secret() or "", "Content-Type": "application/json"},
+        }
+
+    def parse_teams(self, resp: httpx.Response) -> list[str]:
+        resp.raise_for_status()
+        return [team["key"] for team in resp.json()["data"]["teams"]["nodes"]]
+
+    def mirror_request(self, teams: list[str] | None, updated_after: str, page: str) -> tuple[str, str, dict]:
+        issue_filter: dict = {}
+        if teams is not None:
+            issue_filter["team"] = {"key": {"in": teams}}
+        if updated_after:
+            issue_filter["updatedAt"] = {"gt": updated_after}
+        variables = {"filter": issue_filter, "first": MIRROR_PAGE_SIZE, "after": page or None}
+        return "POST", API_URL, {
+            "json": {"query": MIRROR_QUERY, "variables": variables},
+            "headers": {"Authorization": self.secret() or "", "Content-Type": "application/json"},
+        }
+
+    def parse_mirror(self, resp: httpx.Response) -> tuple[list[dict], str]:
+        resp.raise_for_status()
+        connection = resp.json()["data"]["issues"]
+        issues = [
+            {
+                "id": node["id"],
+                "identifier": node["identifier"],
+                "title": node.get("title", ""),
+                "state": (node.get("state") or {}).get("name", ""),
+                "assignee_id": (node.get("assignee") or {}).get("id"),
+                "updated_at": node["updatedAt"],
+            }
+            for node in connection["nodes"]
+        ]
+        page_info = connection.get("pageInfo") or {}
+        return issues, (page_info.get("endCursor") or "") if page_info.get("hasNextPage") else ""
+
@@ -0,0 +1,90 @@
+"""
+Memoized tool responses for identical follow-up calls.
+
+Agents chaining tools often repeat a call with the same arguments within one
+turn. A response is kept under its tool name, its arguments and a fingerprint
+of the workspace state it was built from (HEAD SHA, CI snapshot, which
+credentials are set), so any change there is a miss. Entries also expire after
+SWARMIA_MCP_MEMO_TTL seconds (default 60, 0 disables memoization), which bounds
+staleness from changes the fingerprint does not cover, such as a new untracked
+service directory. Beyond MAX_ENTRIES the least recently used entry is evicted.
+Hits, misses and evictions per tool are reported by the metrics resource.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+MAX_ENTRIES = 256
+DEFAULT_TTL = 60.0
+# Credentials whose presence changes what the tools report (values never enter keys)
+CREDENTIALS = (
+    "LINEAR_API_KEY",
+    "JIRA_BASE_URL",
+    "JIRA_API_TOKEN",
+    "GITHUB_TOKEN",
+    "SWARMIA_DEPLOYMENTS_AUTHORIZATION",
+)
+
+# (tool, key) -> (stored at, response)
+_entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+_counts: dict[str, dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def ttl() -> float:
+    try:
+        return max(0.0, float(os.getenv("SWARMIA_MCP_MEMO_TTL", DEFAULT_TTL)))
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def credentials() -> tuple[bool, ...]:
+    """Which of CREDENTIALS are set."""
+    return tuple(bool(os.getenv(name)) for name in CREDENTIALS)
+
+
+def _count(tool: str, outcome: str) -> None:
+    counts = _counts.setdefault(tool, {"hits": 0, "misses": 0, "evictions": 0})
+    counts[outcome] += 1
+
+
+def get(tool: str, key: Hashable) -> Any | None:
+    """A copy of the memoized response, or None (a miss)."""
+    lifetime = ttl()
+    if not lifetime:
+        return None
+    with _lock:
+        entry = _entries.get((tool, key))
+        if entry is None or time.monotonic() - entry[0] >= lifetime:
+            _entries.pop((tool, key), None)
+            _count(tool, "misses")
+            return None
+        _entries.move_to_end((tool, key))
+        _count(tool, "hits")
+    # Shallow copy: callers (e.g. profiling) may replace meta on what they return
+    return copy.copy(entry[1])
+
+
+def put(tool: str, key: Hashable, response: Any) -> Any:
+    """Memoize response and return it."""
+    if not ttl():
+        return response
+    with _lock:
+        _entries[(tool, key)] = (time.monotonic(), copy.copy(response))
+        _entries.move_to_end((tool, key))
+        while len(_entries) > MAX_ENTRIES:
+            (evicted, _), _ = _entries.popitem(last=False)
+            _count(evicted, "evictions")
+    return response
+
+
+def stats() -> dict:
+    """Entries held plus hit/miss/eviction counts per tool."""
+    with _lock:
+        return {"entries": len(_entries), "tools": {tool: dict(counts) for tool, counts in sorted(_counts.items())}}
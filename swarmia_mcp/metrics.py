@@ -0,0 +1,126 @@
+"""
+In-process latency metrics.
+
+Spans record wall time per named operation into rolling windows; snapshot()
+reports counts, errors and p50/p95/p99 per span. Set SWARMIA_MCP_METRICS_FILE
+to also append every span as a JSON line for offline analysis.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+WINDOW = 1024
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Series:
+    __slots__ = ("durations", "count", "errors", "total")
+
+    def __init__(self) -> None:
+        self.durations: deque[float] = deque(maxlen=WINDOW)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+
+
+_series: dict[str, _Series] = {}
+_lock = threading.Lock()
+_export = None
+
+
+def _export_file():
+    global _export
+    path = os.getenv("SWARMIA_MCP_METRICS_FILE")
+    if not path:
+        return None
+    if _export is None or _export.name != path:
+        _export = open(path, "a", encoding="utf-8", buffering=1)
+    return _export
+
+
+def record(name: str, seconds: float, error: bool = False) -> None:
+    with _lock:
+        series = _series.get(name)
+        if series is None:
+            series = _series[name] = _Series()
+        series.durations.append(seconds)
+        series.count += 1
+        series.errors += error
+        series.total += seconds
+        export = _export_file()
+        if export is not None:
+            export.write(json.dumps({
+                "ts": round(time.time(), 3),
+                "span": name,
+                "ms": round(seconds * 1000, 3),
+                "error": error,
+            }) + "\n")
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a block; exceptions count as errors (cancellation does not)."""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        record(name, time.perf_counter() - start, error)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator form of span() for sync and async functions."""
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    """Per-span stats; percentiles cover the last WINDOW samples, counts the whole process."""
+    with _lock:
+        items = [(name, sorted(s.durations), s.count, s.errors, s.total) for name, s in _series.items()]
+    stats = {}
+    for name, ordered, count, errors, total in sorted(items):
+        stats[name] = {
+            "count": count,
+            "errors": errors,
+            "mean_ms": round(1000 * total / count, 3) if count else 0.0,
+            "p50_ms": round(1000 * _percentile(ordered, 0.50), 3) if ordered else 0.0,
+            "p95_ms": round(1000 * _percentile(ordered, 0.95), 3) if ordered else 0.0,
+            "p99_ms": round(1000 * _percentile(ordered, 0.99), 3) if ordered else 0.0,
+            "max_ms": round(1000 * ordered[-1], 3) if ordered else 0.0,
+        }
+    return stats
@@ -0,0 +1,124 @@
+"""
+Opt-in CPU profiling of single tool calls.
+
+Enable it per call with the tool's `profile` argument, or for every call with
+SWARMIA_MCP_PROFILE=1 (or a comma-separated list of tool names). The call runs
+under cProfile; the .prof file is written to the cache directory (open it with
+`python -m pstats` or snakeviz) and its path plus the top hotspots by self
+time are returned in the ToolResult meta under "profile". When disabled the
+wrapper only checks the argument and the env var.
+
+cProfile sees the event loop thread: work handed to asyncio.to_thread shows up
+as waiting time, and other calls running on the loop meanwhile are included.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import os
+import threading
+from contextvars import ContextVar
+import time
+from typing import Any, Callable, TypeVar
+
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+
+TOP_N = 15
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_active = threading.Lock()  # one profiler per process
+_counter = itertools.count()
+_profiling: ContextVar[bool] = ContextVar("swarmia_mcp_profiling", default=False)
+
+
+def active() -> bool:
+    """Whether the current tool call runs under the profiler (shortcuts such as memo hits should be skipped)."""
+    return _profiling.get()
+
+
+def enabled(tool: str) -> bool:
+    """SWARMIA_MCP_PROFILE: 1/true/all for every tool, or a comma-separated list of tool names."""
+    setting = os.getenv("SWARMIA_MCP_PROFILE", "").strip()
+    if setting.lower() in ("", "0", "false", "no"):
+        return False
+    if setting.lower() in ("1", "true", "yes", "all"):
+        return True
+    return tool in {name.strip() for name in setting.split(",")}
+
+
+def hotspots(profiler: Any, limit: int = TOP_N) -> list[dict]:
+    """Functions with the most self time: calls, self and cumulative milliseconds."""
+    import pstats
+
+    rows = []
+    for (filename, line, function), (_prim, calls, self_s, cum_s, _callers) in pstats.Stats(profiler).stats.items():
+        location = function if filename == "~" else f"{filename}:{line}({function})"
+        rows.append({
+            "function": location,
+            "calls": calls,
+            "self_ms": round(self_s * 1000, 3),
+            "cumulative_ms": round(cum_s * 1000, 3),
+        })
+    rows.sort(key=lambda row: row["self_ms"], reverse=True)
+    return rows[:limit]
+
+
+def _with_meta(result: Any, meta: dict) -> Any:
+    if isinstance(result, str):
+        result = ToolResult(content=[TextContent(type="text", text=result)])
+    if isinstance(result, ToolResult):
+        result.meta = {**(result.meta or {}), **meta}
+    return result
+
+
+async def _run(tool: str, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    import cProfile
+
+    from swarmia_mcp.cache import user_cache_dir
+
+    if not _active.acquire(blocking=False):
+        return _with_meta(await fn(*args, **kwargs), {"profile": {"error": "another call is being profiled"}})
+    profiler = cProfile.Profile()
+    try:
+        try:
+            profiler.enable()
+        except ValueError as exc:  # another profiler (e.g. a debugger) owns the hook
+            return _with_meta(await fn(*args, **kwargs), {"profile": {"error": str(exc)}})
+        start = time.perf_counter()
+        token = _profiling.set(True)
+        try:
+            result = await fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            _profiling.reset(token)
+        wall_ms = round((time.perf_counter() - start) * 1000, 1)
+    finally:
+        _active.release()
+
+    profile: dict = {"wall_ms": wall_ms, "hotspots": hotspots(profiler)}
+    path = user_cache_dir() / "profiles" / f"{tool}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(_counter)}.prof"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+        profile["path"] = str(path)
+    except OSError as exc:
+        profile["error"] = f"could not write profile: {exc}"
+    return _with_meta(result, {"profile": profile})
+
+
+def profiled(tool: str) -> Callable[[F], F]:
+    """Profile an async tool when called with profile=True or when SWARMIA_MCP_PROFILE selects it."""
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not (kwargs.get("profile") or enabled(tool)):
+                return await fn(*args, **kwargs)
+            return await _run(tool, fn, args, kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
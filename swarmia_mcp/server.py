@@ -2,7 +2,9 @@
 Swarmia MCP Server
 
 A local MCP server that acts as an intelligent pair programmer for Swarmia integration.
-Tools: check_swarmia_commit_hygiene, scaffold_swarmia_deployment, query_swarmia_docs
+Tools: check_swarmia_commit_hygiene (+ get_swarmia_commit_hygiene_page), scaffold_swarmia_deployment,
+       query_swarmia_docs, audit_swarmia_commit_history, backfill_swarmia_deployments,
+       audit_swarmia_branches, sync_swarmia_issue_mirror
 
 Run: uv run python -m swarmia_mcp
 Test: npx @modelcontextprotocol/inspector uv run python -m swarmia_mcp
@@ -10,22 +12,38 @@ Test: npx @modelcontextprotocol/inspector uv run python -m swarmia_mcp
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import contextlib
 import json
 import os
 import re
-import subprocess
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 import logging
 import sys
 
-import httpx
-from dotenv import load_dotenv
-from fastmcp import FastMCP
-from fastmcp.server.apps import AppConfig
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.resources import ResourceContent, ResourceResult
+from fastmcp.server.apps import UI_MIME_TYPE, AppConfig
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+# Everything else (httpx, SQLite, git, docs and widget machinery) is imported
+# by the tool that first needs it, so the stdio handshake only waits on fastmcp.
+from swarmia_mcp import metrics, profiling
+
+if TYPE_CHECKING:
+    from swarmia_mcp.widgets import WidgetAsset
+
 # Plain logger — avoids Rich column padding and line wrapping in VS Code
 _handler = logging.StreamHandler(sys.stderr)
 _handler.setFormatter(logging.Formatter("%(message)s"))
@@ -37,41 +55,25 @@ logger.propagate = False
 # Suppress FastMCP's Rich-formatted internal logger (causes line wrapping in VS Code)
 logging.getLogger("fastmcp").setLevel(logging.WARNING)
 
-load_dotenv()
-
 # ---------------------------------------------------------------------------
 # Widget HTML (built by Vite into assets/)
 # ---------------------------------------------------------------------------
 
-ASSETS_DIR = Path(__file__).parent.parent / "assets"
-
+@metrics.timed("widget.load")
+def _load_widget_html(widget_name: str) -> WidgetAsset:
+    """Load a built widget as self-contained HTML (cached until its files change)."""
+    from swarmia_mcp.widgets import load_widget
 
-def _load_widget_html(widget_name: str) -> str:
-    """Load a built widget HTML file, inlining the JS bundle for self-contained serving."""
-    html_path = ASSETS_DIR / widget_name / "index.html"
-    if not html_path.exists():
-        return f"<html><body><p>Widget '{widget_name}' not built. Run <code>pnpm run build</code>.</p></body></html>"
+    return load_widget(widget_name)
 
-    html = html_path.read_text(encoding="utf-8")
 
-    # Inline the JS bundle so the HTML is fully self-contained
-    # Vite outputs: <script type="module" crossorigin src="../shared/xxx.js"></script>
-    import re as _re
+async def _widget_resource(widget_name: str) -> ResourceResult:
+    """Serve a widget with its content hash so clients can skip unchanged payloads."""
+    asset = await asyncio.to_thread(_load_widget_html, widget_name)
+    return ResourceResult([
+        ResourceContent(asset.html, mime_type=UI_MIME_TYPE, meta={"contentHash": f"sha256:{asset.sha256}"})
+    ])
 
-    def _inline_script(match: _re.Match) -> str:
-        src = match.group(1)
-        js_path = (html_path.parent / src).resolve()
-        if js_path.exists():
-            js_content = js_path.read_text(encoding="utf-8")
-            return f'<script type="module">{js_content}</script>'
-        return match.group(0)
-
-    html = _re.sub(
-        r'<script type="module" crossorigin src="([^"]+)"></script>',
-        _inline_script,
-        html,
-    )
-    return html
 
 mcp = FastMCP(
     "Swarmia",
@@ -82,9 +84,15 @@ mcp = FastMCP(
     ),
 )
 
-LINEAR_API_URL = "https://api.linear.app/graphql"
-ISSUE_KEY_PATTERN = re.compile(r"[A-Z]{2,10}-\d+")
 SAFE_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+# Commits are memoized by SHA in git_backend, so large scans stay cheap
+MAX_HYGIENE_COMMITS = 1000
+# Commit rows in the first page of a hygiene check and per get_swarmia_commit_hygiene_page page
+HYGIENE_PAGE_SIZE = 50
+MAX_HYGIENE_PAGE_SIZE = 500
+# Finished scans kept for paging (oldest dropped first)
+MAX_HYGIENE_SCANS = 32
+HYGIENE_STEPS = 4
 
 
 # ---------------------------------------------------------------------------
@@ -92,118 +100,227 @@ SAFE_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
 # ---------------------------------------------------------------------------
 
 
-def _run_git(*args: str) -> str:
-    """Run a git command and return stdout. Raises RuntimeError on failure."""
-    result = subprocess.run(
-        ["git", *args],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
-    return result.stdout.strip()
-
-
-def _linear_headers() -> dict[str, str] | None:
-    key = os.getenv("LINEAR_API_KEY")
-    if not key:
-        return None
-    return {"Authorization": key, "Content-Type": "application/json"}
-
-
-def _query_linear_issues(issue_ids: list[str]) -> dict:
-    """Query Linear GraphQL API for issue details. Returns {id: {title, state, assignee_id}}."""
-    headers = _linear_headers()
-    if not headers:
-        return {}
-
-    results: dict = {}
-    # Batch: fetch each issue by identifier
-    for issue_id in issue_ids:
-        query = """
-        query($filter: IssueFilter) {
-            issues(filter: $filter, first: 1) {
-                nodes {
-                    identifier
-                    title
-                    state { name }
-                    assignee { id }
-                }
-            }
-        }
-        """
-        variables = {"filter": {"number": {"eq": int(issue_id.split("-")[1])}, "team": {"key": {"eq": issue_id.split("-")[0]}}}}
-        try:
-            resp = httpx.post(
-                LINEAR_API_URL,
-                json={"query": query, "variables": variables},
-                headers=headers,
-                timeout=10,
+GIT_TIMEOUT = 10
+
+# Set by main(): over HTTP the process cwd means nothing to the client
+_http_mode = False
+
+
+def _allowed_roots() -> list[Path]:
+    """SWARMIA_MCP_WORKSPACE_ROOTS (os.pathsep-separated); empty means unrestricted."""
+    value = os.getenv("SWARMIA_MCP_WORKSPACE_ROOTS", "")
+    return [Path(p).expanduser().resolve() for p in value.split(os.pathsep) if p.strip()]
+
+
+def _check_allowed(path: Path) -> Path:
+    """Resolve path and enforce SWARMIA_MCP_WORKSPACE_ROOTS. Raises ValueError."""
+    path = path.expanduser().resolve()
+    allowed = _allowed_roots()
+    if allowed and not any(path.is_relative_to(root) for root in allowed):
+        raise ValueError(f"Error: `{path}` is outside the workspace roots this server may access.")
+    return path
+
+
+async def _client_roots(ctx: Context | None) -> list[Path]:
+    """Workspace folders announced by the client (MCP roots); empty if it has none."""
+    if ctx is None:
+        return []
+    try:
+        roots = await asyncio.wait_for(ctx.list_roots(), 5)
+    except Exception:
+        # Client without roots support (or no session)
+        return []
+    return [
+        Path(url2pathname(urlparse(str(root.uri)).path))
+        for root in roots
+        if str(root.uri).startswith("file://")
+    ]
+
+
+async def _resolve_workspace(workspace: str, ctx: Context | None) -> Path:
+    """Workspace root for a tool call. Raises ValueError with a user-facing message.
+
+    An explicit workspace wins. Otherwise stdio mode uses the process cwd and
+    HTTP mode the client's first MCP root.
+    """
+    if workspace:
+        path = Path(workspace)
+    elif not _http_mode:
+        return Path.cwd()
+    else:
+        roots = await _client_roots(ctx)
+        if not roots:
+            raise ValueError(
+                "Error: `workspace` is required when the server runs over HTTP "
+                "(pass the absolute path of the project root)."
             )
-            resp.raise_for_status()
-            data = resp.json()
-            nodes = data.get("data", {}).get("issues", {}).get("nodes", [])
-            if nodes:
-                node = nodes[0]
-                results[issue_id] = {
-                    "title": node.get("title", ""),
-                    "state": node.get("state", {}).get("name", ""),
-                    "assignee_id": (node.get("assignee") or {}).get("id"),
-                }
-        except (httpx.HTTPStatusError, httpx.RequestError):
-            # Will be handled in caller — missing entries = unverified
-            pass
-
-    return results
-
-
-def _get_linear_viewer_id() -> str | None:
-    """Get the authenticated user's Linear ID."""
-    headers = _linear_headers()
-    if not headers:
-        return None
+        path = roots[0]
+    path = _check_allowed(path)
+    if not path.is_dir():
+        raise ValueError(f"Error: workspace `{path}` is not a directory on the server.")
+    return path
+
+
+def _memo_key(root: Path, *args: object) -> tuple:
+    """Tool arguments plus the workspace state a response is built from (see memo).
+
+    Blocking (HEAD files, CI snapshot scan and its lock): call via asyncio.to_thread.
+    """
+    from swarmia_mcp import ci_scan, git_backend, memo
+
+    repo = git_backend.get_repo(root)
+    head = repo.resolve_ref("HEAD") if repo else None
+    ci = ci_scan.snapshot(root).fingerprint
+    return (str(root), *args, head, ci, memo.credentials(), os.getenv("SWARMIA_MCP_DOCS_DIR", ""))
+
+
+@metrics.timed("git.run")
+async def _run_git(*args: str, cwd: Path | None = None) -> str:
+    """Run a git command and return stdout. Raises RuntimeError on failure.
+
+    The git process is killed if it times out or the calling tool is cancelled.
+    """
     try:
-        resp = httpx.post(
-            LINEAR_API_URL,
-            json={"query": "{ viewer { id } }"},
-            headers=headers,
-            timeout=10,
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        resp.raise_for_status()
-        return resp.json().get("data", {}).get("viewer", {}).get("id")
-    except (httpx.HTTPStatusError, httpx.RequestError):
-        return None
+    except OSError as exc:
+        raise RuntimeError(f"git unavailable: {exc}") from exc
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), GIT_TIMEOUT)
+    except BaseException as exc:
+        if proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            await proc.wait()
+        if isinstance(exc, TimeoutError):
+            raise RuntimeError(f"git {args[0]} timed out") from exc
+        raise
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace").strip() or f"git {args[0]} failed")
+    return stdout.decode(errors="replace").strip()
 
 
 # ---------------------------------------------------------------------------
 # Tool 1: check_swarmia_commit_hygiene
 # ---------------------------------------------------------------------------
 
+# scan id -> (commits, widget issue data, issue keys already looked up); pages are sliced from here
+_hygiene_scans: OrderedDict[str, tuple[list[dict], dict, set[str]]] = OrderedDict()
+
+
+def _ago(seconds: float) -> str:
+    """Rough human duration: "40s", "12 min", "3 h", "2 days"."""
+    if seconds < 60:
+        return f"{round(seconds)}s"
+    if seconds < 3600:
+        return f"{round(seconds / 60)} min"
+    if seconds < 2 * 86400:
+        return f"{round(seconds / 3600)} h"
+    return f"{round(seconds / 86400)} days"
+
+
+async def _progress(ctx: Context | None, step: float, message: str) -> None:
+    """MCP progress notification (dropped when the client sent no progress token)."""
+    if ctx is not None:
+        await ctx.report_progress(step, HYGIENE_STEPS, message)
+
+
+def _hygiene_page(scan_id: str, offset: int, page_size: int) -> dict:
+    """One page of a finished scan: its commits, their issue data and the next cursor."""
+    commits, linear, _checked = _hygiene_scans[scan_id]
+    page = commits[offset:offset + page_size]
+    end = offset + len(page)
+    ids = {issue_id for commit in page for issue_id in commit["ids"]}
+    return {
+        "commits": page,
+        "linear_data": {issue_id: info for issue_id, info in linear.items() if issue_id in ids},
+        "offset": offset,
+        "commit_count": len(commits),
+        "next_cursor": f"{scan_id}:{end}" if end < len(commits) else None,
+    }
+
+
+def _widget_issues(linear_data: dict, viewer_ids: dict[str, str], fetched_at: dict[str, float]) -> dict:
+    """Issue data as the widget shows it: assignment to the viewer and cache age."""
+    widget_linear = {}
+    now = time.time()
+    for issue_id, info in linear_data.items():
+        # Over HTTP the viewer is the owner of the server's token, not the caller
+        assigned_to_you = None
+        viewer_id = None if _http_mode else viewer_ids.get(info["tracker"])
+        if viewer_id and info.get("assignee_id"):
+            assigned_to_you = info["assignee_id"] == viewer_id
+        widget_linear[issue_id] = {
+            "title": info["title"],
+            "state": info["state"],
+            "tracker": info["tracker"],
+            "assigned_to_you": assigned_to_you,
+            "age_seconds": round(now - fetched_at[issue_id]),
+            "fresh": info["fresh"],
+        }
+    return widget_linear
+
 
 @mcp.resource("ui://swarmia/commit-hygiene.html")
-def commit_hygiene_view() -> str:
+async def commit_hygiene_view() -> ResourceResult:
     """Interactive commit hygiene dashboard widget."""
-    return _load_widget_html("commit-hygiene")
+    return await _widget_resource("commit-hygiene")
 
 
 @mcp.tool(app=AppConfig(resource_uri="ui://swarmia/commit-hygiene.html"))
-def check_swarmia_commit_hygiene(num_commits: int = 10) -> str:
+@metrics.timed("tool.check_swarmia_commit_hygiene")
+@profiling.profiled("check_swarmia_commit_hygiene")
+async def check_swarmia_commit_hygiene(
+    num_commits: int = 10,
+    refresh_linear: bool = False,
+    workspace: str = "",
+    page_size: int = HYGIENE_PAGE_SIZE,
+    profile: bool = False,
+    ctx: Context | None = None,
+) -> str:
     """Check if recent commits and the current branch follow Swarmia tracking conventions.
 
     Verifies that branch names and commit messages contain issue tracker IDs
-    (e.g. ENG-123). If a LINEAR_API_KEY is configured, validates each issue
-    against the Linear API to confirm it exists and is assigned to the current user.
+    (e.g. ENG-123). Each key prefix is routed to an issue tracker (Linear by
+    default; Jira or GitHub Issues via SWARMIA_MCP_ISSUE_TRACKERS). Where that
+    tracker has credentials, each issue is checked to confirm it exists and is
+    assigned to the current user (not over HTTP, where that user would be the
+    owner of the server's token), with one bulk request per tracker. Results are
+    cached on disk; stale entries are served and refreshed in the background.
+    Progress is reported while git and the trackers are read. Key coverage
+    counts every scanned commit, but structured_content holds only the first
+    page_size commits and only their issues (and the branch's) are verified;
+    pass next_cursor to get_swarmia_commit_hygiene_page for the rest.
 
     Args:
-        num_commits: Number of recent commits to check (default: 10).
+        num_commits: Number of recent commits to check (default: 10, max: 1000).
+        refresh_linear: Drop cached issue tracker data and refetch it (default: False).
+        workspace: Absolute path of the project root. Required when the server
+                   runs over HTTP; defaults to the server's working directory.
+        page_size: Commits in the first page of structured_content (default: 50, max: 500).
+        profile: Capture a CPU profile of this call; its file path and top hotspots
+                 are returned in the result meta (default: False).
     """
-    num_commits = max(1, min(int(num_commits), 100))
+    from swarmia_mcp import git_backend, issues, keys
+
+    num_commits = max(1, min(int(num_commits), MAX_HYGIENE_COMMITS))
+    page_size = max(1, min(int(page_size), MAX_HYGIENE_PAGE_SIZE))
     logger.info("check_swarmia_commit_hygiene: scanning last %d commits", num_commits)
+    try:
+        root = await _resolve_workspace(workspace, ctx)
+    except ValueError as exc:
+        return str(exc)
 
     # --- Get branch name ---
+    repo = git_backend.get_repo(root)
     try:
-        branch = _run_git("branch", "--show-current")
+        if repo is None:
+            raise RuntimeError("not a git repository")
+        branch = repo.current_branch()
     except RuntimeError:
         return (
             "Error: This directory is not a git repository or git is not installed. "
@@ -213,40 +330,54 @@ def check_swarmia_commit_hygiene(num_commits: int = 10) -> str:
     if not branch:
         branch = "(detached HEAD)"
 
-    branch_ids = ISSUE_KEY_PATTERN.findall(branch)
+    extractor = keys.extractor(await issues.team_keys())
+    branch_ids = extractor.findall(branch)
 
-    # --- Get commits ---
+    # --- Get commits (persistent cat-file worker, one-shot git log as fallback) ---
+    await _progress(ctx, 0, f"Reading the last {num_commits} commits")
     try:
-        log_output = _run_git("log", f"-n{num_commits}", "--oneline")
+        log = [(c.sha, c.subject) for c in await repo.log(num_commits)]
     except RuntimeError:
-        return "No commits found in this repository yet."
+        try:
+            log_output = await _run_git("log", f"-n{num_commits}", "--format=%H %s", cwd=root)
+        except RuntimeError:
+            log_output = ""
+        log = [line.partition(" ")[::2] for line in log_output.splitlines()]
 
-    if not log_output:
+    if not log:
         return "No commits found in this repository yet."
 
+    await _progress(ctx, 1, f"Extracting issue keys from {len(log)} commits")
     commits = []
-    for line in log_output.splitlines():
-        parts = line.split(" ", 1)
-        sha = parts[0]
-        message = parts[1] if len(parts) > 1 else ""
-        ids_found = ISSUE_KEY_PATTERN.findall(message)
-        commits.append({"sha": sha, "message": message, "ids": ids_found})
-
-    # --- Collect all unique issue IDs ---
-    all_ids = set()
-    for c in commits:
+    with metrics.span("hygiene.extract"):
+        ids_found = extractor.extract([message for _sha, message in log])
+        for (sha, message), ids in zip(log, ids_found):
+            commits.append({"sha": sha, "message": message, "ids": ids})
+
+    # --- Collect the issue IDs to verify now: the branch and the first page ---
+    # Later pages are verified by get_swarmia_commit_hygiene_page as they are loaded
+    all_ids = set(branch_ids)
+    for c in commits[:page_size]:
         all_ids.update(c["ids"])
-    all_ids.update(branch_ids)
+    checked_ids = set(all_ids)
 
-    # --- Linear validation (if key available) ---
-    linear_available = bool(os.getenv("LINEAR_API_KEY"))
+    # --- Issue tracker validation (where credentials are available) ---
+    linear_available = issues.configured()
     linear_data: dict = {}
-    viewer_id: str | None = None
+    fetched_at: dict[str, float] = {}
+    viewer_ids: dict[str, str] = {}
+    rate_limited: list[str] = []
 
     if linear_available and all_ids:
-        viewer_id = _get_linear_viewer_id()
-        linear_data = _query_linear_issues(list(all_ids))
-        if not linear_data and not viewer_id:
+        await _progress(ctx, 2, f"Verifying {len(all_ids)} issues")
+
+        async def tracker_done(label: str, done: int, total: int) -> None:
+            await _progress(ctx, 2 + done / total, f"{label} issues verified")
+
+        viewer_ids, linear_data, fetched_at, rate_limited = await issues.cached_lookup(
+            sorted(all_ids), refresh=refresh_linear, on_progress=tracker_done
+        )
+        if not linear_data and not viewer_ids and not rate_limited:
             linear_available = False
 
     # --- Build directive summary for LLM (widget shows the full data) ---
@@ -271,11 +402,14 @@ def check_swarmia_commit_hygiene(num_commits: int = 10) -> str:
     else:
         summary_lines.append(f"All {len(commits)} commits have issue keys. ✅")
 
-    # Linear status
+    # Tracker status
     if linear_available and linear_data:
-        verified_ids = ", ".join(linear_data.keys())
-        summary_lines.append(f"Linear verified: {verified_ids}.")
-        unverified = all_ids - set(linear_data.keys())
+        by_tracker: dict[str, list[str]] = {}
+        for issue_id, info in linear_data.items():
+            by_tracker.setdefault(info["tracker"], []).append(issue_id)
+        for tracker, ids in by_tracker.items():
+            summary_lines.append(f"{issues.label(tracker)} verified: {', '.join(ids)}.")
+        unverified = all_ids - set(linear_data.keys()) - set(rate_limited)
         if unverified:
             summary_lines.append(
                 f"Could not verify: {', '.join(sorted(unverified))} "
@@ -283,44 +417,100 @@ def check_swarmia_commit_hygiene(num_commits: int = 10) -> str:
             )
     elif not linear_available and all_ids:
         summary_lines.append(
-            "No LINEAR_API_KEY — regex-only validation. "
-            "Add LINEAR_API_KEY to .env for full issue verification."
+            "No issue tracker credentials — regex-only validation. "
+            "Add LINEAR_API_KEY (or JIRA_BASE_URL + JIRA_API_TOKEN, or GITHUB_TOKEN) "
+            "to .env for full issue verification."
         )
+    if rate_limited:
+        summary_lines.append(
+            f"Issue tracker rate limit reached, not checked yet: {', '.join(rate_limited)}. "
+            "Re-run in a minute; verified issues are cached."
+        )
+    if linear_available and len(commits) > page_size:
+        summary_lines.append(
+            f"Issues of the first {page_size} commits verified; later pages are verified as they are loaded."
+        )
+    mirrors = issues.mirror_status() if linear_available else []
+    for mirror in mirrors:
+        line = f"{issues.label(mirror['tracker'])} mirror: {mirror['issues']:,} issues"
+        if mirror["age_seconds"] is not None:
+            line += f", synced {_ago(mirror['age_seconds'])} ago"
+        if not mirror["usable"]:
+            line += " (too old or incomplete, not used; run sync_swarmia_issue_mirror)"
+        summary_lines.append(line + ".")
 
     summary_lines.append(
-        "\nThe widget shows the full commit table, progress bar, and Linear verification. "
+        "\nThe widget shows the full commit table, progress bar, and issue verification. "
         "Focus your response on actionable recommendations only — do not repeat the commit list or table."
     )
 
     text = "\n".join(summary_lines)
 
     # Build structured data for the widget
-    widget_linear = {}
-    for issue_id, info in linear_data.items():
-        assigned_to_you = None
-        if viewer_id and info.get("assignee_id"):
-            assigned_to_you = info["assignee_id"] == viewer_id
-        widget_linear[issue_id] = {
-            "title": info["title"],
-            "state": info["state"],
-            "assigned_to_you": assigned_to_you,
-        }
+    widget_linear = _widget_issues(linear_data, viewer_ids, fetched_at)
 
     summary_text = summary_lines[1] if len(summary_lines) > 1 else ""
 
+    scan_id = os.urandom(6).hex()
+    _hygiene_scans[scan_id] = (commits, widget_linear, checked_ids - set(rate_limited))
+    while len(_hygiene_scans) > MAX_HYGIENE_SCANS:
+        _hygiene_scans.popitem(last=False)
+    first_page = _hygiene_page(scan_id, 0, page_size)
+    # Branch issues are shown above the table, whatever page is loaded
+    first_page["linear_data"].update({i: widget_linear[i] for i in branch_ids if i in widget_linear})
+    await _progress(ctx, HYGIENE_STEPS, "Done")
+
     return ToolResult(
         content=[TextContent(type="text", text=text)],
         structured_content={
             "branch": branch,
             "branch_ids": branch_ids,
-            "commits": commits,
-            "linear_data": widget_linear,
+            **first_page,
+            "with_keys": len(commits) - len(missing),
+            "linear_rate_limited": rate_limited,
+            "mirror": mirrors,
             "summary": summary_text,
         },
         meta={},
     )
 
 
+@mcp.tool
+@metrics.timed("tool.get_swarmia_commit_hygiene_page")
+async def get_swarmia_commit_hygiene_page(cursor: str, page_size: int = HYGIENE_PAGE_SIZE) -> ToolResult:
+    """Fetch the next page of commits from a check_swarmia_commit_hygiene scan.
+
+    Pages come from the finished scan kept in memory, so they are consistent
+    with the first page and cost no git calls. Issues first seen on this page
+    are verified now, through the same cache as the check. Recent scans only:
+    when a cursor has expired, re-run check_swarmia_commit_hygiene.
+
+    Args:
+        cursor: The next_cursor value of the previous page.
+        page_size: Commits per page (default: 50, max: 500).
+    """
+    scan_id, _, offset = cursor.partition(":")
+    if scan_id not in _hygiene_scans or not offset.isdigit():
+        # An error result, so the widget can tell the user instead of silently loading nothing
+        raise ToolError("Commit range expired. Re-run check_swarmia_commit_hygiene for a fresh scan.")
+    from swarmia_mcp import issues
+
+    _hygiene_scans.move_to_end(scan_id)
+    commits, linear, checked = _hygiene_scans[scan_id]
+    offset, page_size = int(offset), max(1, min(int(page_size), MAX_HYGIENE_PAGE_SIZE))
+    pending = sorted({i for c in commits[offset:offset + page_size] for i in c["ids"]} - checked)
+    rate_limited: list[str] = []
+    if pending and issues.configured():
+        viewer_ids, linear_data, fetched_at, rate_limited = await issues.cached_lookup(pending)
+        linear.update(_widget_issues(linear_data, viewer_ids, fetched_at))
+        checked.update(set(pending) - set(rate_limited))
+    page = _hygiene_page(scan_id, offset, page_size)
+    page["linear_rate_limited"] = rate_limited
+    shown = page["offset"] + len(page["commits"])
+    text = f"Commits {page['offset'] + 1}-{shown} of {page['commit_count']}."
+    return ToolResult(content=[TextContent(type="text", text=text)], structured_content=page, meta={})
+
+
 # ---------------------------------------------------------------------------
 # Tool 2: scaffold_swarmia_deployment
 # ---------------------------------------------------------------------------
@@ -356,9 +546,9 @@ jobs:
 """
 
 @mcp.resource("ui://swarmia/deployment-scaffold.html")
-def deployment_scaffold_view() -> str:
+async def deployment_scaffold_view() -> ResourceResult:
     """Interactive deployment scaffold configuration wizard."""
-    return _load_widget_html("deployment-scaffold")
+    return await _widget_resource("deployment-scaffold")
 
 
 GITLAB_CI_TEMPLATE = """\
@@ -384,10 +574,171 @@ swarmia-deployment:
 """
 
 
+# Monorepos: one matrix job per service, skipped when nothing under its path changed since the
+# previous successful deploy run (a push may carry many commits, so the tip commit alone is not enough)
+GITHUB_ACTIONS_MATRIX_TEMPLATE = """\
+# Swarmia Deployment Tracking (one deployment per service changed since the previous deploy)
+# Add SWARMIA_DEPLOYMENTS_AUTHORIZATION to your repository secrets
+# Docs: https://help.swarmia.com/deployment-tracking
+
+name: Swarmia Deployment Tracking
+
+on:
+  workflow_run:
+    workflows: [{workflow_name}]
+    types: [completed]
+
+jobs:
+  swarmia-deployment:
+    if: ${{{{ github.event.workflow_run.conclusion == 'success' }}}}
+    runs-on: ubuntu-latest
+    permissions:
+      contents: read
+      actions: read
+    strategy:
+      fail-fast: false
+      matrix:
+        include:
+{matrix}
+    steps:
+      - uses: actions/checkout@v4
+        with:
+          ref: ${{{{ github.event.workflow_run.head_sha }}}}
+          fetch-depth: 0
+      - name: Notify Swarmia
+        # Event and matrix values reach the script only as environment variables (never
+        # expanded into it), so a crafted branch name cannot inject commands
+        env:
+          GH_TOKEN: ${{{{ github.token }}}}
+          REPOSITORY: ${{{{ github.repository }}}}
+          WORKFLOW_ID: ${{{{ github.event.workflow_run.workflow_id }}}}
+          HEAD_BRANCH: ${{{{ github.event.workflow_run.head_branch }}}}
+          HEAD_SHA: ${{{{ github.event.workflow_run.head_sha }}}}
+          SERVICE_APP: ${{{{ matrix.app }}}}
+          SERVICE_PATH: ${{{{ matrix.path }}}}
+          SWARMIA_DEPLOYMENTS_AUTHORIZATION: ${{{{ secrets.SWARMIA_DEPLOYMENTS_AUTHORIZATION }}}}
+        run: |
+          # Commit deployed by the previous successful run of the deploy workflow on this branch
+          PREVIOUS=$(gh api -X GET "repos/$REPOSITORY/actions/workflows/$WORKFLOW_ID/runs" \\
+            -f status=success -f branch="$HEAD_BRANCH" -F per_page=20 \\
+            --jq '.workflow_runs[].head_sha' | grep -vxF "$HEAD_SHA" | head -n 1 || true)
+          # First deploy, or history rewritten: report every service
+          if [ -n "$PREVIOUS" ] && git cat-file -e "$PREVIOUS^{{commit}}" 2>/dev/null \\
+            && git diff --quiet "$PREVIOUS" HEAD -- "$SERVICE_PATH"; then
+            echo "$SERVICE_PATH unchanged since $PREVIOUS, not a deployment of $SERVICE_APP"
+            exit 0
+          fi
+          jq -n --arg sha "$HEAD_SHA" --arg app "$SERVICE_APP" --arg repo "$REPOSITORY" \\
+            '{{version: $sha, appName: $app, commitSha: $sha, repositoryFullName: $repo}}' \\
+            | curl -X POST https://hook.swarmia.com/deployments \\
+                -H "Authorization: $SWARMIA_DEPLOYMENTS_AUTHORIZATION" \\
+                -H "Content-Type: application/json" \\
+                -d @-
+"""
+
+GITLAB_CI_SERVICE_TEMPLATE = """\
+swarmia-deployment-{app_name}:
+  stage: .post
+  script:
+    - |
+      curl -X POST https://hook.swarmia.com/deployments \\
+        -H "Authorization: $SWARMIA_DEPLOYMENTS_AUTHORIZATION" \\
+        -H "Content-Type: application/json" \\
+        -d '{{
+          "version": "$CI_COMMIT_SHA",
+          "appName": "{app_name}",
+          "commitSha": "$CI_COMMIT_SHA",
+          "repositoryFullName": "$CI_PROJECT_PATH"
+        }}'
+  rules:
+    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
+      changes:
+        - "{changes}"
+"""
+
+
+def _jenkins_stage(app_name: str, stage_name: str = "Notify Swarmia", path: str = "") -> str:
+    """Jenkins stage posting one deployment; with path, only when the build's changes touch it."""
+    when = f"    when {{ changeset '{path}/**' }}\n" if path else ""
+    return (
+        f"stage('{stage_name}') {{\n"
+        f"{when}"
+        f"    steps {{\n"
+        f"        sh '''\n"
+        f"            curl -X POST https://hook.swarmia.com/deployments \\\n"
+        f'              -H "Authorization: $SWARMIA_DEPLOYMENTS_AUTHORIZATION" \\\n'
+        f'              -H "Content-Type: application/json" \\\n'
+        f"              -d '{{\n"
+        f'                \"version\": \"\'$GIT_COMMIT\'\",\n'
+        f'                \"appName\": \"{app_name}\",\n'
+        f'                \"commitSha\": \"\'$GIT_COMMIT\'\",\n'
+        f'                \"repositoryFullName\": \"\'$GIT_URL\'\"\n'
+        f"              }}'\n"
+        f"        '''\n"
+        f"    }}\n"
+        f"}}"
+    )
+
+
+def _monorepo_snippet(found: list, ci: str, workflow_name: str) -> str:
+    """One config covering every discovered service (GitHub matrix, GitLab job / Jenkins stage per service)."""
+    if ci == "gitlab":
+        return "\n".join(
+            # GitLab matches paths relative to the repository, without "./"
+            GITLAB_CI_SERVICE_TEMPLATE.format(
+                app_name=service.name, changes=f"{service.path}/**/*" if service.path else "**/*"
+            )
+            for service in found
+        )
+    if ci == "jenkins":
+        return "\n\n".join(
+            _jenkins_stage(service.name, f"Notify Swarmia ({service.name})", service.path)
+            for service in found
+        )
+    matrix = "\n".join(
+        f"          - app: {service.name}\n            path: {service.path or '.'}" for service in found
+    )
+    return GITHUB_ACTIONS_MATRIX_TEMPLATE.format(workflow_name=workflow_name, matrix=matrix)
+
+
+def _monorepo_steps(ci: str, workflow_name: str, has_ci: bool) -> list[str]:
+    """Setup steps for a config covering several services."""
+    if ci == "gitlab":
+        return [
+            "Add `SWARMIA_DEPLOYMENTS_AUTHORIZATION` as a CI/CD variable (Settings → CI/CD → Variables)",
+            "Append the `swarmia-deployment-<service>` jobs to `.gitlab-ci.yml`; each runs only when "
+            "its service path changed in the pushed commits (`rules: changes`)",
+            "Delete the jobs of libraries and tools that are never deployed",
+        ]
+    if ci == "jenkins":
+        return [
+            "Add `SWARMIA_DEPLOYMENTS_AUTHORIZATION` as a Jenkins credential and inject it as an environment variable",
+            "Add the `Notify Swarmia (<service>)` stages after your deploy stages; each runs only when the "
+            "build's changes touch its service path (`when { changeset }`)",
+            "Delete the stages of libraries and tools that are never deployed",
+        ]
+    return [
+        *(["Create the `.github/workflows/` directory in your repository"] if not has_ci else []),
+        "Save this config as `.github/workflows/swarmia-deploy.yml`",
+        "Add `SWARMIA_DEPLOYMENTS_AUTHORIZATION` to your GitHub repository secrets "
+        "(Settings → Secrets and variables → Actions)",
+        f'Verify the `workflow_name` matches your deploy workflow (currently: `"{workflow_name}"`)',
+        "Each matrix entry reports its service when its path changed since the previous successful "
+        "deploy run; delete the entries of libraries and tools that are never deployed",
+        "Commit and push the workflow file",
+    ]
+
+
 @mcp.tool(app=AppConfig(resource_uri="ui://swarmia/deployment-scaffold.html"))
-def scaffold_swarmia_deployment(
+@metrics.timed("tool.scaffold_swarmia_deployment")
+@profiling.profiled("scaffold_swarmia_deployment")
+async def scaffold_swarmia_deployment(
     app_name: str = "",
     workflow_name: str = "deploy",
+    discover_services: bool = True,
+    workspace: str = "",
+    profile: bool = False,
+    ctx: Context | None = None,
 ) -> str:
     """Generate CI/CD configuration for Swarmia's Deployment Tracking webhook.
 
@@ -396,27 +747,57 @@ def scaffold_swarmia_deployment(
     config sends a POST to https://hook.swarmia.com/deployments with the
     required fields: version, appName, commitSha, repositoryFullName.
 
+    In monorepos, service roots (Dockerfile or Helm chart, or package.json /
+    pyproject.toml in a declared workspace) are discovered in one parallel walk
+    that honours .gitignore and skips vendored directories. With two or more
+    services below the root, the config covers every service (a GitHub Actions
+    matrix that reports only services changed since the previous deploy, or
+    one GitLab job / Jenkins stage per service); otherwise the repository is
+    one app.
+
     This tool does NOT write files — it returns the YAML as text. The IDE's
-    native file-edit capabilities should be used to apply it.
+    native file-edit capabilities should be used to apply it. A repeated call
+    with the same arguments is answered from memory until HEAD, the CI files
+    or the configured credentials change (or SWARMIA_MCP_MEMO_TTL passes).
 
     Args:
         app_name: The application/service name for Swarmia tracking.
-                  Defaults to the repository directory name.
+                  Defaults to the repository directory name. Setting it
+                  skips service discovery.
         workflow_name: For GitHub Actions, the name of the deployment workflow
                        to trigger on (default: "deploy").
+        discover_services: Look for multiple services in the workspace (default: True).
+        workspace: Absolute path of the project root. Required when the server
+                   runs over HTTP; defaults to the server's working directory.
+        profile: Capture a CPU profile of this call; its file path and top hotspots
+                 are returned in the result meta (default: False). Bypasses the
+                 response memo.
     """
-    logger.info("scaffold_swarmia_deployment: generating config (app=%s)", app_name or "<auto>")
-    workspace = Path.cwd()
+    from swarmia_mcp import ci_scan, memo, services
 
+    logger.info("scaffold_swarmia_deployment: generating config (app=%s)", app_name or "<auto>")
+    try:
+        root = await _resolve_workspace(workspace, ctx)
+    except ValueError as exc:
+        return str(exc)
+    memo_key = await asyncio.to_thread(_memo_key, root, app_name, workflow_name, discover_services)
+    if not profiling.active() and (memoized := memo.get("scaffold_swarmia_deployment", memo_key)) is not None:
+        return memoized
+
+    found: list[services.Service] = []
+    if not app_name and discover_services:
+        with metrics.span("scaffold.discover"):
+            found = await asyncio.to_thread(services.discover, root)
+        # One service, or a root that is itself a service, is a single app named after the workspace
+        if len(found) < 2 or any(not service.path for service in found):
+            found = []
     if not app_name:
-        app_name = workspace.name
+        app_name = root.name
     app_name = SAFE_NAME_PATTERN.sub("-", app_name)
     workflow_name = SAFE_NAME_PATTERN.sub("-", workflow_name)
 
-    # Detect CI/CD framework
-    has_github = (workspace / ".github" / "workflows").is_dir()
-    has_gitlab = (workspace / ".gitlab-ci.yml").is_file()
-    has_jenkins = (workspace / "Jenkinsfile").is_file()
+    # Detect CI/CD framework (from the workspace snapshot, shared with query_swarmia_docs)
+    has_github, has_gitlab, has_jenkins = await asyncio.to_thread(ci_scan.detect_ci, root)
 
     # --- Build the full YAML snippets (needed for structured_content) ---
     yaml_snippet_raw = ""
@@ -440,23 +821,7 @@ def scaffold_swarmia_deployment(
             "Commit and push the updated `.gitlab-ci.yml`",
         ]
     elif has_jenkins:
-        yaml_snippet_raw = (
-            f"stage('Notify Swarmia') {{\n"
-            f"    steps {{\n"
-            f"        sh '''\n"
-            f"            curl -X POST https://hook.swarmia.com/deployments \\\n"
-            f'              -H "Authorization: $SWARMIA_DEPLOYMENTS_AUTHORIZATION" \\\n'
-            f'              -H "Content-Type: application/json" \\\n'
-            f"              -d '{{\n"
-            f'                \"version\": \"\'$GIT_COMMIT\'\",\n'
-            f'                \"appName\": \"{app_name}\",\n'
-            f'                \"commitSha\": \"\'$GIT_COMMIT\'\",\n'
-            f'                \"repositoryFullName\": \"\'$GIT_URL\'\"\n'
-            f"              }}'\n"
-            f"        '''\n"
-            f"    }}\n"
-            f"}}"
-        )
+        yaml_snippet_raw = _jenkins_stage(app_name)
         setup_steps_raw = [
             "Add `SWARMIA_DEPLOYMENTS_AUTHORIZATION` as a Jenkins credential",
             "Inject it as an environment variable in your pipeline",
@@ -475,6 +840,16 @@ def scaffold_swarmia_deployment(
             "Commit and push the workflow file",
         ]
 
+    monorepo = len(found) > 1
+    if monorepo:
+        ci = "gitlab" if has_gitlab and not has_github else "jenkins" if has_jenkins and not has_github else "github"
+        yaml_snippet_raw = _monorepo_snippet(found, ci, workflow_name)
+        setup_steps_raw = _monorepo_steps(ci, workflow_name, has_github or has_gitlab or has_jenkins)
+        # One Swarmia app per service; the workspace directory name is not one of them
+        app_name = ", ".join(service.name for service in found[:20])
+        if len(found) > 20:
+            app_name += f", +{len(found) - 20} more"
+
     # --- Build directive summary for LLM (widget shows YAML + steps) ---
     summary_lines: list[str] = []
 
@@ -486,8 +861,18 @@ def scaffold_swarmia_deployment(
     elif has_jenkins:
         detected_ci = "Jenkins"
 
+    if monorepo:
+        listed = ", ".join(f"`{service.name}` ({service.path})" for service in found[:20])
+        more = f" and {len(found) - 20} more" if len(found) > 20 else ""
+        summary_lines.append(
+            f"Monorepo: {len(found)} services found: {listed}{more}. Each is reported as its own "
+            "Swarmia app; suggest removing libraries and tools that are never deployed."
+        )
     if detected_ci:
-        summary_lines.append(f"Detected CI/CD: {detected_ci}. App name: `{app_name}`.")
+        summary_lines.append(
+            f"Detected CI/CD: {detected_ci}."
+            + ("" if monorepo else f" App name: `{app_name}`.")
+        )
         summary_lines.append(
             f"Target file: "
             + (
@@ -510,7 +895,7 @@ def scaffold_swarmia_deployment(
 
     text = "\n".join(summary_lines)
 
-    return ToolResult(
+    return memo.put("scaffold_swarmia_deployment", memo_key, ToolResult(
         content=[TextContent(type="text", text=text)],
         structured_content={
             "detected_ci": detected_ci,
@@ -518,9 +903,10 @@ def scaffold_swarmia_deployment(
             "workflow_name": workflow_name,
             "yaml_snippet": yaml_snippet_raw,
             "setup_steps": setup_steps_raw,
+            "services": [{"name": s.name, "path": s.path, "kinds": s.kinds} for s in found],
         },
         meta={},
-    )
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -529,27 +915,65 @@ def scaffold_swarmia_deployment(
 
 
 @mcp.resource("ui://swarmia/docs-diagnostic.html")
-def docs_diagnostic_view() -> str:
+async def docs_diagnostic_view() -> ResourceResult:
     """Interactive documentation diagnostic dashboard."""
-    return _load_widget_html("docs-diagnostic")
+    return await _widget_resource("docs-diagnostic")
 
 
 @mcp.tool(app=AppConfig(resource_uri="ui://swarmia/docs-diagnostic.html"))
-def query_swarmia_docs(query: str) -> str:
+@metrics.timed("tool.query_swarmia_docs")
+@profiling.profiled("query_swarmia_docs")
+async def query_swarmia_docs(
+    query: str,
+    top_k: int = 3,
+    workspace: str = "",
+    profile: bool = False,
+    ctx: Context | None = None,
+) -> str:
     """Search the bundled Swarmia documentation for an answer to the user's question.
 
-    Returns the full documentation context prepended with the user's query so
-    the LLM can extract the most relevant answer. Keep responses concise —
-    max 3 sentences unless the user asks for detail.
+    Returns the documentation sections most relevant to the query (BM25-ranked,
+    with heading paths and scores) so the LLM can extract the answer. When
+    SWARMIA_MCP_DOCS_DIR is set, local markdown (help center exports, runbooks)
+    is searched too, through an on-disk index. Falls back to the bundled
+    documentation when no section matches. Keep responses concise —
+    max 3 sentences unless the user asks for detail. A repeated question is
+    answered from memory until the workspace's CI files or credentials change.
 
     Args:
         query: The user's question about Swarmia.
+        top_k: Number of documentation sections to return (default: 3).
+        workspace: Absolute path of the project root, used for the integration
+                   status checks. Required when the server runs over HTTP;
+                   defaults to the server's working directory.
+        profile: Capture a CPU profile of this call; its file path and top hotspots
+                 are returned in the result meta (default: False). Bypasses the
+                 response memo.
     """
+    from swarmia_mcp import ci_scan, docs_index, memo
+
     logger.info("query_swarmia_docs: %s", query[:80])
-    docs_path = Path(__file__).parent / "docs_context.md"
+    top_k = max(1, min(int(top_k), 10))
+    try:
+        root = await _resolve_workspace(workspace, ctx)
+    except ValueError as exc:
+        return str(exc)
+    memo_key = await asyncio.to_thread(_memo_key, root, query, top_k)
+    if not profiling.active() and (memoized := memo.get("query_swarmia_docs", memo_key)) is not None:
+        return memoized
 
     try:
-        docs_content = docs_path.read_text(encoding="utf-8")
+        with metrics.span("docs.search"):
+            matches = await asyncio.to_thread(docs_index.search, query, top_k)
+        docs_content = (
+            "\n\n".join(
+                f"_Section: {section.title} (score {score:.2f}"
+                f"{f', {Path(section.source).name}' if section.source else ''})_\n\n{section.text}"
+                for section, score in matches
+            )
+            if matches
+            else await asyncio.to_thread(docs_index.full_corpus)
+        )
     except FileNotFoundError:
         return (
             "Error: Local documentation corpus (docs_context.md) is missing. "
@@ -570,7 +994,8 @@ def query_swarmia_docs(query: str) -> str:
     integrations = []
 
     # GitHub: check if .github/ exists
-    has_github = (Path.cwd() / ".github").is_dir()
+    snapshot = await asyncio.to_thread(ci_scan.snapshot, root)
+    has_github = snapshot.has_dir(".github")
     integrations.append({
         "name": "GitHub",
         "status": "green" if has_github else "red",
@@ -593,43 +1018,484 @@ def query_swarmia_docs(query: str) -> str:
     })
 
     # Deployment tracking: check for webhook config in known CI paths
-    ci_files: list[Path] = []
-    gh_workflows = Path.cwd() / ".github" / "workflows"
-    if gh_workflows.is_dir():
-        ci_files.extend(gh_workflows.glob("*.yml"))
-        ci_files.extend(gh_workflows.glob("*.yaml"))
-    gitlab_ci = Path.cwd() / ".gitlab-ci.yml"
-    if gitlab_ci.is_file():
-        ci_files.append(gitlab_ci)
-    has_deploy = any(
-        "hook.swarmia.com" in f.read_text(encoding="utf-8", errors="ignore")
-        for f in ci_files
-        if f.stat().st_size < 50_000
-    )
+    webhook_file = snapshot.deploy_webhook()
     integrations.append({
         "name": "Deployment Tracking",
-        "status": "green" if has_deploy else "red",
-        "detail": "Swarmia webhook found in CI config" if has_deploy else "No deployment webhook configured",
+        "status": "green" if webhook_file else "red",
+        "detail": (
+            f"Swarmia webhook found in {ci_scan.relative(webhook_file, root)}"
+            if webhook_file else "No deployment webhook configured"
+        ),
     })
 
-    return ToolResult(
+    return memo.put("query_swarmia_docs", memo_key, ToolResult(
         content=[TextContent(type="text", text=text)],
         structured_content={
             "query": query,
             "answer": "(LLM will summarize from documentation context)",
+            "sections": [
+                {"heading_path": list(section.heading_path), "score": round(score, 3), "source": section.source}
+                for section, score in matches
+            ],
             "integrations": integrations,
         },
         meta={},
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Tool 4: audit_swarmia_commit_history
+# ---------------------------------------------------------------------------
+
+
+@mcp.tool
+@metrics.timed("tool.audit_swarmia_commit_history")
+async def audit_swarmia_commit_history(
+    repositories: list[str] | None = None,
+    revision_range: str = "HEAD",
+    since: str = "",
+    until: str = "",
+    ctx: Context | None = None,
+) -> str | ToolResult:
+    """Audit issue-key coverage over the full git history of every repository in the workspace.
+
+    Streams `git log` for each repository (in parallel) and reports the share of
+    commits whose message contains an issue tracker ID (e.g. ENG-123), overall
+    and broken down per repository, author and month. Use this for team-level
+    or historical questions; use check_swarmia_commit_hygiene for the current branch.
+
+    Args:
+        repositories: Repository paths to audit. Defaults to the client's workspace
+                      roots (and git repositories directly below them), or the
+                      cwd when the server runs over stdio.
+        revision_range: Revision or range to scan, e.g. "HEAD", "main", "v1.0..HEAD" (default: "HEAD").
+        since: Only commits after this date, e.g. "2025-01-01" or "6 months ago".
+        until: Only commits before this date.
+    """
+    from swarmia_mcp import audit, issues, keys
+
+    logger.info("audit_swarmia_commit_history: range=%s since=%s until=%s", revision_range, since, until)
+    if revision_range.startswith("-"):
+        return "Error: revision_range must be a revision or range (e.g. `main` or `v1.0..HEAD`), not an option."
+
+    try:
+        if repositories:
+            roots = [_check_allowed(Path(r)) for r in repositories]
+        else:
+            roots = [_check_allowed(r) for r in await _client_roots(ctx)]
+            if not roots and _http_mode:
+                return "Error: Pass `repositories` (absolute paths) when the server runs over HTTP."
+            roots = roots or [Path.cwd()]
+    except ValueError as exc:
+        return str(exc)
+    repos = await asyncio.to_thread(audit.discover_repos, roots)
+    if not repos:
+        return (
+            "Error: No git repositories found in "
+            + ", ".join(f"`{r}`" for r in roots)
+            + ". Pass `repositories` explicitly or open a git-initialized workspace."
+        )
+
+    extractor = keys.extractor(await issues.team_keys())
+    cancel = threading.Event()
+    try:
+        audits = await asyncio.to_thread(
+            audit.audit_repos, repos, extractor, revision_range, since, until, cancel
+        )
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
+
+    stats = audit.summarize(audits)
+    overall = stats["overall"]
+    summary_lines = [
+        f"{overall['with_keys']}/{overall['commits']} commits ({overall['percent']}%) "
+        f"across {len(repos)} repositor{'y' if len(repos) == 1 else 'ies'} have issue keys."
+    ]
+    for repo_stats in stats["by_repo"]:
+        if "error" in repo_stats:
+            summary_lines.append(f"`{repo_stats['repo']}`: could not be scanned ({repo_stats['error']}).")
+    weakest = [a for a in stats["by_author"] if a["commits"] >= 10 and a["percent"] < 50][:5]
+    if weakest:
+        summary_lines.append(
+            "Authors with most untracked work: "
+            + ", ".join(f"{a['author']} ({a['percent']}%)" for a in weakest) + "."
+        )
+    summary_lines.append(
+        "\nstructured_content has per-repository, per-author and per-month coverage. "
+        "Focus on trends and the biggest gaps rather than listing every number."
+    )
+
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(summary_lines))],
+        structured_content={
+            "revision_range": revision_range,
+            "since": since,
+            "until": until,
+            **stats,
+        },
+        meta={},
     )
 
 
+# ---------------------------------------------------------------------------
+# Tool 5: backfill_swarmia_deployments
+# ---------------------------------------------------------------------------
+
+MAX_BACKFILL_DEPLOYMENTS = 5000
+BACKFILL_PREVIEW = 5
+
+
+@mcp.tool
+@metrics.timed("tool.backfill_swarmia_deployments")
+async def backfill_swarmia_deployments(
+    app_name: str = "",
+    tag_pattern: str = "v*",
+    revision_range: str = "",
+    since: str = "",
+    max_deployments: int = 500,
+    environment: str = "",
+    repository_full_name: str = "",
+    dry_run: bool = True,
+    concurrency: int = 8,
+    workspace: str = "",
+    ctx: Context | None = None,
+) -> str | ToolResult:
+    """Backfill historical deployments into Swarmia so DORA metrics have history from day one.
+
+    Derives past deployments from git tags (default) or from the first-parent
+    commits of a release branch range, and sends each one to Swarmia's
+    Deployments API with the same payload the scaffolded CI config sends
+    (version, appName, commitSha, repositoryFullName) plus deployedAt.
+    Defaults to a dry run that only shows what would be sent; run it again
+    with dry_run=false to post. Posting is resumable: deployments already
+    accepted are recorded in a checkpoint file and skipped on the next run.
+    Requires SWARMIA_DEPLOYMENTS_AUTHORIZATION unless dry_run is true.
+
+    Args:
+        app_name: The application/service name for Swarmia tracking.
+                  Defaults to the repository directory name.
+        tag_pattern: Tags that mark deployments, as a glob (default: "v*").
+                     Each tag is one deployment of the commit it points to,
+                     deployed at the tag's creation date.
+        revision_range: Use commits instead of tags, e.g. "release" or
+                        "v1.0..production": every first-parent commit in the
+                        range is one deployment, at its commit date.
+        since: Only deployments on or after this ISO date, e.g. "2025-01-01" (UTC unless it has an offset).
+        max_deployments: Send at most this many (the most recent; default: 500, max: 5000).
+        environment: Optional Swarmia environment, e.g. "production".
+        repository_full_name: "owner/name"; defaults to the origin remote.
+        dry_run: Only report what would be sent (default: True).
+        concurrency: Requests in flight at once (default: 8, max: 32).
+        workspace: Absolute path of the project root. Required when the server
+                   runs over HTTP; defaults to the server's working directory.
+    """
+    from swarmia_mcp import backfill
+
+    logger.info("backfill_swarmia_deployments: tags=%s range=%s dry_run=%s", tag_pattern, revision_range, dry_run)
+    try:
+        root = await _resolve_workspace(workspace, ctx)
+    except ValueError as exc:
+        return str(exc)
+    if revision_range.startswith("-") or tag_pattern.startswith("-"):
+        return "Error: revision_range and tag_pattern must be a revision/range or glob, not an option."
+    if since and not backfill.is_iso_date(since):
+        return f"Error: `since` must be an ISO date like 2025-01-01, got `{since}`."
+    max_deployments = max(1, min(int(max_deployments), MAX_BACKFILL_DEPLOYMENTS))
+
+    app_name = SAFE_NAME_PATTERN.sub("-", app_name or root.name)
+    if not repository_full_name:
+        try:
+            remote = await _run_git("remote", "get-url", "origin", cwd=root)
+        except RuntimeError:
+            remote = ""
+        repository_full_name = backfill.repository_full_name(remote) or ""
+    if not repository_full_name:
+        return (
+            "Error: Could not derive the repository name from the `origin` remote. "
+            "Pass `repository_full_name` (e.g. `acme/web`)."
+        )
+
+    try:
+        if revision_range:
+            output = await _run_git(
+                "log", "--first-parent", f"--format={backfill.RANGE_FORMAT}", revision_range, "--", cwd=root
+            )
+            found = backfill.parse_range(output)
+        else:
+            output = await _run_git(
+                "for-each-ref", "--sort=creatordate", f"--format={backfill.TAG_FORMAT}",
+                f"refs/tags/{tag_pattern}", cwd=root,
+            )
+            found = backfill.parse_tags(output)
+    except RuntimeError as exc:
+        return f"Error: Could not read deployments from git: {exc}"
+    deployments = backfill.select(found, since, max_deployments)
+    source = f"first-parent commits of `{revision_range}`" if revision_range else f"tags matching `{tag_pattern}`"
+    if not deployments:
+        return f"No deployments found in {source}{f' since {since}' if since else ''}."
+
+    bodies = [backfill.payload(d, app_name, repository_full_name, environment) for d in deployments]
+    url = backfill.api_url()
+    checkpoint = backfill.Checkpoint.for_target(root, app_name, repository_full_name, url)
+    pending = [body for body in bodies if body not in checkpoint]
+    structured = {
+        "dry_run": dry_run,
+        "url": url,
+        "source": source,
+        "app_name": app_name,
+        "repository_full_name": repository_full_name,
+        "deployments": len(bodies),
+        "already_posted": len(bodies) - len(pending),
+        "first_deployed_at": bodies[0]["deployedAt"],
+        "last_deployed_at": bodies[-1]["deployedAt"],
+        "checkpoint": str(checkpoint.path),
+        "preview": pending[:BACKFILL_PREVIEW],
+    }
+
+    summary = (
+        f"{len(bodies)} deployments of `{app_name}` from {source} "
+        f"({bodies[0]['deployedAt']} to {bodies[-1]['deployedAt']}), "
+        f"{len(bodies) - len(pending)} already posted."
+    )
+    if dry_run:
+        text = (
+            f"Dry run: {summary} Would POST {len(pending)} to {url}.\n"
+            "structured_content.preview shows the first payloads. "
+            "Confirm with the user, then call again with dry_run=false."
+        )
+        return ToolResult(content=[TextContent(type="text", text=text)], structured_content=structured, meta={})
+
+    if not backfill.authorization():
+        return (
+            "Error: SWARMIA_DEPLOYMENTS_AUTHORIZATION is not set. Add the deployment token "
+            "from Swarmia's settings to .env (the same secret the CI config uses)."
+        )
+    result = await backfill.post_all(bodies, checkpoint, concurrency)
+    structured.update(posted=result["posted"], failed=result["failed"][:20], failed_count=len(result["failed"]))
+    lines = [f"{summary} Posted {result['posted']} to {url}."]
+    if result["failed"]:
+        lines.append(
+            f"{len(result['failed'])} failed (first: {result['failed'][0]['error']}). "
+            "Re-run the same call to retry only those; posted deployments are skipped."
+        )
+    return ToolResult(content=[TextContent(type="text", text="\n".join(lines))], structured_content=structured, meta={})
+
+
+# ---------------------------------------------------------------------------
+# Tool 6: audit_swarmia_branches
+# ---------------------------------------------------------------------------
+
+MAX_BRANCH_UNIQUE_COMMITS = 200
+BRANCH_SUMMARY_LIMIT = 10
+
+
+@mcp.tool
+@metrics.timed("tool.audit_swarmia_branches")
+async def audit_swarmia_branches(
+    default_branch: str = "",
+    include_remote: bool = True,
+    workspace: str = "",
+    ctx: Context | None = None,
+) -> str | ToolResult:
+    """Check every local and remote branch for issue keys, without checking anything out.
+
+    Lists all branches in one `git for-each-ref` pass and, for each, finds the
+    commits not yet on the default branch. A branch is "tracked" when its name
+    or all of its unique commits carry an issue tracker ID (e.g. ENG-123),
+    "partial" when only some commits do, "untracked" when none do, and
+    "merged" when it has no unique commits. Results are cached per branch tip,
+    so re-running only re-walks branches that moved.
+
+    Args:
+        default_branch: Branch to compare against, e.g. "main" or "origin/main".
+                        Defaults to origin/HEAD, then main/master/trunk/develop.
+        include_remote: Also audit remote-tracking branches (default: True).
+        workspace: Absolute path of the project root. Required when the server
+                   runs over HTTP; defaults to the server's working directory.
+    """
+    from swarmia_mcp import branches, git_backend, issues, keys
+
+    logger.info("audit_swarmia_branches: default=%s remote=%s", default_branch or "<auto>", include_remote)
+    try:
+        root = await _resolve_workspace(workspace, ctx)
+    except ValueError as exc:
+        return str(exc)
+    repo = git_backend.get_repo(root)
+    if repo is None:
+        return "Error: This directory is not a git repository. Please run this from a git-initialized project."
+
+    patterns = ["refs/heads", "refs/remotes"] if include_remote else ["refs/heads"]
+    try:
+        output = await _run_git("for-each-ref", f"--format={branches.REF_FORMAT}", *patterns, cwd=root)
+    except RuntimeError as exc:
+        return f"Error: Could not list branches: {exc}"
+    refs = branches.parse_refs(output)
+    # The default branch may be remote-only even when remote branches are not audited
+    base = branches.default_branch(refs, default_branch)
+    if base is None and not include_remote:
+        with contextlib.suppress(RuntimeError):
+            remote_output = await _run_git("for-each-ref", f"--format={branches.REF_FORMAT}", "refs/remotes", cwd=root)
+            base = branches.default_branch(branches.parse_refs(remote_output), default_branch)
+    if base is None:
+        wanted = f"`{default_branch}`" if default_branch else "a default branch (origin/HEAD, main, master)"
+        return f"Error: Could not find {wanted}. Pass `default_branch` explicitly."
+
+    extractor = keys.extractor(await issues.team_keys())
+    try:
+        results = await branches.audit(repo, refs, base, extractor, MAX_BRANCH_UNIQUE_COMMITS)
+    except RuntimeError as exc:
+        return f"Error: Could not read commits: {exc}"
+
+    counts = {status: 0 for status in branches.STATUS_ORDER}
+    for branch in results:
+        counts[branch["status"]] += 1
+    summary_lines = [
+        f"{len(results)} branches compared with `{base.short}`: "
+        + ", ".join(f"{count} {status}" for status, count in counts.items()) + "."
+    ]
+    needy = [b for b in results if b["status"] in ("untracked", "partial")][:BRANCH_SUMMARY_LIMIT]
+    if needy:
+        summary_lines.append(
+            "Missing issue keys: "
+            + ", ".join(f"`{b['branch']}` ({b['missing_keys']}/{b['unique_commits']} commits)" for b in needy)
+            + ". Suggest renaming with `git branch -m <ENG-XXX>-{name}` or rewording commits."
+        )
+    else:
+        summary_lines.append("Every unmerged branch is tracked. ✅")
+    summary_lines.append("\nstructured_content.branches has every branch, neediest first.")
+
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(summary_lines))],
+        structured_content={"default_branch": base.short, "counts": counts, "branches": results},
+        meta={},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tool 7: sync_swarmia_issue_mirror
+# ---------------------------------------------------------------------------
+
+
+@mcp.tool
+@metrics.timed("tool.sync_swarmia_issue_mirror")
+async def sync_swarmia_issue_mirror(full: bool = False, ctx: Context | None = None) -> str | ToolResult:
+    """Sync the local mirror of issue tracker issues used for offline validation.
+
+    The mirror keeps each issue's key, title, state, assignee and updatedAt in
+    a local SQLite index. A sync only fetches issues updated since the last one
+    (a 250-issue page per request), and an interrupted sync resumes where it
+    stopped. check_swarmia_commit_hygiene serves keys found in a mirror synced
+    within the last day without any request, and reports how old it is. Set
+    SWARMIA_MCP_ISSUE_MIRROR=1 to keep it synced in the background instead.
+    Linear only; teams are SWARMIA_MCP_TEAM_KEYS, else all teams.
+
+    Args:
+        full: Drop the mirror and fetch every issue again (default: False).
+    """
+    from swarmia_mcp import issues
+
+    logger.info("sync_swarmia_issue_mirror: full=%s", full)
+    if not issues.configured():
+        return "Error: No issue tracker credentials. Add LINEAR_API_KEY to .env to build a mirror."
+
+    async def page_done(label: str, fetched: int) -> None:
+        if ctx is not None:
+            await ctx.report_progress(fetched, None, f"{label}: {fetched:,} issues fetched")
+
+    results = await issues.sync_mirrors(full=full, on_page=page_done)
+    if not results:
+        return "Error: None of the configured issue trackers can be mirrored (Linear only)."
+
+    summary_lines = []
+    for result in results:
+        label = issues.label(result["tracker"])
+        if "error" in result:
+            line = f"{label}: sync stopped ({result['error']}) after {result['fetched']:,} updated issues"
+            if result.get("issues") is not None:
+                line += f"; the mirror holds {result['issues']:,} issues and resumes on the next sync"
+            summary_lines.append(line + ".")
+        else:
+            summary_lines.append(
+                f"{label}: {result['fetched']:,} updated issues fetched; the mirror holds {result['issues']:,} issues."
+            )
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(summary_lines))],
+        structured_content={"mirrors": results},
+        meta={},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Observability
+# ---------------------------------------------------------------------------
+
+
+@mcp.resource("metrics://swarmia", mime_type="application/json")
+def swarmia_metrics() -> str:
+    """Latency histograms for this server process.
+
+    Per span (each tool, git, Linear HTTP, widget loading, parsing): call and
+    error counts plus mean/p50/p95/p99/max in milliseconds over the last samples.
+    Also the response memo's size and hit/miss/eviction counts per tool.
+    """
+    from swarmia_mcp import memo
+
+    return json.dumps({"spans": metrics.snapshot(), "memo": memo.stats()}, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
 
+class _ToolConcurrencyLimit(Middleware):
+    """Bound concurrent tool calls; waiting time is recorded as the tool.queue_wait span."""
+
+    def __init__(self, limit: int):
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> ToolResult:
+        with metrics.span("tool.queue_wait"):
+            await self._semaphore.acquire()
+        try:
+            return await call_next(context)
+        finally:
+            self._semaphore.release()
+
+
 def main():
-    mcp.run(transport="stdio", show_banner=False)
+    """stdio by default; `--transport http` serves many clients (and workspaces) from one process."""
+    global _http_mode
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(prog="swarmia-mcp", description="Swarmia MCP server")
+    parser.add_argument("--transport", choices=("stdio", "http"), default=os.getenv("SWARMIA_MCP_TRANSPORT", "stdio"))
+    parser.add_argument("--host", default=os.getenv("SWARMIA_MCP_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("SWARMIA_MCP_PORT", "8000")))
+    parser.add_argument(
+        "--max-concurrency", type=int, default=int(os.getenv("SWARMIA_MCP_MAX_CONCURRENCY", "16")),
+        help="tool calls running at once (HTTP mode); the rest queue",
+    )
+    parser.add_argument(
+        "--git-workers", type=int,
+        help="repositories with a live `git cat-file` worker (default: SWARMIA_MCP_GIT_WORKERS or 4)",
+    )
+    args = parser.parse_args()
+    if args.git_workers:
+        os.environ["SWARMIA_MCP_GIT_WORKERS"] = str(args.git_workers)
+
+    if args.transport == "stdio":
+        mcp.run(transport="stdio", show_banner=False)
+        return
+
+    if not _allowed_roots():
+        parser.error("HTTP mode requires SWARMIA_MCP_WORKSPACE_ROOTS (the directories clients may access)")
+    _http_mode = True
+    mcp.add_middleware(_ToolConcurrencyLimit(max(1, args.max_concurrency)))
+    logger.info("Swarmia MCP: streamable HTTP on http://%s:%d/mcp", args.host, args.port)
+    mcp.run(transport="http", host=args.host, port=args.port, show_banner=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,249 @@
+"""
+Service discovery for monorepos: which directories hold a deployable service.
+
+The workspace is walked with os.scandir on a thread pool, one directory per
+task, so listings overlap on slow and networked filesystems. `.gitignore` files
+are honoured (nested ones too, with negation and directory-only rules), and
+vendored or generated trees (node_modules, vendor, .venv, ...) and hidden
+directories are never entered. Only directories and marker file names are
+matched against ignore rules, which keeps the walk cheap on 500k-file trees.
+
+A service root is a directory with a Dockerfile or Helm chart (Chart.yaml), or
+with a package.json or pyproject.toml when the root declares a workspace (or
+has no manifest of its own). Manifests and charts below a service belong to
+that service; without a workspace, nested manifests are parts of the root app.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+# Marker file name -> service kind
+MARKERS = {
+    "Dockerfile": "docker",
+    "package.json": "node",
+    "pyproject.toml": "python",
+    "Chart.yaml": "helm",
+}
+# Never entered, wherever they appear (hidden directories are skipped as well)
+PRUNED_DIRS = frozenset({
+    "node_modules", "bower_components", "vendor", "third_party", "third-party",
+    "venv", "site-packages", "__pycache__", "dist", "build", "target",
+    "coverage", "Pods", "DerivedData",
+})
+# Root files declaring a workspace whose package.json / pyproject.toml directories are services
+WORKSPACE_FILES = ("pnpm-workspace.yaml", "lerna.json", "nx.json", "turbo.json", "rush.json")
+MAX_WORKERS = 16
+MAX_SERVICES = 200
+
+# (directory the .gitignore lives in, compiled pattern, negated, directory only)
+Rule = tuple[str, "re.Pattern[str]", bool, bool]
+
+
+@dataclass
+class Service:
+    path: str                     # relative to the workspace, "" for the root
+    kinds: list[str] = field(default_factory=list)
+    name: str = ""
+
+
+@lru_cache(maxsize=4096)
+def _translate(pattern: str) -> str:
+    """gitignore glob -> regex over '/'-separated paths (without anchors)."""
+    out, i = [], 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                out.append(f"[{'^' + body[1:] if body.startswith('!') else body}]")
+                i = end
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def parse_gitignore(text: str, base: str) -> list[Rule]:
+    """Rules of one .gitignore in directory `base` (relative, "" for the root)."""
+    rules: list[Rule] = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        if line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.strip("/") if dir_only else line
+        if not line:
+            continue
+        # A slash anywhere but the end anchors the pattern to base; otherwise it matches at any depth
+        if "/" in line:
+            regex = _translate(line.lstrip("/"))
+        else:
+            regex = "(?:.*/)?" + _translate(line)
+        rules.append((base, re.compile(regex + r"\Z"), negated, dir_only))
+    return rules
+
+
+def ignored(rules: tuple[Rule, ...], rel: str, is_dir: bool) -> bool:
+    """Whether path rel (relative to the workspace) is ignored; the last matching rule wins."""
+    result = False
+    for base, pattern, negated, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel.startswith(base + "/"):
+                continue
+            sub = rel[len(base) + 1:]
+        else:
+            sub = rel
+        if pattern.match(sub):
+            result = not negated
+    return result
+
+
+def _list(root: Path, rel: str, rules: tuple[Rule, ...]) -> tuple[list[str], list[str], tuple[Rule, ...]]:
+    """Scan one directory: (subdirectories to enter, marker files found, rules for children)."""
+    path = root / rel if rel else root
+    dirs, files = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # d_type answers is_dir() without a stat; only candidate names get is_file()
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.name)
+                elif (entry.name in MARKERS or entry.name == ".gitignore") and entry.is_file():
+                    files.append(entry.name)
+    except OSError:
+        return [], [], rules
+    if ".gitignore" in files:
+        try:
+            text = (path / ".gitignore").read_text(encoding="utf-8", errors="replace")
+            rules = rules + tuple(parse_gitignore(text, rel))
+        except OSError:
+            pass
+    prefix = f"{rel}/" if rel else ""
+    subdirs = [
+        prefix + name for name in dirs
+        if not name.startswith(".") and name not in PRUNED_DIRS and not ignored(rules, prefix + name, True)
+    ]
+    markers = [name for name in files if name in MARKERS and not ignored(rules, prefix + name, False)]
+    return subdirs, markers, rules
+
+
+def walk(root: Path, workers: int = MAX_WORKERS) -> dict[str, list[str]]:
+    """Every non-ignored directory with marker files: {relative dir: [marker names]}."""
+    found: dict[str, list[str]] = {}
+    base_rules: tuple[Rule, ...] = ()
+    exclude = root / ".git" / "info" / "exclude"
+    if exclude.is_file():
+        base_rules = tuple(parse_gitignore(exclude.read_text(encoding="utf-8", errors="replace"), ""))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="swarmia-services") as pool:
+        pending: set[Future] = {pool.submit(_list, root, "", base_rules)}
+        rel_of: dict[Future, str] = {next(iter(pending)): ""}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel = rel_of.pop(future)
+                subdirs, markers, rules = future.result()
+                if markers:
+                    found[rel] = sorted(markers)
+                for child in subdirs:
+                    submitted = pool.submit(_list, root, child, rules)
+                    rel_of[submitted] = child
+                    pending.add(submitted)
+    return found
+
+
+def _names(services: list[Service], root_name: str) -> None:
+    """Directory names, widened with parent directories until unique."""
+    def candidate(service: Service, depth: int) -> str:
+        parts = service.path.split("/") if service.path else [root_name]
+        return "-".join(parts[-depth:])
+
+    depth = {id(service): 1 for service in services}
+    while True:
+        names: dict[str, list[Service]] = {}
+        for service in services:
+            names.setdefault(candidate(service, depth[id(service)]), []).append(service)
+        clashes = [group for group in names.values() if len(group) > 1]
+        widened = False
+        for group in clashes:
+            for service in group:
+                if depth[id(service)] < len(service.path.split("/")):
+                    depth[id(service)] += 1
+                    widened = True
+        if not widened:
+            break
+    for service in services:
+        service.name = re.sub(r"[^a-zA-Z0-9_-]", "-", candidate(service, depth[id(service)]))
+
+
+def _declares_workspace(root: Path) -> bool:
+    """Whether the root manifest declares a multi-package workspace."""
+    if any((root / name).is_file() for name in WORKSPACE_FILES):
+        return True
+    for name, marker in (("package.json", '"workspaces"'), ("pyproject.toml", "[tool.uv.workspace]")):
+        try:
+            if marker in (root / name).read_text(encoding="utf-8", errors="replace"):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def discover(root: Path) -> list[Service]:
+    """Service roots below root, shallowest first (at most MAX_SERVICES).
+
+    The workspace root itself only counts when it is the only service or has a
+    Dockerfile or chart of its own (a root package.json or pyproject.toml in a
+    monorepo is usually tooling).
+    """
+    found = walk(root)
+    root_kinds = {MARKERS[name] for name in found.get("", [])}
+    manifests_are_services = not {"node", "python"} & root_kinds or _declares_workspace(root)
+    services: dict[str, Service] = {}
+    for rel in sorted(found, key=lambda r: (r.count("/"), r)):
+        kinds = {MARKERS[name] for name in found[rel]}
+        if "docker" not in kinds:
+            owners = [path for path in services if path and rel.startswith(path + "/")]
+            if owners:
+                owner = services[max(owners, key=len)]
+                owner.kinds = sorted(set(owner.kinds) | kinds)
+                continue
+            if rel and "helm" not in kinds and not manifests_are_services:
+                continue
+        services[rel] = Service(rel, sorted(kinds))
+    root_service = services.get("")
+    if root_service is not None and len(services) > 1 and not {"docker", "helm"} & set(root_service.kinds):
+        del services[""]
+    result = list(services.values())[:MAX_SERVICES]
+    _names(result, root.name)
+    return result
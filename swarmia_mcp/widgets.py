@@ -0,0 +1,130 @@
+"""
+Widget HTML assets for the ui:// resources.
+
+Vite builds each widget into assets/<widget>/ as an index.html that references a
+hashed JS bundle. MCP hosts need one self-contained document, so the bundle is
+inlined once and kept in memory (with a content hash) until a source file
+changes on disk.
+
+`python -m swarmia_mcp.widgets` writes the inlined document next to the Vite
+output (widget.html); it is served as-is while it is at least as new as
+index.html and every JS/CSS bundle that index.html references.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).parent.parent / "assets"
+PREBUILT_NAME = "widget.html"
+
+# Vite outputs: <script type="module" crossorigin src="./index-xxx.js"></script>
+_SCRIPT_TAG = re.compile(r'<script type="module" crossorigin src="([^"]+)"></script>')
+# ... and for widgets with styles: <link rel="stylesheet" crossorigin href="./index-xxx.css">
+_STYLESHEET_TAG = re.compile(r'<link rel="stylesheet" crossorigin href="([^"]+)">')
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True)
+class WidgetAsset:
+    html: str
+    sha256: str
+    sources: tuple[tuple[Path, int | None], ...]
+
+    def is_current(self) -> bool:
+        """True while none of the files the HTML was built from changed."""
+        return all(_mtime(path) == mtime for path, mtime in self.sources)
+
+
+def inline_widget(html_path: Path) -> tuple[str, list[Path]]:
+    """Inline the JS bundle(s) referenced by a Vite index.html.
+
+    Returns the self-contained HTML and the files it was built from.
+    """
+    html = html_path.read_text(encoding="utf-8")
+    sources = [html_path]
+
+    def _inline(match: re.Match, tag: str) -> str:
+        path = (html_path.parent / match.group(1)).resolve()
+        if not path.exists():
+            return match.group(0)
+        sources.append(path)
+        return tag.format(path.read_text(encoding="utf-8"))
+
+    html = _SCRIPT_TAG.sub(lambda m: _inline(m, '<script type="module">{}</script>'), html)
+    html = _STYLESHEET_TAG.sub(lambda m: _inline(m, "<style>{}</style>"), html)
+    return html, sources
+
+
+def _bundle_files(html_path: Path) -> list[Path]:
+    """index.html plus the JS/CSS bundles it references."""
+    try:
+        html = html_path.read_text(encoding="utf-8")
+    except OSError:
+        return [html_path]
+    refs = _SCRIPT_TAG.findall(html) + _STYLESHEET_TAG.findall(html)
+    return [html_path, *((html_path.parent / ref).resolve() for ref in refs)]
+
+
+def _build_asset(widget_name: str) -> WidgetAsset:
+    widget_dir = ASSETS_DIR / widget_name
+    index = widget_dir / "index.html"
+    prebuilt = widget_dir / PREBUILT_NAME
+    bundles = _bundle_files(index)
+    bundle_mtimes = [_mtime(path) for path in bundles]
+    prebuilt_mtime = _mtime(prebuilt)
+
+    # A Vite rebuild rewrites the bundles; the prebuilt file must be at least as new as all of them
+    if prebuilt_mtime is not None and all(m is None or prebuilt_mtime >= m for m in bundle_mtimes):
+        html = prebuilt.read_text(encoding="utf-8")
+        sources = [prebuilt, *bundles]
+    elif bundle_mtimes[0] is not None:
+        html, sources = inline_widget(index)
+    else:
+        html = (
+            f"<html><body><p>Widget '{widget_name}' not built. "
+            f"Run <code>pnpm run build</code>.</p></body></html>"
+        )
+        sources = [prebuilt, index]
+
+    return WidgetAsset(
+        html=html,
+        sha256=hashlib.sha256(html.encode("utf-8")).hexdigest(),
+        sources=tuple((path, _mtime(path)) for path in sources),
+    )
+
+
+_assets: dict[str, WidgetAsset] = {}
+
+
+def load_widget(widget_name: str) -> WidgetAsset:
+    """Return the cached widget, rebuilding it only if a source file changed."""
+    asset = _assets.get(widget_name)
+    if asset is None or not asset.is_current():
+        asset = _assets[widget_name] = _build_asset(widget_name)
+    return asset
+
+
+def build(assets_dir: Path = ASSETS_DIR) -> list[Path]:
+    """Write the inlined widget.html for every built widget. Returns the written paths."""
+    written = []
+    for index in sorted(assets_dir.glob("*/index.html")):
+        html, _ = inline_widget(index)
+        target = index.with_name(PREBUILT_NAME)
+        target.write_text(html, encoding="utf-8")
+        written.append(target)
+    return written
+
+
+if __name__ == "__main__":
+    for path in build():
+        print(path)
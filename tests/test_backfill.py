@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from swarmia_mcp import backfill
+
+
+def _deployment(version, deployed_at):
+    return {"version": version, "commitSha": version, "deployedAt": deployed_at}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2025-01-01", datetime(2025, 1, 1, tzinfo=timezone.utc)),
+        ("2025-01-01T12:00:00", datetime(2025, 1, 1, 12, tzinfo=timezone.utc)),
+        ("2025-01-01T12:00:00Z", datetime(2025, 1, 1, 12, tzinfo=timezone.utc)),
+        ("2025-01-01T12:00:00+02:00", datetime(2025, 1, 1, 10, tzinfo=timezone.utc)),
+        ("2025-01-01T01:00:00+05:30", datetime(2024, 12, 31, 19, 30, tzinfo=timezone.utc)),
+        ("2024-12-31T20:00:00-08:00", datetime(2025, 1, 1, 4, tzinfo=timezone.utc)),
+    ],
+)
+def test_utc(value, expected):
+    parsed = backfill._utc(value)
+    assert parsed == expected
+    assert parsed.utcoffset().total_seconds() == 0
+
+
+DEPLOYMENTS = [
+    _deployment("v3", "2025-01-02T00:30:00+02:00"),  # 2025-01-01T22:30Z
+    _deployment("v1", "2024-12-31T20:00:00-08:00"),  # 2025-01-01T04:00Z
+    _deployment("v2", "2025-01-01T12:00:00+00:00"),
+    _deployment("v0", "2024-12-30T09:00:00+00:00"),
+]
+
+
+@pytest.mark.parametrize(
+    ("since", "limit", "expected"),
+    [
+        ("", 0, ["v0", "v1", "v2", "v3"]),
+        ("", 2, ["v2", "v3"]),
+        ("2025-01-01", 0, ["v1", "v2", "v3"]),
+        ("2025-01-01T04:00:00Z", 0, ["v1", "v2", "v3"]),
+        ("2025-01-01T05:00:00+01:00", 0, ["v1", "v2", "v3"]),
+        ("2025-01-01T12:00:01", 0, ["v3"]),
+        ("2025-01-02", 0, []),
+        ("2025-01-01", 1, ["v3"]),
+    ],
+)
+def test_select(since, limit, expected):
+    assert [d["version"] for d in backfill.select(DEPLOYMENTS, since, limit)] == expected
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        # Lightweight tag: no peeled object
+        ("v1.0\x00aaa\x00\x002025-01-01T10:00:00+02:00", [("v1.0", "aaa", "2025-01-01T10:00:00+02:00")]),
+        # Annotated tag: peeled to its commit
+        ("v1.1\x00tagobj\x00ccc\x002025-02-01T00:00:00Z", [("v1.1", "ccc", "2025-02-01T00:00:00Z")]),
+        # No creation date, or a malformed line
+        ("v1.2\x00ddd\x00\x00", []),
+        ("garbage", []),
+        ("", []),
+    ],
+)
+def test_parse_tags(output, expected):
+    assert [(d["version"], d["commitSha"], d["deployedAt"]) for d in backfill.parse_tags(output)] == expected
+
+
+def test_parse_tags_multiple_lines():
+    output = "v1\x00a\x00\x002025-01-01T00:00:00Z\nv2\x00t\x00b\x002025-01-02T00:00:00Z\n"
+    assert [d["commitSha"] for d in backfill.parse_tags(output)] == ["a", "b"]
@@ -0,0 +1,50 @@
+import pytest
+
+from swarmia_mcp import keys
+
+TEAMS = frozenset({"ENG", "OPS", "ENGX"})
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("ENG-123 fix login", ["ENG-123"]),
+        ("fix(ENG-1): login, refs OPS-22", ["ENG-1", "OPS-22"]),
+        ("[ENGX-7] longest prefix wins", ["ENGX-7"]),
+        ("XENG-1 is not ENG-1's tail", ["ENG-1"]),
+        ("eng-123 lowercase", []),
+        ("ENG-", []),
+        ("decode UTF-8 and hash with SHA-256", []),
+        ("dates in ISO-8601", []),
+        ("FOO-12 from an unknown team", []),
+    ],
+)
+def test_allowlist(message, expected):
+    assert keys.extractor(TEAMS).findall(message) == expected
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("ENG-123 fix login", ["ENG-123"]),
+        ("FOO-12 any team", ["FOO-12"]),
+        ("decode UTF-8", []),
+        ("hash with SHA-256, see RFC-7231", []),
+        ("dates in ISO-8601", []),
+        ("CVE-2024 patched in ENG-9", ["ENG-9"]),
+        ("A-1 prefix too short", []),
+    ],
+)
+def test_denylist(message, expected):
+    assert keys.extractor(None).findall(message) == expected
+
+
+@pytest.mark.parametrize("allowlist", [TEAMS, None])
+def test_extract_maps_keys_to_messages(allowlist):
+    messages = ["ENG-1 first", "no key\nENG-2 on line two", "", "UTF-8 only", "OPS-3 and ENG-4"]
+    assert keys.extractor(allowlist).extract(messages) == [["ENG-1"], ["ENG-2"], [], [], ["OPS-3", "ENG-4"]]
+
+
+def test_extract_never_spans_messages():
+    assert keys.extractor(TEAMS).extract(["ENG", "-1"]) == [[], []]
+    assert keys.extractor(None).extract([]) == []